@@ -5,7 +5,7 @@
 매직넘버 제거와 동적 밸런싱을 위한 핵심 컴포넌트입니다.
 """
 
-from typing import Any, Dict, Optional, TypeVar, Generic, Union
+from typing import Any, Callable, Dict, Optional, TypeVar, Generic, Union
 from pathlib import Path
 import pandas as pd
 from dataclasses import dataclass
@@ -67,6 +67,9 @@ class ExcelConstantsProvider:
         self._constants_cache: Dict[str, Any] = {}
         self._definitions_cache: Dict[str, ConstantDefinition] = {}
         self._is_loaded = False
+        # 로드할 때마다 증가하는 버전과 리로드 구독자
+        self.version = 0
+        self._subscribers: list[Callable[['ExcelConstantsProvider'], None]] = []
     
     def load_data(self) -> Dict[str, Any]:
         """엑셀에서 모든 상수 데이터를 로드합니다."""
@@ -74,11 +77,17 @@ class ExcelConstantsProvider:
             return self._constants_cache.copy()
         
         try:
-            # 상수 시트들 로드
-            constants_data = self._load_constants_sheets()
+            # 상수 시트들 로드 (새 딕셔너리에 만든 뒤 한 번에 교체)
+            definitions: Dict[str, ConstantDefinition] = {}
+            constants_data = self._load_constants_sheets(definitions)
+            if not constants_data and self._constants_cache:
+                print("엑셀 상수가 비어 있어 기존 상수를 유지합니다")
+                return self._constants_cache.copy()
             
             self._constants_cache = constants_data
+            self._definitions_cache = definitions
             self._is_loaded = True
+            self.version += 1
             
             return constants_data.copy()
             
@@ -86,8 +95,8 @@ class ExcelConstantsProvider:
             print(f"엑셀 상수 로드 실패: {e}")
             return {}
     
-    def _load_constants_sheets(self) -> Dict[str, Any]:
-        """상수 관련 시트들을 로드합니다."""
+    def _load_constants_sheets(self, definitions: Dict[str, ConstantDefinition]) -> Dict[str, Any]:
+        """상수 관련 시트들을 로드합니다 (정의 정보는 definitions에 채움)."""
         constants = {}
         
         try:
@@ -103,7 +112,7 @@ class ExcelConstantsProvider:
             for sheet_name in constant_sheets:
                 try:
                     df = pd.read_excel(self.excel_path, sheet_name=sheet_name)
-                    sheet_constants = self._parse_constants_sheet(df, sheet_name)
+                    sheet_constants = self._parse_constants_sheet(df, sheet_name, definitions)
                     constants.update(sheet_constants)
                 except Exception as sheet_error:
                     print(f"시트 '{sheet_name}' 로드 실패: {sheet_error}")
@@ -115,7 +124,9 @@ class ExcelConstantsProvider:
             print(f"상수 시트 로드 실패: {e}")
             return {}
     
-    def _parse_constants_sheet(self, df: pd.DataFrame, category: str) -> Dict[str, Any]:
+    def _parse_constants_sheet(
+        self, df: pd.DataFrame, category: str, definitions: Dict[str, ConstantDefinition]
+    ) -> Dict[str, Any]:
         """상수 시트를 파싱합니다."""
         constants = {}
         
@@ -140,7 +151,7 @@ class ExcelConstantsProvider:
                 constants[key] = value
                 
                 # 정의 정보 저장
-                self._definitions_cache[key] = ConstantDefinition(
+                definitions[key] = ConstantDefinition(
                     key=key,
                     value=value,
                     data_type=data_type,
@@ -197,11 +208,43 @@ class ExcelConstantsProvider:
         return result
     
     def reload_constants(self) -> None:
-        """상수를 다시 로드합니다."""
-        self._constants_cache.clear()
-        self._definitions_cache.clear()
+        """
+        상수를 다시 로드합니다.
+
+        새 상수를 모두 읽은 뒤 한 번에 교체하므로, 리로드 중에도 다른 스레드는
+        이전 상수를 그대로 읽습니다. 로드에 성공하면 구독자에게 알립니다.
+        """
+        version = self.version
         self._is_loaded = False
         self.load_data()
+        if self.version == version:
+            # 로드 실패: 기존 상수 유지
+            self._is_loaded = bool(self._constants_cache)
+            return
+        
+        for callback in list(self._subscribers):
+            try:
+                callback(self)
+            except Exception as e:
+                print(f"상수 구독자 알림 실패: {callback!r} (오류: {e})")
+    
+    def subscribe(self, callback: Callable[['ExcelConstantsProvider'], None]) -> Callable[[], None]:
+        """
+        상수 리로드 알림을 구독합니다.
+
+        Args:
+            callback: 리로드된 제공자를 받을 함수
+
+        Returns:
+            Callable[[], None]: 구독 해제 함수
+        """
+        self._subscribers.append(callback)
+        
+        def unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+        
+        return unsubscribe
     
     def list_all_constants(self) -> Dict[str, ConstantDefinition]:
         """모든 상수 정의를 반환합니다."""
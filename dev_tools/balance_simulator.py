@@ -8,15 +8,31 @@
 
 import argparse
 import json
-import random
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from dev_tools.batch_simulator import (
+    METRIC_COLUMNS,
+    RISK_SUBSYSTEM,
+    SIMULATION_MODES,
+    SPILL_COLUMNS,
+    BalanceModel,
+    BatchSimulator,
+    run_session,
+)
+from dev_tools.scenario_sweep import DEFAULT_CHUNK_SIZE, build_sweep_points, run_sweep
+from dev_tools.streaming_stats import ColumnarSpill, StreamingAggregator
 from game_constants import (
     MAGIC_NUMBER_ZERO,
+    Metric,
     MAGIC_NUMBER_ONE_HUNDRED,
     PROBABILITY_LOW_THRESHOLD,
     PROBABILITY_HIGH_THRESHOLD,
+    get_constants_snapshot,
 )
+from src.core.rng import RngService
 from src.economy.engine import EconomyEngine
 from src.events.engine import EventEngine
 from src.metrics.tracker import MetricsTracker
@@ -25,18 +41,40 @@ from src.metrics.tracker import MetricsTracker
 class BalanceSimulator:
     """게임 밸런스 시뮬레이터"""
 
-    def __init__(self, config_file: str = "data/balance_config.json"):
+    def __init__(
+        self, config_file: str = "data/balance_config.json", model: BalanceModel | None = None
+    ):
         """
         초기화
 
+        이벤트 엔진은 배치 모드와 같은 이벤트/연쇄 효과 파일
+        (simulation.events_file / simulation.tradeoff_file)을 읽습니다.
+
         Args:
             config_file: 밸런스 설정 파일 경로
+            model: 배치 모델 (기본값: None). 주어지면 설정 파일 대신 모델의 설정,
+                경제 설정, 이벤트/연쇄 효과 파일을 사용 (배치 스칼라 모드용)
         """
         self.config_file = config_file
-        self.config = self.load_config()
         self.metrics_tracker = MetricsTracker()
-        self.economy_engine = EconomyEngine(self.metrics_tracker)
-        self.event_engine = EventEngine(self.metrics_tracker)
+        # simulate_day()에 위험도 난수를 넘기지 않을 때 쓰는 난수 서비스
+        self.rng = RngService()
+        if model is None:
+            self.config = self.load_config()
+            events_file, tradeoff_file = self._data_files()
+            self.economy_engine = EconomyEngine(self.metrics_tracker)
+            self.event_engine = EventEngine(
+                self.metrics_tracker, events_file=events_file, tradeoff_file=tradeoff_file
+            )
+        else:
+            self.config = model.config
+            self.economy_engine = EconomyEngine(self.metrics_tracker, config=model.economy_config)
+            self.event_engine = EventEngine(
+                self.metrics_tracker,
+                events_file=model.events_file,
+                tradeoff_file=model.tradeoff_file,
+                max_cascade_depth=model.max_cascade_depth,
+            )
 
     def load_config(self) -> dict[str, Any]:
         """
@@ -62,6 +100,7 @@ class BalanceSimulator:
         Returns:
             기본 설정 딕셔너리
         """
+        constants = get_constants_snapshot()
         return {
             "simulation": {"days": 30, "iterations": 100, "random_seed": 42},
             "initial_metrics": {
@@ -75,18 +114,35 @@ class BalanceSimulator:
                 "demand": 60.0,
             },
             "scenarios": [
-                {"name": "conservative", "risk_factor": PROBABILITY_LOW_THRESHOLD},
+                {
+                    "name": "conservative",
+                    "risk_factor": constants.get(
+                        "PROBABILITY_LOW_THRESHOLD", PROBABILITY_LOW_THRESHOLD
+                    ),
+                },
                 {"name": "balanced", "risk_factor": 0.5},
-                {"name": "aggressive", "risk_factor": PROBABILITY_HIGH_THRESHOLD},
+                {
+                    "name": "aggressive",
+                    "risk_factor": constants.get(
+                        "PROBABILITY_HIGH_THRESHOLD", PROBABILITY_HIGH_THRESHOLD
+                    ),
+                },
             ],
         }
 
-    def run_simulation(self, scenario: str = "balanced") -> dict[str, Any]:
+    def run_simulation(
+        self,
+        scenario: str = "balanced",
+        streaming: bool = False,
+        spill_file: str | None = None,
+    ) -> dict[str, Any]:
         """
         시뮬레이션 실행
 
         Args:
             scenario: 시나리오 이름
+            streaming: True이면 detailed_results 대신 일자·지표별 온라인 통계만 유지
+            spill_file: 원시 일별 행을 기록할 컬럼형 파일 경로 (.npy 또는 .parquet)
 
         Returns:
             시뮬레이션 결과
@@ -103,69 +159,211 @@ class BalanceSimulator:
             scenario_config = self.config["scenarios"][1]  # 기본값: balanced
 
         results = []
-        random.seed(seed)
+        aggregator = StreamingAggregator(days, METRIC_COLUMNS) if streaming else None
+        spill = ColumnarSpill(spill_file, SPILL_COLUMNS) if spill_file else None
+        # 배치 모드와 같은 실행별 위험도 스트림 (같은 시드면 결과가 같음)
+        rng = RngService(seed)
 
-        for iteration in range(iterations):
-            # 초기 상태 설정
-            self.reset_simulation()
-            daily_results = []
+        try:
+            for iteration in range(iterations):
+                # 초기 상태 설정
+                self.reset_simulation()
+                daily_results = []
+                days_survived = 0
+
+                for day in range(days):
+                    # 일일 시뮬레이션
+                    risk_draw = rng.stream(RISK_SUBSYSTEM, day, run_session(iteration)).random()
+                    day_result = self.simulate_day(scenario_config, day, risk_draw)
+                    days_survived += 1
+                    if aggregator is not None or spill is not None:
+                        values = [day_result["metrics"][name.upper()] for name in METRIC_COLUMNS]
+                        if aggregator is not None:
+                            aggregator.add_day(day, np.array(values))
+                        if spill is not None:
+                            spill.append(np.array([iteration, day, *values]))
+                    if aggregator is None:
+                        daily_results.append(day_result)
+
+                    # 게임 오버 조건 확인
+                    if self.check_game_over():
+                        break
+
+                final_metrics = self._metrics_by_name()
+                if aggregator is not None:
+                    aggregator.add_runs(
+                        np.array([days_survived]),
+                        np.array([final_metrics[name.upper()] for name in METRIC_COLUMNS]),
+                    )
+                    continue
+
+                results.append(
+                    {
+                        "iteration": iteration,
+                        "days_survived": days_survived,
+                        "final_metrics": final_metrics,
+                        "daily_results": daily_results,
+                    }
+                )
+        finally:
+            if spill is not None:
+                spill.close()
+        if aggregator is not None:
+            return aggregator.summary(scenario)
+        return self.analyze_results(results, scenario)
 
-            for day in range(days):
-                # 일일 시뮬레이션
-                day_result = self.simulate_day(scenario_config, day)
-                daily_results.append(day_result)
+    def run_batch_simulation(
+        self,
+        scenario: str = "balanced",
+        mode: str = "vectorized",
+        iterations: int | None = None,
+        days: int | None = None,
+        streaming: bool = False,
+        spill_file: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        NumPy 배치 모드로 시뮬레이션 실행
 
-                # 게임 오버 조건 확인
-                if self.check_game_over():
-                    break
+        모든 반복을 (실행 x 지표) 배열 하나로 동시에 진행합니다. 하루 진행
+        규칙, 이벤트/연쇄 효과 파일, 위험도 난수 스트림이 run_simulation()과 같으므로
+        같은 설정과 시드면 요약 통계도 같습니다.
 
-            results.append(
-                {
-                    "iteration": iteration,
-                    "days_survived": len(daily_results),
-                    "final_metrics": self.metrics_tracker.get_metrics(),
-                    "daily_results": daily_results,
-                }
+        Args:
+            scenario: 시나리오 이름
+            mode: "vectorized" 또는 "scalar" (교차 검증용)
+            iterations: 실행 수 (기본값: None, 설정값 사용)
+            days: 시뮬레이션 일수 (기본값: None, 설정값 사용)
+            streaming: True이면 일자·지표별 온라인 통계(daily_stats)를 요약에 포함
+            spill_file: 원시 일별 행을 기록할 컬럼형 파일 경로 (.npy 또는 .parquet)
+
+        Returns:
+            analyze_results와 같은 형태의 분석 결과 (detailed_results 제외)
+        """
+        events_file, tradeoff_file = self._data_files()
+        model = BalanceModel(self.config, events_file=events_file, tradeoff_file=tradeoff_file)
+        days = self.config["simulation"]["days"] if days is None else days
+        aggregator = StreamingAggregator(days, METRIC_COLUMNS) if streaming else None
+        spill = ColumnarSpill(spill_file, SPILL_COLUMNS) if spill_file else None
+        try:
+            result = BatchSimulator(model).run(
+                scenario,
+                iterations=iterations,
+                days=days,
+                mode=mode,
+                aggregator=aggregator,
+                spill=spill,
             )
+        finally:
+            if spill is not None:
+                spill.close()
+        if aggregator is not None:
+            return aggregator.summary(scenario)
+        return result.summary()
+
+    def run_sweep(
+        self,
+        risk_factors: list[float],
+        metric_grid: dict[str, list[float]] | None = None,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        mode: str = "vectorized",
+        iterations: int | None = None,
+        days: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        위험도 값과 초기 지표 격자의 모든 조합을 프로세스 풀로 병렬 실행
 
-        return self.analyze_results(results, scenario)
+        반복은 고정 크기 청크로 나뉘고 청크마다 시드에서 파생된 난수 스트림을
+        사용하므로, 결과는 워커 수와 관계없이 같습니다.
+
+        Args:
+            risk_factors: 위험도 값 목록
+            metric_grid: 지표 이름 → 초기값 후보 목록 (기본값: None)
+            workers: 워커 프로세스 수 (기본값: None, CPU 수)
+            chunk_size: 청크당 실행 수
+            mode: "vectorized" 또는 "scalar"
+            iterations: 조합별 실행 수 (기본값: None, 설정값 사용)
+            days: 시뮬레이션 일수 (기본값: None, 설정값 사용)
+
+        Returns:
+            조합별 분석 결과 목록 (detailed_results 제외)
+        """
+        events_file, tradeoff_file = self._data_files()
+        return run_sweep(
+            self.config,
+            build_sweep_points(risk_factors, metric_grid),
+            iterations=iterations,
+            days=days,
+            workers=workers,
+            chunk_size=chunk_size,
+            mode=mode,
+            events_file=events_file,
+            tradeoff_file=tradeoff_file,
+        )
+
+    def _data_files(self) -> tuple[str | None, str | None]:
+        """
+        이벤트/연쇄 효과 파일 경로 (없는 파일은 None)
+
+        기본값은 data/events.toml, data/tradeoff_matrix.toml입니다.
+        """
+        sim_config = self.config["simulation"]
+        events_file = sim_config.get("events_file", "data/events.toml")
+        tradeoff_file = sim_config.get("tradeoff_file", "data/tradeoff_matrix.toml")
+        return (
+            events_file if Path(events_file).exists() else None,
+            tradeoff_file if Path(tradeoff_file).exists() else None,
+        )
 
     def reset_simulation(self) -> None:
         """시뮬레이션 상태 초기화"""
         initial_metrics = self.config["initial_metrics"]
         self.metrics_tracker.reset()
+        self.event_engine.event_queue.clear()
+        self.event_engine.cooldowns.clear()
+        self.event_engine.current_turn = 0
 
         # 초기 지표 설정
         for metric, value in initial_metrics.items():
-            self.metrics_tracker.update_metric(metric.upper(), value)
+            self.metrics_tracker.update_metric(Metric[metric.upper()], value)
 
-    def simulate_day(self, scenario_config: dict[str, Any], day: int) -> dict[str, Any]:
+    def _metrics_by_name(self) -> dict[str, float]:
+        """현재 지표를 JSON 직렬화 가능한 이름 키 딕셔너리로 반환"""
+        return {metric.name: value for metric, value in self.metrics_tracker.get_metrics().items()}
+
+    def simulate_day(
+        self, scenario_config: dict[str, Any], day: int, risk_draw: float | None = None
+    ) -> dict[str, Any]:
         """
         일일 시뮬레이션
 
         Args:
             scenario_config: 시나리오 설정
-            day: 현재 날짜
+            day: 현재 날짜 (이벤트 쿨다운 턴)
+            risk_draw: 위험도 판정 난수 (기본값: None, 이 경우 self.rng의 일수별 스트림 사용)
 
         Returns:
             일일 결과
         """
         risk_factor = scenario_config["risk_factor"]
+        self.event_engine.current_turn = day
+        if risk_draw is None:
+            risk_draw = self.rng.daily_stream(RISK_SUBSYSTEM, day).random()
 
         # 경제 엔진 실행
         economy_result = self.economy_engine.process_daily_economics()
 
         # 이벤트 엔진 실행 (위험도에 따라 이벤트 발생 확률 조정)
-        if random.random() < risk_factor:
+        if risk_draw < risk_factor:
             events = self.event_engine.evaluate_triggers()
-            for event in events:
-                self.event_engine.apply_effects(event)
+            self.event_engine.event_queue.extend(events)
+            self.event_engine.apply_effects()
         else:
             events = []
 
         return {
             "day": day,
-            "metrics": self.metrics_tracker.get_metrics().copy(),
+            "metrics": self._metrics_by_name(),
             "economy_result": economy_result,
             "events": [event.id if hasattr(event, "id") else str(event) for event in events],
             "risk_factor": risk_factor,
@@ -181,15 +379,15 @@ class BalanceSimulator:
         metrics = self.metrics_tracker.get_metrics()
 
         # 파산 조건
-        if metrics.get("money", 0) <= MAGIC_NUMBER_ZERO:
+        if metrics.get(Metric.MONEY, 0) <= MAGIC_NUMBER_ZERO:
             return True
 
         # 극도의 스트레스 조건
-        if metrics.get("suffering", 0) >= MAGIC_NUMBER_ONE_HUNDRED:
+        if metrics.get(Metric.SUFFERING, 0) >= MAGIC_NUMBER_ONE_HUNDRED:
             return True
 
         # 평판 파탄 조건
-        if metrics.get("reputation", 0) <= MAGIC_NUMBER_ZERO:
+        if metrics.get(Metric.REPUTATION, 0) <= MAGIC_NUMBER_ZERO:
             return True
 
         return False
@@ -263,17 +461,75 @@ class BalanceSimulator:
                 print(f"  {metric}: {value:.1f}")
 
 
+def _parse_float_list(text: str) -> list[float]:
+    """쉼표로 구분된 실수 목록을 파싱합니다."""
+    return [float(value) for value in text.split(",") if value.strip()]
+
+
 def main() -> None:
     """메인 함수"""
     parser = argparse.ArgumentParser(description="게임 밸런스 시뮬레이터")
     parser.add_argument("--config", default="data/balance_config.json", help="설정 파일 경로")
     parser.add_argument("--scenario", default="balanced", help="시나리오 이름")
     parser.add_argument("--output", help="결과 출력 파일 경로")
+    parser.add_argument("--batch", action="store_true", help="NumPy 배치 모드로 실행")
+    parser.add_argument("--mode", default="vectorized", choices=SIMULATION_MODES, help="배치 실행 모드")
+    parser.add_argument("--iterations", type=int, help="배치 모드 실행 수 (기본값: 설정값)")
+    parser.add_argument("--days", type=int, help="배치 모드 시뮬레이션 일수 (기본값: 설정값)")
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="반복별 상세 결과 대신 일자·지표별 온라인 통계만 유지",
+    )
+    parser.add_argument("--spill", help="원시 일별 행을 기록할 컬럼형 파일 (.npy 또는 .parquet)")
+    parser.add_argument(
+        "--sweep-risk", type=_parse_float_list, help="스윕할 위험도 값 (쉼표 구분, 예: 0.1,0.5)"
+    )
+    parser.add_argument(
+        "--sweep-metric",
+        action="append",
+        default=[],
+        help="스윕할 초기 지표 격자 (예: money=5000,10000, 여러 번 지정 가능)",
+    )
+    parser.add_argument("--workers", type=int, help="스윕 워커 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="스윕 청크당 실행 수")
 
     args = parser.parse_args()
 
     simulator = BalanceSimulator(args.config)
-    results = simulator.run_simulation(args.scenario)
+    if args.sweep_risk:
+        metric_grid = {}
+        for spec in args.sweep_metric:
+            name, _, values = spec.partition("=")
+            metric_grid[name.strip().lower()] = _parse_float_list(values)
+        sweep_results = simulator.run_sweep(
+            args.sweep_risk,
+            metric_grid,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            mode=args.mode,
+            iterations=args.iterations,
+            days=args.days,
+        )
+        for results in sweep_results:
+            simulator.print_summary(results)
+        if args.output:
+            simulator.save_results({"sweep": sweep_results}, args.output)
+        return
+
+    if args.batch:
+        results = simulator.run_batch_simulation(
+            args.scenario,
+            mode=args.mode,
+            iterations=args.iterations,
+            days=args.days,
+            streaming=args.streaming,
+            spill_file=args.spill,
+        )
+    else:
+        results = simulator.run_simulation(
+            args.scenario, streaming=args.streaming, spill_file=args.spill
+        )
 
     simulator.print_summary(results)
 
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+파일: dev_tools/batch_simulator.py
+설명: NumPy 기반 몬테카를로 배치 밸런스 시뮬레이터
+
+N개의 게임을 (실행 x 지표) 배열 하나로 표현하고, BalanceSimulator.simulate_day()의
+하루(경제 처리, 위험도 판정, THRESHOLD 이벤트 효과, 지표 추적기 연쇄 효과,
+tradeoff_matrix.toml 연쇄 효과)를 배열 연산으로 한 번에 적용합니다.
+
+두 가지 실행 모드를 제공합니다:
+- "vectorized": 모든 실행을 배열 연산으로 동시에 진행
+- "scalar": 실행마다 BalanceSimulator를 두고 같은 위험도 난수로 simulate_day()를
+  호출 (MetricsTracker, EconomyEngine, EventEngine을 그대로 사용하는 교차 검증용)
+
+위험도 난수는 RngService의 "balance.risk" 스트림에서 실행(세션 "run-<번호>")과
+일수별로 뽑으므로, 같은 시드라면 두 모드와 BalanceSimulator.run_simulation()의
+결과가 일치합니다.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from dev_tools.streaming_stats import ColumnarSpill, StreamingAggregator
+from game_constants import (
+    FLOAT_EPSILON,
+    MAGIC_NUMBER_ONE_HUNDRED,
+    MAGIC_NUMBER_ZERO,
+    REPUTATION_BASELINE,
+    Metric,
+    get_constants_snapshot,
+)
+from src.core.rng import RngService, draw_uniforms
+from src.economy.models import load_economy_config
+from src.events.catalog import EventCatalog, load_catalog
+from src.events.trigger_index import resolve_metric
+from src.metrics.state import METRIC_ORDER, METRIC_ORDINAL
+from src.metrics.tracker import MetricsTracker, threshold_cascade_plan
+
+if TYPE_CHECKING:
+    from dev_tools.balance_simulator import BalanceSimulator
+
+# 지표 열 순서 (배열의 열 인덱스 = METRICS 내 위치, MetricsTracker와 같음)
+METRICS: tuple[Metric, ...] = METRIC_ORDER
+METRIC_INDEX: dict[Metric, int] = METRIC_ORDINAL
+
+MONEY = METRIC_INDEX[Metric.MONEY]
+REPUTATION = METRIC_INDEX[Metric.REPUTATION]
+HAPPINESS = METRIC_INDEX[Metric.HAPPINESS]
+SUFFERING = METRIC_INDEX[Metric.SUFFERING]
+INVENTORY = METRIC_INDEX[Metric.INVENTORY]
+DEMAND = METRIC_INDEX[Metric.DEMAND]
+
+HAPPINESS_SUFFERING_SUM = 100.0
+SIMULATION_MODES = ("vectorized", "scalar")
+# 스트리밍 집계/스필에 사용하는 지표 열 이름
+METRIC_COLUMNS = tuple(metric.name.lower() for metric in METRICS)
+SPILL_COLUMNS = ("iteration", "day", *METRIC_COLUMNS)
+# 일일 위험도 판정 난수 스트림 (실행마다 세션 하나)
+RISK_SUBSYSTEM = "balance.risk"
+
+
+def run_session(iteration: int) -> str:
+    """실행 번호의 난수 세션 이름"""
+    return f"run-{iteration}"
+
+
+@dataclass
+class BatchResult:
+    """배치 시뮬레이션 결과"""
+
+    scenario: str
+    days: int
+    final_metrics: np.ndarray  # (실행 수, 지표 수)
+    days_survived: np.ndarray  # (실행 수,)
+    daily_mean: np.ndarray  # (일수, 지표 수): 해당 일에 생존한 실행의 평균
+    daily_alive: np.ndarray  # (일수,): 해당 일을 마친 생존 실행 수
+
+    @property
+    def iterations(self) -> int:
+        """실행 수"""
+        return int(self.final_metrics.shape[0])
+
+    def summary(self) -> dict[str, Any]:
+        """
+        BalanceSimulator.analyze_results와 같은 형태의 요약을 반환합니다.
+
+        Returns:
+            분석 결과 (detailed_results 제외)
+        """
+        successful = self.days_survived >= self.days
+        final_metrics_avg: dict[str, float] = {}
+        if successful.any():
+            means = self.final_metrics[successful].mean(axis=0)
+            final_metrics_avg = {name: float(means[i]) for i, name in enumerate(METRIC_COLUMNS)}
+
+        return {
+            "scenario": self.scenario,
+            "total_iterations": self.iterations,
+            "success_rate": float(successful.mean()) if self.iterations else 0.0,
+            "avg_survival_days": float(self.days_survived.mean()) if self.iterations else 0.0,
+            "final_metrics_avg": final_metrics_avg,
+        }
+
+
+class BalanceModel:
+    """
+    배치 시뮬레이션 모델
+
+    시뮬레이션 설정, 경제 설정, 이벤트 카탈로그(이벤트 정의와 연쇄 효과 매트릭스)를
+    보관합니다. BalanceSimulator의 EventEngine과 같은 파일을 읽습니다.
+    """
+
+    def __init__(
+        self,
+        config: dict[str, Any],
+        events_file: str | None = None,
+        tradeoff_file: str | None = None,
+        economy_config: dict[str, Any] | None = None,
+        max_cascade_depth: int = 10,
+    ) -> None:
+        """
+        BalanceModel 초기화
+
+        Args:
+            config: BalanceSimulator 설정 (simulation, initial_metrics, scenarios)
+            events_file: 이벤트 정의 파일 경로 (기본값: None, 이벤트 없음)
+            tradeoff_file: 트레이드오프 매트릭스 파일 경로 (기본값: None, 연쇄 효과 없음)
+            economy_config: 경제 설정 (기본값: None, 이 경우 설정 파일에서 로드)
+            max_cascade_depth: 최대 연쇄 깊이 (기본값: 10)
+        """
+        self.config = config
+        self.events_file = events_file
+        self.tradeoff_file = tradeoff_file
+        self.economy_config = economy_config or load_economy_config()
+        self.max_cascade_depth = max_cascade_depth
+        self.catalog: EventCatalog = load_catalog(events_file, tradeoff_file)
+
+        # BalanceSimulator.reset_simulation()과 같이 설정 순서대로 update_metric() 적용
+        tracker = MetricsTracker()
+        for name, value in config.get("initial_metrics", {}).items():
+            metric = resolve_metric(name)
+            if metric is not None:
+                tracker.update_metric(metric, float(value))
+        self.initial_metrics = tracker.get_metrics_array().copy()
+
+        # 매일 실행마다 뽑는 난수 열 수 (0번 열은 일일 위험도 판정용)
+        self.draw_columns = 1
+
+    def scenario_config(self, scenario: str) -> dict[str, Any]:
+        """시나리오 설정을 찾습니다 (없으면 두 번째 시나리오 사용)."""
+        scenarios = self.config["scenarios"]
+        found = next((s for s in scenarios if s["name"] == scenario), None)
+        return found if found is not None else scenarios[min(1, len(scenarios) - 1)]
+
+    @property
+    def price(self) -> int:
+        """판매 가격 (경제 설정의 optimal_price)"""
+        return self.economy_config.get("demand", {}).get("optimal_price", 10000)
+
+
+class BatchSimulator:
+    """NumPy 배열 기반 몬테카를로 밸런스 시뮬레이터"""
+
+    def __init__(self, model: BalanceModel) -> None:
+        """
+        BatchSimulator 초기화
+
+        Args:
+            model: 배치 시뮬레이션 모델
+        """
+        self.model = model
+
+    def run(
+        self,
+        scenario: str = "balanced",
+        iterations: int | None = None,
+        days: int | None = None,
+        seed: int | None = None,
+        mode: str = "vectorized",
+        aggregator: StreamingAggregator | None = None,
+        spill: ColumnarSpill | None = None,
+    ) -> BatchResult:
+        """
+        배치 시뮬레이션 실행
+
+        Args:
+            scenario: 시나리오 이름
+            iterations: 실행 수 (기본값: None, 설정값 사용)
+            days: 시뮬레이션 일수 (기본값: None, 설정값 사용)
+            seed: 난수 시드 (기본값: None, 설정값 사용)
+            mode: "vectorized" 또는 "scalar"
+            aggregator: 일자별 온라인 통계 집계기 (기본값: None)
+            spill: 원시 일별 행 기록기 (기본값: None)
+
+        Returns:
+            BatchResult: 시뮬레이션 결과
+        """
+        if mode not in SIMULATION_MODES:
+            raise ValueError(f"지원되지 않는 시뮬레이션 모드: {mode}")
+
+        sim_config = self.model.config["simulation"]
+        iterations = sim_config["iterations"] if iterations is None else iterations
+        days = sim_config["days"] if days is None else days
+        seed = sim_config["random_seed"] if seed is None else seed
+        rng = RngService(seed)
+        return self.run_with_rng(scenario, iterations, days, rng, mode, aggregator, spill)
+
+    def run_with_rng(
+        self,
+        scenario: str,
+        iterations: int,
+        days: int,
+        rng: RngService,
+        mode: str = "vectorized",
+        aggregator: StreamingAggregator | None = None,
+        spill: ColumnarSpill | None = None,
+    ) -> BatchResult:
+        """
+        주어진 난수 서비스로 배치 시뮬레이션을 실행합니다.
+
+        매일 실행별 위험도 스트림에서 (실행 수 x 난수 열 수) 크기의 난수를 한 번에
+        뽑으므로, 두 모드와 run_simulation()은 같은 난수를 사용합니다.
+
+        aggregator가 주어지면 하루를 마친 실행의 지표를 일자별 온라인 통계에,
+        spill이 주어지면 (iteration, day, 지표...) 행을 컬럼형 파일에 기록합니다.
+        """
+        model = self.model
+        scenario_config = model.scenario_config(scenario)
+
+        state = np.tile(model.initial_metrics, (iterations, 1))
+        alive = np.ones(iterations, dtype=bool)
+        days_survived = np.zeros(iterations, dtype=np.int64)
+        last_fired = np.full((iterations, len(model.catalog)), -np.inf)
+        daily_mean = np.zeros((days, len(METRICS)), dtype=np.float64)
+        daily_alive = np.zeros(days, dtype=np.int64)
+        runs = self._scalar_runs(iterations) if mode == "scalar" else None
+        # 실행별 위험도 스트림 키 (rng.uniforms()와 같은 값을 매일 키 계산 없이 뽑음)
+        keys = np.array(
+            [rng.key(RISK_SUBSYSTEM, run_session(iteration)) for iteration in range(iterations)],
+            dtype=np.uint64,
+        )
+
+        for day in range(days):
+            if not alive.any():
+                continue
+            draws = draw_uniforms(keys, day, model.draw_columns)
+
+            if runs is None:
+                self._step_vectorized(
+                    state, alive, last_fired, draws, day, scenario_config["risk_factor"]
+                )
+            else:
+                self._step_scalar(runs, state, alive, draws, day, scenario_config)
+
+            # 하루를 마친 실행 기록 후 게임 오버 판정
+            days_survived[alive] = day + 1
+            game_over = alive & (
+                (state[:, MONEY] <= MAGIC_NUMBER_ZERO)
+                | (state[:, SUFFERING] >= MAGIC_NUMBER_ONE_HUNDRED)
+                | (state[:, REPUTATION] <= MAGIC_NUMBER_ZERO)
+            )
+            daily_alive[day] = int(alive.sum())
+            daily_mean[day] = state[alive].mean(axis=0)
+            if aggregator is not None:
+                aggregator.add_day(day, state[alive])
+            if spill is not None:
+                rows = np.flatnonzero(alive)
+                spill.append(
+                    np.column_stack([rows, np.full(rows.size, day), state[rows]]).astype(np.float64)
+                )
+            alive &= ~game_over
+
+        if aggregator is not None:
+            aggregator.add_runs(days_survived, state)
+
+        return BatchResult(
+            scenario=scenario,
+            days=days,
+            final_metrics=state,
+            days_survived=days_survived,
+            daily_mean=daily_mean,
+            daily_alive=daily_alive,
+        )
+
+    # ------------------------------------------------------------------
+    # 벡터화 모드
+    # ------------------------------------------------------------------
+
+    def _update_block(self, block: np.ndarray, updates: dict[Metric, np.ndarray]) -> None:
+        """
+        MetricsTracker.tradeoff_update_metrics()와 같이 업데이트, 행복-고통 시소,
+        지표 추적기 연쇄 효과(임계값 규칙 한 단계)를 적용합니다.
+        """
+        for metric, values in updates.items():
+            block[:, METRIC_INDEX[metric]] = values
+        if Metric.HAPPINESS in updates:
+            block[:, SUFFERING] = HAPPINESS_SUFFERING_SUM - block[:, HAPPINESS]
+        elif Metric.SUFFERING in updates:
+            block[:, HAPPINESS] = HAPPINESS_SUFFERING_SUM - block[:, SUFFERING]
+
+        plan = threshold_cascade_plan(MetricsTracker.cascade_thresholds)
+        cascade_updates = plan.propagate_level_batch(
+            lambda column: block[:, column], [METRIC_INDEX[metric] for metric in updates]
+        )
+        for metric, values in cascade_updates.items():
+            block[:, METRIC_INDEX[metric]] = values
+
+    def _cascade(self, block: np.ndarray, changed: set[Metric]) -> None:
+        """EventEngine._process_cascade_effects()와 같이 매트릭스 연쇄 효과를 적용합니다."""
+        updates = self.model.catalog.cascade_plan.propagate_batch(
+            lambda column: block[:, column],
+            [METRIC_INDEX[metric] for metric in changed],
+            self.model.max_cascade_depth,
+        )
+        if updates:
+            self._update_block(block, updates)
+
+    def _step_vectorized(
+        self,
+        state: np.ndarray,
+        alive: np.ndarray,
+        last_fired: np.ndarray,
+        draws: np.ndarray,
+        day: int,
+        risk_factor: float,
+    ) -> None:
+        """살아있는 모든 실행을 하루 진행합니다."""
+        model = self.model
+        catalog = model.catalog
+        rows = np.flatnonzero(alive)
+        block = state[rows]
+
+        # 1. 경제 처리 (EconomyEngine.process_daily_economics)
+        demand_config = model.economy_config.get("demand", {})
+        profit_config = model.economy_config.get("profit", {})
+        price = model.price
+        base_demand = demand_config.get("base_demand", 50)
+        price_elasticity = demand_config.get("price_elasticity", -0.5)
+        reputation_effect = demand_config.get("reputation_effect", 0.2)
+        optimal_price = demand_config.get("optimal_price", 10000)
+        baseline = float(get_constants_snapshot().get("REPUTATION_BASELINE", REPUTATION_BASELINE))
+
+        price_factor = 1.0
+        if optimal_price > 0 and price != optimal_price:
+            price_factor = 1 + price_elasticity * (price - optimal_price) / optimal_price
+        reputation = block[:, REPUTATION]
+        reputation_factor = np.where(
+            reputation != baseline, 1 + reputation_effect * (reputation - baseline) / baseline, 1.0
+        )
+        demand = np.round(np.maximum(0, base_demand * price_factor * reputation_factor))
+        inventory = np.trunc(block[:, INVENTORY])
+        units_sold = np.minimum(demand, inventory)
+        revenue = units_sold * price
+        total_cost = units_sold * profit_config.get("base_unit_cost", 3000) + profit_config.get(
+            "fixed_cost_daily", 15000
+        )
+        self._update_block(
+            block,
+            {
+                Metric.MONEY: block[:, MONEY] + (revenue - total_cost),
+                Metric.INVENTORY: np.maximum(inventory - units_sold, 0),
+                Metric.DEMAND: demand,
+            },
+        )
+
+        # 2. 위험도 판정을 통과한 실행의 THRESHOLD 이벤트 판정 (EventEngine.evaluate_triggers)
+        event_day = draws[rows, 0] < risk_factor
+        current = block[:, catalog.threshold_columns]
+        fire_masks = [
+            event_day & _compare(current[:, i], condition, catalog.threshold_values[i])
+            for i, condition in enumerate(catalog.threshold_conditions)
+        ]
+
+        # 3. 원래 이벤트 순서로 쿨다운, 효과, 연쇄 효과 적용 (EventEngine.apply_effects)
+        for i, position in enumerate(catalog.threshold_positions):
+            fires = fire_masks[i]
+            cooldown = catalog.cooldowns[position]
+            if cooldown > 0:
+                fires = fires & ~(day - last_fired[rows, position] < cooldown)
+            fired = np.flatnonzero(fires)
+            if fired.size == 0:
+                continue
+            last_fired[rows[fired], position] = day
+            effects = catalog.effects[position]
+            if not effects:
+                continue
+
+            sub = block[fired]
+            updates = {
+                effect.metric: effect.formula.apply_batch(sub[:, effect.column])
+                for effect in effects
+            }
+            self._update_block(sub, updates)
+            self._cascade(sub, set(updates))
+            block[fired] = sub
+
+        state[rows] = block
+
+    # ------------------------------------------------------------------
+    # 스칼라 모드 (교차 검증용)
+    # ------------------------------------------------------------------
+
+    def _scalar_runs(self, iterations: int) -> list["BalanceSimulator"]:
+        """실행마다 이 모델로 초기화한 BalanceSimulator를 만듭니다."""
+        # 순환 import 방지 (balance_simulator가 이 모듈을 import함)
+        from dev_tools.balance_simulator import BalanceSimulator
+
+        runs = [BalanceSimulator(model=self.model) for _ in range(iterations)]
+        for simulator in runs:
+            simulator.reset_simulation()
+        return runs
+
+    def _step_scalar(
+        self,
+        runs: list["BalanceSimulator"],
+        state: np.ndarray,
+        alive: np.ndarray,
+        draws: np.ndarray,
+        day: int,
+        scenario_config: dict[str, Any],
+    ) -> None:
+        """살아있는 실행마다 같은 위험도 난수로 BalanceSimulator.simulate_day()를 호출합니다."""
+        for row in np.flatnonzero(alive):
+            simulator = runs[row]
+            simulator.simulate_day(scenario_config, day, risk_draw=float(draws[row, 0]))
+            state[row] = simulator.metrics_tracker.get_metrics_array()
+
+
+def _compare(current: Any, condition: str, threshold: float) -> Any:
+    """트리거 조건을 스칼라 또는 배열에 대해 평가합니다."""
+    if condition == "LESS_THAN":
+        return current < threshold
+    if condition == "GREATER_THAN":
+        return current > threshold
+    if condition == "LESS_THAN_OR_EQUAL":
+        return current <= threshold
+    if condition == "GREATER_THAN_OR_EQUAL":
+        return current >= threshold
+    if condition == "EQUAL":
+        return abs(current - threshold) < FLOAT_EPSILON
+    return abs(current - threshold) >= FLOAT_EPSILON  # NOT_EQUAL
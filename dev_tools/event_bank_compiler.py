@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+파일: dev_tools/event_bank_compiler.py
+설명: 이벤트 뱅크 바이너리 컴파일러
+
+data/events_generated, data/events_bank 등의 JSON/TOML 이벤트 파일을 읽어
+Pydantic 스키마로 한 번 검증한 뒤, 실행 시점에 파일 탐색과 JSON 파싱 없이
+바로 읽을 수 있는 바이너리 뱅크(src/events/bank.py 형식)로 묶습니다.
+
+사용 예:
+    python -m dev_tools.event_bank_compiler                 # 기본 입력으로 빌드
+    python -m dev_tools.event_bank_compiler --check         # 뱅크가 최신인지 확인
+    python -m dev_tools.event_bank_compiler --input data/events "*/*.toml"
+"""
+
+import argparse
+import json
+import sys
+import tomllib
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.events.bank import (  # noqa: E402
+    BANK_SUFFIX,
+    DEFAULT_BANK_INPUTS,
+    EventBank,
+    EventBankError,
+    collect_sources,
+    write_event_bank,
+)
+from src.events.schema import Event  # noqa: E402
+
+DEFAULT_BANK_PATH = PROJECT_ROOT / "data" / f"events{BANK_SUFFIX}"
+
+
+@dataclass
+class CompileReport:
+    """컴파일 결과 요약"""
+
+    output: str
+    content_hash: str = ""
+    source_files: int = 0
+    compiled: int = 0
+    invalid: list[dict[str, Any]] = field(default_factory=list)
+    duplicates: list[str] = field(default_factory=list)
+
+
+def _read_events(path: Path) -> list[dict[str, Any]]:
+    """JSON/TOML 파일에서 이벤트 dict 목록을 읽습니다 (단일 이벤트 파일 포함)."""
+    if path.suffix == ".toml":
+        with open(path, "rb") as f:
+            data: Any = tomllib.load(f)
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+    if isinstance(data, list):
+        return [event for event in data if isinstance(event, dict)]
+    if isinstance(data, dict):
+        if isinstance(data.get("events"), list):
+            return [event for event in data["events"] if isinstance(event, dict)]
+        if "id" in data and "effects" in data:
+            return [data]
+    return []
+
+
+def _group_name(path: Path, base: Path, event: dict[str, Any]) -> str:
+    """이벤트 그룹 이름 (하위 디렉토리 이름, 없으면 이벤트 카테고리)."""
+    relative = path.relative_to(base)
+    if len(relative.parts) > 1:
+        return relative.parts[0]
+    return str(event.get("category", ""))
+
+
+def compile_event_bank(
+    output: Path = DEFAULT_BANK_PATH,
+    inputs: Sequence[tuple[str, str]] = DEFAULT_BANK_INPUTS,
+    root: Path = PROJECT_ROOT,
+) -> CompileReport:
+    """
+    이벤트 파일들을 검증하고 바이너리 뱅크로 컴파일합니다.
+
+    검증에 실패한 이벤트와 중복 ID(먼저 나온 이벤트를 사용)는 뱅크에서 빼고
+    보고서에 기록합니다.
+
+    Args:
+        output: 출력 뱅크 경로
+        inputs: (루트 기준 디렉토리, glob 패턴) 목록
+        root: 입력 디렉토리의 기준 경로
+
+    Returns:
+        CompileReport: 컴파일 결과 요약
+    """
+    report = CompileReport(output=str(output))
+    files = collect_sources(root, inputs)
+    report.source_files = len(files)
+
+    bases = [root / directory for directory, _pattern in inputs]
+    compiled: list[tuple[Event, str, Path]] = []
+    seen: set[str] = set()
+    for path in files:
+        base = next((b for b in bases if path.is_relative_to(b)), root)
+        try:
+            raw_events = _read_events(path)
+        except (OSError, ValueError) as e:
+            print(f"❌ 파일 로드 오류 ({path}): {e!s}")
+            continue
+
+        for raw in raw_events:
+            event_id = raw.get("id", "unknown")
+            try:
+                event = Event.model_validate(raw)
+            except ValidationError as e:
+                report.invalid.append(
+                    {
+                        "id": event_id,
+                        "source_file": path.relative_to(root).as_posix(),
+                        "errors": [
+                            f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                            for error in e.errors()
+                        ],
+                    }
+                )
+                continue
+            if event.id in seen:
+                report.duplicates.append(event.id)
+                continue
+            seen.add(event.id)
+            compiled.append((event, _group_name(path, base, raw), path))
+
+    report.content_hash = write_event_bank(output, compiled, root, inputs, files)
+    report.compiled = len(compiled)
+    return report
+
+
+def check_event_bank(path: Path = DEFAULT_BANK_PATH) -> bool:
+    """
+    뱅크가 있고 원본과 일치하는지 확인합니다.
+
+    Args:
+        path: 뱅크 경로
+
+    Returns:
+        bool: 최신이면 True
+    """
+    if not path.exists():
+        return False
+    try:
+        with EventBank(path) as bank:
+            return not bank.is_stale()
+    except EventBankError:
+        return False
+
+
+def main() -> int:
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="이벤트 뱅크 바이너리 컴파일러")
+    parser.add_argument("--output", type=Path, default=DEFAULT_BANK_PATH, help="출력 뱅크 경로")
+    parser.add_argument(
+        "--input",
+        nargs=2,
+        action="append",
+        metavar=("DIR", "PATTERN"),
+        help="입력 디렉토리와 glob 패턴 (여러 번 지정 가능, 기본값: 생성/뱅크 이벤트)",
+    )
+    parser.add_argument("--check", action="store_true", help="빌드하지 않고 최신인지만 확인")
+    args = parser.parse_args()
+
+    if args.check:
+        fresh = check_event_bank(args.output)
+        print(f"{'✅ 최신' if fresh else '⚠️ 다시 빌드 필요'}: {args.output}")
+        return 0 if fresh else 1
+
+    inputs = [tuple(item) for item in args.input] if args.input else DEFAULT_BANK_INPUTS
+    report = compile_event_bank(args.output, inputs)
+    print(f"✅ {report.compiled}개 이벤트 컴파일 ({report.source_files}개 파일): {report.output}")
+    if report.invalid:
+        print(f"⚠️ 검증 실패로 제외된 이벤트 {len(report.invalid)}개")
+        for item in report.invalid:
+            print(f"  • {item['id']} ({item['source_file']}): {', '.join(item['errors'])}")
+    if report.duplicates:
+        print(f"⚠️ 중복 ID로 제외된 이벤트 {len(report.duplicates)}개")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
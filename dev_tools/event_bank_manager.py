@@ -5,7 +5,7 @@ import json
 import shutil
 import sys
 import tomllib  # Python 3.11+
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Any, ClassVar
@@ -14,6 +14,8 @@ from tqdm import tqdm
 
 from dev_tools.config import EVENT_CATEGORIES
 from game_constants import PROBABILITY_HIGH_THRESHOLD, SCORE_THRESHOLD_HIGH, SCORE_THRESHOLD_MEDIUM
+from dev_tools.event_validator import ValidationCache, validate_event_checks
+from src.events.bank import EventBank, ManifestEntry
 
 """
 파일: dev_tools/event_bank_manager.py
@@ -42,7 +44,7 @@ except ImportError:
     class _EventValidatorStub:
         """이벤트 검증기 스텁"""
 
-        def __init__(self) -> None:
+        def __init__(self, input_file: str = "") -> None:
             self.errors: list[str] = []
 
         def validate_event(self, event: dict[str, Any]) -> bool:
@@ -119,10 +121,15 @@ class EventBankManager:
     def __init__(self) -> None:
         """초기화"""
         print("🔧 EventBankManager 초기화 중...")
-        self.events: dict[str, list[dict[str, Any]]] = {
+        # 카테고리별 이벤트: 원본 파일에서 읽으면 list, 컴파일된 뱅크에서 읽으면
+        # 접근할 때 디코딩하는 BankRecords
+        self.events: dict[str, Sequence[dict[str, Any]]] = {
             category: [] for category in self.CATEGORIES
         }
-        self.validator = _EventValidator()
+        # 통계·필터링은 레코드 대신 매니페스트만 사용
+        self.manifest: list[ManifestEntry] = []
+        self._bank: EventBank | None = None
+        self.validator = _EventValidator("")
         self.simulator = _EventSimulator("", _SimulationConfig())
         self.data_dir = Path("data/events")
         self.out_dir = Path("out")
@@ -182,13 +189,99 @@ class EventBankManager:
                 print(f"❌ 파일 로드 오류 ({file_path}): {e!s}")
                 sys.stdout.flush()
 
-    def load_all_events(self) -> int:
+    def load_compiled_bank(self, bank_path: Path) -> int:
+        """
+        컴파일된 이벤트 뱅크에서 이벤트 로드 (JSON 파싱·스키마 검증 없음)
+
+        뱅크는 메모리 매핑된 채로 열어 두고, 이벤트 레코드는 접근할 때만
+        디코딩합니다.
+
+        Args:
+            bank_path: dev_tools/event_bank_compiler.py로 만든 뱅크 경로
+
+        Returns:
+            로드된 이벤트 수
+        """
+        bank = EventBank(bank_path)
+        if bank.is_stale():
+            print(f"⚠️ 이벤트 뱅크가 원본과 다릅니다: {bank_path}")
+            sys.stdout.flush()
+        return self._load_from_bank(bank)
+
+    def _load_from_bank(self, bank: EventBank) -> int:
+        """열린 이벤트 뱅크를 그룹(카테고리)별 지연 디코딩 시퀀스로 연결합니다."""
+        self.close()
+        positions: dict[str, list[int]] = {}
+        for entry in bank.manifest:
+            positions.setdefault(entry.group, []).append(entry.position)
+        for group, group_positions in positions.items():
+            self.events[group] = bank.records(group_positions)
+        self.manifest = list(bank.manifest)
+        self._bank = bank
+        print(f"📊 컴파일된 뱅크에서 {len(bank)}개 이벤트 로드 완료: {bank.path}")
+        sys.stdout.flush()
+        return len(bank)
+
+    def close(self) -> None:
+        """열려 있는 컴파일된 뱅크를 닫고 뱅크에서 읽은 이벤트를 비웁니다."""
+        if self._bank is None:
+            return
+        for category, events in list(self.events.items()):
+            if not isinstance(events, list):
+                self.events[category] = []
+        self.manifest = []
+        self._bank.close()
+        self._bank = None
+
+    @staticmethod
+    def _manifest_entry(
+        event: dict[str, Any], category: str, file_path: Path, position: int
+    ) -> ManifestEntry:
+        """원본 파일에서 읽은 이벤트의 매니페스트 항목 (offset은 파일 안의 순번)."""
+        return ManifestEntry(
+            id=str(event.get("id", "unknown")),
+            group=category,
+            category=str(event.get("category", category)),
+            type=str(event.get("type", "UNKNOWN")),
+            tags=tuple(event.get("tags", [])),
+            metrics=tuple(effect.get("metric", "UNKNOWN") for effect in event.get("effects", [])),
+            file=str(file_path),
+            position=position,
+            offset=position,
+            length=0,
+        )
+
+    def _add_file_events(
+        self, category: str, file_path: Path, events: list[dict[str, Any]]
+    ) -> None:
+        """원본 파일에서 읽은 이벤트와 매니페스트 항목을 추가합니다."""
+        category_events = self.events[category]
+        assert isinstance(category_events, list)
+        category_events.extend(events)
+        self.manifest.extend(
+            self._manifest_entry(event, category, file_path, i) for i, event in enumerate(events)
+        )
+
+    def load_all_events(self, compiled_bank: Path | None = None) -> int:
         """
         모든 이벤트 로드
 
+        Args:
+            compiled_bank: 컴파일된 이벤트 뱅크 경로 (기본값: None).
+                뱅크가 있고 원본 내용 해시가 일치하면 파일을 다시 파싱하지 않고
+                뱅크에서 읽습니다. 오래된 뱅크는 무시하고 원본 파일을 읽습니다.
+
         Returns:
             로드된 이벤트 수
         """
+        if compiled_bank is not None and compiled_bank.exists():
+            bank = EventBank(compiled_bank)
+            if not bank.is_stale():
+                return self._load_from_bank(bank)
+            bank.close()
+            print(f"⚠️ 이벤트 뱅크가 원본과 달라 원본 파일을 읽습니다: {compiled_bank}")
+            sys.stdout.flush()
+
         print("📂 이벤트 로드 시작...")
         sys.stdout.flush()
         total_events = 0
@@ -200,52 +293,92 @@ class EventBankManager:
                 sys.stdout.flush()
                 continue
 
-            # TOML 파일 로드
-            toml_files = list(category_dir.glob("*.toml"))
-            print(f"🔍 '{category}' 카테고리에서 {len(toml_files)}개의 TOML 파일 발견")
-            sys.stdout.flush()
-
-            for file_path in toml_files:
+            # TOML/JSON 파일 로드 (파일마다 출력하지 않고 카테고리별로 요약)
+            files = list(category_dir.glob("*.toml")) + list(category_dir.glob("*.json"))
+            category_events = 0
+            for file_path in files:
                 try:
-                    with open(file_path, "rb") as f:
-                        data = tomllib.load(f)
-                        events = data.get("events", [])
-                        if events:
-                            self.events[category].extend(events)
-                            total_events += len(events)
-                            print(f"✅ {len(events)}개 이벤트 로드: {file_path}")
-                            sys.stdout.flush()
+                    if file_path.suffix == ".toml":
+                        with open(file_path, "rb") as f:
+                            data = tomllib.load(f)
+                    else:
+                        with open(file_path, encoding="utf-8") as f:
+                            data = json.load(f)
+                    events = data.get("events", [])
+                    if events:
+                        self._add_file_events(category, file_path, events)
+                        category_events += len(events)
                 except Exception as e:
                     print(f"❌ 파일 로드 오류 ({file_path}): {e!s}")
-                    sys.stdout.flush()
 
-            # JSON 파일 로드
-            json_files = list(category_dir.glob("*.json"))
-            print(f"🔍 '{category}' 카테고리에서 {len(json_files)}개의 JSON 파일 발견")
-            sys.stdout.flush()
-
-            for file_path in json_files:
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        data = json.load(f)
-                        events = data.get("events", [])
-                        if events:
-                            self.events[category].extend(events)
-                            total_events += len(events)
-                            print(f"✅ {len(events)}개 이벤트 로드: {file_path}")
-                            sys.stdout.flush()
-                except Exception as e:
-                    print(f"❌ 파일 로드 오류 ({file_path}): {e!s}")
-                    sys.stdout.flush()
+            total_events += category_events
+            print(f"✅ '{category}': {len(files)}개 파일에서 {category_events}개 이벤트 로드")
 
         print(f"📊 총 {total_events}개 이벤트 로드 완료")
         sys.stdout.flush()
         return total_events
 
-    def validate_all_events(self) -> tuple[int, int]:
+    def filter_events(
+        self,
+        category: str | None = None,
+        event_type: str | None = None,
+        tag: str | None = None,
+        metric: str | None = None,
+    ) -> list[ManifestEntry]:
+        """
+        매니페스트만으로 조건에 맞는 이벤트를 찾습니다 (레코드 디코딩 없음).
+
+        Args:
+            category: 이벤트 그룹(카테고리) 이름
+            event_type: 이벤트 타입
+            tag: 포함해야 하는 태그
+            metric: 효과가 영향을 주어야 하는 메트릭
+
+        Returns:
+            조건에 맞는 매니페스트 항목 목록
+        """
+        return [
+            entry
+            for entry in self.manifest
+            if (category is None or entry.group == category)
+            and (event_type is None or entry.type == event_type)
+            and (tag is None or tag in entry.tags)
+            and (metric is None or metric in entry.metrics)
+        ]
+
+    def get_event(self, entry: ManifestEntry) -> dict[str, Any]:
+        """
+        매니페스트 항목의 이벤트 레코드를 읽습니다.
+
+        Args:
+            entry: filter_events 등으로 얻은 매니페스트 항목
+
+        Returns:
+            이벤트 데이터 (`_source_file` 포함)
+        """
+        if self._bank is not None:
+            event = self._bank.record_at(entry.position)
+            event["_source_file"] = entry.file
+            return event
+        for event in self.events.get(entry.group, []):
+            if event.get("id") == entry.id and event.get("_source_file", entry.file) == entry.file:
+                return event
+        raise KeyError(entry.id)
+
+    def validate_all_events(
+        self, workers: int | None = None, cache_path: Path | None = None
+    ) -> tuple[int, int]:
         """
         모든 이벤트 검증
 
+        이벤트 내용 해시별 검사 결과를 캐시하여 바뀌지 않은 이벤트는 다시
+        검사하지 않고, 나머지는 프로세스 풀에 나눠 검사합니다. 결과는 도착하는
+        대로 집계하므로 전체 검사 결과를 메모리에 모으지 않습니다.
+
+        Args:
+            workers: 검사 프로세스 수 (None이면 CPU 수)
+            cache_path: 검증 캐시 경로 (None이면 out_dir/validation_cache.json)
+
         Returns:
             (성공 수, 실패 수) 튜플
         """
@@ -255,33 +388,42 @@ class EventBankManager:
         self.failure_count = 0
         self.validation_errors = []
 
-        for category, events in self.events.items():
-            print(f"\n🔍 '{category}' 카테고리 이벤트 검증 중...")
-            sys.stdout.flush()
-
-            # 진행률 표시 추가
-            for event in tqdm(events, desc=f"Validating {category}", unit="event"):
-                event_id = event.get("id", "unknown")
+        cache = ValidationCache(cache_path or self.out_dir / "validation_cache.json")
+        total = sum(len(events) for events in self.events.values())
+        sources: list[tuple[str, str, str]] = []
+
+        def all_events() -> Generator[dict[str, Any], None, None]:
+            # 결과 보고에 필요한 정보만 남기고 이벤트 자체는 보관하지 않음
+            for category, events in self.events.items():
+                for event in events:
+                    event_id = event.get("id", "unknown")
+                    sources.append((category, event_id, event.get("_source_file", "unknown")))
+                    yield event
+
+        checks_iter = validate_event_checks(all_events(), cache, workers)
+        for position, checks in tqdm(checks_iter, total=total, desc="Validating", unit="event"):
+            errors = checks["structure_errors"]
+            if not errors:
+                self.success_count += 1
+                continue
 
-                # 이벤트 검증
-                if self.validator.validate_event(event):
-                    self.success_count += 1
-                    print(f"✅ 이벤트 검증 성공: {event_id}")
-                    sys.stdout.flush()
-                else:
-                    self.failure_count += 1
-                    error_info = {
-                        "id": event_id,
-                        "category": category,
-                        "errors": self.validator.errors.copy(),
-                        "source_file": event.get("_source_file", "unknown"),
-                    }
-                    self.validation_errors.append(error_info)
-                    print(f"❌ 이벤트 검증 실패: {event_id}")
-                    print(f"   오류: {', '.join(self.validator.errors)}")
-                    sys.stdout.flush()
+            self.failure_count += 1
+            category, event_id, source_file = sources[position]
+            self.validation_errors.append(
+                {
+                    "id": event_id,
+                    "category": category,
+                    "errors": errors,
+                    "source_file": source_file,
+                }
+            )
+            print(f"❌ 이벤트 검증 실패: {event_id}")
+            print(f"   오류: {', '.join(errors)}")
 
-        print(f"\n📊 검증 결과: 성공 {self.success_count}개, 실패 {self.failure_count}개")
+        if not self.dry_run:
+            cache.save()
+        print(f"\n♻️ 캐시 재사용 {cache.hits}개, 새로 검사 {cache.misses}개")
+        print(f"📊 검증 결과: 성공 {self.success_count}개, 실패 {self.failure_count}개")
         sys.stdout.flush()
         return (self.success_count, self.failure_count)
 
@@ -460,33 +602,21 @@ class EventBankManager:
             "tags": {},
         }
 
-        # 카테고리별 통계
+        # 카테고리별 통계 (len은 레코드를 디코딩하지 않음)
         for category, events in self.events.items():
             stats["total_events"] += len(events)
             stats["categories"][category] = len(events)
 
-            # 진행률 표시 추가
-            for event in tqdm(events, desc=f"Analyzing {category}", unit="event"):
-                # 타입별 통계
-                event_type = event.get("type", "UNKNOWN")
-                types_dict = stats["types"]
-                assert isinstance(types_dict, dict)
-                types_dict[event_type] = types_dict.get(event_type, 0) + 1
-
-                # 태그 통계
-                tags = event.get("tags", [])
-                tags_dict = stats["tags"]
-                assert isinstance(tags_dict, dict)
-                for tag in tags:
-                    tags_dict[tag] = tags_dict.get(tag, 0) + 1
-
-                # 메트릭 영향 통계
-                effects = event.get("effects", [])
-                metrics_dict = stats["metrics"]
-                assert isinstance(metrics_dict, dict)
-                for effect in effects:
-                    metric = effect.get("metric", "UNKNOWN")
-                    metrics_dict[metric] = metrics_dict.get(metric, 0) + 1
+        # 타입·태그·메트릭 영향 통계는 매니페스트만 사용
+        types_dict: dict[str, int] = stats["types"]
+        tags_dict: dict[str, int] = stats["tags"]
+        metrics_dict: dict[str, int] = stats["metrics"]
+        for entry in self.manifest:
+            types_dict[entry.type] = types_dict.get(entry.type, 0) + 1
+            for tag in entry.tags:
+                tags_dict[tag] = tags_dict.get(tag, 0) + 1
+            for metric in entry.metrics:
+                metrics_dict[metric] = metrics_dict.get(metric, 0) + 1
 
         print("✅ 통계 생성 완료")
         sys.stdout.flush()
@@ -505,19 +635,20 @@ class EventBankManager:
         print("📤 이벤트 뱅크 내보내기 시작...")
         sys.stdout.flush()
 
-        # 모든 이벤트를 하나의 리스트로 합치기
-        all_events = []
-        for category, events in self.events.items():
-            for event in events:
-                # _source_file 필드 제거
-                event_copy = event.copy()
-                event_copy.pop("_source_file", None)
-                all_events.append(event_copy)
-
-        # 결과 저장
+        # 결과 저장 (이벤트를 하나씩 써서 전체 목록을 메모리에 만들지 않음)
         if not self.dry_run:
             with open(output_path, "w", encoding="utf-8") as f:
-                json.dump({"events": all_events}, f, ensure_ascii=False, indent=2)
+                f.write('{\n  "events": [')
+                separator = "\n"
+                for events in self.events.values():
+                    for event in events:
+                        # _source_file 필드 제거
+                        event_copy = event.copy()
+                        event_copy.pop("_source_file", None)
+                        encoded = json.dumps(event_copy, ensure_ascii=False, indent=2)
+                        f.write(separator + "    " + encoded.replace("\n", "\n    "))
+                        separator = ",\n"
+                f.write("\n  ]\n}" if separator != "\n" else "]\n}")
             print(f"✅ 이벤트 뱅크가 {output_path}에 저장되었습니다.")
         else:
             print(f"🔍 [DRY RUN] 이벤트 뱅크가 {output_path}에 저장됩니다.")
@@ -703,6 +834,12 @@ def main() -> int:
     parser.add_argument("--merge", type=str, help="다른 이벤트 뱅크 병합 (디렉토리 경로)")
     parser.add_argument("--dry-run", action="store_true", help="실제 파일 변경 없이 실행")
     parser.add_argument("--output", type=str, default="out", help="출력 디렉토리 (기본값: out)")
+    parser.add_argument(
+        "--bank", type=str, help="컴파일된 이벤트 뱅크 경로 (최신이면 원본 대신 사용)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, help="검증 프로세스 수 (기본값: 0 = CPU 수)"
+    )
 
     args = parser.parse_args()
 
@@ -726,9 +863,11 @@ def main() -> int:
     manager.out_dir = Path(args.output)
     manager.out_dir.mkdir(exist_ok=True)
 
+    compiled_bank = Path(args.bank) if args.bank else None
+
     # 작업 실행
     if args.load:
-        manager.load_all_events()
+        manager.load_all_events(compiled_bank)
         stats = manager.generate_bank_statistics()
         print("\n📊 이벤트 뱅크 통계:")
         sys.stdout.flush()
@@ -740,15 +879,15 @@ def main() -> int:
 
     if args.validate:
         if not manager.events:
-            manager.load_all_events()
-        manager.validate_all_events()
+            manager.load_all_events(compiled_bank)
+        manager.validate_all_events(args.workers or None)
         report_path = manager.save_validation_report()
         print(f"📄 검증 리포트: {report_path}")
         sys.stdout.flush()
 
     if args.quality:
         if not manager.events:
-            manager.load_all_events()
+            manager.load_all_events(compiled_bank)
         metrics = manager.calculate_quality_metrics()
         print("\n📊 품질 메트릭 요약:")
         sys.stdout.flush()
@@ -766,12 +905,12 @@ def main() -> int:
 
     if args.simulate:
         if not manager.events:
-            manager.load_all_events()
+            manager.load_all_events(compiled_bank)
         manager.run_balance_simulation()
 
     if args.export:
         if not manager.events:
-            manager.load_all_events()
+            manager.load_all_events(compiled_bank)
         # 단일 파일로 내보내기
         output_path = manager.out_dir / "all_events.json"
         manager.export_bank_to_json(output_path)
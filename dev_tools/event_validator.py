@@ -7,8 +7,15 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
+import marshal
+import os
+import sys
 import tomllib  # Python 3.11+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -21,6 +28,21 @@ from game_constants import (
     MAGIC_NUMBER_ONE_THOUSAND,
     PROBABILITY_LOW_THRESHOLD,
     PROBABILITY_HIGH_THRESHOLD,
+    get_constants_snapshot,
+)
+
+# 검증 결과 캐시 형식 버전 (검사 결과 구조가 바뀌면 올림)
+VALIDATION_CACHE_VERSION = 1
+
+# 프로세스 풀에 한 번에 넘기는 이벤트 수
+VALIDATION_CHUNK_SIZE = 256
+
+# 이벤트 하나의 검사 결과 키 (validate_events 보고서의 이벤트 항목과 같음)
+CHECK_KEYS = (
+    "structure_errors",
+    "balance_warnings",
+    "uncertainty_assessments",
+    "no_right_answer_assessments",
 )
 
 
@@ -304,7 +326,8 @@ class EventValidator:
             for effect in event["effects"]:
                 if "probability" in effect:
                     prob = effect["probability"]
-                    if PROBABILITY_LOW_THRESHOLD <= prob <= PROBABILITY_HIGH_THRESHOLD:
+                    low_threshold, high_threshold = _probability_thresholds()
+                    if low_threshold <= prob <= high_threshold:
                         assessments.append("✓ 확률적 효과 - 적절한 불확실성")
                     else:
                         assessments.append("⚠ 확률적 효과 - 불확실성 부족")
@@ -369,10 +392,52 @@ class EventValidator:
 
         return assessments
 
-    def validate_events(self) -> dict[str, Any]:
+    def check_event(self, event: dict[str, Any]) -> dict[str, list[str]]:
+        """
+        이벤트 하나에 모든 검사(구조, 트리거, 효과, 선택지, 밸런스, 불확실성,
+        정답 없음 원칙)를 실행합니다.
+
+        Args:
+            event: 검증할 이벤트 데이터
+
+        Returns:
+            CHECK_KEYS별 오류·경고·평가 목록
+        """
+        # 구조 검증
+        structure_errors = self.validate_event_structure(event)
+
+        # 트리거 검증
+        if "triggers" in event:
+            structure_errors.extend(self.validate_triggers(event["triggers"]))
+
+        # 효과 검증
+        if "effects" in event:
+            structure_errors.extend(self.validate_effects(event["effects"]))
+
+        # 선택지 검증
+        if "choices" in event:
+            structure_errors.extend(self.validate_choices(event["choices"]))
+
+        return {
+            "structure_errors": structure_errors,
+            # 밸런스 검증
+            "balance_warnings": self.validate_balance(event),
+            # 불확실성 검증
+            "uncertainty_assessments": self.validate_uncertainty_elements(event),
+            # 정답 없음 원칙 검증
+            "no_right_answer_assessments": self.validate_no_right_answer_principle(event),
+        }
+
+    def validate_events(
+        self, cache: ValidationCache | None = None, workers: int | None = 1
+    ) -> dict[str, Any]:
         """
         전체 이벤트 검증 실행
 
+        Args:
+            cache: 이벤트 내용 해시별 검증 결과 캐시 (None이면 모두 검사)
+            workers: 검사 프로세스 수 (None이면 CPU 수)
+
         Returns:
             검증 결과 딕셔너리
         """
@@ -397,46 +462,9 @@ class EventValidator:
             },
         }
 
-        for i, event in enumerate(events):
-            event_result = {
-                "index": i,
-                "id": event.get("id", f"event_{i}"),
-                "structure_errors": [],
-                "balance_warnings": [],
-                "uncertainty_assessments": [],
-                "no_right_answer_assessments": [],
-            }
-
-            # 구조 검증
-            structure_errors = self.validate_event_structure(event)
-            event_result["structure_errors"] = structure_errors
-
-            # 트리거 검증
-            if "triggers" in event:
-                trigger_errors = self.validate_triggers(event["triggers"])
-                event_result["structure_errors"].extend(trigger_errors)
-
-            # 효과 검증
-            if "effects" in event:
-                effect_errors = self.validate_effects(event["effects"])
-                event_result["structure_errors"].extend(effect_errors)
-
-            # 선택지 검증
-            if "choices" in event:
-                choice_errors = self.validate_choices(event["choices"])
-                event_result["structure_errors"].extend(choice_errors)
-
-            # 밸런스 검증
-            balance_warnings = self.validate_balance(event)
-            event_result["balance_warnings"] = balance_warnings
-
-            # 불확실성 검증
-            uncertainty_assessments = self.validate_uncertainty_elements(event)
-            event_result["uncertainty_assessments"] = uncertainty_assessments
-
-            # 정답 없음 원칙 검증
-            no_right_answer_assessments = self.validate_no_right_answer_principle(event)
-            event_result["no_right_answer_assessments"] = no_right_answer_assessments
+        # 검사 결과는 입력 순서대로 도착하므로 바로 보고서에 이어 붙임
+        for i, checks in validate_event_checks(events, cache, workers):
+            event_result = {"index": i, "id": events[i].get("id", f"event_{i}"), **checks}
 
             # 통계 업데이트
             if not event_result["structure_errors"]:
@@ -508,11 +536,20 @@ class EventValidator:
             for event in problem_events[:5]:  # 최대 5개만 출력
                 print(f"  - {event['id']}: {len(event['structure_errors'])}개 오류")
 
-    def process(self) -> None:
-        """검증 프로세스 실행"""
+    def process(self, cache: ValidationCache | None = None, workers: int | None = 1) -> None:
+        """
+        검증 프로세스 실행
+
+        Args:
+            cache: 검증 결과 캐시 (None이면 모두 검사)
+            workers: 검사 프로세스 수 (None이면 CPU 수)
+        """
         print(f"🔍 이벤트 검증 시작: {self.input_file}")
 
-        results = self.validate_events()
+        results = self.validate_events(cache, workers)
+        if cache is not None:
+            cache.save()
+            print(f"♻️ 캐시 재사용 {cache.hits}개, 새로 검사 {cache.misses}개")
         self.print_summary(results)
 
         if self.output_file:
@@ -579,16 +616,261 @@ class EventValidator:
         }
 
 
+def _probability_thresholds() -> tuple[float, float]:
+    """현재 상수 스냅샷의 (낮은, 높은) 확률 임계값 (상수 리로드를 바로 반영)"""
+    snapshot = get_constants_snapshot()
+    return (
+        snapshot.get("PROBABILITY_LOW_THRESHOLD", PROBABILITY_LOW_THRESHOLD),
+        snapshot.get("PROBABILITY_HIGH_THRESHOLD", PROBABILITY_HIGH_THRESHOLD),
+    )
+
+
+@functools.cache
+def _rules_fingerprint_for(probability_thresholds: tuple[float, float]) -> str:
+    """검증 규칙 지문 (이 모듈 소스와 주어진 확률 임계값 기준)"""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    thresholds = (
+        MAGIC_NUMBER_ZERO,
+        MAGIC_NUMBER_TWO,
+        MAGIC_NUMBER_THREE,
+        MAGIC_NUMBER_FIFTY,
+        MAGIC_NUMBER_TWENTY,
+        MAGIC_NUMBER_ONE_THOUSAND,
+        *probability_thresholds,
+    )
+    digest.update(repr(thresholds).encode("utf-8"))
+    # 내용 해시에 쓰는 marshal 형식은 파이썬 버전마다 다를 수 있음
+    digest.update(repr(sys.version_info[:2]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _rules_fingerprint() -> str:
+    """검증 규칙 지문: 이 모듈 소스나 사용하는 상수 값(리로드 포함)이 바뀌면 달라집니다."""
+    return _rules_fingerprint_for(_probability_thresholds())
+
+
+def event_content_hash(event: dict[str, Any]) -> str:
+    """
+    이벤트 내용 해시 (`_source_file`은 무시).
+
+    JSON 직렬화보다 몇 배 빠른 marshal 직렬화를 BLAKE2b로 해시합니다. 키
+    순서가 바뀌면 다른 해시가 되지만, 이 경우 다시 검사할 뿐 결과는 같습니다.
+    marshal로 직렬화할 수 없는 값(TOML 날짜 등)이 있으면 JSON으로 대신합니다.
+
+    Args:
+        event: 이벤트 데이터
+
+    Returns:
+        16진수 해시 문자열 (32자)
+    """
+    if "_source_file" in event:
+        event = {key: value for key, value in event.items() if key != "_source_file"}
+    try:
+        encoded = marshal.dumps(event, 4)
+    except ValueError:
+        encoded = json.dumps(event, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class ValidationCache:
+    """
+    이벤트 내용 해시 → 검사 결과 캐시
+
+    JSON 파일에 저장되며, 캐시 형식 버전이나 검증 규칙 지문이 다르면 비어
+    있는 상태로 시작합니다. 대부분의 이벤트가 같은 검사 결과를 내므로 파일에는
+    서로 다른 결과 목록과 해시 → 결과 번호만 기록합니다.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """
+        초기화
+
+        Args:
+            path: 캐시 파일 경로 (None이면 메모리에만 보관)
+        """
+        self.path = Path(path) if path else None
+        self.entries: dict[str, dict[str, list[str]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        assert self.path is not None
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 검증 캐시를 읽을 수 없어 무시합니다 ({self.path}): {e!s}")
+            return
+        if (
+            data.get("version") == VALIDATION_CACHE_VERSION
+            and data.get("rules") == _rules_fingerprint()
+        ):
+            results = data.get("results", [])
+            self.entries = {key: results[i] for key, i in data.get("entries", {}).items()}
+
+    def get(self, key: str) -> dict[str, list[str]] | None:
+        """
+        캐시된 검사 결과를 반환합니다.
+
+        Args:
+            key: 이벤트 내용 해시
+
+        Returns:
+            검사 결과 (없으면 None)
+        """
+        checks = self.entries.get(key)
+        if checks is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return checks
+
+    def put(self, key: str, checks: dict[str, list[str]]) -> None:
+        """
+        검사 결과를 저장합니다.
+
+        Args:
+            key: 이벤트 내용 해시
+            checks: 검사 결과
+        """
+        self.entries[key] = checks
+        self._dirty = True
+
+    def save(self) -> None:
+        """바뀐 내용이 있으면 캐시 파일을 기록합니다 (임시 파일 후 교체)."""
+        if self.path is None or not self._dirty:
+            return
+        # 같은 검사 결과는 한 번만 기록
+        result_numbers: dict[str, int] = {}
+        entries = {}
+        for key, checks in self.entries.items():
+            encoded = json.dumps(checks, ensure_ascii=False, separators=(",", ":"))
+            entries[key] = result_numbers.setdefault(encoded, len(result_numbers))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": VALIDATION_CACHE_VERSION,
+                    "rules": _rules_fingerprint(),
+                    "results": [json.loads(encoded) for encoded in result_numbers],
+                    "entries": entries,
+                },
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(temp_path, self.path)
+        self._dirty = False
+
+
+def _check_chunk(events: list[dict[str, Any]]) -> list[dict[str, list[str]]]:
+    """
+    이벤트 묶음을 검사합니다 (프로세스 풀 작업 함수).
+
+    검사 중 예외가 난 이벤트는 묶음 전체를 중단하지 않고 구조 오류로 기록합니다.
+    """
+    validator = EventValidator("")
+    results = []
+    for event in events:
+        try:
+            results.append(validator.check_event(event))
+        except Exception as e:
+            checks: dict[str, list[str]] = {key: [] for key in CHECK_KEYS}
+            checks["structure_errors"].append(f"검증 중 예외 발생: {type(e).__name__}: {e!s}")
+            results.append(checks)
+    return results
+
+
+def validate_event_checks(
+    events: Iterable[dict[str, Any]],
+    cache: ValidationCache | None = None,
+    workers: int | None = 1,
+    chunk_size: int = VALIDATION_CHUNK_SIZE,
+) -> Iterator[tuple[int, dict[str, list[str]]]]:
+    """
+    이벤트들을 검사하여 (순번, 검사 결과)를 입력 순서대로 내보냅니다.
+
+    캐시에 같은 내용 해시가 있는 이벤트는 다시 검사하지 않습니다. 나머지는
+    chunk_size개씩 묶어 workers개 프로세스에 나눠 검사하고, 검사할 이벤트가
+    한 묶음 이하면 프로세스 풀을 만들지 않고 바로 검사합니다. 입력은
+    chunk_size * workers개 단위로 읽고 결과를 바로 내보내므로, 전체 이벤트나
+    전체 결과를 메모리에 모으지 않습니다.
+
+    Args:
+        events: 이벤트 데이터 (한 번만 순회)
+        cache: 검사 결과 캐시 (None이면 모두 검사)
+        workers: 프로세스 수 (None이면 CPU 수)
+        chunk_size: 프로세스 하나에 한 번에 넘기는 이벤트 수
+
+    Yields:
+        (입력 순번, CHECK_KEYS별 검사 결과)
+    """
+    workers = workers or os.cpu_count() or 1
+    executor: ProcessPoolExecutor | None = None
+
+    def check_window(
+        window: list[tuple[int, dict[str, Any]]],
+    ) -> Iterator[tuple[int, dict[str, list[str]]]]:
+        nonlocal executor
+        if cache is None:
+            keys: list[str] = []
+            results: list[dict[str, list[str]] | None] = [None] * len(window)
+        else:
+            keys = [event_content_hash(event) for _position, event in window]
+            results = [cache.get(key) for key in keys]
+        missing = [i for i, checks in enumerate(results) if checks is None]
+        if missing:
+            batch = [window[i][1] for i in missing]
+            if workers > 1 and len(batch) > chunk_size:
+                if executor is None:
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                chunks = [batch[i : i + chunk_size] for i in range(0, len(batch), chunk_size)]
+                checked = [
+                    checks for chunk in executor.map(_check_chunk, chunks) for checks in chunk
+                ]
+            else:
+                checked = _check_chunk(batch)
+            for i, checks in zip(missing, checked, strict=True):
+                results[i] = checks
+                if cache is not None:
+                    cache.put(keys[i], checks)
+
+        for (position, _event), checks in zip(window, results, strict=True):
+            assert checks is not None
+            yield position, {key: list(checks[key]) for key in CHECK_KEYS}
+
+    window_size = chunk_size * workers
+    window: list[tuple[int, dict[str, Any]]] = []
+    try:
+        for position, event in enumerate(events):
+            window.append((position, event))
+            if len(window) >= window_size:
+                yield from check_window(window)
+                window = []
+        if window:
+            yield from check_window(window)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
 def main() -> None:
     """메인 함수"""
     parser = argparse.ArgumentParser(description="이벤트 데이터 검증 도구")
     parser.add_argument("input", help="검증할 이벤트 파일 경로")
     parser.add_argument("--output", help="검증 결과 출력 파일 경로")
+    parser.add_argument("--cache", help="검증 결과 캐시 파일 경로 (바뀐 이벤트만 다시 검사)")
+    parser.add_argument("--workers", type=int, default=1, help="검사 프로세스 수 (0이면 CPU 수)")
 
     args = parser.parse_args()
 
     validator = EventValidator(args.input, args.output)
-    validator.process()
+    validator.process(ValidationCache(args.cache) if args.cache else None, args.workers or None)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+파일: dev_tools/scenario_sweep.py
+설명: 프로세스 풀 기반 밸런스 시나리오 스윕
+
+위험도(risk_factor) 값과 초기 지표 격자의 조합마다 배치 시뮬레이션을 실행합니다.
+각 조합의 반복은 고정 크기 청크로 나누어 ProcessPoolExecutor에 분배하고,
+청크별 부분 집계를 청크 순서대로 병합합니다.
+
+청크 경계와 청크별 난수 스트림은 시드와 (조합 번호, 청크 번호)로만 결정되므로
+워커 수와 관계없이 같은 결과를 얻습니다.
+"""
+
+import itertools
+import json
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from dev_tools.batch_simulator import (
+    METRICS,
+    SIMULATION_MODES,
+    BalanceModel,
+    BatchResult,
+    BatchSimulator,
+)
+from src.core.rng import RngService
+
+# 기본 청크 크기 (워커 수와 무관하게 고정되어야 결과가 재현됨)
+DEFAULT_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class SweepPoint:
+    """스윕의 한 조합 (시나리오 이름, 위험도, 초기 지표 덮어쓰기)"""
+
+    name: str
+    risk_factor: float
+    initial_metrics: tuple[tuple[str, float], ...] = ()
+
+    def build_config(self, base_config: dict[str, Any]) -> dict[str, Any]:
+        """기본 설정에 이 조합의 시나리오와 초기 지표를 덮어쓴 설정을 만듭니다."""
+        config = json.loads(json.dumps(base_config))
+        config["initial_metrics"].update(dict(self.initial_metrics))
+        config["scenarios"] = [{"name": self.name, "risk_factor": self.risk_factor}]
+        return config
+
+
+@dataclass
+class SweepAggregate:
+    """
+    analyze_results 형태로 병합 가능한 부분 집계
+
+    정수 합계는 병합 순서와 무관하고, 실수 합계는 청크 순서대로 병합하므로
+    워커 수가 달라도 같은 값이 나옵니다.
+    """
+
+    days: int
+    total_iterations: int = 0
+    successful_runs: int = 0
+    survival_days_sum: int = 0
+    final_metrics_sum: np.ndarray = field(default_factory=lambda: np.zeros(len(METRICS)))
+
+    @classmethod
+    def from_result(cls, result: BatchResult) -> "SweepAggregate":
+        """배치 결과 하나를 부분 집계로 변환합니다."""
+        successful = result.days_survived >= result.days
+        return cls(
+            days=result.days,
+            total_iterations=result.iterations,
+            successful_runs=int(successful.sum()),
+            survival_days_sum=int(result.days_survived.sum()),
+            final_metrics_sum=result.final_metrics[successful].sum(axis=0),
+        )
+
+    def merge(self, other: "SweepAggregate") -> "SweepAggregate":
+        """다른 부분 집계를 더한 새 집계를 반환합니다."""
+        return SweepAggregate(
+            days=self.days,
+            total_iterations=self.total_iterations + other.total_iterations,
+            successful_runs=self.successful_runs + other.successful_runs,
+            survival_days_sum=self.survival_days_sum + other.survival_days_sum,
+            final_metrics_sum=self.final_metrics_sum + other.final_metrics_sum,
+        )
+
+    def summary(self, scenario: str) -> dict[str, Any]:
+        """
+        BalanceSimulator.analyze_results와 같은 형태의 요약을 반환합니다.
+
+        Args:
+            scenario: 시나리오 이름
+
+        Returns:
+            분석 결과 (detailed_results 제외)
+        """
+        total = self.total_iterations
+        final_metrics_avg: dict[str, float] = {}
+        if self.successful_runs:
+            means = self.final_metrics_sum / self.successful_runs
+            final_metrics_avg = {
+                metric.name.lower(): float(means[i]) for i, metric in enumerate(METRICS)
+            }
+
+        return {
+            "scenario": scenario,
+            "total_iterations": total,
+            "success_rate": self.successful_runs / total if total else 0.0,
+            "avg_survival_days": self.survival_days_sum / total if total else 0.0,
+            "final_metrics_avg": final_metrics_avg,
+        }
+
+
+@dataclass(frozen=True)
+class _ChunkTask:
+    """워커 프로세스에 전달되는 청크 작업"""
+
+    point_index: int
+    chunk_index: int
+    config_json: str
+    scenario: str
+    iterations: int
+    days: int
+    seed: int
+    mode: str
+    events_file: str | None
+    tradeoff_file: str | None
+
+
+# 워커 프로세스별 모델 캐시 (같은 설정의 청크가 파일을 다시 읽지 않도록)
+_MODEL_CACHE: dict[tuple[str, str | None, str | None], BalanceModel] = {}
+
+
+def _get_model(task: _ChunkTask) -> BalanceModel:
+    """청크 작업에 맞는 BalanceModel을 캐시에서 가져오거나 만듭니다."""
+    key = (task.config_json, task.events_file, task.tradeoff_file)
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        model = BalanceModel(
+            json.loads(task.config_json),
+            events_file=task.events_file,
+            tradeoff_file=task.tradeoff_file,
+        )
+        _MODEL_CACHE[key] = model
+    return model
+
+
+def _run_chunk(task: _ChunkTask) -> SweepAggregate:
+    """
+    청크 하나를 실행합니다.
+
+    난수 스트림은 SeedSequence(seed, spawn_key=(조합 번호, 청크 번호))로
+    만들어지므로 어느 워커에서 실행되어도 같습니다.
+    """
+    sequence = np.random.SeedSequence(task.seed, spawn_key=(task.point_index, task.chunk_index))
+    rng = RngService(sequence)
+    simulator = BatchSimulator(_get_model(task))
+    result = simulator.run_with_rng(task.scenario, task.iterations, task.days, rng, task.mode)
+    return SweepAggregate.from_result(result)
+
+
+def build_sweep_points(
+    risk_factors: Iterable[float],
+    metric_grid: dict[str, Sequence[float]] | None = None,
+) -> list[SweepPoint]:
+    """
+    위험도 값과 초기 지표 격자의 모든 조합을 만듭니다.
+
+    Args:
+        risk_factors: 위험도 값 목록
+        metric_grid: 지표 이름 → 초기값 후보 목록 (기본값: None, 격자 없음)
+
+    Returns:
+        list[SweepPoint]: 조합 목록 (위험도 → 격자 순서)
+    """
+    metric_grid = metric_grid or {}
+    names = list(metric_grid)
+    points = []
+    for risk_factor in risk_factors:
+        for values in itertools.product(*(metric_grid[name] for name in names)):
+            overrides = tuple(zip(names, (float(v) for v in values), strict=True))
+            label = ",".join(f"{name}={value:g}" for name, value in overrides)
+            name = f"risk={risk_factor:g}" + (f" {label}" if label else "")
+            points.append(SweepPoint(name, float(risk_factor), overrides))
+    return points
+
+
+def run_sweep(
+    base_config: dict[str, Any],
+    points: Sequence[SweepPoint],
+    iterations: int | None = None,
+    days: int | None = None,
+    seed: int | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mode: str = "vectorized",
+    events_file: str | None = None,
+    tradeoff_file: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    시나리오 스윕 실행
+
+    Args:
+        base_config: BalanceSimulator 설정
+        points: 실행할 조합 목록
+        iterations: 조합별 실행 수 (기본값: None, 설정값 사용)
+        days: 시뮬레이션 일수 (기본값: None, 설정값 사용)
+        seed: 난수 시드 (기본값: None, 설정값 사용)
+        workers: 워커 프로세스 수 (기본값: None, CPU 수 / 1이면 현재 프로세스에서 실행)
+        chunk_size: 청크당 실행 수
+        mode: "vectorized" 또는 "scalar"
+        events_file: 이벤트 정의 파일 경로
+        tradeoff_file: 트레이드오프 매트릭스 파일 경로
+
+    Returns:
+        list[dict[str, Any]]: 조합별 analyze_results 형태의 요약 (points 순서)
+    """
+    if mode not in SIMULATION_MODES:
+        raise ValueError(f"지원되지 않는 시뮬레이션 모드: {mode}")
+    if chunk_size <= 0:
+        raise ValueError(f"청크 크기는 양수여야 합니다: {chunk_size}")
+
+    sim_config = base_config["simulation"]
+    iterations = sim_config["iterations"] if iterations is None else iterations
+    days = sim_config["days"] if days is None else days
+    seed = sim_config["random_seed"] if seed is None else seed
+
+    tasks = []
+    for point_index, point in enumerate(points):
+        config_json = json.dumps(point.build_config(base_config))
+        for chunk_index, start in enumerate(range(0, iterations, chunk_size)):
+            tasks.append(
+                _ChunkTask(
+                    point_index=point_index,
+                    chunk_index=chunk_index,
+                    config_json=config_json,
+                    scenario=point.name,
+                    iterations=min(chunk_size, iterations - start),
+                    days=days,
+                    seed=seed,
+                    mode=mode,
+                    events_file=events_file,
+                    tradeoff_file=tradeoff_file,
+                )
+            )
+
+    if workers == 1:
+        partials = [_run_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map은 제출 순서대로 결과를 돌려주므로 병합 순서가 고정됨
+            partials = list(executor.map(_run_chunk, tasks))
+
+    aggregates = [SweepAggregate(days=days) for _ in points]
+    for task, partial in zip(tasks, partials, strict=True):
+        aggregates[task.point_index] = aggregates[task.point_index].merge(partial)
+
+    return [
+        aggregate.summary(point.name) for point, aggregate in zip(points, aggregates, strict=True)
+    ]
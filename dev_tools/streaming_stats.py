@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+파일: dev_tools/streaming_stats.py
+설명: 밸런스 시뮬레이션 스트리밍 집계
+
+반복마다 일별 지표 딕셔너리를 모두 보관하는 대신, 일자·지표별 온라인 통계
+(Welford 평균/분산, 최소/최대, 분위수 스케치, 생존 수)만 유지합니다.
+원시 일별 행이 필요하면 중첩 JSON 대신 컬럼형 파일(.npy 또는 Parquet)로
+흘려 씁니다. 반복 수가 늘어도 메모리 사용량은 일정합니다.
+"""
+
+import json
+import math
+import shutil
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+
+# 분위수 스케치의 기본 상대 오차
+DEFAULT_SKETCH_ACCURACY = 0.01
+# 요약에 포함할 기본 분위수
+DEFAULT_QUANTILES = (0.05, 0.5, 0.95)
+# 컬럼형 스필 버퍼 행 수
+SPILL_BUFFER_ROWS = 4096
+
+
+class QuantileSketch:
+    """
+    로그 버킷 기반 분위수 스케치 (DDSketch 방식)
+
+    값 x를 ceil(log_gamma(|x|)) 버킷에 세어 두므로, 추정 분위수의 상대 오차가
+    accuracy 이하로 유지됩니다. 여러 열을 한 번에 받아 열별로 집계하며,
+    같은 accuracy의 스케치끼리 병합할 수 있습니다.
+    """
+
+    def __init__(self, columns: int, accuracy: float = DEFAULT_SKETCH_ACCURACY) -> None:
+        """
+        QuantileSketch 초기화
+
+        Args:
+            columns: 열(지표) 수
+            accuracy: 상대 오차 (0 < accuracy < 1)
+        """
+        if not 0 < accuracy < 1:
+            raise ValueError(f"잘못된 스케치 정확도: {accuracy}")
+        self.columns = columns
+        self.accuracy = accuracy
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self._gamma)
+        # 열별 버킷: 양수는 +인덱스, 음수는 -인덱스 키, 0은 zero_counts
+        self._buckets: list[dict[int, int]] = [{} for _ in range(columns)]
+        self._negative: list[dict[int, int]] = [{} for _ in range(columns)]
+        self._zero_counts = np.zeros(columns, dtype=np.int64)
+        self.counts = np.zeros(columns, dtype=np.int64)
+
+    def _indices(self, magnitudes: np.ndarray) -> np.ndarray:
+        """양수 크기를 버킷 인덱스로 변환합니다."""
+        return np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+
+    def add(self, values: np.ndarray) -> None:
+        """
+        값을 추가합니다.
+
+        Args:
+            values: (행 수, 열 수) 또는 (열 수,) 배열
+        """
+        values = np.asarray(values, dtype=np.float64).reshape(-1, self.columns)
+        if values.shape[0] == 0:
+            return
+        finite = np.isfinite(values)
+        self.counts += finite.sum(axis=0)
+        self._zero_counts += (values == 0).sum(axis=0)
+
+        for store, sign_mask in ((self._buckets, values > 0), (self._negative, values < 0)):
+            mask = sign_mask & finite
+            if not mask.any():
+                continue
+            rows, cols = np.nonzero(mask)
+            indices = self._indices(np.abs(values[rows, cols]))
+            # (버킷, 열) 쌍을 정수 키 하나로 묶어 한 번에 세고,
+            # 파이썬 루프는 고유 버킷 수만큼만 돕니다
+            keys = indices * self.columns + cols
+            unique, counts = np.unique(keys, return_counts=True)
+            for key, count in zip(unique.tolist(), counts.tolist(), strict=True):
+                index, col = divmod(key, self.columns)
+                bucket = store[col]
+                bucket[index] = bucket.get(index, 0) + count
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """같은 설정의 다른 스케치를 병합합니다."""
+        if other.columns != self.columns or other.accuracy != self.accuracy:
+            raise ValueError("열 수나 정확도가 다른 스케치는 병합할 수 없습니다")
+        for mine, theirs in zip(
+            self._buckets + self._negative, other._buckets + other._negative, strict=True
+        ):
+            for index, count in theirs.items():
+                mine[index] = mine.get(index, 0) + count
+        self._zero_counts += other._zero_counts
+        self.counts += other.counts
+
+    def _bucket_value(self, index: int) -> float:
+        """버킷 대표값 (버킷 경계의 상대 오차 중앙값)"""
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    def quantile(self, column: int, q: float) -> float:
+        """
+        한 열의 분위수를 추정합니다.
+
+        Args:
+            column: 열 번호
+            q: 분위 (0~1)
+
+        Returns:
+            float: 추정 분위수 (값이 없으면 nan)
+        """
+        total = int(self.counts[column])
+        if total == 0:
+            return math.nan
+        rank = q * (total - 1)
+
+        seen = 0
+        negative = self._negative[column]
+        for index in sorted(negative, reverse=True):
+            seen += negative[index]
+            if seen > rank:
+                return -self._bucket_value(index)
+        seen += int(self._zero_counts[column])
+        if seen > rank:
+            return 0.0
+        positive = self._buckets[column]
+        for index in sorted(positive):
+            seen += positive[index]
+            if seen > rank:
+                return self._bucket_value(index)
+        return self._bucket_value(max(positive)) if positive else 0.0
+
+
+class StreamingAggregator:
+    """
+    일자·지표별 온라인 통계 집계기
+
+    반복(run) 단위 통계(성공 수, 생존 일수 합, 성공한 실행의 최종 지표)와
+    일자별 통계(생존 수, Welford 평균/분산, 최소/최대, 분위수 스케치)를
+    유지합니다. 같은 설정의 집계기끼리 병합할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        days: int,
+        columns: Sequence[str],
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        sketch_accuracy: float = DEFAULT_SKETCH_ACCURACY,
+    ) -> None:
+        """
+        StreamingAggregator 초기화
+
+        Args:
+            days: 시뮬레이션 일수
+            columns: 지표 이름 목록 (값 배열의 열 순서)
+            quantiles: 요약에 포함할 분위수 (빈 값이면 스케치를 만들지 않음)
+            sketch_accuracy: 분위수 스케치 상대 오차
+        """
+        self.days = days
+        self.columns = list(columns)
+        self.quantiles = tuple(quantiles)
+        width = len(self.columns)
+
+        self.total_iterations = 0
+        self.successful_runs = 0
+        self.survival_days_sum = 0
+        self.final_mean = np.zeros(width)
+
+        self.day_counts = np.zeros(days, dtype=np.int64)
+        self.day_mean = np.zeros((days, width))
+        self.day_m2 = np.zeros((days, width))
+        self.day_min = np.full((days, width), np.inf)
+        self.day_max = np.full((days, width), -np.inf)
+        self.sketches: list[QuantileSketch] | None = None
+        if self.quantiles:
+            self.sketches = [QuantileSketch(width, sketch_accuracy) for _ in range(days)]
+
+    def add_day(self, day: int, values: np.ndarray) -> None:
+        """
+        하루를 마친 실행들의 지표 값을 추가합니다.
+
+        Args:
+            day: 0부터 시작하는 일자
+            values: (실행 수, 지표 수) 또는 (지표 수,) 배열
+        """
+        values = np.asarray(values, dtype=np.float64).reshape(-1, len(self.columns))
+        n_b = values.shape[0]
+        if n_b == 0:
+            return
+
+        # Chan의 병렬 Welford 결합 (n_b == 1이면 일반 Welford 갱신과 같음)
+        n_a = self.day_counts[day]
+        mean_b = values.mean(axis=0)
+        m2_b = ((values - mean_b) ** 2).sum(axis=0)
+        total = n_a + n_b
+        delta = mean_b - self.day_mean[day]
+        self.day_mean[day] += delta * (n_b / total)
+        self.day_m2[day] += m2_b + delta**2 * (n_a * n_b / total)
+        self.day_counts[day] = total
+
+        np.minimum(self.day_min[day], values.min(axis=0), out=self.day_min[day])
+        np.maximum(self.day_max[day], values.max(axis=0), out=self.day_max[day])
+        if self.sketches is not None:
+            self.sketches[day].add(values)
+
+    def add_runs(self, days_survived: np.ndarray, final_metrics: np.ndarray) -> None:
+        """
+        끝난 실행들의 생존 일수와 최종 지표를 추가합니다.
+
+        Args:
+            days_survived: (실행 수,) 생존 일수
+            final_metrics: (실행 수, 지표 수) 최종 지표
+        """
+        days_survived = np.asarray(days_survived, dtype=np.int64).reshape(-1)
+        final_metrics = np.asarray(final_metrics, dtype=np.float64).reshape(-1, len(self.columns))
+        successful = days_survived >= self.days
+
+        self.total_iterations += int(days_survived.size)
+        self.survival_days_sum += int(days_survived.sum())
+        n_b = int(successful.sum())
+        if n_b:
+            n_a = self.successful_runs
+            delta = final_metrics[successful].mean(axis=0) - self.final_mean
+            self.final_mean += delta * (n_b / (n_a + n_b))
+            self.successful_runs = n_a + n_b
+
+    def merge(self, other: "StreamingAggregator") -> None:
+        """같은 일수·지표의 다른 집계기를 병합합니다."""
+        if other.days != self.days or other.columns != self.columns:
+            raise ValueError("일수나 지표가 다른 집계기는 병합할 수 없습니다")
+
+        n_a, n_b = self.successful_runs, other.successful_runs
+        if n_b:
+            delta = other.final_mean - self.final_mean
+            self.final_mean += delta * (n_b / (n_a + n_b))
+        self.successful_runs = n_a + n_b
+        self.total_iterations += other.total_iterations
+        self.survival_days_sum += other.survival_days_sum
+
+        n_a_days = self.day_counts[:, None].astype(np.float64)
+        n_b_days = other.day_counts[:, None].astype(np.float64)
+        total = n_a_days + n_b_days
+        safe_total = np.where(total > 0, total, 1.0)
+        delta = other.day_mean - self.day_mean
+        self.day_mean += delta * (n_b_days / safe_total)
+        self.day_m2 += other.day_m2 + delta**2 * (n_a_days * n_b_days / safe_total)
+        self.day_counts += other.day_counts
+        np.minimum(self.day_min, other.day_min, out=self.day_min)
+        np.maximum(self.day_max, other.day_max, out=self.day_max)
+        if self.sketches is not None and other.sketches is not None:
+            for mine, theirs in zip(self.sketches, other.sketches, strict=True):
+                mine.merge(theirs)
+
+    @property
+    def day_variance(self) -> np.ndarray:
+        """일자·지표별 표본 분산 (표본이 2개 미만이면 0)"""
+        denominator = np.maximum(self.day_counts - 1, 1)[:, None]
+        return np.where(self.day_counts[:, None] > 1, self.day_m2 / denominator, 0.0)
+
+    def daily_stats(self) -> list[dict[str, Any]]:
+        """일자별 생존 수와 지표 통계 목록을 반환합니다."""
+        std = np.sqrt(self.day_variance)
+        total = self.total_iterations
+        stats = []
+        for day in range(self.days):
+            count = int(self.day_counts[day])
+            metrics: dict[str, dict[str, float]] = {}
+            if count:
+                for column, name in enumerate(self.columns):
+                    entry = {
+                        "mean": float(self.day_mean[day, column]),
+                        "std": float(std[day, column]),
+                        "min": float(self.day_min[day, column]),
+                        "max": float(self.day_max[day, column]),
+                    }
+                    if self.sketches is not None:
+                        # 스케치 추정값은 관측된 최소/최대 범위로 제한
+                        for q in self.quantiles:
+                            estimate = self.sketches[day].quantile(column, q)
+                            entry[f"p{round(q * 100):02d}"] = min(
+                                max(estimate, entry["min"]), entry["max"]
+                            )
+                    metrics[name] = entry
+            stats.append(
+                {
+                    "day": day,
+                    "alive": count,
+                    "survival_rate": count / total if total else 0.0,
+                    "metrics": metrics,
+                }
+            )
+        return stats
+
+    def summary(self, scenario: str) -> dict[str, Any]:
+        """
+        BalanceSimulator.analyze_results와 같은 형태의 요약을 반환합니다.
+
+        detailed_results 대신 일자별 통계(daily_stats)를 포함합니다.
+
+        Args:
+            scenario: 시나리오 이름
+
+        Returns:
+            분석 결과
+        """
+        total = self.total_iterations
+        final_metrics_avg: dict[str, float] = {}
+        if self.successful_runs:
+            final_metrics_avg = {
+                name: float(self.final_mean[i]) for i, name in enumerate(self.columns)
+            }
+
+        return {
+            "scenario": scenario,
+            "total_iterations": total,
+            "success_rate": self.successful_runs / total if total else 0.0,
+            "avg_survival_days": self.survival_days_sum / total if total else 0.0,
+            "final_metrics_avg": final_metrics_avg,
+            "daily_stats": self.daily_stats(),
+        }
+
+
+class ColumnarSpill:
+    """
+    원시 일별 행을 컬럼형 파일로 흘려 쓰는 기록기
+
+    파일 확장자가 .parquet이면 pyarrow로 행 그룹 단위 기록하고, 그 외에는
+    .npy 형식으로 기록합니다 (행을 임시 파일에 이어 쓴 뒤 닫을 때 헤더를 붙임).
+    .npy에는 열 이름이 없으므로 같은 이름의 .columns.json 파일에 함께 저장합니다.
+    메모리에는 최대 buffer_rows 행만 보관합니다.
+    """
+
+    def __init__(
+        self, path: str | Path, columns: Sequence[str], buffer_rows: int = SPILL_BUFFER_ROWS
+    ) -> None:
+        """
+        ColumnarSpill 초기화
+
+        Args:
+            path: 출력 파일 경로 (.npy 또는 .parquet)
+            columns: 열 이름 목록
+            buffer_rows: 디스크에 쓰기 전 모아 둘 행 수
+        """
+        self.path = Path(path)
+        self.columns = list(columns)
+        self.buffer_rows = buffer_rows
+        self.rows_written = 0
+        self._buffer: list[np.ndarray] = []
+        self._buffered = 0
+        self._closed = False
+
+        self._parquet = self.path.suffix == ".parquet"
+        if self._parquet:
+            if pq is None:
+                raise ImportError("Parquet 스필에는 pyarrow가 필요합니다 (.npy 경로를 사용하세요)")
+            schema = pa.schema([(name, pa.float64()) for name in self.columns])
+            self._writer = pq.ParquetWriter(self.path, schema)
+        else:
+            self._raw = tempfile.NamedTemporaryFile(
+                prefix=self.path.name, suffix=".raw", dir=self.path.parent or None, delete=False
+            )
+
+    def append(self, rows: np.ndarray) -> None:
+        """
+        행을 추가합니다.
+
+        Args:
+            rows: (행 수, 열 수) 또는 (열 수,) 배열
+        """
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, len(self.columns))
+        self._buffer.append(rows)
+        self._buffered += rows.shape[0]
+        if self._buffered >= self.buffer_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """버퍼의 행을 디스크에 씁니다."""
+        if not self._buffer:
+            return
+        block = np.concatenate(self._buffer)
+        self._buffer.clear()
+        self._buffered = 0
+        if self._parquet:
+            table = pa.Table.from_arrays(
+                [pa.array(block[:, i]) for i in range(len(self.columns))], names=self.columns
+            )
+            self._writer.write_table(table)
+        else:
+            self._raw.write(np.ascontiguousarray(block).tobytes())
+        self.rows_written += block.shape[0]
+
+    def close(self) -> None:
+        """남은 행을 쓰고 파일을 완성합니다."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        if self._parquet:
+            self._writer.close()
+            return
+
+        self._raw.close()
+        header = {
+            "descr": np.lib.format.dtype_to_descr(np.dtype(np.float64)),
+            "fortran_order": False,
+            "shape": (self.rows_written, len(self.columns)),
+        }
+        with open(self.path, "wb") as out, open(self._raw.name, "rb") as raw:
+            np.lib.format.write_array_header_1_0(out, header)
+            shutil.copyfileobj(raw, out)
+        Path(self._raw.name).unlink()
+        with open(self.path.with_suffix(".columns.json"), "w", encoding="utf-8") as f:
+            json.dump(self.columns, f, ensure_ascii=False)
+
+    def __enter__(self) -> "ColumnarSpill":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -13,11 +13,19 @@ Chicken-RNG 게임의 핵심 지표와 상수를 정의하는 모듈 (엑셀 기
 """
 
 from enum import Enum, auto
-from typing import Final, Dict, Any, Optional, Tuple
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Final, Any
 from dataclasses import dataclass
 from pathlib import Path
-import pandas as pd
 from functools import lru_cache
+import hashlib
+import json
+import os
+import threading
+
+# pandas는 엑셀을 실제로 다시 파싱할 때만 가져옵니다 (캐시 적중 시 import 비용 없음)
+if TYPE_CHECKING:
+    import pandas as pd
 
 # 무한대 값을 위한 타입 힌트 호환 상수
 INF: Final = float("inf")
@@ -65,25 +73,68 @@ class TriggerCondition(Enum):
     LESS_THAN_OR_EQUAL = auto()  # 이하
 
 
+# 컴파일된 상수 캐시 형식 버전 (직렬화 구조가 바뀌면 올림)
+CONSTANTS_CACHE_VERSION: Final = 1
+CONSTANTS_CACHE_SUFFIX: Final = ".constants.json"
+
+
+def _file_sha256(path: Path) -> str:
+    """파일 내용의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _to_builtin(value: Any) -> Any:
+    """pandas/numpy 스칼라를 JSON으로 직렬화 가능한 파이썬 기본 타입으로 변환"""
+    return value.item() if hasattr(value, "item") else value
+
+
+# 기본 상수 엑셀 파일 (작업 디렉토리와 무관하게 이 모듈 기준 경로)
+DEFAULT_CONSTANTS_EXCEL: Final = str(
+    Path(__file__).resolve().parent / "data" / "game_initial_values_with_formulas.xlsx"
+)
+
+
 # 엑셀 기반 상수 로더 클래스
 class ExcelConstantsLoader:
-    """엑셀 파일에서 상수를 로드하는 클래스"""
+    """
+    엑셀 파일에서 상수를 로드하는 클래스
+
+    파싱한 상수는 엑셀 파일 옆의 JSON 캐시(*.constants.json)에 엑셀의
+    수정 시간·크기·SHA-256 해시와 함께 저장됩니다. 엑셀이 바뀌지 않았다면
+    캐시에서 바로 로드하므로 pandas를 import하지 않습니다.
+    """
     
-    def __init__(self, excel_path: str = "data/game_initial_values_with_formulas.xlsx"):
+    def __init__(
+        self,
+        excel_path: str = DEFAULT_CONSTANTS_EXCEL,
+        cache_path: str | None = None,
+    ):
         self.excel_path = Path(excel_path)
-        self._cache: Dict[str, Any] = {}
+        self.cache_path = (
+            Path(cache_path)
+            if cache_path is not None
+            else self.excel_path.with_suffix(CONSTANTS_CACHE_SUFFIX)
+        )
+        self._cache: dict[str, Any] = {}
         self._loaded = False
+        self.loaded_from_cache = False
     
     @lru_cache(maxsize=None)
-    def _load_sheet_data(self, sheet_name: str) -> pd.DataFrame:
+    def _load_sheet_data(self, sheet_name: str) -> "pd.DataFrame":
         """시트 데이터를 캐시와 함께 로드"""
+        import pandas as pd
+
         try:
             return pd.read_excel(self.excel_path, sheet_name=sheet_name)
         except Exception as e:
             print(f"⚠️ 시트 '{sheet_name}' 로드 실패: {e}")
             return pd.DataFrame()
     
-    def _load_constants_from_sheet(self, sheet_name: str) -> Dict[str, Any]:
+    def _load_constants_from_sheet(self, sheet_name: str) -> dict[str, Any]:
         """상수 시트에서 Key-Value 데이터를 로드"""
         df = self._load_sheet_data(sheet_name)
         constants = {}
@@ -107,15 +158,131 @@ class ExcelConstantsLoader:
                 elif data_type == 'str':
                     value = str(value)
             
-            constants[key] = value
+            constants[key] = _to_builtin(value)
         
         return constants
     
-    def load_all_constants(self) -> None:
-        """모든 상수를 엑셀에서 로드"""
+    def _workbook_signature(self) -> dict[str, Any] | None:
+        """엑셀 파일의 수정 시간과 크기 (파일이 없으면 None)"""
+        try:
+            stat = self.excel_path.stat()
+        except OSError:
+            return None
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    
+    def _read_cache(self) -> dict[str, Any] | None:
+        """
+        엑셀과 일치하는 컴파일된 캐시를 읽습니다.
+
+        수정 시간과 크기가 같으면 해시 계산 없이 캐시를 사용하고, 수정 시간만
+        바뀐 경우(복사, 체크아웃 등)에는 내용 해시가 같을 때 캐시를 사용합니다.
+        엑셀 파일이 없으면 캐시를 그대로 사용합니다.
+
+        Returns:
+            dict[str, Any] | None: 캐시 데이터 (없거나 오래되었으면 None)
+        """
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != CONSTANTS_CACHE_VERSION:
+            return None
+
+        signature = self._workbook_signature()
+        if signature is None:
+            return data
+        source = data.get("source", {})
+        if source.get("mtime_ns") == signature["mtime_ns"] and source.get("size") == signature["size"]:
+            return data
+        if source.get("sha256") == _file_sha256(self.excel_path):
+            # 내용은 같으므로 다음 import에서 해시를 다시 계산하지 않도록 갱신
+            data["source"].update(signature)
+            self._write_cache_data(data)
+            return data
+        return None
+    
+    def _write_cache_data(self, data: dict[str, Any]) -> None:
+        """캐시 데이터를 임시 파일에 쓴 뒤 교체합니다."""
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️ 상수 캐시 저장 실패: {self.cache_path} ({e})")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def _write_cache(self) -> None:
+        """현재 로드된 상수를 컴파일된 캐시로 저장합니다."""
+        signature = self._workbook_signature()
+        if signature is None:
+            return
+        special = ('TRADEOFF_RELATIONSHIPS', 'UNCERTAINTY_WEIGHTS', 'METRIC_RANGES')
+        data = {
+            "version": CONSTANTS_CACHE_VERSION,
+            "source": {**signature, "sha256": _file_sha256(self.excel_path)},
+            "constants": {k: v for k, v in self._cache.items() if k not in special},
+            "tradeoff_relationships": {
+                source.name: [target.name for target in targets]
+                for source, targets in self._cache.get('TRADEOFF_RELATIONSHIPS', {}).items()
+            },
+            "uncertainty_weights": {
+                metric.name: weight
+                for metric, weight in self._cache.get('UNCERTAINTY_WEIGHTS', {}).items()
+            },
+            "metric_ranges": {
+                metric.name: list(bounds)
+                for metric, bounds in self._cache.get('METRIC_RANGES', {}).items()
+            },
+        }
+        self._write_cache_data(data)
+    
+    def _apply_cache(self, data: dict[str, Any]) -> None:
+        """캐시 데이터를 상수 딕셔너리로 복원합니다."""
+        self._cache.update(data.get("constants", {}))
+        if "tradeoff_relationships" in data:
+            self._cache['TRADEOFF_RELATIONSHIPS'] = {
+                Metric[source]: [Metric[target] for target in targets]
+                for source, targets in data["tradeoff_relationships"].items()
+            }
+        if "uncertainty_weights" in data:
+            self._cache['UNCERTAINTY_WEIGHTS'] = {
+                Metric[name]: float(weight) for name, weight in data["uncertainty_weights"].items()
+            }
+        if "metric_ranges" in data:
+            self._cache['METRIC_RANGES'] = {
+                Metric[name]: (float(lo), float(hi), float(default))
+                for name, (lo, hi, default) in data["metric_ranges"].items()
+            }
+    
+    def load_all_constants(self, use_cache: bool = True) -> None:
+        """
+        모든 상수를 로드
+
+        Args:
+            use_cache: 엑셀과 일치하는 컴파일된 캐시가 있으면 사용할지 여부
+        """
         if self._loaded:
             return
         
+        if use_cache:
+            data = self._read_cache()
+            if data is not None:
+                try:
+                    self._apply_cache(data)
+                except (KeyError, TypeError, ValueError) as e:
+                    print(f"⚠️ 상수 캐시가 손상되어 엑셀에서 다시 로드합니다: {e}")
+                    self._cache.clear()
+                else:
+                    self._loaded = True
+                    self.loaded_from_cache = True
+                    return
+        
+        self.loaded_from_cache = False
         print("📊 엑셀에서 상수 로드 중...")
         
         try:
@@ -141,6 +308,7 @@ class ExcelConstantsLoader:
             
             self._loaded = True
             print(f"🎉 총 {len(self._cache)}개 상수 로드 완료!")
+            self._write_cache()
             
         except Exception as e:
             print(f"❌ 상수 로드 실패: {e}")
@@ -235,46 +403,200 @@ class ExcelConstantsLoader:
         return self._cache.get(key, default)
     
     def reload_constants(self) -> None:
-        """상수를 다시 로드"""
-        self._cache.clear()
+        """상수를 엑셀에서 다시 파싱하고 컴파일된 캐시를 갱신"""
+        # 이미 게시된 딕셔너리를 비우지 않도록 새 딕셔너리로 교체
+        self._cache = {}
         self._loaded = False
         # 캐시 클리어
         self._load_sheet_data.cache_clear()
-        self.load_all_constants()
+        self.load_all_constants(use_cache=False)
+
+
+@dataclass(frozen=True)
+class ConstantsSnapshot:
+    """
+    버전이 붙은 상수 스냅샷
+
+    리로드할 때마다 새 스냅샷을 만들어 통째로 교체하므로, 한 번 얻은
+    스냅샷은 바뀌지 않습니다 (딕셔너리는 읽기 전용으로 취급).
+    """
+
+    version: int
+    values: dict[str, Any]
+    metric_ranges: dict[Metric, tuple[float, float, float]]
+    tradeoff_relationships: dict[Metric, list[Metric]]
+    uncertainty_weights: dict[Metric, float]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """상수 값을 가져오기"""
+        return self.values.get(key, default)
 
 
 # 전역 상수 로더 인스턴스
 _constants_loader = ExcelConstantsLoader()
 
+
+@dataclass
+class _SnapshotHolder:
+    """현재 상수 스냅샷을 담는 모듈 수준 보관 객체 (global 재바인딩 없이 교체)"""
+
+    snapshot: ConstantsSnapshot
+
+
+# 현재 상수 스냅샷 (참조 교체는 원자적이므로 읽을 때 잠금이 필요 없음)
+_constants_holder = _SnapshotHolder(ConstantsSnapshot(0, {}, {}, {}, {}))
+_constants_subscribers: list[Callable[[ConstantsSnapshot], None]] = []
+_reload_lock = threading.Lock()
+
+
+def _publish_constants() -> ConstantsSnapshot:
+    """로더의 현재 상수로 새 스냅샷을 만들어 교체하고 구독자에게 알림"""
+    values = dict(_constants_loader._cache)
+    snapshot = ConstantsSnapshot(
+        version=_constants_holder.snapshot.version + 1,
+        values=values,
+        metric_ranges=values.get('METRIC_RANGES', {}),
+        tradeoff_relationships=values.get('TRADEOFF_RELATIONSHIPS', {}),
+        uncertainty_weights=values.get('UNCERTAINTY_WEIGHTS', {}),
+    )
+    _constants_holder.snapshot = snapshot
+
+    for callback in list(_constants_subscribers):
+        try:
+            callback(snapshot)
+        except Exception as e:
+            print(f"⚠️ 상수 구독자 알림 실패: {callback!r} ({e})")
+    return snapshot
+
+
+def get_constants_snapshot() -> ConstantsSnapshot:
+    """현재 상수 스냅샷을 가져오기"""
+    return _constants_holder.snapshot
+
+
+def subscribe_constants(callback: Callable[[ConstantsSnapshot], None]) -> Callable[[], None]:
+    """
+    상수 리로드 알림을 구독
+
+    Args:
+        callback: 새 스냅샷을 받을 함수
+
+    Returns:
+        Callable[[], None]: 구독 해제 함수
+    """
+    _constants_subscribers.append(callback)
+
+    def unsubscribe() -> None:
+        if callback in _constants_subscribers:
+            _constants_subscribers.remove(callback)
+
+    return unsubscribe
+
+
 # 편의 함수
 def get_constant(key: str, default: Any = None) -> Any:
-    """상수 값을 가져오는 편의 함수"""
-    return _constants_loader.get_constant(key, default)
+    """상수 값을 가져오는 편의 함수 (현재 스냅샷 기준)"""
+    return _constants_holder.snapshot.values.get(key, default)
+
+def reload_all_constants() -> ConstantsSnapshot:
+    """
+    모든 상수를 엑셀에서 다시 로드하고 새 스냅샷으로 교체하는 편의 함수
 
-def reload_all_constants() -> None:
-    """모든 상수를 다시 로드하는 편의 함수"""
-    _constants_loader.reload_constants()
+    로드에 실패하면 기존 스냅샷을 그대로 유지합니다.
+
+    Returns:
+        ConstantsSnapshot: 현재 상수 스냅샷
+    """
+    with _reload_lock:
+        _constants_loader.reload_constants()
+        if not _constants_loader._loaded:
+            print("⚠️ 상수 리로드 실패, 기존 상수를 유지합니다")
+            return _constants_holder.snapshot
+        return _publish_constants()
 
 # 동적 상수 접근자들 (엑셀에서 로드됨)
-def get_tradeoff_relationships() -> Dict[Metric, list[Metric]]:
+def get_tradeoff_relationships() -> dict[Metric, list[Metric]]:
     """트레이드오프 관계를 동적으로 가져오기"""
-    return get_constant('TRADEOFF_RELATIONSHIPS', {})
+    return _constants_holder.snapshot.tradeoff_relationships
 
-def get_uncertainty_weights() -> Dict[Metric, float]:
+def get_uncertainty_weights() -> dict[Metric, float]:
     """불확실성 가중치를 동적으로 가져오기"""
-    return get_constant('UNCERTAINTY_WEIGHTS', {})
+    return _constants_holder.snapshot.uncertainty_weights
 
-def get_metric_ranges() -> Dict[Metric, Tuple[float, float, float]]:
+def get_metric_ranges() -> dict[Metric, tuple[float, float, float]]:
     """지표 범위를 동적으로 가져오기"""
-    return get_constant('METRIC_RANGES', {})
+    return _constants_holder.snapshot.metric_ranges
+
+
+class ConstantsWatcher:
+    """
+    엑셀 파일 변경 감시자
+
+    주기적으로 엑셀 파일의 수정 시간과 크기를 확인하고, 바뀌었으면
+    reload_all_constants()로 새 스냅샷을 게시합니다. 저장 도중이라 로드에
+    실패하면 기존 스냅샷을 유지하고 다음 주기에 다시 시도합니다.
+    """
 
-# 모듈 로드 시 상수들을 미리 로드하여 전역 변수로 만들기
+    def __init__(self, interval: float = 1.0) -> None:
+        """
+        ConstantsWatcher 초기화
+
+        Args:
+            interval: 확인 주기 (초)
+        """
+        self.interval = interval
+        self._signature = _constants_loader._workbook_signature()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def check(self) -> bool:
+        """
+        엑셀 파일이 바뀌었으면 상수를 다시 로드
+
+        Returns:
+            bool: 새 스냅샷을 게시했는지 여부
+        """
+        signature = _constants_loader._workbook_signature()
+        if signature is None or signature == self._signature:
+            return False
+        version = _constants_holder.snapshot.version
+        if reload_all_constants().version == version:
+            return False
+        self._signature = signature
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self) -> "ConstantsWatcher":
+        """감시 스레드를 시작"""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="constants-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """감시 스레드를 종료"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+# 모듈 로드 시 상수들을 미리 로드하여 첫 스냅샷으로 게시
 _constants_loader.load_all_constants()
+_publish_constants()
 
 # 기존 하드코딩된 상수들 → 엑셀 기반 동적 로드로 교체 (전역 변수로 설정)
-TRADEOFF_RELATIONSHIPS: Final[Dict[Metric, list[Metric]]] = get_tradeoff_relationships()
-UNCERTAINTY_WEIGHTS: Final[Dict[Metric, float]] = get_uncertainty_weights()
-METRIC_RANGES: Final[Dict[Metric, Tuple[float, float, float]]] = get_metric_ranges()
+# 아래 전역 변수들은 import 시점 값입니다. 실행 중 리로드를 반영하려면
+# get_constants_snapshot() 또는 get_constant()로 읽으세요.
+TRADEOFF_RELATIONSHIPS: Final[dict[Metric, list[Metric]]] = get_tradeoff_relationships()
+UNCERTAINTY_WEIGHTS: Final[dict[Metric, float]] = get_uncertainty_weights()
+METRIC_RANGES: Final[dict[Metric, tuple[float, float, float]]] = get_metric_ranges()
 
 # 게임 진행 관련 상수들 (엑셀에서 로드)
 MAX_ACTIONS_PER_DAY: Final[int] = get_constant('MAX_ACTIONS_PER_DAY', 3)
@@ -354,10 +676,12 @@ def cap_metric_value(metric: Metric, value: float) -> float:
     Returns:
         범위 내로 제한된 값
     """
-    if metric not in METRIC_RANGES:
+    # 리로드된 범위를 바로 반영하도록 현재 스냅샷에서 읽음
+    ranges = _constants_holder.snapshot.metric_ranges
+    if metric not in ranges:
         return value
     
-    min_val, max_val, _ = METRIC_RANGES[metric]
+    min_val, max_val, _ = ranges[metric]
     return max(min_val, min(max_val, value))
 
 # 데이터클래스들 유지
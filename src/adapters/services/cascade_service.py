@@ -5,11 +5,11 @@
 """
 
 from datetime import datetime, timedelta
-import random
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
 from ...core.ports.cascade_port import ICascadeService
+from ...core.rng import RngService
 from ...core.ports.event_port import IEventService
 from ...core.domain.events import Event
 from ...core.domain.game_state import GameState
@@ -27,13 +27,15 @@ from ...core.domain.metrics import MetricEnum
 class CascadeServiceImpl(ICascadeService):
     """연쇄 이벤트 서비스 구현체"""
 
-    def __init__(self, event_service: IEventService):
+    def __init__(self, event_service: IEventService, rng: RngService | None = None):
         """초기화
 
         Args:
             event_service: 이벤트 서비스 인스턴스
+            rng: 난수 서비스 (확률적 연쇄 판정에 일수별 "cascade" 스트림 사용)
         """
         self._event_service = event_service
+        self._rng = rng or RngService()
         self._cascade_chains: dict[str, CascadeChain] = {}
         self._pending_events: list[PendingEvent] = []
         self._max_cascade_depth = 5  # 기본 최대 연쇄 깊이
@@ -153,7 +155,8 @@ class CascadeServiceImpl(ICascadeService):
 
             elif node.cascade_type == CascadeType.PROBABILISTIC:
                 # 확률적 발생 이벤트
-                if random.random() <= node.probability:
+                rng = self._rng.daily_stream("cascade", game_state.current_day)
+                if rng.random() <= node.probability:
                     result_events.append(event)
 
         return result_events
@@ -10,12 +10,12 @@
 @freeze v0.1.0
 """
 
-import random
 from typing import Dict, Any, Tuple, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
 from ..core.domain.game_state import GameState
+from ..core.rng import RngService
 from ..core.domain.metrics import MetricsSnapshot, Metric, MetricEnum
 from ..core.domain.action_slots import (
     DailyActionPlan, ActionSlotConfiguration, 
@@ -69,8 +69,13 @@ class GamePhilosophyApplicationService:
     4. 감정적 여정 → 다양한 엔딩 시나리오
     """
     
-    def __init__(self, philosophy_level: GamePhilosophyLevel = GamePhilosophyLevel.NORMAL):
+    def __init__(
+        self,
+        philosophy_level: GamePhilosophyLevel = GamePhilosophyLevel.NORMAL,
+        rng: Optional[RngService] = None,
+    ):
         self.philosophy_level = philosophy_level
+        self.rng = rng or RngService()  # 판정 난수는 일수별 "philosophy" 스트림
         self.action_config = ActionSlotConfiguration()
         
         # 철학 레벨별 설정
@@ -143,7 +148,7 @@ class GamePhilosophyApplicationService:
         final_success_rate = max(0.05, min(0.95, base_success + situational_modifier))
         
         # 확률적 판정
-        roll = random.random()
+        roll = self.rng.daily_stream("philosophy", game_state.current_day).random()
         is_success = roll < final_success_rate
         
         # 크리티컬 판정
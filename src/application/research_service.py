@@ -5,7 +5,6 @@
 @freeze v0.1.0
 """
 
-import random
 from typing import List, Optional, Dict, Tuple, Any
 from dataclasses import dataclass
 
@@ -20,14 +19,21 @@ from ..core.domain.research import (
 )
 from ..core.domain.game_state import GameState
 from ..core.domain.metrics import MetricsSnapshot, MetricEnum
+from ..core.rng import RngService, RngStream
 
 
 class ResearchApplicationService(IResearchService):
     """연구개발 애플리케이션 서비스"""
     
-    def __init__(self, repository: IResearchRepository):
+    def __init__(self, repository: IResearchRepository, rng: Optional[RngService] = None):
         self._repository = repository
         self._config = repository.get_configuration()
+        # 연구 판정 난수는 일수별 "research" 스트림 (리플레이·저장 복원 시 같은 난수)
+        self._rng = rng or RngService()
+
+    def _stream(self, day: int) -> RngStream:
+        """해당 일수의 연구 판정 난수 스트림"""
+        return self._rng.daily_stream("research", day)
     
     def get_available_projects(
         self, 
@@ -68,7 +74,7 @@ class ResearchApplicationService(IResearchService):
         
         # 연구 결과 시뮬레이션
         is_success, message = self.simulate_research_outcome(
-            project, adjusted_probability
+            project, adjusted_probability, day=game_state.current_day
         )
         
         # 실제 효과 계산
@@ -79,7 +85,7 @@ class ResearchApplicationService(IResearchService):
         # 혁신 이름 생성 (성공 시)
         innovation_name = None
         if is_success:
-            innovation_name = self._generate_innovation_name(project)
+            innovation_name = self._generate_innovation_name(project, game_state.current_day)
         
         result = ResearchResult(
             project=project.complete_research(is_success),
@@ -139,15 +145,17 @@ class ResearchApplicationService(IResearchService):
     def simulate_research_outcome(
         self,
         project: ResearchProject,
-        success_probability: float
+        success_probability: float,
+        day: int = 0
     ) -> Tuple[bool, str]:
-        """연구 결과 시뮬레이션"""
+        """연구 결과 시뮬레이션 (day: 난수 스트림 일수)"""
+        rng = self._stream(day)
         # 기본 성공/실패 판정
-        is_success = random.random() < success_probability
+        is_success = rng.random() < success_probability
         
         if is_success:
             # 대박 확률 체크
-            is_breakthrough = random.random() < self._config.breakthrough_chance
+            is_breakthrough = rng.random() < self._config.breakthrough_chance
             
             if is_breakthrough:
                 messages = [
@@ -163,7 +171,7 @@ class ResearchApplicationService(IResearchService):
                 ]
         else:
             # 치명적 실패 확률 체크
-            is_critical_failure = random.random() < self._config.critical_failure_chance
+            is_critical_failure = rng.random() < self._config.critical_failure_chance
             
             if is_critical_failure:
                 messages = [
@@ -181,10 +189,10 @@ class ResearchApplicationService(IResearchService):
                     f"예상과 다른 결과로 상품화 불가",
                     f"기술적 한계로 인한 개발 중단"
                 ]
-                reason = random.choice(failure_reasons)
+                reason = rng.choice(failure_reasons)
                 messages = [f"💸 연구 실패... 사유: {reason}"]
         
-        message = random.choice(messages)
+        message = rng.choice(messages)
         return is_success, message
     
     def get_research_recommendations(
@@ -297,43 +305,45 @@ class ResearchApplicationService(IResearchService):
         metrics_snapshot: MetricsSnapshot
     ) -> ResearchEffects:
         """실제 효과 계산"""
+        rng = self._stream(game_state.current_day)
         if is_success:
             base_effects = project.expected_effects
             
             # 대박 확률 체크
-            is_breakthrough = random.random() < self._config.breakthrough_chance
+            is_breakthrough = rng.random() < self._config.breakthrough_chance
             
             if is_breakthrough:
                 # 대박 시 1.5~2.0배 효과
-                multiplier = random.uniform(1.5, 2.0)
+                multiplier = rng.uniform(1.5, 2.0)
                 return base_effects.apply_multiplier(multiplier)
             else:
                 # 일반 성공 시 0.8~1.2배 효과 (약간의 변동성)
-                multiplier = random.uniform(0.8, 1.2)
+                multiplier = rng.uniform(0.8, 1.2)
                 return base_effects.apply_multiplier(multiplier)
         else:
             # 실패 시 페널티 적용
             base_penalty = project.failure_penalty
             
             # 치명적 실패 확률 체크
-            is_critical = random.random() < self._config.critical_failure_chance
+            is_critical = rng.random() < self._config.critical_failure_chance
             
             if is_critical:
                 # 치명적 실패 시 1.5~2.5배 페널티
-                multiplier = random.uniform(1.5, 2.5)
+                multiplier = rng.uniform(1.5, 2.5)
                 return base_penalty.apply_multiplier(multiplier)
             else:
                 # 일반 실패 시 페널티 그대로
                 return base_penalty
     
-    def _generate_innovation_name(self, project: ResearchProject) -> str:
+    def _generate_innovation_name(self, project: ResearchProject, day: int) -> str:
         """혁신 이름 생성 (성공 시)"""
+        rng = self._stream(day)
         prefixes = ["시그니처", "프리미엄", "스페셜", "혁신적", "차세대"]
         suffixes = ["에디션", "시리즈", "컬렉션", "라인", "브랜드"]
         
         if project.research_type == ResearchType.NEW_MENU:
-            return f"{random.choice(prefixes)} {project.name}"
+            return f"{rng.choice(prefixes)} {project.name}"
         elif project.research_type == ResearchType.NEW_SAUCE:
-            return f"{project.name} {random.choice(suffixes)}"
+            return f"{project.name} {rng.choice(suffixes)}"
         else:
-            return f"{random.choice(prefixes)} {project.name} {random.choice(suffixes)}" 
\ No newline at end of file
+            return f"{rng.choice(prefixes)} {project.name} {rng.choice(suffixes)}" 
\ No newline at end of file
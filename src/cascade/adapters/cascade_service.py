@@ -5,10 +5,12 @@
 전략 패턴을 통해 다양한 cascade 타입별 처리 로직을 분리하여 관리합니다.
 """
 
-import random
+from collections import deque
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from game_constants import MAX_CASCADE_NODES
+from src.core.rng import RngService
 from src.cascade.domain.models import (
     CascadeChain,
     CascadeNode,
@@ -17,6 +19,7 @@ from src.cascade.domain.models import (
     PendingEvent,
     TriggerCondition,
 )
+from src.cascade.domain.pending_queue import PendingEventQueue
 from src.cascade.ports.cascade_port import ICascadeService
 from src.cascade.ports.event_port import IEventService
 from src.cascade.domain.strategies.strategy_factory import (
@@ -25,6 +28,20 @@ from src.cascade.domain.strategies.strategy_factory import (
 )
 
 
+@dataclass
+class _ChainIndex:
+    """
+    루트 이벤트별 연쇄 체인 캐시 항목.
+
+    관계가 바뀌어 루트에서 도달 가능한 이벤트가 영향을 받을 때만 버려집니다.
+    """
+
+    nodes: frozenset[CascadeNode]  # BFS 깊이가 반영된 체인 노드
+    max_depth: int  # 노드의 실제 최대 깊이
+    has_cycle: bool  # 루트에서 도달 가능한 관계에 사이클이 있는지
+    chains: dict[int, CascadeChain] = field(default_factory=dict)  # max_depth별 체인
+
+
 class CascadeServiceImpl(ICascadeService):
     """
     ICascadeService 인터페이스 구현체.
@@ -33,20 +50,37 @@ class CascadeServiceImpl(ICascadeService):
     전략 패턴을 통해 cascade 타입별 처리를 위임합니다.
     """
 
-    def __init__(self, event_service: IEventService, strategy_factory: CascadeStrategyFactory | None = None):
+    def __init__(
+        self,
+        event_service: IEventService,
+        strategy_factory: CascadeStrategyFactory | None = None,
+        rng: RngService | None = None,
+    ):
         """
         CascadeServiceImpl 생성자.
 
         Args:
             event_service: 이벤트 서비스 인스턴스
             strategy_factory: cascade 전략 팩토리 (의존성 주입)
+            rng: 난수 서비스 (확률적 연쇄 판정에 턴별 "cascade" 스트림 사용)
         """
         self._event_service = event_service
+        self._rng = rng or RngService()
         self._strategy_factory = strategy_factory or get_cascade_strategy_factory()
         self._cascade_relations: dict[str, list[CascadeNode]] = (
             {}
         )  # 부모 이벤트 ID -> 자식 노드 목록
-        self._pending_events: list[PendingEvent] = []  # 지연 이벤트 목록
+        self._pending_events = PendingEventQueue()  # trigger_turn 순서의 지연 이벤트 큐
+
+        # 관계 그래프 색인 (register_cascade_relation에서 갱신)
+        self._children: dict[str, list[str]] = {}  # 부모 이벤트 ID -> 자식 이벤트 ID (중복 제거)
+        self._parent_positions: dict[str, int] = {}  # 부모 이벤트 ID -> 등록 순서
+        self._first_depths: dict[str, dict[str, int]] = {}  # 자식 ID -> 부모별 첫 노드 깊이
+        self._topo_index: dict[str, int] | None = {}  # 이벤트 ID -> 위상 정렬 위치
+        self._topo_bounds = (0, -1)  # 위상 정렬 위치의 (최소, 최대)
+        self._graph_has_cycle = False
+        self._reachable: dict[str, frozenset[str]] = {}  # 이벤트 ID -> 도달 가능한 이벤트
+        self._chain_index: dict[str, _ChainIndex] = {}  # 루트 이벤트 ID -> 체인 캐시
 
     def get_cascade_events(self, event_id: str, game_state: Any) -> list[str]:
         """
@@ -79,7 +113,8 @@ class CascadeServiceImpl(ICascadeService):
 
             # 확률적 이벤트인 경우 확률 계산
             if node.is_probabilistic():
-                if random.random() > node.probability:
+                rng = self._rng.daily_stream("cascade", getattr(game_state, "current_day", 0))
+                if rng.random() > node.probability:
                     continue
 
             # 지연 이벤트인 경우 지연 이벤트 목록에 추가
@@ -140,101 +175,150 @@ class CascadeServiceImpl(ICascadeService):
         Raises:
             ValueError: 연쇄 체인에 사이클이 있거나 최대 깊이를 초과하는 경우
         """
-        # 루트 이벤트 ID 추출
-        root_event_id = getattr(root_event, "id", str(root_event))
+        _final_state, result = self._run_cascade([root_event], game_state, current_turn, max_depth)
+        return result
+
+    def process_cascade_batch(
+        self,
+        root_events: list[Any],
+        game_state: Any,
+        current_turn: int = 0,
+        max_depth: int = 5,
+    ) -> tuple[Any, CascadeResult]:
+        """
+        한 턴에 발생한 여러 루트 이벤트의 연쇄를 한 번에 처리합니다.
 
-        # 연쇄 체인 구성
-        cascade_chain = self.build_cascade_chain(root_event_id, max_depth)
+        각 루트의 체인을 하나의 DAG로 합쳐 처리하므로 여러 루트가 공유하는
+        하위 이벤트(및 다른 루트의 연쇄로 이미 발생한 루트)는 한 번만 발생합니다.
+        루트 이벤트를 순서대로 먼저 적용한 뒤 하위 이벤트를 단계별로 처리합니다.
 
-        # 연쇄 체인 검증
-        if not self.validate_cascade_limits(cascade_chain):
-            raise ValueError(f"연쇄 체인이 최대 깊이({max_depth})를 초과합니다.")
+        이벤트 서비스가 apply_metrics_delta(deltas, game_state)를 제공하면 지표
+        변화량을 하나의 버퍼에 모아 두었다가 조건 평가가 필요할 때와 마지막에만
+        게임 상태를 만듭니다. 없으면 이벤트마다 apply_event_effects를 호출합니다.
+
+        Args:
+            root_events: 이번 턴에 발생한 루트 이벤트 목록
+            game_state: 현재 게임 상태
+            current_turn: 현재 게임 턴 (기본값: 0)
+            max_depth: 최대 연쇄 깊이 (기본값: 5)
+
+        Returns:
+            (최종 게임 상태, 전체 연쇄 처리 결과)
+
+        Raises:
+            ValueError: 연쇄 체인에 사이클이 있거나 최대 깊이를 초과하는 경우
+        """
+        return self._run_cascade(root_events, game_state, current_turn, max_depth)
+
+    def _run_cascade(
+        self, root_events: list[Any], game_state: Any, current_turn: int, max_depth: int
+    ) -> tuple[Any, CascadeResult]:
+        """루트 이벤트들의 합쳐진 연쇄 DAG를 BFS로 처리합니다."""
+        # 연쇄 체인 구성 및 검증 (관계가 바뀌지 않았으면 캐시 사용, 사이클이면 ValueError)
+        root_ids = [getattr(root_event, "id", str(root_event)) for root_event in root_events]
+        depth_reached = 0
+        for root_event_id in dict.fromkeys(root_ids):
+            self.build_cascade_chain(root_event_id, max_depth)
+            chain_depth = self._chain_index[root_event_id].max_depth
+            if chain_depth > max_depth:
+                raise ValueError(f"연쇄 체인이 최대 깊이({max_depth})를 초과합니다.")
+            depth_reached = max(depth_reached, chain_depth)
 
         # 처리 결과 초기화
         triggered_events: list[str] = []
         pending_events: list[PendingEvent] = []
-        triggered_event_objects: list[Any] = []
-
-        # 루트 이벤트 처리
-        triggered_events.append(root_event_id)
-        triggered_event_objects.append(root_event)
+        metrics_impact: dict[str, float] = {}  # 지표 변화량 누적 버퍼
+        rng = self._rng.daily_stream("cascade", current_turn)  # 확률적 연쇄 판정용
 
-        # 현재 게임 상태 복사
+        # 지표 변화량을 한 번에 적용할 수 있으면 상태 생성을 미룸
+        apply_delta = getattr(self._event_service, "apply_metrics_delta", None)
+        unapplied: dict[str, float] = {}
         current_state = game_state
 
-        # 루트 이벤트 효과 적용
-        current_state = self._event_service.apply_event_effects(root_event, current_state)
+        def trigger(event_id: str, event: Any) -> None:
+            nonlocal current_state
+            triggered_events.append(event_id)
+            if apply_delta is None:
+                current_state = self._event_service.apply_event_effects(event, current_state)
+                self._accumulate_effects(event, metrics_impact)
+            else:
+                self._accumulate_effects(event, metrics_impact, unapplied)
+
+        def state_now() -> Any:
+            nonlocal current_state
+            if unapplied:
+                current_state = apply_delta(dict(unapplied), current_state)
+                unapplied.clear()
+            return current_state
 
-        # 연쇄 이벤트 처리 (BFS)
-        queue = [root_event_id]
-        processed = {root_event_id}
+        # 루트 이벤트 처리
+        processed: set[str] = set()
+        queue: deque[str] = deque()
+        for root_event_id, root_event in zip(root_ids, root_events, strict=True):
+            if root_event_id in processed:
+                continue
+            trigger(root_event_id, root_event)
+            processed.add(root_event_id)
+            queue.append(root_event_id)
 
+        # 연쇄 이벤트 처리 (BFS)
         while queue:
-            current_id = queue.pop(0)
+            current_id = queue.popleft()
 
             # 현재 이벤트의 자식 이벤트 처리
-            if current_id in self._cascade_relations:
-                for node in self._cascade_relations[current_id]:
-                    # 이미 처리된 노드 스킵
-                    if node.event_id in processed:
+            for node in self._cascade_relations.get(current_id, ()):
+                # 이미 처리된 노드 스킵
+                if node.event_id in processed:
+                    continue
+
+                # 조건부 이벤트인 경우 조건 평가
+                if node.is_conditional() and node.trigger_condition:
+                    condition_dict = {
+                        "expression": node.trigger_condition.expression,
+                        "parameters": dict(node.trigger_condition.parameters),
+                    }
+                    if not self._event_service.evaluate_trigger_condition(
+                        condition_dict, state_now()
+                    ):
                         continue
 
-                    # 조건부 이벤트인 경우 조건 평가
-                    if node.is_conditional() and node.trigger_condition:
-                        condition_dict = {
-                            "expression": node.trigger_condition.expression,
-                            "parameters": dict(node.trigger_condition.parameters),
-                        }
-                        if not self._event_service.evaluate_trigger_condition(
-                            condition_dict, current_state
-                        ):
-                            continue
-
-                    # 확률적 이벤트인 경우 확률 계산
-                    if node.is_probabilistic():
-                        if random.random() > node.probability:
-                            continue
-
-                    # 지연 이벤트인 경우 지연 이벤트 목록에 추가
-                    if node.is_delayed():
-                        delay_event = PendingEvent(
-                            event_id=node.event_id,
-                            delay_turns=node.delay_turns,
-                            trigger_turn=current_turn + node.delay_turns,
-                            cascade_type=CascadeType.DELAYED,
-                            probability=node.probability,
-                        )
-                        pending_events.append(delay_event)
-                        self._pending_events.append(delay_event)
-                        processed.add(node.event_id)  # 지연 이벤트도 처리된 것으로 표시
+                # 확률적 이벤트인 경우 확률 계산
+                if node.is_probabilistic():
+                    if rng.random() > node.probability:
                         continue
 
-                    # 전략 패턴을 통한 cascade 처리
-                    strategy = self._strategy_factory.get_strategy(node.cascade_type)
-                    
-                    # 전략을 통해 노드 처리 여부 결정
-                    if strategy.process(node):
-                        # 이벤트 효과 적용
-                        event = self._event_service.get_event_by_id(node.event_id)
-                        current_state = self._event_service.apply_event_effects(event, current_state)
-                        triggered_events.append(node.event_id)
-                        triggered_event_objects.append(event)
-                        processed.add(node.event_id)
-                        queue.append(node.event_id)  # 다음 레벨 처리를 위해 큐에 추가
-                    else:
-                        # 전략에서 처리 거부한 경우 스킵
-                        processed.add(node.event_id)  # 처리 완료로 표시하여 무한 루프 방지
-
-        # 지표 영향도 계산
-        metrics_impact = self.calculate_metrics_impact(triggered_event_objects, game_state)
-
-        # 결과 반환
-        return CascadeResult(
+                # 지연 이벤트인 경우 지연 이벤트 목록에 추가
+                if node.is_delayed():
+                    delay_event = PendingEvent(
+                        event_id=node.event_id,
+                        delay_turns=node.delay_turns,
+                        trigger_turn=current_turn + node.delay_turns,
+                        cascade_type=CascadeType.DELAYED,
+                        probability=node.probability,
+                    )
+                    pending_events.append(delay_event)
+                    self._pending_events.schedule(delay_event)
+                    processed.add(node.event_id)  # 지연 이벤트도 처리된 것으로 표시
+                    continue
+
+                # 전략 패턴을 통한 cascade 처리
+                strategy = self._strategy_factory.get_strategy(node.cascade_type)
+
+                # 전략을 통해 노드 처리 여부 결정
+                if strategy.process(node):
+                    # 이벤트 효과 적용
+                    trigger(node.event_id, self._event_service.get_event_by_id(node.event_id))
+                    queue.append(node.event_id)  # 다음 레벨 처리를 위해 큐에 추가
+                # 전략에서 처리 거부한 경우에도 처리 완료로 표시하여 무한 루프 방지
+                processed.add(node.event_id)
+
+        result = CascadeResult(
             triggered_events=tuple(triggered_events),
             pending_events=tuple(pending_events),
             metrics_impact=metrics_impact,
-            depth_reached=cascade_chain.get_max_actual_depth(),
+            depth_reached=depth_reached,
         )
+        return state_now(), result
 
     def check_cascade_cycle(self, event_chain: CascadeChain) -> bool:
         """
@@ -258,14 +342,40 @@ class CascadeServiceImpl(ICascadeService):
         Returns:
             처리해야 할 지연 이벤트 목록
         """
-        result = [event for event in self._pending_events if event.trigger_turn == current_turn]
+        return self._pending_events.pop_due(current_turn)
 
-        # 처리된 이벤트는 목록에서 제거
-        self._pending_events = [
-            event for event in self._pending_events if event.trigger_turn != current_turn
-        ]
+    def cancel_pending_events(self, event_id: str) -> int:
+        """
+        아직 발생하지 않은 지연 이벤트를 취소합니다.
 
-        return result
+        Args:
+            event_id: 취소할 이벤트 ID
+
+        Returns:
+            취소한 지연 이벤트 수
+        """
+        return self._pending_events.cancel_event(event_id)
+
+    def snapshot_pending_events(self) -> dict[str, Any]:
+        """
+        게임 저장용 지연 이벤트 상태를 반환합니다.
+
+        Returns:
+            JSON으로 저장할 수 있는 스냅샷 데이터
+        """
+        return self._pending_events.snapshot()
+
+    def restore_pending_events(self, data: dict[str, Any]) -> None:
+        """
+        저장된 지연 이벤트 상태를 복원합니다.
+
+        Args:
+            data: snapshot_pending_events()가 반환한 데이터
+
+        Raises:
+            ValueError: 스냅샷 형식이 잘못된 경우
+        """
+        self._pending_events.restore(data)
 
     def register_cascade_relation(
         self,
@@ -317,11 +427,11 @@ class CascadeServiceImpl(ICascadeService):
         depth = 0
         if parent_event_id in self._cascade_relations:
             # 부모가 이미 자식 노드인 경우, 부모의 깊이 + 1
-            for nodes in self._cascade_relations.values():
-                for node in nodes:
-                    if node.event_id == parent_event_id:
-                        depth = node.depth + 1
-                        break
+            # (부모를 자식으로 가진 관계 중 마지막에 등록된 부모 목록의 첫 노드 기준)
+            parent_depths = self._first_depths.get(parent_event_id)
+            if parent_depths:
+                last_parent = max(parent_depths, key=self._parent_positions.__getitem__)
+                depth = parent_depths[last_parent] + 1
 
         # 연쇄 노드 생성
         node = CascadeNode(
@@ -337,79 +447,206 @@ class CascadeServiceImpl(ICascadeService):
         # 연쇄 관계 등록
         if parent_event_id not in self._cascade_relations:
             self._cascade_relations[parent_event_id] = []
+            self._parent_positions[parent_event_id] = len(self._parent_positions)
 
         self._cascade_relations[parent_event_id].append(node)
+        self._first_depths.setdefault(child_event_id, {}).setdefault(parent_event_id, depth)
+        self._add_graph_edge(parent_event_id, child_event_id)
 
         return node
 
-    def build_cascade_chain(self, root_event_id: str, max_depth: int = 5) -> CascadeChain:
+    def _add_graph_edge(self, parent_event_id: str, child_event_id: str) -> None:
         """
-        루트 이벤트로부터 연쇄 체인을 구성합니다.
+        관계 그래프 색인에 간선을 반영하고 영향받는 캐시만 무효화합니다.
 
         Args:
-            root_event_id: 루트 이벤트 ID
-            max_depth: 최대 연쇄 깊이 (기본값: 5)
+            parent_event_id: 부모 이벤트 ID
+            child_event_id: 자식 이벤트 ID
+        """
+        # 부모에서 도달 가능한 이벤트가 바뀌므로, 부모와 부모에 도달할 수 있는
+        # 이벤트의 도달 가능 집합과 체인 캐시만 버림 (같은 간선 재등록도 노드가 늘어남)
+        stale = [
+            event_id
+            for event_id, reachable in self._reachable.items()
+            if event_id == parent_event_id or parent_event_id in reachable
+        ]
+        for event_id in stale:
+            del self._reachable[event_id]
+            self._chain_index.pop(event_id, None)
+
+        children = self._children.setdefault(parent_event_id, [])
+        if child_event_id in children:
+            return
+        children.append(child_event_id)
+
+        # 위상 정렬 위치 갱신: 순서가 이미 맞거나 새 이벤트이면 그대로 유지
+        order = self._topo_index
+        if order is None:
+            return
+        low, high = self._topo_bounds
+        parent_position = order.get(parent_event_id)
+        child_position = order.get(child_event_id)
+        if parent_position is None and child_position is None:
+            order[parent_event_id] = high + 1
+            order[child_event_id] = high + 2
+            self._topo_bounds = (low, high + 2)
+        elif child_position is None:
+            order[child_event_id] = high + 1
+            self._topo_bounds = (low, high + 1)
+        elif parent_position is None:
+            order[parent_event_id] = low - 1
+            self._topo_bounds = (low - 1, high)
+        elif parent_position >= child_position:
+            self._topo_index = None  # 다음 조회 때 다시 계산
+
+    def _ensure_topological_order(self) -> dict[str, int] | None:
+        """위상 정렬 위치를 반환합니다 (사이클이 있으면 None)."""
+        if self._topo_index is None and not self._graph_has_cycle:
+            in_degree: dict[str, int] = {}
+            for parent_id, children in self._children.items():
+                in_degree.setdefault(parent_id, 0)
+                for child_id in children:
+                    in_degree[child_id] = in_degree.get(child_id, 0) + 1
+
+            queue = deque(event_id for event_id, degree in in_degree.items() if degree == 0)
+            order: dict[str, int] = {}
+            while queue:
+                event_id = queue.popleft()
+                order[event_id] = len(order)
+                for child_id in self._children.get(event_id, ()):
+                    in_degree[child_id] -= 1
+                    if in_degree[child_id] == 0:
+                        queue.append(child_id)
+
+            if len(order) == len(in_degree):
+                self._topo_index = order
+                self._topo_bounds = (0, len(order) - 1)
+            else:
+                self._graph_has_cycle = True  # 관계는 추가만 되므로 이후에도 사이클 유지
+        return self._topo_index
+
+    def get_topological_order(self) -> list[str]:
+        """
+        등록된 모든 연쇄 관계의 위상 정렬 순서를 반환합니다.
 
         Returns:
-            구성된 연쇄 체인
+            부모가 항상 자식보다 앞에 오는 이벤트 ID 목록
 
         Raises:
-            ValueError: 유효하지 않은 이벤트 ID이거나 연쇄 체인에 사이클이 있는 경우
+            ValueError: 연쇄 관계에 사이클이 있는 경우
         """
-        # 이벤트 ID 검증
-        try:
-            self._event_service.get_event_by_id(root_event_id)
-        except ValueError as e:
-            raise ValueError(f"유효하지 않은 루트 이벤트 ID: {e!s}") from e
+        order = self._ensure_topological_order()
+        if order is None:
+            raise ValueError("연쇄 관계에 사이클이 있습니다.")
+        return sorted(order, key=order.__getitem__)
 
-        # 노드 집합 초기화
-        nodes: set[CascadeNode] = set()
+    def get_reachable_events(self, event_id: str) -> frozenset[str]:
+        """
+        이벤트에서 연쇄 관계로 도달할 수 있는 이벤트 ID 집합을 반환합니다 (캐시됨).
 
+        Args:
+            event_id: 시작 이벤트 ID
+
+        Returns:
+            도달 가능한 이벤트 ID 집합 (사이클로 돌아오는 경우에만 자기 자신 포함)
+        """
+        reachable = self._reachable.get(event_id)
+        if reachable is None:
+            found: set[str] = set()
+            stack = list(self._children.get(event_id, ()))
+            while stack:
+                current_id = stack.pop()
+                if current_id in found:
+                    continue
+                found.add(current_id)
+                stack.extend(self._children.get(current_id, ()))
+            reachable = frozenset(found)
+            self._reachable[event_id] = reachable
+        return reachable
+
+    def _has_reachable_cycle(self, root_event_id: str) -> bool:
+        """루트에서 도달 가능한 관계에 사이클이 있는지 확인합니다."""
+        if self._ensure_topological_order() is not None:
+            return False
+        # 도달 가능한 이벤트 중 자기 자신으로 돌아오는 것이 있으면 사이클
+        reachable = self.get_reachable_events(root_event_id)
+        return any(
+            event_id in self.get_reachable_events(event_id)
+            for event_id in reachable | {root_event_id}
+        )
+
+    def _build_chain_index(self, root_event_id: str) -> _ChainIndex:
+        """루트 이벤트의 체인 노드, 깊이, 사이클 여부를 계산합니다."""
         # 루트 노드 추가
         root_node = CascadeNode(event_id=root_event_id, depth=0, cascade_type=CascadeType.IMMEDIATE)
-        nodes.add(root_node)
+        nodes: set[CascadeNode] = {root_node}
 
         # 노드 깊이 맵 (이벤트 ID -> 깊이)
         depth_map = {root_event_id: 0}
 
         # BFS로 연쇄 체인 구성
-        queue = [root_event_id]
-        visited = {root_event_id}
+        queue = deque([root_event_id])
 
         while queue and len(nodes) < MAX_CASCADE_NODES:  # 안전장치: 최대 연쇄 노드 수
-            current_id = queue.pop(0)
+            current_id = queue.popleft()
             current_depth = depth_map[current_id]
 
-            if current_id in self._cascade_relations:
-                for child_node in self._cascade_relations[current_id]:
-                    # 깊이 재설정 (부모 깊이 + 1)
-                    updated_child_node = CascadeNode(
-                        event_id=child_node.event_id,
-                        parent_id=child_node.parent_id,
-                        depth=current_depth + 1,  # 부모 깊이 + 1
-                        cascade_type=child_node.cascade_type,
-                        trigger_condition=child_node.trigger_condition,
-                        probability=child_node.probability,
-                        delay_turns=child_node.delay_turns,
-                        node_id=child_node.node_id,
-                    )
-
-                    nodes.add(updated_child_node)
+            for child_node in self._cascade_relations.get(current_id, ()):
+                # 깊이 재설정 (부모 깊이 + 1)
+                if child_node.depth == current_depth + 1:
+                    nodes.add(child_node)
+                else:
+                    nodes.add(replace(child_node, depth=current_depth + 1))
 
-                    if child_node.event_id not in visited:
-                        visited.add(child_node.event_id)
-                        queue.append(child_node.event_id)
-                        depth_map[child_node.event_id] = current_depth + 1
+                if child_node.event_id not in depth_map:
+                    queue.append(child_node.event_id)
+                    depth_map[child_node.event_id] = current_depth + 1
 
-        # 연쇄 체인 생성
-        chain = CascadeChain(
-            root_event_id=root_event_id, nodes=frozenset(nodes), max_depth=max_depth
+        return _ChainIndex(
+            nodes=frozenset(nodes),
+            max_depth=max(node.depth for node in nodes),
+            has_cycle=self._has_reachable_cycle(root_event_id),
         )
 
+    def build_cascade_chain(self, root_event_id: str, max_depth: int = 5) -> CascadeChain:
+        """
+        루트 이벤트로부터 연쇄 체인을 구성합니다.
+
+        Args:
+            root_event_id: 루트 이벤트 ID
+            max_depth: 최대 연쇄 깊이 (기본값: 5)
+
+        Returns:
+            구성된 연쇄 체인
+
+        Raises:
+            ValueError: 유효하지 않은 이벤트 ID이거나 연쇄 체인에 사이클이 있는 경우
+        """
+        # 이벤트 ID 검증
+        try:
+            self._event_service.get_event_by_id(root_event_id)
+        except ValueError as e:
+            raise ValueError(f"유효하지 않은 루트 이벤트 ID: {e!s}") from e
+
+        # 관계가 바뀌지 않았으면 캐시된 노드·깊이·사이클 여부를 그대로 사용
+        chain_index = self._chain_index.get(root_event_id)
+        if chain_index is None:
+            chain_index = self._build_chain_index(root_event_id)
+            self._chain_index[root_event_id] = chain_index
+            self.get_reachable_events(root_event_id)  # 무효화 판단에 필요
+
         # 사이클 검사
-        if chain.has_cycles():
+        if chain_index.has_cycle:
             raise ValueError("연쇄 체인에 사이클이 있습니다.")
 
+        # 연쇄 체인 생성 (불변 객체이므로 max_depth별로 재사용)
+        chain = chain_index.chains.get(max_depth)
+        if chain is None:
+            chain = CascadeChain(
+                root_event_id=root_event_id, nodes=chain_index.nodes, max_depth=max_depth
+            )
+            chain_index.chains[max_depth] = chain
+
         return chain
 
     def calculate_metrics_impact(
@@ -430,22 +667,23 @@ class CascadeServiceImpl(ICascadeService):
 
         # 각 이벤트의 효과를 누적
         for event in triggered_events:
-            # 이벤트 효과 추출 (테스트 코드의 MockEventService와 일치하도록 수정)
-            effects = getattr(event, "effects", [])
-
-            for effect in effects:
-                # 테스트 코드의 MockEventService에서는 effect가 딕셔너리 형태
-                if isinstance(effect, dict):
-                    metric = effect.get("metric")
-                    value = effect.get("value", 0.0)
-                else:
-                    metric = getattr(effect, "metric", None)
-                    value = getattr(effect, "value", 0.0)
-
-                if metric:
-                    if metric in metrics_impact:
-                        metrics_impact[metric] += float(value)
-                    else:
-                        metrics_impact[metric] = float(value)
+            self._accumulate_effects(event, metrics_impact)
 
         return metrics_impact
+
+    @staticmethod
+    def _accumulate_effects(event: Any, *buffers: dict[str, float]) -> None:
+        """이벤트 효과의 지표 변화량을 버퍼들에 더합니다."""
+        # 이벤트 효과 추출 (테스트 코드의 MockEventService와 일치하도록 수정)
+        for effect in getattr(event, "effects", []):
+            # 테스트 코드의 MockEventService에서는 effect가 딕셔너리 형태
+            if isinstance(effect, dict):
+                metric = effect.get("metric")
+                value = effect.get("value", 0.0)
+            else:
+                metric = getattr(effect, "metric", None)
+                value = getattr(effect, "value", 0.0)
+
+            if metric:
+                for buffer in buffers:
+                    buffer[metric] = buffer.get(metric, 0.0) + float(value)
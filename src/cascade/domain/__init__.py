@@ -2,7 +2,8 @@
 Cascade 모듈의 도메인 레이어.
 
 이 패키지는 연쇄 이벤트 시스템의 핵심 비즈니스 엔티티와 규칙을 포함합니다.
-모든 도메인 객체는 불변(immutable)이며 외부 의존성이 없습니다.
+도메인 모델은 불변(immutable)이며, 상태를 가진 것은 지연 이벤트 큐뿐입니다.
+모두 외부 의존성이 없습니다.
 """
 
 from src.cascade.domain.models import (
@@ -13,6 +14,7 @@ from src.cascade.domain.models import (
     TriggerCondition,
     PendingEvent,
 )
+from src.cascade.domain.pending_queue import PendingEventQueue
 
 __all__ = [
     "CascadeChain",
@@ -20,5 +22,6 @@ __all__ = [
     "CascadeResult",
     "CascadeType",
     "PendingEvent",
+    "PendingEventQueue",
     "TriggerCondition",
 ]
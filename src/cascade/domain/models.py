@@ -44,6 +44,10 @@ class TriggerCondition:
                 f"조건식 '{self.expression}'에 파라미터가 필요하지만 제공되지 않았습니다."
             )
 
+    def __hash__(self) -> int:
+        """파라미터 매핑을 포함한 해시 (CascadeChain의 노드 집합에 넣기 위해 필요)."""
+        return hash((self.expression, frozenset(self.parameters.items())))
+
 
 @dataclass(frozen=True)
 class PendingEvent:
@@ -0,0 +1,207 @@
+"""
+지연 연쇄 이벤트 큐.
+
+DELAYED 연쇄로 생긴 PendingEvent를 trigger_turn 기준 최소 힙에 보관하여,
+매 턴 전체 목록을 훑지 않고 O(log n)으로 해당 턴의 이벤트를 꺼냅니다.
+취소는 표시만 해 두고 꺼낼 때 버리며(지연 삭제), 취소된 항목이 절반을
+넘으면 힙을 다시 만듭니다. 상태는 JSON으로 저장할 수 있는 dict로
+스냅샷하고 복원할 수 있어 게임 저장 데이터에 함께 넣을 수 있습니다.
+"""
+
+import heapq
+from collections.abc import Iterator
+from typing import Any
+
+from src.cascade.domain.models import CascadeType, PendingEvent
+
+PENDING_SNAPSHOT_VERSION = 1
+
+
+class PendingEventQueue:
+    """
+    trigger_turn 순서의 지연 이벤트 큐.
+
+    턴은 앞으로만 진행한다고 가정합니다. pop_due(turn)는 trigger_turn이 turn인
+    이벤트를 등록 순서대로 반환하고, 그보다 이른(놓친) 이벤트는 버립니다.
+    """
+
+    def __init__(self) -> None:
+        """PendingEventQueue 생성자."""
+        self._heap: list[tuple[int, int, PendingEvent]] = []  # (trigger_turn, 순번, 이벤트)
+        self._next_handle = 0
+        self._active: dict[int, str] = {}  # 핸들 -> 이벤트 ID
+        self._handles_by_event: dict[str, set[int]] = {}  # 이벤트 ID -> 핸들
+        self._cancelled: set[int] = set()  # 힙에 남아 있는 취소된 핸들
+        self.expired_count = 0  # 트리거 턴을 놓쳐 버린 이벤트 수
+
+    def __len__(self) -> int:
+        """취소되지 않은 대기 이벤트 수."""
+        return len(self._active)
+
+    def __iter__(self) -> Iterator[PendingEvent]:
+        """대기 이벤트를 (trigger_turn, 등록 순서)대로 순회합니다."""
+        for _turn, handle, event in sorted(self._heap):
+            if handle not in self._cancelled:
+                yield event
+
+    def schedule(self, event: PendingEvent) -> int:
+        """
+        지연 이벤트를 등록합니다.
+
+        Args:
+            event: 지연 이벤트
+
+        Returns:
+            취소에 사용할 핸들
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        heapq.heappush(self._heap, (event.trigger_turn, handle, event))
+        self._active[handle] = event.event_id
+        self._handles_by_event.setdefault(event.event_id, set()).add(handle)
+        return handle
+
+    def cancel(self, handle: int) -> bool:
+        """
+        등록된 지연 이벤트를 취소합니다.
+
+        Args:
+            handle: schedule()이 반환한 핸들
+
+        Returns:
+            취소했으면 True, 이미 처리·취소된 핸들이면 False
+        """
+        event_id = self._active.pop(handle, None)
+        if event_id is None:
+            return False
+        self._forget(handle, event_id)
+        self._cancelled.add(handle)
+        if len(self._cancelled) * 2 > len(self._heap):
+            self._compact()
+        return True
+
+    def cancel_event(self, event_id: str) -> int:
+        """
+        특정 이벤트 ID의 대기 이벤트를 모두 취소합니다.
+
+        Args:
+            event_id: 이벤트 ID
+
+        Returns:
+            취소한 이벤트 수
+        """
+        handles = list(self._handles_by_event.get(event_id, ()))
+        return sum(self.cancel(handle) for handle in handles)
+
+    def peek_turn(self) -> int | None:
+        """
+        가장 이른 대기 이벤트의 trigger_turn을 반환합니다.
+
+        Returns:
+            trigger_turn (대기 이벤트가 없으면 None)
+        """
+        self._drop_cancelled_head()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, current_turn: int) -> list[PendingEvent]:
+        """
+        현재 턴에 처리할 지연 이벤트를 꺼냅니다.
+
+        trigger_turn이 current_turn보다 이른 이벤트는 트리거 턴을 놓친 것으로
+        보고 반환하지 않고 버립니다 (expired_count 증가).
+
+        Args:
+            current_turn: 현재 게임 턴
+
+        Returns:
+            trigger_turn이 current_turn인 이벤트 (등록 순서)
+        """
+        due: list[PendingEvent] = []
+        heap = self._heap
+        while heap and heap[0][0] <= current_turn:
+            turn, handle, event = heapq.heappop(heap)
+            if handle in self._cancelled:
+                self._cancelled.discard(handle)
+                continue
+            del self._active[handle]
+            self._forget(handle, event.event_id)
+            if turn == current_turn:
+                due.append(event)
+            else:
+                self.expired_count += 1
+        return due
+
+    def clear(self) -> None:
+        """모든 대기 이벤트를 제거합니다."""
+        self._heap.clear()
+        self._active.clear()
+        self._handles_by_event.clear()
+        self._cancelled.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        대기 이벤트 상태를 JSON으로 저장할 수 있는 dict로 반환합니다.
+
+        Returns:
+            스냅샷 데이터 (취소된 이벤트 제외, 처리 순서대로)
+        """
+        return {
+            "version": PENDING_SNAPSHOT_VERSION,
+            "events": [
+                [
+                    event.event_id,
+                    event.delay_turns,
+                    event.trigger_turn,
+                    event.cascade_type.name,
+                    event.probability,
+                ]
+                for event in self
+            ],
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """
+        스냅샷으로 대기 이벤트 상태를 되돌립니다 (기존 핸들은 무효화).
+
+        Args:
+            data: snapshot()이 반환한 데이터
+
+        Raises:
+            ValueError: 지원하지 않는 스냅샷 버전이거나 이벤트 값이 잘못된 경우
+        """
+        if data.get("version") != PENDING_SNAPSHOT_VERSION:
+            raise ValueError(f"지원하지 않는 지연 이벤트 스냅샷 버전: {data.get('version')}")
+
+        try:
+            events = [
+                PendingEvent(
+                    event_id=event_id,
+                    delay_turns=delay_turns,
+                    trigger_turn=trigger_turn,
+                    cascade_type=CascadeType[cascade_type],
+                    probability=probability,
+                )
+                for event_id, delay_turns, trigger_turn, cascade_type, probability in data["events"]
+            ]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"잘못된 지연 이벤트 스냅샷: {e!s}") from e
+
+        self.clear()
+        for event in events:
+            self.schedule(event)
+
+    def _forget(self, handle: int, event_id: str) -> None:
+        handles = self._handles_by_event[event_id]
+        handles.discard(handle)
+        if not handles:
+            del self._handles_by_event[event_id]
+
+    def _drop_cancelled_head(self) -> None:
+        while self._heap and self._heap[0][1] in self._cancelled:
+            self._cancelled.discard(heapq.heappop(self._heap)[1])
+
+    def _compact(self) -> None:
+        """취소된 항목을 힙에서 제거합니다."""
+        self._heap = [entry for entry in self._heap if entry[1] not in self._cancelled]
+        heapq.heapify(self._heap)
+        self._cancelled.clear()
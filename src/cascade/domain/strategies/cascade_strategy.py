@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
-from src.core.domain.cascade import CascadeNode
+from src.cascade.domain.models import CascadeNode
 
 
 class ICascadeStrategy(ABC):
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from src.core.domain.cascade import CascadeNode
+from src.cascade.domain.models import CascadeNode
 from src.cascade.domain.strategies.cascade_strategy import ICascadeStrategy
 
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 
-from src.core.domain.cascade import CascadeNode
+from src.cascade.domain.models import CascadeNode
 from src.cascade.domain.strategies.cascade_strategy import ICascadeStrategy
 from game_constants import (
     MAGIC_NUMBER_ONE_HUNDRED,
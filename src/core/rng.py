@@ -0,0 +1,300 @@
+"""
+결정적 난수 서비스
+
+이벤트 폴링, 연쇄 확률, 불확실성 변동, 게임 철학 판정, 연구, 스토리텔러 등
+모든 확률적 하위 시스템의 난수를 시드 하나에서 (세션, 하위 시스템, 일수)별
+스트림으로 나눠 줍니다.
+
+난수는 스트림 키와 카운터(일수 * RNG_STREAM_STRIDE + 순번)를 SplitMix64로
+섞어 만드는 카운터 기반 방식이라 스트림 사이에 공유 상태가 없습니다. 같은
+(시드, 세션, 하위 시스템, 일수, 순번)은 다른 스트림을 얼마나, 어떤 순서로,
+몇 개씩 묶어 뽑았는지와 관계없이 항상 같은 값을 내므로, 세션이나 시뮬레이션
+묶음을 벡터화해 진행해도 한 세션씩 진행한 결과와 비트 단위로 같습니다.
+"""
+
+import hashlib
+from collections.abc import MutableSequence, Sequence
+from typing import TypeVar
+
+import numpy as np
+
+# 하루에 스트림마다 뽑을 수 있는 난수 수의 상한 (카운터 = 일수 * 간격 + 순번)
+RNG_STREAM_STRIDE = 1 << 20
+
+# RngStream이 한 번에 미리 만들어 두는 난수 수
+STREAM_BUFFER_SIZE = 64
+
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+T = TypeVar("T")
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """SplitMix64 혼합 함수 (uint64 배열, 오버플로는 의도된 모듈러 연산)."""
+    z = x + _GOLDEN_GAMMA
+    z = (z ^ (z >> np.uint64(30))) * _MIX_1
+    z = (z ^ (z >> np.uint64(27))) * _MIX_2
+    return z ^ (z >> np.uint64(31))
+
+
+def counter_uniforms(keys: np.ndarray, counters: np.ndarray) -> np.ndarray:
+    """
+    스트림 키와 카운터로 [0, 1) 균등 난수를 만듭니다.
+
+    같은 (키, 카운터)는 항상 같은 값을 내므로 스트림 순서나 묶음 크기와
+    관계없이 재현됩니다.
+
+    Args:
+        keys: (스트림 수,) uint64 스트림 키
+        counters: (스트림 수 x 난수 수) uint64 카운터
+
+    Returns:
+        np.ndarray: (스트림 수 x 난수 수) float64 난수
+    """
+    with np.errstate(over="ignore"):
+        z = _splitmix64(keys[:, None] ^ _splitmix64(counters))
+    return (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def draw_uniforms(
+    keys: np.ndarray, days: np.ndarray | int, count: int, start: int = 0
+) -> np.ndarray:
+    """
+    스트림 묶음의 하루치 난수를 한 번에 뽑습니다.
+
+    각 행은 RngStream(키, 일수)에서 start번째부터 count개를 뽑은 값과 같습니다.
+
+    Args:
+        keys: (스트림 수,) uint64 스트림 키
+        days: 스트림별 일수 배열 또는 모든 스트림 공통 일수
+        count: 스트림마다 뽑을 난수 수
+        start: 첫 난수의 순번 (기본값: 0)
+
+    Returns:
+        np.ndarray: (스트림 수 x count) float64 난수
+
+    Raises:
+        ValueError: 하루 난수 수가 RNG_STREAM_STRIDE를 넘는 경우
+    """
+    if start + count > RNG_STREAM_STRIDE:
+        raise ValueError(f"하루 난수 수가 너무 많습니다: {start + count}")
+    keys = np.asarray(keys, dtype=np.uint64)
+    base = np.broadcast_to(np.asarray(days, dtype=np.uint64), keys.shape)
+    counters = base[:, None] * np.uint64(RNG_STREAM_STRIDE) + np.arange(
+        start, start + count, dtype=np.uint64
+    )
+    return counter_uniforms(keys, counters)
+
+
+def _name_words(name: str) -> tuple[int, int]:
+    """이름을 실행 환경과 관계없이 고정된 32비트 정수 두 개로 바꿉니다."""
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest[:4], "little"), int.from_bytes(digest[4:], "little")
+
+
+class RngStream:
+    """
+    한 (세션, 하위 시스템, 일수)의 난수 스트림
+
+    random.Random에서 게임 코드가 쓰는 메서드(random, uniform, randint,
+    choice, shuffle)를 제공하므로 기존 rng 자리에 그대로 넘길 수 있습니다.
+    난수를 뽑을 때마다 순번이 하나씩 늘어나며, 한 스트림에서 뽑을 수 있는
+    난수는 RNG_STREAM_STRIDE개까지입니다.
+    """
+
+    __slots__ = ("key", "day", "position", "_buffer", "_buffer_start")
+
+    def __init__(self, key: np.uint64 | int, day: int = 0) -> None:
+        """
+        RngStream 초기화
+
+        Args:
+            key: 스트림 키 (RngService.key()로 만듦)
+            day: 일수 (기본값: 0)
+        """
+        self.key = np.uint64(key)
+        self.day = day
+        self.position = 0
+        self._buffer: list[float] = []
+        self._buffer_start = 0
+
+    def random_array(self, count: int) -> np.ndarray:
+        """
+        [0, 1) 난수 count개를 배열로 뽑습니다.
+
+        Args:
+            count: 뽑을 난수 수
+
+        Returns:
+            np.ndarray: (count,) float64 난수
+        """
+        values = draw_uniforms(np.array([self.key]), self.day, count, self.position)[0]
+        self.position += count
+        return values
+
+    def random(self) -> float:
+        """[0, 1) 난수 하나를 뽑습니다."""
+        offset = self.position - self._buffer_start
+        if not 0 <= offset < len(self._buffer):
+            count = max(1, min(STREAM_BUFFER_SIZE, RNG_STREAM_STRIDE - self.position))
+            self._buffer = draw_uniforms(np.array([self.key]), self.day, count, self.position)[
+                0
+            ].tolist()
+            self._buffer_start = self.position
+            offset = 0
+        self.position += 1
+        return self._buffer[offset]
+
+    def uniform(self, a: float, b: float) -> float:
+        """[a, b) 구간의 균등 난수를 뽑습니다."""
+        return a + (b - a) * self.random()
+
+    def randint(self, a: int, b: int) -> int:
+        """[a, b] 구간(양 끝 포함)의 정수 난수를 뽑습니다."""
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """
+        시퀀스에서 원소 하나를 고릅니다.
+
+        Raises:
+            IndexError: 빈 시퀀스인 경우
+        """
+        if not seq:
+            raise IndexError("빈 시퀀스에서 고를 수 없습니다")
+        return seq[int(self.random() * len(seq))]
+
+    def shuffle(self, items: MutableSequence[T]) -> None:
+        """시퀀스를 제자리에서 섞습니다 (Fisher-Yates)."""
+        for i in reversed(range(1, len(items))):
+            j = int(self.random() * (i + 1))
+            items[i], items[j] = items[j], items[i]
+
+
+class RngService:
+    """
+    시드 하나에서 (세션, 하위 시스템, 일수)별 난수 스트림을 나눠 주는 서비스
+
+    스트림 키는 SeedSequence(시드, spawn_key=(세션, 하위 시스템))에서 만들므로
+    같은 시드·세션·하위 시스템이면 실행 환경과 관계없이 같고, 서로 다른
+    하위 시스템의 스트림은 독립적입니다.
+    """
+
+    def __init__(self, seed: int | np.random.SeedSequence | None = None, session: str = "") -> None:
+        """
+        RngService 초기화
+
+        Args:
+            seed: 음이 아닌 정수 시드 또는 SeedSequence (None이면 운영체제 엔트로피 사용)
+            session: 기본 세션 이름 (기본값: "")
+        """
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        self.session = session
+        self._keys: dict[tuple[str, str], np.uint64] = {}
+        self._streams: dict[tuple[str, str], RngStream] = {}
+
+    def key(self, subsystem: str, session: str | None = None) -> np.uint64:
+        """
+        하위 시스템 스트림 키를 만듭니다.
+
+        Args:
+            subsystem: 하위 시스템 이름 (예: "events", "uncertainty")
+            session: 세션 이름 (기본값: None, 서비스의 기본 세션)
+
+        Returns:
+            np.uint64: 스트림 키
+        """
+        session = self.session if session is None else session
+        key = self._keys.get((session, subsystem))
+        if key is None:
+            sequence = np.random.SeedSequence(
+                self.seed_sequence.entropy,
+                spawn_key=(
+                    *self.seed_sequence.spawn_key,
+                    *_name_words(session),
+                    *_name_words(subsystem),
+                ),
+                pool_size=self.seed_sequence.pool_size,
+            )
+            key = sequence.generate_state(1, dtype=np.uint64)[0]
+            self._keys[(session, subsystem)] = key
+        return key
+
+    def stream(self, subsystem: str, day: int = 0, session: str | None = None) -> RngStream:
+        """
+        하위 시스템의 하루치 난수 스트림을 만듭니다.
+
+        Args:
+            subsystem: 하위 시스템 이름
+            day: 일수 (기본값: 0)
+            session: 세션 이름 (기본값: None, 서비스의 기본 세션)
+
+        Returns:
+            RngStream: 순번 0부터 시작하는 스트림
+        """
+        return RngStream(self.key(subsystem, session), day)
+
+    def daily_stream(self, subsystem: str, day: int = 0, session: str | None = None) -> RngStream:
+        """
+        하위 시스템의 해당 일수 스트림을 이어서 사용합니다.
+
+        같은 일수에 다시 부르면 앞에서 뽑던 스트림을 그대로 돌려주고, 일수가
+        바뀌면 순번 0부터 시작하는 새 스트림을 만듭니다. 따라서 어떤 날의
+        난수열은 이전 날에 난수를 몇 개 뽑았는지와 관계없습니다.
+
+        Args:
+            subsystem: 하위 시스템 이름
+            day: 일수 (기본값: 0)
+            session: 세션 이름 (기본값: None, 서비스의 기본 세션)
+
+        Returns:
+            RngStream: 해당 일수의 스트림
+        """
+        name = (self.session if session is None else session, subsystem)
+        stream = self._streams.get(name)
+        if stream is None or stream.day != day:
+            stream = self._streams[name] = self.stream(subsystem, day, name[0])
+        return stream
+
+    def uniforms(
+        self,
+        subsystem: str,
+        sessions: Sequence[str],
+        days: np.ndarray | int,
+        count: int,
+    ) -> np.ndarray:
+        """
+        여러 세션의 하루치 난수를 한 번에 뽑습니다.
+
+        각 행은 stream(subsystem, day, session).random_array(count)와 같습니다.
+
+        Args:
+            subsystem: 하위 시스템 이름
+            sessions: 세션 이름 목록
+            days: 세션별 일수 배열 또는 모든 세션 공통 일수
+            count: 세션마다 뽑을 난수 수
+
+        Returns:
+            np.ndarray: (세션 수 x count) float64 난수
+        """
+        keys = np.array([self.key(subsystem, session) for session in sessions], dtype=np.uint64)
+        return draw_uniforms(keys, days, count)
+
+    def spawn(self, count: int) -> list["RngService"]:
+        """
+        서로 독립적인 자식 서비스를 만듭니다 (병렬 시뮬레이션용).
+
+        같은 시드의 서비스에서 같은 순서로 만든 자식은 항상 같습니다.
+
+        Args:
+            count: 자식 서비스 수
+
+        Returns:
+            list[RngService]: 자식 서비스 목록
+        """
+        return [RngService(child, self.session) for child in self.seed_sequence.spawn(count)]
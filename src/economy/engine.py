@@ -12,10 +12,11 @@ from game_constants import (
     Metric,
     PROBABILITY_LOW_THRESHOLD,
     cap_metric_value,
+    get_constants_snapshot,
 )
 
 # 경제 모델 함수 가져오기
-from src.economy.models import load_economy_config
+from src.economy.models import load_economy_config, tradeoff_compute_demand
 
 # 트레이드오프 상수
 TRADEOFF_FACTORS = {"PRICE_TO_REPUTATION": PROBABILITY_LOW_THRESHOLD, "PRICE_TO_FATIGUE": 0.2}
@@ -95,7 +96,10 @@ def tradeoff_apply_price_change(
         config = load_economy_config().get("tradeoffs", {})
 
     # 기본 트레이드오프 설정
-    reputation_factor = config.get("price_to_reputation_factor", PROBABILITY_LOW_THRESHOLD)
+    reputation_factor = config.get(
+        "price_to_reputation_factor",
+        get_constants_snapshot().get("PROBABILITY_LOW_THRESHOLD", PROBABILITY_LOW_THRESHOLD),
+    )
     fatigue_factor = config.get("price_to_fatigue_factor", 0.2)
 
     # 결과 지표 복사
@@ -187,3 +191,64 @@ def update_economy_state(current_state: dict[str, Any], decision: dict[str, Any]
         )
 
     return new_state
+
+
+class EconomyEngine:
+    """
+    일일 경제 처리 엔진
+
+    MetricsTracker의 지표를 기반으로 하루치 수요, 판매량, 이익을 계산하고
+    자금·재고·수요 지표에 반영합니다.
+    """
+
+    def __init__(
+        self,
+        metrics_tracker: Any,
+        config: dict[str, Any] | None = None,
+        price: int | None = None,
+    ) -> None:
+        """
+        EconomyEngine 초기화
+
+        Args:
+            metrics_tracker: 지표 추적기
+            config: 경제 설정 파라미터 (기본값: None, 이 경우 설정 파일에서 로드)
+            price: 판매 가격 (기본값: None, 이 경우 설정의 optimal_price 사용)
+        """
+        self.metrics_tracker = metrics_tracker
+        self.config = config or load_economy_config()
+        self.price = (
+            price
+            if price is not None
+            else self.config.get("demand", {}).get("optimal_price", 10000)
+        )
+
+    def process_daily_economics(self) -> dict[str, float]:
+        """
+        하루치 경제 활동을 처리합니다.
+
+        Returns:
+            Dict[str, float]: 수요, 판매량, 이익
+        """
+        profit_config = self.config.get("profit", {})
+        metrics = self.metrics_tracker.get_metrics_view()
+
+        demand = tradeoff_compute_demand(self.price, metrics[Metric.REPUTATION], self.config)
+        current_inventory = int(metrics[Metric.INVENTORY])
+        units_sold = min(demand, current_inventory)
+        profit = compute_profit_no_right_answer(
+            units_sold,
+            profit_config.get("base_unit_cost", 3000),
+            self.price,
+            profit_config.get("fixed_cost_daily", 15000),
+        )
+
+        self.metrics_tracker.tradeoff_update_metrics(
+            {
+                Metric.MONEY: metrics[Metric.MONEY] + profit,
+                Metric.INVENTORY: uncertainty_adjust_inventory(units_sold, current_inventory),
+                Metric.DEMAND: demand,
+            }
+        )
+
+        return {"demand": demand, "units_sold": units_sold, "profit": profit}
@@ -12,7 +12,7 @@ import json
 import os
 from typing import Any, cast
 
-from game_constants import PROBABILITY_LOW_THRESHOLD, REPUTATION_BASELINE
+from game_constants import PROBABILITY_LOW_THRESHOLD, REPUTATION_BASELINE, get_constants_snapshot
 
 
 def load_economy_config() -> dict[str, Any]:
@@ -75,6 +75,8 @@ def tradeoff_compute_demand(price: int, reputation: float, config: dict[str, Any
     price_elasticity = demand_config.get("price_elasticity", -0.5)
     reputation_effect = demand_config.get("reputation_effect", 0.2)
     optimal_price = demand_config.get("optimal_price", 10000)
+    # 실행 중 리로드된 기준 평판을 반영하도록 현재 상수 스냅샷에서 읽음
+    reputation_baseline = get_constants_snapshot().get("REPUTATION_BASELINE", REPUTATION_BASELINE)
 
     # 가격 탄력성 적용 (가격이 높을수록 수요 감소, 낮을수록 수요 증가)
     price_factor = 1.0
@@ -84,9 +86,9 @@ def tradeoff_compute_demand(price: int, reputation: float, config: dict[str, Any
 
     # 평판 효과 적용 (평판이 높을수록 수요 증가)
     reputation_factor = 1.0
-    if reputation != REPUTATION_BASELINE:
+    if reputation != reputation_baseline:
         reputation_factor = (
-            1 + reputation_effect * (reputation - REPUTATION_BASELINE) / REPUTATION_BASELINE
+            1 + reputation_effect * (reputation - reputation_baseline) / reputation_baseline
         )
 
     # 최종 수요 계산 (음수 방지, 소수점 반올림)
@@ -4,7 +4,9 @@
 이 파일은 src/events 패키지를 초기화하고 필요한 모듈을 노출합니다.
 """
 
+from src.events.catalog import EventCatalog
 from src.events.engine import EventEngine
+from src.events.formula import CompiledFormula, compile_formula
 from src.events.integration import GameEventSystem
 from src.events.models import (
     Alert,
@@ -14,6 +16,7 @@ from src.events.models import (
     Trigger,
     TriggerCondition,
 )
+from src.events.scheduler import SessionScheduler
 from src.events.schema import (
     load_events_from_json,
     load_events_from_toml,
@@ -22,13 +25,17 @@ from src.events.schema import (
 
 __all__ = [
     "Alert",
+    "CompiledFormula",
     "Effect",
     "Event",
+    "EventCatalog",
     "EventCategory",
     "EventEngine",
     "GameEventSystem",
+    "SessionScheduler",
     "Trigger",
     "TriggerCondition",
+    "compile_formula",
     "load_events_from_json",
     "load_events_from_toml",
     "save_events_to_json",
@@ -0,0 +1,502 @@
+"""
+컴파일된 이벤트 뱅크
+
+검증을 마친 이벤트 정의를 바이너리 파일 하나로 묶어, 실행 시점에는 원본
+디렉토리 탐색, 파일별 JSON 파싱, 잘못된 이벤트 처리 없이 바로 읽습니다.
+파일 구조는 다음과 같습니다.
+
+    MAGIC (8바이트)
+    헤더 길이 (<I) + 헤더 JSON (형식 버전, 원본 목록, 내용 해시, 매니페스트 열)
+    색인: 이벤트마다 (<QI) 데이터 영역 내 오프셋과 길이
+    데이터: 이벤트마다 marshal로 직렬화한 dict
+
+파일은 메모리 매핑으로 열고 ID → 오프셋 색인으로 필요한 이벤트만 꺼냅니다.
+헤더의 매니페스트(ID, 카테고리, 타입, 태그, 영향 메트릭, 원본 파일)만으로
+통계와 필터링을 할 수 있어, 이벤트 수가 늘어도 레코드를 메모리에 올리지
+않습니다.
+레코드는 빌드 시 검증을 통과한 dict이므로 모델 생성은 pydantic-core의 빠른
+경로에서 항상 성공합니다 (model_construct로 중첩 모델을 직접 만드는 것보다
+측정상 두 배 이상 빠릅니다).
+헤더에는 원본 파일의 크기·수정 시각과 전체 내용의 SHA-256 해시가 들어 있어,
+원본이 바뀌어 뱅크가 오래되었는지 확인할 수 있습니다.
+빌드는 dev_tools/event_bank_compiler.py가 담당합니다.
+"""
+
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, overload
+
+from src.events.schema import Event
+
+MAGIC = b"CMEVBNK1"
+BANK_FORMAT_VERSION = 2
+BANK_SUFFIX = ".evbank"
+
+_HEADER_LENGTH = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<QI")
+
+# 기본 빌드 입력: (프로젝트 루트 기준 디렉토리, glob 패턴)
+DEFAULT_BANK_INPUTS: tuple[tuple[str, str], ...] = (
+    ("data/events_generated", "*.json"),
+    ("data/events_bank", "**/*.json"),
+)
+
+
+class EventBankError(ValueError):
+    """이벤트 뱅크 파일을 읽을 수 없을 때 발생하는 예외"""
+
+
+@dataclass(frozen=True, slots=True)
+class BankSource:
+    """
+    뱅크를 만든 원본 파일 정보
+
+    Attributes:
+        path: 루트 기준 상대 경로 (POSIX 구분자)
+        size: 파일 크기 (바이트)
+        mtime_ns: 수정 시각 (ns)
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestEntry:
+    """
+    뱅크에 든 이벤트 한 개의 요약 (레코드를 디코딩하지 않고 읽음)
+
+    Attributes:
+        id: 이벤트 ID
+        group: 이벤트 그룹 (원본 하위 디렉토리 또는 카테고리)
+        category: 이벤트 카테고리
+        type: 이벤트 타입
+        tags: 태그 목록
+        metrics: 효과가 영향을 주는 메트릭 목록 (효과 순서, 중복 포함)
+        file: 원본 파일의 루트 기준 상대 경로
+        position: 뱅크 안의 이벤트 순번
+        offset: 데이터 영역 안의 레코드 오프셋 (바이트)
+        length: 레코드 길이 (바이트)
+    """
+
+    id: str
+    group: str
+    category: str
+    type: str
+    tags: tuple[str, ...]
+    metrics: tuple[str, ...]
+    file: str
+    position: int
+    offset: int
+    length: int
+
+
+def collect_sources(root: Path, inputs: Sequence[tuple[str, str]]) -> list[Path]:
+    """
+    빌드 입력에 해당하는 원본 파일 목록을 정렬하여 반환합니다.
+
+    Args:
+        root: 입력 디렉토리의 기준 경로
+        inputs: (디렉토리, glob 패턴) 목록
+
+    Returns:
+        list[Path]: 중복 없이 정렬된 원본 파일 경로
+    """
+    files: set[Path] = set()
+    for directory, pattern in inputs:
+        base = root / directory
+        if base.is_dir():
+            files.update(path for path in base.glob(pattern) if path.is_file())
+    return sorted(files)
+
+
+def describe_sources(root: Path, files: Sequence[Path]) -> list[BankSource]:
+    """
+    원본 파일의 상대 경로, 크기, 수정 시각을 읽습니다.
+
+    Args:
+        root: 기준 경로
+        files: 원본 파일 경로 목록
+
+    Returns:
+        list[BankSource]: 원본 파일 정보 목록
+    """
+    sources = []
+    for path in files:
+        stat = path.stat()
+        relative = path.relative_to(root).as_posix()
+        sources.append(BankSource(relative, stat.st_size, stat.st_mtime_ns))
+    return sources
+
+
+def content_hash(root: Path, files: Sequence[Path]) -> str:
+    """
+    원본 파일들의 상대 경로와 내용으로 SHA-256 해시를 계산합니다.
+
+    Args:
+        root: 기준 경로
+        files: 원본 파일 경로 목록 (정렬된 순서)
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    for path in files:
+        relative = path.relative_to(root).as_posix().encode("utf-8")
+        data = path.read_bytes()
+        digest.update(len(relative).to_bytes(4, "little") + relative)
+        digest.update(len(data).to_bytes(8, "little") + data)
+    return digest.hexdigest()
+
+
+def write_event_bank(
+    path: Path,
+    events: Sequence[tuple[Event, str, Path]],
+    root: Path,
+    inputs: Sequence[tuple[str, str]],
+    files: Sequence[Path],
+) -> str:
+    """
+    검증된 이벤트를 바이너리 뱅크 파일로 기록합니다 (임시 파일 후 교체).
+
+    Args:
+        path: 출력 파일 경로
+        events: (검증된 이벤트, 그룹 이름, 원본 파일 경로) 목록
+        root: 빌드 입력의 기준 경로
+        inputs: 빌드 입력 (디렉토리, glob 패턴) 목록
+        files: 원본 파일 경로 목록
+
+    Returns:
+        str: 원본 내용 해시
+    """
+    records = [marshal.dumps(event.model_dump(mode="json"), 4) for event, _group, _file in events]
+    digest = content_hash(root, files)
+    sources = describe_sources(root, files)
+    source_positions = {source.path: i for i, source in enumerate(sources)}
+    header = {
+        "format": BANK_FORMAT_VERSION,
+        "root": os.path.relpath(root, path.parent),
+        "inputs": [list(item) for item in inputs],
+        "sources": [[source.path, source.size, source.mtime_ns] for source in sources],
+        "content_hash": digest,
+        "ids": [event.id for event, _group, _file in events],
+        "groups": [group for _event, group, _file in events],
+        "categories": [event.category for event, _group, _file in events],
+        "types": [event.type for event, _group, _file in events],
+        "tags": [event.tags for event, _group, _file in events],
+        "metrics": [[effect.metric for effect in event.effects] for event, _group, _file in events],
+        "files": [
+            source_positions[file.relative_to(root).as_posix()] for _event, _group, file in events
+        ],
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    index = bytearray()
+    offset = 0
+    for record in records:
+        index += _INDEX_ENTRY.pack(offset, len(record))
+        offset += len(record)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(header_bytes)))
+        f.write(header_bytes)
+        f.write(index)
+        for record in records:
+            f.write(record)
+    os.replace(temp_path, path)
+    return digest
+
+
+class EventBank:
+    """
+    메모리 매핑된 컴파일 이벤트 뱅크 리더
+
+    이벤트는 요청할 때 디코딩하고, 한 번 만든 모델은 캐시하여 같은 객체를
+    돌려줍니다.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        EventBank 초기화
+
+        Args:
+            path: 뱅크 파일 경로
+
+        Raises:
+            EventBankError: 뱅크 파일 형식이 올바르지 않은 경우
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # 빈 파일
+            self._file.close()
+            raise EventBankError(f"이벤트 뱅크가 비어 있습니다: {path}") from e
+
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+        self._events: dict[int, Event] = {}
+
+    def _read_header(self) -> None:
+        """헤더와 색인을 읽습니다."""
+        data = self._map
+        if data[: len(MAGIC)] != MAGIC:
+            raise EventBankError(f"이벤트 뱅크 파일이 아닙니다: {self.path}")
+        (header_length,) = _HEADER_LENGTH.unpack_from(data, len(MAGIC))
+        header_start = len(MAGIC) + _HEADER_LENGTH.size
+        header = json.loads(bytes(data[header_start : header_start + header_length]))
+        if header.get("format") != BANK_FORMAT_VERSION:
+            raise EventBankError(f"지원하지 않는 이벤트 뱅크 형식: {header.get('format')}")
+
+        self.content_hash: str = header["content_hash"]
+        self.root = (self.path.parent / header["root"]).resolve()
+        self.inputs: list[tuple[str, str]] = [tuple(item) for item in header["inputs"]]
+        self.sources = [BankSource(*source) for source in header["sources"]]
+        self.ids: list[str] = header["ids"]
+        self.groups: list[str] = header["groups"]
+        self._header = header
+        self._manifest: list[ManifestEntry] | None = None
+        self._positions = {event_id: i for i, event_id in enumerate(self.ids)}
+        self._index_start = header_start + header_length
+        self._data_start = self._index_start + _INDEX_ENTRY.size * len(self.ids)
+        if self._data_start > len(data):
+            raise EventBankError(f"이벤트 뱅크 색인이 잘렸습니다: {self.path}")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def manifest(self) -> list[ManifestEntry]:
+        """
+        이벤트 매니페스트 (헤더와 색인만으로 만들며, 처음 접근할 때 한 번 생성)
+
+        Returns:
+            list[ManifestEntry]: 빌드 순서의 이벤트 요약 목록
+        """
+        if self._manifest is None:
+            header = self._header
+            index = self._map[self._index_start : self._data_start]
+            files = [source.path for source in self.sources]
+            self._manifest = [
+                ManifestEntry(
+                    id=event_id,
+                    group=group,
+                    category=category,
+                    type=event_type,
+                    tags=tuple(tags),
+                    metrics=tuple(metrics),
+                    file=files[file],
+                    position=position,
+                    offset=offset,
+                    length=length,
+                )
+                for position, (
+                    event_id,
+                    group,
+                    category,
+                    event_type,
+                    tags,
+                    metrics,
+                    file,
+                    (offset, length),
+                ) in enumerate(
+                    zip(
+                        self.ids,
+                        self.groups,
+                        header["categories"],
+                        header["types"],
+                        header["tags"],
+                        header["metrics"],
+                        header["files"],
+                        _INDEX_ENTRY.iter_unpack(index),
+                        strict=True,
+                    )
+                )
+            ]
+        return self._manifest
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self._positions
+
+    def __enter__(self) -> "EventBank":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """메모리 매핑과 파일을 닫습니다."""
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def record_at(self, position: int) -> dict[str, Any]:
+        """
+        빌드 순번의 이벤트를 dict로 디코딩합니다 (매번 새로 디코딩).
+
+        Args:
+            position: 이벤트 순번
+
+        Returns:
+            dict[str, Any]: 검증된 이벤트 데이터
+        """
+        offset, length = _INDEX_ENTRY.unpack_from(
+            self._map, self._index_start + _INDEX_ENTRY.size * position
+        )
+        start = self._data_start + offset
+        return marshal.loads(self._map[start : start + length])
+
+    def get_raw(self, event_id: str) -> dict[str, Any]:
+        """
+        이벤트를 dict로 반환합니다 (매번 새로 디코딩).
+
+        Args:
+            event_id: 이벤트 ID
+
+        Returns:
+            dict[str, Any]: 검증된 이벤트 데이터
+
+        Raises:
+            KeyError: 없는 이벤트 ID인 경우
+        """
+        return self.record_at(self._positions[event_id])
+
+    def get(self, event_id: str) -> Event:
+        """
+        이벤트 모델을 반환합니다 (처음 요청할 때 생성, 캐시됨).
+
+        Args:
+            event_id: 이벤트 ID
+
+        Returns:
+            Event: 이벤트 모델
+
+        Raises:
+            KeyError: 없는 이벤트 ID인 경우
+        """
+        return self._event_at(self._positions[event_id])
+
+    def _event_at(self, position: int) -> Event:
+        event = self._events.get(position)
+        if event is None:
+            # 레코드는 JSON 형태로 저장되므로 열거형 값은 문자열로 들어 있습니다
+            event = Event.model_validate(self.record_at(position), strict=False)
+            self._events[position] = event
+        return event
+
+    def events(self) -> list[Event]:
+        """
+        모든 이벤트 모델을 빌드 순서대로 반환합니다.
+
+        Returns:
+            list[Event]: 이벤트 모델 목록
+        """
+        return [self._event_at(position) for position in range(len(self.ids))]
+
+    def iter_raw(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        (그룹 이름, 이벤트 dict)를 빌드 순서대로 반환합니다.
+
+        Yields:
+            tuple[str, dict[str, Any]]: 그룹 이름과 이벤트 데이터
+        """
+        for position, group in enumerate(self.groups):
+            yield group, self.record_at(position)
+
+    def records(self, positions: Sequence[int]) -> "BankRecords":
+        """
+        순번 목록에 해당하는 이벤트를 접근할 때 디코딩하는 시퀀스로 반환합니다.
+
+        Args:
+            positions: 이벤트 순번 목록
+
+        Returns:
+            BankRecords: 지연 디코딩 시퀀스
+        """
+        return BankRecords(self, positions)
+
+    def is_stale(self) -> bool:
+        """
+        원본 파일이 바뀌어 뱅크를 다시 빌드해야 하는지 확인합니다.
+
+        원본 목록과 크기·수정 시각이 모두 같으면 바로 최신으로 판단하고,
+        다르면 내용 해시를 다시 계산하여 비교합니다 (touch만 한 경우는 최신).
+
+        Returns:
+            bool: 오래되었으면 True
+        """
+        files = collect_sources(self.root, self.inputs)
+        if describe_sources(self.root, files) == self.sources:
+            return False
+        return content_hash(self.root, files) != self.content_hash
+
+
+class BankRecords(Sequence[dict[str, Any]]):
+    """
+    뱅크 레코드를 접근할 때마다 디코딩하는 읽기 전용 시퀀스
+
+    디코딩한 dict는 보관하지 않으므로 메모리 사용량은 순번 목록 크기뿐입니다.
+    레코드마다 원본 파일 경로를 `_source_file`로 붙입니다.
+    """
+
+    __slots__ = ("_bank", "_positions")
+
+    def __init__(self, bank: EventBank, positions: Sequence[int]) -> None:
+        self._bank = bank
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "BankRecords":
+        ...
+
+    def __getitem__(self, index: int | slice) -> "dict[str, Any] | BankRecords":
+        if isinstance(index, slice):
+            return BankRecords(self._bank, self._positions[index])
+        return self._decode(self._positions[index])
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for position in self._positions:
+            yield self._decode(position)
+
+    def _decode(self, position: int) -> dict[str, Any]:
+        record = self._bank.record_at(position)
+        record["_source_file"] = self._bank.manifest[position].file
+        return record
+
+
+def is_event_bank(path: str | Path) -> bool:
+    """
+    파일이 컴파일된 이벤트 뱅크인지 확인합니다.
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        bool: 이벤트 뱅크 파일이면 True
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
@@ -0,0 +1,534 @@
+"""
+공유 이벤트 카탈로그
+
+이벤트 정의와 연쇄 효과 매트릭스를 한 번만 읽어, 여러 게임 세션이 함께
+참조하는 불변 카탈로그로 컴파일합니다. 트리거·확률·쿨다운·효과는 이벤트
+순서로 인덱싱되는 배열과 튜플로 보관하므로, 세션별 상태(지표, 마지막 발생
+턴)는 카탈로그 밖의 배열에 따로 둘 수 있습니다.
+
+읽은 정의는 파일 경로와 수정 시각·크기를 키로 프로세스 전체에서 캐시하므로
+새 세션은 파일을 다시 파싱하거나 검증하지 않습니다. 세션별 쿨다운 상태는
+CooldownTable에 둡니다.
+"""
+
+import os
+import threading
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from game_constants import Metric, get_metric_ranges
+from src.events.bank import BANK_SUFFIX, EventBank
+from src.events.formula import CompiledFormula, FormulaKind, compile_formula
+from src.events.schema import (
+    Event,
+    EventContainer,
+    load_events_from_json,
+    load_events_from_toml,
+)
+from src.events.trigger_index import (
+    INDEXED_CONDITIONS,
+    TriggerIndex,
+    event_category_name,
+    resolve_condition,
+    resolve_metric,
+)
+from src.metrics.cascade import CascadePlan, build_cascade_plan
+from src.metrics.state import METRIC_ORDINAL
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledEffect:
+    """
+    컴파일된 이벤트 효과
+
+    Attributes:
+        metric: 대상 지표
+        column: 대상 지표의 열 번호 (METRIC_ORDER 기준)
+        formula: 컴파일된 효과 수식
+    """
+
+    metric: Metric
+    column: int
+    formula: CompiledFormula
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCascadeEdge:
+    """
+    컴파일된 연쇄 효과 간선 (조건 없이 항상 발생)
+
+    Attributes:
+        source: 원인 지표
+        target: 대상 지표
+        target_column: 대상 지표의 열 번호 (METRIC_ORDER 기준)
+        formula: 컴파일된 연쇄 수식 (value는 원인 지표 값)
+        message: 연쇄 효과 메시지
+    """
+
+    source: Metric
+    target: Metric
+    target_column: int
+    formula: CompiledFormula
+    message: str | None = None
+
+    def fire(self, base: float, value: float) -> tuple[float, str | None]:
+        """수식을 적용해 (새 대상 값, 메시지)를 반환합니다."""
+        return self.formula.apply(base, value), self.message
+
+    def fire_batch(self, base: np.ndarray, value: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """세션 묶음에 수식을 적용해 (새 대상 값 배열, 발생 마스크)를 반환합니다."""
+        return self.formula.apply_batch(base, value), np.ones(base.shape, dtype=bool)
+
+
+def compile_cascade_edges(
+    cascade_matrix: dict[Metric, list[dict[str, Any]]],
+) -> tuple[CompiledCascadeEdge, ...]:
+    """
+    연쇄 효과 매트릭스의 간선을 컴파일합니다.
+
+    추적하지 않는 지표를 대상으로 하는 간선과 컴파일에 실패한 수식은 경고를
+    출력하고 건너뜁니다.
+
+    Args:
+        cascade_matrix: 원인 지표별 연쇄 효과 간선 목록
+
+    Returns:
+        tuple[CompiledCascadeEdge, ...]: 매트릭스 순서의 컴파일된 간선
+    """
+    tracked = set(get_metric_ranges())
+
+    compiled_edges: list[CompiledCascadeEdge] = []
+    for source, targets in cascade_matrix.items():
+        for edge in targets:
+            target = getattr(Metric, str(edge.get("target", "")).upper(), None)
+            if target is None or target not in tracked or "formula" not in edge:
+                print(f"Invalid edge: {edge}")
+                continue
+            formula = compile_formula(edge["formula"])
+            if formula.kind == FormulaKind.INVALID:
+                print(f"연쇄 효과 적용 실패: {formula.source} ({formula.error})")
+                continue
+            compiled_edges.append(
+                CompiledCascadeEdge(
+                    source, target, METRIC_ORDINAL[target], formula, edge.get("message")
+                )
+            )
+    return tuple(compiled_edges)
+
+
+def compile_cascade_plan(cascade_matrix: dict[Metric, list[dict[str, Any]]]) -> CascadePlan:
+    """
+    연쇄 효과 매트릭스만으로 전파 계획을 컴파일합니다.
+
+    Args:
+        cascade_matrix: 원인 지표별 연쇄 효과 간선 목록
+
+    Returns:
+        CascadePlan: 컴파일된 전파 계획
+    """
+    return build_cascade_plan(compile_cascade_edges(cascade_matrix))
+
+
+def _read_only_array(values: list[Any], dtype: type) -> np.ndarray:
+    """읽기 전용 NumPy 배열을 만듭니다."""
+    array = np.asarray(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+def file_signature(filepath: str | Path) -> tuple[str, int, int]:
+    """
+    캐시 키로 쓸 파일 서명을 반환합니다.
+
+    Args:
+        filepath: 파일 경로
+
+    Returns:
+        tuple[str, int, int]: (절대 경로, 수정 시각(ns), 크기)
+    """
+    path = os.path.abspath(filepath)
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+@dataclass(frozen=True)
+class SharedEvents:
+    """
+    프로세스 전체에서 공유하는 이벤트 정의
+
+    이벤트 모델과 트리거 인덱스 원본은 모든 엔진이 함께 참조하므로 수정하면
+    안 됩니다. 마지막 발생 턴 같은 세션 상태는 CooldownTable에 둡니다.
+
+    Attributes:
+        signature: 읽은 파일의 서명 (절대 경로, 수정 시각, 크기)
+        container: 검증된 이벤트 컨테이너
+        trigger_index: 트리거 인덱스 원본 (엔진은 fork()한 사본을 사용)
+    """
+
+    signature: tuple[str, int, int]
+    container: EventContainer[Any]
+    trigger_index: TriggerIndex
+
+
+_cache_lock = threading.Lock()
+_shared_events: dict[str, SharedEvents] = {}
+_cascade_matrices: dict[str, tuple[tuple[str, int, int], dict[Metric, list[dict[str, Any]]]]] = {}
+_catalogs: dict[tuple[str, str | None], tuple[tuple[Any, ...], "EventCatalog"]] = {}
+
+
+def _read_event_container(filepath: Path) -> EventContainer[Any]:
+    """
+    이벤트 정의 파일을 읽습니다.
+
+    TOML/JSON은 Pydantic으로 검증하고, 컴파일된 이벤트 뱅크는 빌드할 때
+    걸러진 레코드를 디렉토리 탐색이나 JSON 파싱 없이 바로 읽습니다.
+    """
+    if filepath.suffix == ".toml":
+        return load_events_from_toml(filepath)
+    if filepath.suffix == ".json":
+        return load_events_from_json(filepath)
+    if filepath.suffix == BANK_SUFFIX:
+        with EventBank(filepath) as bank:
+            if bank.is_stale():
+                print(
+                    f"⚠️ 이벤트 뱅크가 원본과 다릅니다. "
+                    f"dev_tools/event_bank_compiler.py로 다시 빌드하세요: {filepath}"
+                )
+            return EventContainer[Event].model_construct(
+                events=bank.events(), metadata={"content_hash": bank.content_hash}
+            )
+    raise ValueError(f"지원되지 않는 파일 형식: {filepath}")
+
+
+def load_shared_events(filepath: str | Path) -> SharedEvents:
+    """
+    이벤트 정의 파일을 프로세스 전체에서 한 번만 읽어 공유합니다.
+
+    파일 경로와 수정 시각·크기가 같으면 캐시된 정의를 그대로 돌려주므로,
+    새 세션은 다시 파싱하거나 Pydantic 검증을 하지 않습니다.
+
+    Args:
+        filepath: 이벤트 정의 파일 경로
+
+    Returns:
+        SharedEvents: 공유 이벤트 정의
+
+    Raises:
+        ValueError: 지원하지 않는 파일 형식인 경우
+    """
+    path = Path(filepath)
+    if path.suffix not in (".toml", ".json", BANK_SUFFIX):
+        raise ValueError(f"지원되지 않는 파일 형식: {filepath}")
+    signature = file_signature(path)
+    cached = _shared_events.get(signature[0])
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    with _cache_lock:
+        cached = _shared_events.get(signature[0])
+        if cached is not None and cached.signature == signature:
+            return cached
+        container = _read_event_container(path)
+        # 효과 수식을 미리 컴파일하여 캐시 (핫 패스에서 문자열 파싱 방지)
+        for event in container.events:
+            for effect in event.effects:
+                compile_formula(effect.formula)
+        shared = SharedEvents(signature, container, TriggerIndex(container.events))
+        _shared_events[signature[0]] = shared
+        return shared
+
+
+def load_event_list(filepath: Path) -> list[Any]:
+    """
+    이벤트 정의 파일(TOML, JSON, 컴파일된 뱅크)의 이벤트 목록을 반환합니다 (공유 캐시 사용).
+
+    Args:
+        filepath: 이벤트 정의 파일 경로
+
+    Returns:
+        list[Any]: 이벤트 목록 (공유 이벤트 모델을 담은 새 리스트)
+
+    Raises:
+        ValueError: 지원하지 않는 파일 형식인 경우
+    """
+    return list(load_shared_events(filepath).container.events)
+
+
+def load_cascade_matrix(filepath: Path) -> dict[Metric, list[dict[str, Any]]]:
+    """
+    트레이드오프 매트릭스 파일에서 연쇄 효과 매트릭스를 읽습니다 (공유 캐시 사용).
+
+    Args:
+        filepath: 트레이드오프 매트릭스 파일 경로
+
+    Returns:
+        dict[Metric, list[dict[str, Any]]]: 원인 지표별 연쇄 효과 간선 목록
+            (딕셔너리는 새로 만들고, 간선 목록은 공유하므로 수정하면 안 됨)
+    """
+    signature = file_signature(filepath)
+    cached = _cascade_matrices.get(signature[0])
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+
+    with open(filepath, "rb") as f:
+        data = tomllib.load(f)
+
+    matrix: dict[Metric, list[dict[str, Any]]] = {}
+    for source_metric, targets in data.get("cascade", {}).items():
+        metric = getattr(Metric, source_metric.upper(), None)
+        if metric is None:
+            print(f"알 수 없는 지표: {source_metric}")
+            continue
+        matrix[metric] = targets
+    with _cache_lock:
+        _cascade_matrices[signature[0]] = (signature, matrix)
+    return dict(matrix)
+
+
+def load_catalog(
+    events_file: str | Path | None = None, tradeoff_file: str | Path | None = None
+) -> "EventCatalog":
+    """
+    파일 경로와 수정 시각을 키로 공유 카탈로그를 반환합니다.
+
+    두 파일이 바뀌지 않았다면 같은 EventCatalog 객체를 돌려줍니다.
+
+    Args:
+        events_file: 이벤트 정의 파일 경로 (기본값: None, 이벤트 없음)
+        tradeoff_file: 트레이드오프 매트릭스 파일 경로 (기본값: None, 연쇄 효과 없음)
+
+    Returns:
+        EventCatalog: 공유 카탈로그
+    """
+    signatures = tuple(
+        file_signature(path) if path else None for path in (events_file, tradeoff_file)
+    )
+    key = (
+        signatures[0][0] if signatures[0] else "",
+        signatures[1][0] if signatures[1] else None,
+    )
+    cached = _catalogs.get(key)
+    if cached is not None and cached[0] == signatures:
+        return cached[1]
+
+    catalog = EventCatalog.from_files(events_file, tradeoff_file)
+    with _cache_lock:
+        _catalogs[key] = (signatures, catalog)
+    return catalog
+
+
+def clear_catalog_cache() -> None:
+    """공유 이벤트 정의, 연쇄 효과 매트릭스, 카탈로그 캐시를 비웁니다."""
+    with _cache_lock:
+        _shared_events.clear()
+        _cascade_matrices.clear()
+        _catalogs.clear()
+
+
+class CooldownTable:
+    """
+    세션별 이벤트 마지막 발생 턴 테이블
+
+    공유 이벤트 모델에 last_fired를 쓰는 대신 엔진마다 이 테이블을 둡니다.
+    한 번이라도 발생한 이벤트만 항목을 가집니다.
+    """
+
+    __slots__ = ("_last_fired",)
+
+    def __init__(self) -> None:
+        self._last_fired: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._last_fired)
+
+    def last_fired(self, event_id: str) -> int | None:
+        """
+        이벤트가 마지막으로 발생한 턴을 반환합니다.
+
+        Args:
+            event_id: 이벤트 ID
+
+        Returns:
+            int | None: 마지막 발생 턴 (발생한 적이 없으면 None)
+        """
+        return self._last_fired.get(event_id)
+
+    def is_cooling_down(self, event_id: str, cooldown: int, turn: int) -> bool:
+        """
+        이벤트가 쿨다운 중인지 확인합니다.
+
+        Args:
+            event_id: 이벤트 ID
+            cooldown: 이벤트 쿨다운 (턴)
+            turn: 현재 턴
+
+        Returns:
+            bool: 쿨다운 중이면 True
+        """
+        if cooldown <= 0:
+            return False
+        last = self._last_fired.get(event_id)
+        return last is not None and turn - last < cooldown
+
+    def mark_fired(self, event_id: str, turn: int) -> None:
+        """
+        이벤트 발생을 기록합니다.
+
+        Args:
+            event_id: 이벤트 ID
+            turn: 발생 턴
+        """
+        self._last_fired[event_id] = turn
+
+    def clear(self) -> None:
+        """모든 기록을 지웁니다."""
+        self._last_fired.clear()
+
+
+@dataclass(frozen=True)
+class EventCatalog:
+    """
+    여러 세션이 공유하는 불변 이벤트 카탈로그
+
+    이벤트 위치(원래 목록 순서)로 인덱싱되는 배열을 보관합니다. 세션별
+    쿨다운 상태는 카탈로그에 쓰지 않고, 사용하는 쪽이 (세션 수 x 이벤트 수)
+    배열 같은 별도 테이블에 보관합니다.
+
+    Attributes:
+        events: 원래 순서의 이벤트 목록
+        cooldowns: 이벤트별 쿨다운 (턴)
+        priorities: 이벤트별 우선순위
+        effects: 이벤트별 컴파일된 효과 목록
+        apply_order: 효과 적용 순서 (우선순위 내림차순, 동률이면 원래 순서)
+        threshold_positions: THRESHOLD 이벤트 위치
+        threshold_columns: THRESHOLD 트리거 지표의 열 번호
+        threshold_values: THRESHOLD 트리거 임계값
+        threshold_conditions: THRESHOLD 트리거 조건 이름
+        random_positions: RANDOM 이벤트 위치
+        random_probabilities: RANDOM 이벤트 발생 확률
+        cascade_plan: 컴파일된 연쇄 효과 전파 계획
+    """
+
+    events: tuple[Any, ...]
+    cooldowns: np.ndarray
+    priorities: np.ndarray
+    effects: tuple[tuple[CompiledEffect, ...], ...]
+    apply_order: tuple[int, ...]
+    threshold_positions: np.ndarray
+    threshold_columns: np.ndarray
+    threshold_values: np.ndarray
+    threshold_conditions: tuple[str, ...]
+    random_positions: np.ndarray
+    random_probabilities: np.ndarray
+    cascade_plan: CascadePlan
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @classmethod
+    def from_files(
+        cls, events_file: str | Path | None = None, tradeoff_file: str | Path | None = None
+    ) -> "EventCatalog":
+        """
+        이벤트 정의 파일과 트레이드오프 매트릭스 파일에서 카탈로그를 만듭니다.
+
+        Args:
+            events_file: 이벤트 정의 파일 경로 (기본값: None, 이벤트 없음)
+            tradeoff_file: 트레이드오프 매트릭스 파일 경로 (기본값: None, 연쇄 효과 없음)
+
+        Returns:
+            EventCatalog: 컴파일된 카탈로그
+        """
+        events = load_event_list(Path(events_file)) if events_file else []
+        cascade_matrix = load_cascade_matrix(Path(tradeoff_file)) if tradeoff_file else {}
+        return cls.from_events(events, cascade_matrix)
+
+    @classmethod
+    def from_events(
+        cls,
+        events: list[Any],
+        cascade_matrix: dict[Metric, list[dict[str, Any]]] | None = None,
+    ) -> "EventCatalog":
+        """
+        이벤트 목록과 연쇄 효과 매트릭스에서 카탈로그를 만듭니다.
+
+        추적하지 않는 지표를 대상으로 하는 효과, 색인할 수 없는 트리거,
+        컴파일에 실패한 수식은 EventEngine과 같이 경고를 출력하고 건너뜁니다.
+
+        Args:
+            events: 이벤트 목록
+            cascade_matrix: 원인 지표별 연쇄 효과 간선 목록 (기본값: None)
+
+        Returns:
+            EventCatalog: 컴파일된 카탈로그
+        """
+        tracked = set(get_metric_ranges())
+
+        effects: list[tuple[CompiledEffect, ...]] = []
+        threshold_positions: list[int] = []
+        threshold_columns: list[int] = []
+        threshold_values: list[float] = []
+        threshold_conditions: list[str] = []
+        random_positions: list[int] = []
+        random_probabilities: list[float] = []
+
+        for position, event in enumerate(events):
+            compiled: list[CompiledEffect] = []
+            for effect in event.effects:
+                metric = resolve_metric(effect.metric)
+                formula = compile_formula(effect.formula)
+                if metric is None or metric not in tracked:
+                    print(f"[Effect Apply Debug] Metric not found or invalid: {effect.metric}")
+                    continue
+                if formula.kind == FormulaKind.INVALID:
+                    print(f"Error evaluating formula (PydanticEvent): {effect.formula}")
+                    continue
+                compiled.append(CompiledEffect(metric, METRIC_ORDINAL[metric], formula))
+            effects.append(tuple(compiled))
+
+            category = event_category_name(event)
+            if category == "RANDOM":
+                random_positions.append(position)
+                random_probabilities.append(float(event.probability))
+            elif category == "THRESHOLD" and event.trigger is not None:
+                trigger = event.trigger
+                metric = resolve_metric(trigger.metric)
+                condition = resolve_condition(trigger.condition)
+                value = trigger.value
+                if (
+                    metric is None
+                    or condition not in INDEXED_CONDITIONS
+                    or not isinstance(value, int | float)
+                    or isinstance(value, bool)
+                ):
+                    print(
+                        f"[Debug] Unindexable trigger: {event.id} "
+                        f"({trigger.metric}, {trigger.condition})"
+                    )
+                    continue
+                threshold_positions.append(position)
+                threshold_columns.append(METRIC_ORDINAL[metric])
+                threshold_values.append(float(value))
+                threshold_conditions.append(condition)
+
+        priorities = [getattr(event, "priority", 0) for event in events]
+        apply_order = sorted(range(len(events)), key=lambda p: -priorities[p])
+
+        return cls(
+            events=tuple(events),
+            cooldowns=_read_only_array([event.cooldown for event in events], np.int64),
+            priorities=_read_only_array(priorities, np.int64),
+            effects=tuple(effects),
+            apply_order=tuple(apply_order),
+            threshold_positions=_read_only_array(threshold_positions, np.intp),
+            threshold_columns=_read_only_array(threshold_columns, np.intp),
+            threshold_values=_read_only_array(threshold_values, np.float64),
+            threshold_conditions=tuple(threshold_conditions),
+            random_positions=_read_only_array(random_positions, np.intp),
+            random_probabilities=_read_only_array(random_probabilities, np.float64),
+            cascade_plan=compile_cascade_plan(cascade_matrix or {}),
+        )
@@ -10,16 +10,26 @@
 - 불확실성: 이벤트 발생과 효과는 예측 불가능한 요소에 영향을 받습니다
 """
 
-import random
-from collections import defaultdict, deque
+from collections import deque
 from pathlib import Path
 from typing import Any
 
-from game_constants import FLOAT_EPSILON, Metric as MetricEnum, EventCategory
-from src.events.models import Alert, TriggerCondition, Trigger  # Trigger import 추가
+from game_constants import Metric as MetricEnum
+from src.core.rng import RngService, RngStream
+from src.events.catalog import (
+    CascadePlan,
+    CooldownTable,
+    compile_cascade_plan,
+    load_cascade_matrix,
+    load_shared_events,
+)
+from src.events.formula import compile_formula
+from src.events.models import Alert
 from src.events.schema import Event as PydanticEvent  # PydanticEvent alias 사용
 from src.events.schema import EventContainer  # EventContainer import 추가
-from src.events.schema import load_events_from_json, load_events_from_toml
+from src.events.trigger_index import TriggerIndex
+from src.metrics.dirty import MetricChanges, SkipStats
+from src.metrics.state import METRIC_ORDINAL
 from src.metrics.tracker import MetricsTracker
 
 # 상수 정의
@@ -46,6 +56,7 @@ class EventEngine:
         tradeoff_file: str | None = None,
         seed: int | None = None,
         max_cascade_depth: int = 10,
+        rng: RngService | None = None,
     ):
         """
         EventEngine 초기화
@@ -56,18 +67,27 @@ class EventEngine:
             tradeoff_file: 트레이드오프 매트릭스 파일 경로 (기본값: None)
             seed: 난수 생성 시드 (기본값: None)
             max_cascade_depth: 최대 연쇄 깊이 (기본값: 10)
+            rng: 난수 서비스 (기본값: None, 이 경우 seed로 새로 생성)
         """
         self.metrics_tracker = metrics_tracker
         self.events_container: EventContainer[PydanticEvent] | None = None
         self.events: list[PydanticEvent] = []
         self.event_queue: deque[PydanticEvent] = deque()
         self.alert_queue: deque[Alert] = deque()
-        self.cascade_matrix: dict[MetricEnum, list[dict[str, Any]]] = {}
+        self._cascade_matrix: dict[MetricEnum, list[dict[str, Any]]] = {}
+        self._cascade_plan = CascadePlan()
         self.max_cascade_depth = max_cascade_depth
+        # 매트릭스 연쇄 효과 전파 횟수 (임계값 규칙은 MetricsTracker.cascade_runs)
+        self.cascade_runs = 0
         self.current_turn = 0
+        self._trigger_index: TriggerIndex | None = None
+        # 트리거는 마지막 평가 이후 바뀐 지표의 조건만 다시 탐색
+        self._metric_changes: tuple[MetricsTracker, MetricChanges] | None = None
+        # 세션별 이벤트 마지막 발생 턴 (공유 이벤트 모델에는 쓰지 않음)
+        self.cooldowns = CooldownTable()
 
-        # 난수 생성기 초기화
-        self.rng = random.Random(seed)
+        # 난수 서비스 초기화 (이벤트 난수는 턴마다 새 스트림)
+        self.rng_service = rng or RngService(seed)
 
         # 이벤트 파일 로드
         if events_file:
@@ -84,100 +104,121 @@ class EventEngine:
         Args:
             seed: 난수 생성 시드 (기본값: None)
         """
-        self.rng = random.Random(seed)
+        self.rng_service = RngService(seed)
+
+    @property
+    def rng(self) -> RngStream:
+        """
+        현재 턴의 이벤트 난수 스트림
+
+        스트림은 (시드, "events", 턴)으로 정해지므로 이전 턴에 난수를 몇 개
+        뽑았는지와 관계없이 같은 턴에서는 같은 난수열이 나옵니다.
+        """
+        return self.rng_service.daily_stream("events", self.current_turn)
 
     def load_events(self, filepath: Path) -> None:
         """
         이벤트 정의 파일을 로드합니다.
 
+        같은 파일(경로, 수정 시각, 크기)은 프로세스 전체에서 한 번만 파싱·검증하고,
+        엔진은 공유 이벤트 정의와 트리거 인덱스 사본만 가집니다.
+        .evbank 파일(dev_tools/event_bank_compiler.py로 컴파일한 뱅크)은 검증 없이 읽습니다.
+
         Args:
-            filepath: 이벤트 정의 파일 경로 (Path 객체)
+            filepath: 이벤트 정의 파일 경로 (.toml, .json, .evbank)
         """
-        if filepath.suffix == ".toml":
-            self.events_container = load_events_from_toml(filepath)
-        elif filepath.suffix == ".json":
-            self.events_container = load_events_from_json(filepath)
-        else:
-            raise ValueError(f"지원되지 않는 파일 형식: {filepath}")
-
-        # EventContainer에서 events 리스트로 변환
-        if self.events_container and hasattr(self.events_container, "events"):
-            self.events = list(self.events_container.events)
+        shared = load_shared_events(filepath)
+        self.events_container = shared.container
+        self.events = list(shared.container.events)
+
+        # 지표별 임계값 트리거 인덱스 (공유 원본의 사본, 효과 수식은 로드 시 컴파일됨)
+        self._trigger_index = shared.trigger_index.fork()
+
+    @property
+    def cascade_matrix(self) -> dict[MetricEnum, list[dict[str, Any]]]:
+        """
+        원인 지표별 연쇄 효과 간선 목록.
+
+        대입하면 전파 계획을 다시 컴파일합니다. 반환된 dict를 직접 수정하면
+        계획에 반영되지 않으므로 새 dict를 대입해야 합니다.
+        """
+        return self._cascade_matrix
+
+    @cascade_matrix.setter
+    def cascade_matrix(self, matrix: dict[MetricEnum, list[dict[str, Any]]]) -> None:
+        self._cascade_matrix = matrix
+        self._cascade_plan = compile_cascade_plan(matrix)
 
     def load_tradeoff_matrix(self, filepath: str) -> None:
         """
         트레이드오프 매트릭스 파일을 로드합니다.
 
+        연쇄 효과 간선은 지표 열 번호와 컴파일된 수식의 위상 정렬된 전파
+        계획으로 컴파일되며, DAG 여부도 이때 한 번만 판정합니다.
+
         Args:
             filepath: 트레이드오프 매트릭스 파일 경로
         """
-        import tomllib
-
         try:
-            with open(filepath, "rb") as f:
-                data = tomllib.load(f)
-
-            # 연쇄 효과 매트릭스 로드
-            if "cascade" in data:
-                for source_metric, targets in data["cascade"].items():
-                    try:
-                        metric = getattr(MetricEnum, source_metric.upper(), None)
-                        if metric is not None:
-                            self.cascade_matrix[metric] = targets
-                        else:
-                            print(f"알 수 없는 지표: {source_metric}")
-                    except KeyError:
-                        print(f"알 수 없는 지표: {source_metric}")
+            # 연쇄 효과 매트릭스 로드 (파일 파싱은 프로세스 전체에서 공유)
+            self.cascade_matrix = {**self._cascade_matrix, **load_cascade_matrix(Path(filepath))}
         except Exception as e:
             print(f"트레이드오프 매트릭스 로드 실패: {e}")
 
+    def _events_to_iterate(self) -> list[PydanticEvent]:
+        """평가 대상 이벤트 목록을 반환합니다 (events_container 우선)."""
+        if self.events_container and hasattr(self.events_container, "events"):
+            return self.events_container.events
+        return self.events
+
+    def _get_trigger_index(self) -> TriggerIndex:
+        """
+        트리거 인덱스를 반환합니다.
+
+        평가 대상 이벤트 목록이 바뀐 경우(다른 리스트로 교체되거나 길이가 변한 경우)
+        인덱스를 다시 만듭니다.
+        """
+        events = self._events_to_iterate()
+        if self._trigger_index is None or not self._trigger_index.is_built_from(events):
+            self._trigger_index = TriggerIndex(events)
+        return self._trigger_index
+
+    def rebuild_trigger_index(self) -> None:
+        """이벤트 목록을 직접 수정한 뒤 트리거 인덱스를 강제로 다시 만듭니다."""
+        self._trigger_index = TriggerIndex(self._events_to_iterate())
+
     def poll(self) -> list[PydanticEvent]:
         """
         현재 턴에 발생 가능한 이벤트를 폴링합니다.
 
+        THRESHOLD 이벤트는 트리거 인덱스로 찾고, RANDOM 이벤트는 원래 순서대로
+        난수를 뽑아 판정합니다 (시드 재현성 유지).
+
         Returns:
             List[PydanticEvent]: 발생 가능한 이벤트 목록
         """
-        current_metrics = self.metrics_tracker.get_metrics()
+        current_metrics = self.metrics_tracker.get_metrics_view()
+        index = self._get_trigger_index()
+
+        # TODO: Cooldown 및 last_triggered_turn 로직 구현 필요
+        fired: list[tuple[int, str]] = [
+            (position, "THRESHOLD")
+            for position in index.evaluate(current_metrics, self._changed_metrics())
+        ]
+        for position in index.random_positions:
+            if self.rng.random() < index.events[position].probability:
+                fired.append((position, "RANDOM"))
+        # TODO: SCHEDULED, CASCADE 타입 처리
+
+        # 원래 이벤트 목록 순서로 기록
+        fired.sort()
         triggered_events: list[PydanticEvent] = []
-
-        events_to_iterate = []
-        if self.events_container and hasattr(self.events_container, "events"):
-            events_to_iterate = self.events_container.events
-        elif self.events:
-            events_to_iterate = self.events
-
-        for event_data in events_to_iterate:
-            can_fire_event = True
-            # TODO: Cooldown 및 last_triggered_turn 로직 구현 필요
-            # if event_data.cooldown > 0 and event_data.id in self.event_last_triggered_turn:
-            #     if self.current_turn - self.event_last_triggered_turn[event_data.id] < event_data.cooldown:
-            #         can_fire_event = False
-
-            if not can_fire_event:
-                continue
-
-            if event_data.type == EventCategory.THRESHOLD:
-                if event_data.trigger and self._evaluate_pydantic_trigger(
-                    event_data.trigger, current_metrics
-                ):
-                    triggered_events.append(event_data)
-                    # Event 객체의 속성에 따라 적절한 이름 사용
-                    event_name = getattr(
-                        event_data, "name_ko", getattr(event_data, "name", event_data.id)
-                    )
-                    self.metrics_tracker.add_event(
-                        f"Polled THRESHOLD: {event_data.id} - {event_name}"
-                    )
-            elif event_data.type == EventCategory.RANDOM:
-                if self.rng.random() < event_data.probability:
-                    triggered_events.append(event_data)
-                    # Event 객체의 속성에 따라 적절한 이름 사용
-                    event_name = getattr(
-                        event_data, "name_ko", getattr(event_data, "name", event_data.id)
-                    )
-                    self.metrics_tracker.add_event(f"Polled RANDOM: {event_data.id} - {event_name}")
-            # TODO: SCHEDULED, CASCADE 타입 처리
+        for position, kind in fired:
+            event_data = index.events[position]
+            triggered_events.append(event_data)
+            # Event 객체의 속성에 따라 적절한 이름 사용
+            event_name = getattr(event_data, "name_ko", getattr(event_data, "name", event_data.id))
+            self.metrics_tracker.add_event(f"Polled {kind}: {event_data.id} - {event_name}")
 
         # 우선순위에 따라 정렬 (Event에 priority가 있으므로 사용 가능)
         triggered_events.sort(key=lambda e: -e.priority)
@@ -187,84 +228,57 @@ class EventEngine:
 
         return triggered_events  # 실제 발생 "가능성이 있는" 이벤트 목록 반환
 
-    def _evaluate_pydantic_trigger(
-        self, trigger: Trigger, current_metrics: dict[MetricEnum, float]
-    ) -> bool:
-        """Pydantic EventTrigger 모델을 평가합니다."""
-        # trigger.metric이 MetricEnum인 경우와 문자열인 경우 모두 처리
-        if isinstance(trigger.metric, MetricEnum):
-            metric_enum = trigger.metric
-        else:
-            metric_enum = getattr(MetricEnum, trigger.metric.upper(), None)
-
-        if not metric_enum or metric_enum not in current_metrics:
-            print(f"[Debug] Metric {trigger.metric} not found in current_metrics or MetricEnum")
-            return False
-        current_value = current_metrics[metric_enum]
-
-        # TriggerCondition enum 처리
-        if isinstance(trigger.condition, TriggerCondition):
-            condition_str = trigger.condition.name
-        else:
-            condition_str = trigger.condition.upper()
-        trigger_value = trigger.value
-
-        if condition_str == "LESS_THAN":
-            return current_value < trigger_value
-        elif condition_str == "GREATER_THAN":
-            return current_value > trigger_value
-        elif condition_str == "EQUAL":
-            return abs(current_value - trigger_value) < FLOAT_EPSILON  # 부동소수점 비교
-        elif condition_str == "NOT_EQUAL":
-            return abs(current_value - trigger_value) >= FLOAT_EPSILON
-        elif condition_str == "GREATER_THAN_OR_EQUAL":
-            return current_value >= trigger_value
-        elif condition_str == "LESS_THAN_OR_EQUAL":
-            return current_value <= trigger_value
-        # TODO: IN_RANGE, NOT_IN_RANGE 구현 필요 (EventTrigger 모델에 range_min/max 없음)
-        print(f"[Debug] Unknown condition: {trigger.condition}")
-        return False
+    def _changed_metrics(self) -> dict[MetricEnum, float] | None:
+        """
+        마지막 트리거 평가 이후 바뀐 지표를 반환합니다.
+
+        Returns:
+            바뀐 지표별 변화량 (지표 추적기가 바뀌어 알 수 없으면 None)
+        """
+        subscription = self._metric_changes
+        if subscription is None or subscription[0] is not self.metrics_tracker:
+            self._metric_changes = (
+                self.metrics_tracker,
+                self.metrics_tracker.subscribe_changes(),
+            )
+            return None
+        return subscription[1].poll()
+
+    @property
+    def trigger_skip_stats(self) -> SkipStats:
+        """임계값 트리거 조건 평가 통계 (건너뛴 조건 수와 비율)"""
+        return self._get_trigger_index().skip_stats
 
     def evaluate_triggers(self) -> list[PydanticEvent]:  # 반환 타입을 PydanticEvent로 명시
         """
         임계값 기반 트리거를 평가합니다.
 
+        poll()과 같은 트리거 인덱스를 사용하므로, 같은 턴에 지표가 바뀌지 않았다면
+        poll()의 평가 결과를 그대로 재사용합니다.
+
         Returns:
             List[PydanticEvent]: 트리거된 이벤트 목록
         """
-        current_metrics = self.metrics_tracker.get_metrics()
-        threshold_events: list[PydanticEvent] = []  # 타입 명시
-
-        events_to_iterate = []
-        if self.events_container and hasattr(self.events_container, "events"):
-            events_to_iterate = self.events_container.events
-        elif self.events:
-            events_to_iterate = self.events
-
-        for event_data in events_to_iterate:
-            if event_data.type != EventCategory.THRESHOLD:
-                continue
-
-            can_fire_event = True  # 임시 (cooldown 로직은 poll에서 처리 가정 또는 EventEngine에서 상태 관리 필요)
-            if not can_fire_event:
-                continue
-
-            if event_data.trigger and self._evaluate_pydantic_trigger(
-                event_data.trigger, current_metrics
-            ):
-                threshold_events.append(event_data)
-                alert_message = event_data.description or f"임계값 이벤트 발생: {event_data.name}"
-                alert = Alert(
-                    event_id=event_data.id,
-                    message=alert_message,
-                    metrics=current_metrics.copy(),  # 여기서 metrics는 MetricEnum을 키로 가짐
-                    turn=self.current_turn,
-                    severity="WARNING",
-                )
-                self.alert_queue.append(alert)
-                self.metrics_tracker.add_event(
-                    f"Triggered: {event_data.id} - {event_data.name}"
-                )  # 이벤트 발생 기록
+        current_metrics = self.metrics_tracker.get_metrics_view()
+        threshold_events = self._get_trigger_index().threshold_events(
+            current_metrics, self._changed_metrics()
+        )
+
+        for event_data in threshold_events:
+            # Event 객체의 속성에 따라 적절한 이름/설명 사용
+            event_name = getattr(event_data, "name_ko", getattr(event_data, "name", event_data.id))
+            alert_message = getattr(event_data, "description", None) or f"임계값 이벤트 발생: {event_name}"
+            alert = Alert(
+                event_id=event_data.id,
+                message=alert_message,
+                metrics=current_metrics.copy(),  # 뷰의 dict 복사본 (MetricEnum 키)
+                turn=self.current_turn,
+                severity="WARNING",
+            )
+            self.alert_queue.append(alert)
+            self.metrics_tracker.add_event(
+                f"Triggered: {event_data.id} - {event_name}"
+            )  # 이벤트 발생 기록
         return threshold_events
 
     def apply_effects(self) -> dict[MetricEnum, float]:
@@ -274,23 +288,17 @@ class EventEngine:
         Returns:
             Dict[MetricEnum, float]: 효과가 적용된 최종 지표 상태
         """
-        current_metrics = self.metrics_tracker.get_metrics()
+        # 읽기 전용 뷰는 업데이트를 바로 반영하므로 이벤트마다 다시 복사할 필요 없음
+        current_metrics = self.metrics_tracker.get_metrics_view()
         if not self.event_queue:
-            return current_metrics
+            return current_metrics.copy()
 
         while self.event_queue:
             event: PydanticEvent = self.event_queue.popleft()
 
-            # Cooldown 및 last_fired 로직 (PydanticEvent의 필드 사용)
-            can_fire_this_event = True
-            if event.cooldown > 0:
-                if event.last_fired is not None and (
-                    self.current_turn - event.last_fired < event.cooldown
-                ):
-                    can_fire_this_event = False
-
-            if can_fire_this_event:
-                event.last_fired = self.current_turn
+            # Cooldown 및 last_fired 로직 (세션별 쿨다운 테이블 사용)
+            if not self.cooldowns.is_cooling_down(event.id, event.cooldown, self.current_turn):
+                self.cooldowns.mark_fired(event.id, self.current_turn)
 
                 updates: dict[MetricEnum, float] = {}
                 for effect_data in event.effects:
@@ -306,27 +314,11 @@ class EventEngine:
                         current_value = current_metrics[metric_enum]
                         new_value = current_value
                         try:
-                            if "%" in effect_data.formula:
-                                formula_val = effect_data.formula.replace("%", "")
-                                percentage = float(formula_val) / 100
-                                new_value = current_value * (1 + percentage)
-                            else:
-                                delta = float(effect_data.formula)
-                                new_value = current_value + delta
-                        except ValueError:
-                            try:
-                                temp_val = current_value
-                                eval_result = eval(
-                                    effect_data.formula, {"__builtins__": {}}, {"value": temp_val}
-                                )
-                                if "value" not in effect_data.formula:
-                                    new_value = current_value + float(eval_result)
-                                else:
-                                    new_value = float(eval_result)
-                            except Exception as e:
-                                print(
-                                    f"Error evaluating formula (PydanticEvent): {effect_data.formula}, Error: {e}"
-                                )
+                            new_value = compile_formula(effect_data.formula).apply(current_value)
+                        except Exception as e:
+                            print(
+                                f"Error evaluating formula (PydanticEvent): {effect_data.formula}, Error: {e}"
+                            )
 
                         updates[metric_enum] = new_value
                     else:
@@ -343,102 +335,41 @@ class EventEngine:
                 self.metrics_tracker.add_event(f"Applied event: {event.id} - {event_name}")
             else:
                 self.metrics_tracker.add_event(
-                    f"Event {event.id} in cooldown. Turn: {self.current_turn}, Last Fired: {event.last_fired}, Cooldown: {event.cooldown}"
+                    f"Event {event.id} in cooldown. Turn: {self.current_turn}, Last Fired: {self.cooldowns.last_fired(event.id)}, Cooldown: {event.cooldown}"
                 )
 
-            current_metrics = self.metrics_tracker.get_metrics()
-        return current_metrics
+        return current_metrics.copy()
 
     def _process_cascade_effects(self, changed_metrics: set[MetricEnum], depth: int) -> None:
         """
-        지표 변화의 연쇄 효과를 처리합니다.
+        지표 변화의 매트릭스 연쇄 효과를 처리합니다.
+
+        컴파일된 전파 계획으로 지표 벡터를 한 번 훑어 모든 단계의 연쇄 효과를
+        계산하고, 결과를 지표 추적기에 한 번만 반영합니다 (반영할 때 추적기가
+        임계값 규칙을 따로 평가함).
 
         Args:
             changed_metrics: 변경된 지표 집합
             depth: 현재 연쇄 깊이
         """
-        # 최대 연쇄 깊이 확인
-        if depth >= self.max_cascade_depth:
+        plan = self._cascade_plan
+        if not plan.steps or depth >= self.max_cascade_depth:
             return
 
-        # 연쇄 효과가 없으면 종료
-        if not self.cascade_matrix:
-            return
+        self.cascade_runs += 1
+        updates, messages = plan.propagate(
+            self.metrics_tracker.get_metrics_array().item,
+            [METRIC_ORDINAL[metric] for metric in changed_metrics],
+            self.max_cascade_depth - depth,
+        )
 
-        # 현재 지표 상태 가져오기 (항상 최신 상태 사용)
-        current_metrics = self.metrics_tracker.get_metrics()
-
-        # 연쇄 효과 적용
-        cascade_updates = {}
-        next_changed_metrics: set[MetricEnum] = set()
-
-        for metric in changed_metrics:
-            if metric not in self.cascade_matrix:
-                continue
-
-            # 현재 지표 값 가져오기
-            current_value = current_metrics[metric]
-
-            # 연쇄 효과 적용
-            for edge in self.cascade_matrix[metric]:
-                target_metric_name = edge["target"]
-                formula = edge["formula"]
-
-                try:
-                    # 대상 지표 확인
-                    target_metric_enum = getattr(MetricEnum, target_metric_name.upper(), None)
-                    if target_metric_enum is None:
-                        print(f"Unknown target metric: {target_metric_name}")
-                        continue
-
-                    # 현재 대상 지표 값 가져오기 (누적 적용을 위해)
-                    target_current_value = current_metrics[target_metric_enum]
-
-                    # 수식 평가 방식 결정
-                    if "%" in formula:
-                        # 백분율 표기법 처리
-                        formula_clean = formula.replace("%", "")
-                        percentage = float(formula_clean) / 100
-                        # 백분율은 현재 값에 대한 상대적 변화량
-                        result = target_current_value * (1 + percentage)
-                    else:
-                        try:
-                            # 단순 숫자인 경우 (변화량으로 처리)
-                            delta = float(formula)
-                            result = target_current_value + delta
-                        except ValueError:
-                            # 복잡한 수식인 경우
-                            # value는 변경된 소스 지표의 현재 값
-                            value = current_value
-
-                            # 수식에 'value'가 포함되어 있는지 확인
-                            if "value" in formula:
-                                # value를 사용하는 수식 (예: "value * 0.9")
-                                result = eval(formula, {"__builtins__": {}}, {"value": value})
-                            else:
-                                # value를 사용하지 않는 수식 (예: "10")
-                                # 이 경우 변화량으로 처리
-                                delta = eval(formula, {"__builtins__": {}}, {})
-                                result = target_current_value + float(delta)
-
-                    # 결과 저장
-                    cascade_updates[target_metric_enum] = result
-                    next_changed_metrics.add(target_metric_enum)
-
-                    # 이벤트 메시지 추가
-                    if "message" in edge:
-                        self.metrics_tracker.add_event(edge["message"])
-                except Exception as e:
-                    print(f"연쇄 효과 적용 실패: {e}")
-
-        # 연쇄 효과가 있으면 적용
-        if cascade_updates:
-            # 지표 업데이트 (누적 적용)
-            self.metrics_tracker.tradeoff_update_metrics(cascade_updates)
-
-            # 다음 단계 연쇄 효과 처리 (변경된 지표만)
-            if next_changed_metrics:
-                self._process_cascade_effects(next_changed_metrics, depth + 1)
+        # 이벤트 메시지 추가
+        for message in messages:
+            self.metrics_tracker.add_event(message)
+
+        # 연쇄 효과가 있으면 한 번에 적용
+        if updates:
+            self.metrics_tracker.tradeoff_update_metrics(updates)
 
     def update(self) -> dict[MetricEnum, float]:
         """
@@ -484,55 +415,9 @@ class EventEngine:
         """
         연쇄 효과 그래프가 DAG(Directed Acyclic Graph)인지 확인합니다.
 
+        매트릭스를 로드(대입)할 때 컴파일하면서 판정한 결과를 반환합니다.
+
         Returns:
             bool: DAG이면 True, 그렇지 않으면 False
         """
-        # 연쇄 효과가 없으면 DAG로 간주
-        if not self.cascade_matrix:
-            return True
-
-        # 간선 목록 생성
-        edges: list[tuple[str, str]] = []
-        for source, targets in self.cascade_matrix.items():
-            for edge in targets:
-                try:
-                    target_name = edge["target"]
-                    target_enum = getattr(MetricEnum, target_name.upper(), None)
-                    if target_enum is not None:
-                        edges.append((source.name, target_enum.name))
-                except (KeyError, AttributeError):
-                    print(f"Invalid edge: {edge}")
-
-        # 그래프 생성
-        graph: dict[str, list[str]] = defaultdict(list)
-        for source_str, target_str in edges:
-            graph[source_str].append(target_str)
-
-        # 사이클 검사
-        def is_cyclic(node: str, visited: set[str], rec_stack: set[str]) -> bool:
-            """DFS를 사용하여 사이클 검사"""
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in graph[node]:
-                if neighbor not in visited:
-                    if is_cyclic(neighbor, visited, rec_stack):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
-
-            rec_stack.remove(node)
-            return False
-
-        # 모든 노드에 대해 사이클 검사
-        visited: set[str] = set()
-        rec_stack: set[str] = set()
-
-        # 딕셔너리 순회 중 크기 변경 방지를 위해 키 리스트를 미리 생성
-        graph_nodes = list(graph.keys())
-        for node in graph_nodes:
-            if node not in visited:
-                if is_cyclic(node, visited, rec_stack):
-                    return False
-
-        return True
+        return self._cascade_plan.is_dag
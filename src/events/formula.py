@@ -0,0 +1,228 @@
+"""
+이벤트 효과 수식 컴파일러
+
+이벤트 효과(effect)와 연쇄 효과(cascade) 수식 문자열을 한 번만 해석하여
+호출 가능한 객체로 캐시합니다. 엔진의 핫 패스에서는 문자열 파싱이나
+eval 없이 컴파일된 함수를 바로 호출합니다.
+
+지원하는 수식 형태:
+- 백분율: "-5%"        → 기준값 * (1 + (-5 / 100))
+- 변화량: "-500"       → 기준값 + (-500)
+- 값 수식: "value * 0.9" → 수식 결과가 새 값
+- 상수 수식: "10 * 2"   → 기준값 + 수식 결과
+"""
+
+import ast
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum, auto
+from functools import cache
+
+import numpy as np
+
+# 수식에서 사용할 수 있는 유일한 변수 이름
+FORMULA_VARIABLE = "value"
+
+# 수식에 허용되는 AST 노드 (함수 호출, 속성 접근, 첨자 등은 허용하지 않음)
+_ALLOWED_NODES: tuple[type[ast.AST], ...] = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.BoolOp,
+    ast.Compare,
+    ast.IfExp,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.operator,
+    ast.unaryop,
+    ast.boolop,
+    ast.cmpop,
+)
+
+
+class FormulaError(ValueError):
+    """수식을 컴파일하거나 평가할 수 없을 때 발생하는 예외"""
+
+
+class FormulaKind(Enum):
+    """컴파일된 수식의 적용 방식"""
+
+    PERCENT = auto()  # 기준값에 대한 백분율 변화
+    DELTA = auto()  # 기준값에 더할 고정 변화량
+    EXPRESSION = auto()  # value를 사용하는 수식 (결과가 새 값)
+    EXPRESSION_DELTA = auto()  # value를 사용하지 않는 수식 (결과가 변화량)
+    INVALID = auto()  # 컴파일 실패
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledFormula:
+    """
+    컴파일된 수식
+
+    Attributes:
+        source: 원본 수식 문자열
+        kind: 수식 적용 방식
+        constant: PERCENT/DELTA 수식의 상수 (PERCENT는 비율로 저장)
+        function: EXPRESSION 계열 수식의 컴파일된 함수
+        error: 컴파일 실패 사유 (INVALID일 때만 설정)
+    """
+
+    source: str
+    kind: FormulaKind
+    constant: float = 0.0
+    function: Callable[[float], float] | None = None
+    error: str | None = None
+
+    @property
+    def uses_value(self) -> bool:
+        """수식 결과가 value 변수에 의존하는지 여부"""
+        return self.kind == FormulaKind.EXPRESSION
+
+    def apply(self, base: float, value: float | None = None) -> float:
+        """
+        수식을 적용하여 새 지표 값을 계산합니다.
+
+        Args:
+            base: 수식이 적용될 지표의 현재 값
+            value: 수식의 value 변수 값 (기본값: None, 이 경우 base 사용)
+
+        Returns:
+            float: 계산된 새 지표 값
+
+        Raises:
+            FormulaError: 컴파일에 실패한 수식인 경우
+        """
+        kind = self.kind
+        if kind == FormulaKind.DELTA:
+            return base + self.constant
+        if kind == FormulaKind.PERCENT:
+            return base * (1 + self.constant)
+        if kind == FormulaKind.EXPRESSION:
+            return float(self.function(base if value is None else value))  # type: ignore[misc]
+        if kind == FormulaKind.EXPRESSION_DELTA:
+            return base + float(self.function(0.0))  # type: ignore[misc]
+        raise FormulaError(f"잘못된 수식: {self.source} ({self.error})")
+
+    def apply_batch(self, base: np.ndarray, value: np.ndarray | None = None) -> np.ndarray:
+        """
+        여러 세션의 지표 값에 수식을 한 번에 적용합니다.
+
+        산술 수식은 배열 연산으로 계산하고, 비교·조건식처럼 배열로 계산할 수
+        없는 수식은 원소마다 apply()와 같은 방식으로 계산합니다.
+
+        Args:
+            base: 수식이 적용될 지표의 현재 값 배열
+            value: 수식의 value 변수 값 배열 (기본값: None, 이 경우 base 사용)
+
+        Returns:
+            np.ndarray: 계산된 새 지표 값 배열 (float64)
+
+        Raises:
+            FormulaError: 컴파일에 실패한 수식인 경우
+        """
+        kind = self.kind
+        if kind == FormulaKind.DELTA:
+            return base + self.constant
+        if kind == FormulaKind.PERCENT:
+            return base * (1 + self.constant)
+        if kind == FormulaKind.EXPRESSION_DELTA:
+            return base + float(self.function(0.0))  # type: ignore[misc]
+        if kind == FormulaKind.EXPRESSION:
+            inputs = base if value is None else value
+            try:
+                result = self.function(inputs)  # type: ignore[misc]
+            except (TypeError, ValueError):
+                result = None
+            if isinstance(result, np.ndarray) and result.shape == inputs.shape:
+                return result.astype(np.float64, copy=False)
+            function = self.function
+            return np.fromiter(
+                (float(function(v)) for v in inputs.tolist()),  # type: ignore[misc]
+                dtype=np.float64,
+                count=len(inputs),
+            )
+        raise FormulaError(f"잘못된 수식: {self.source} ({self.error})")
+
+
+def _validate_tree(tree: ast.AST) -> bool:
+    """
+    수식 AST가 안전한 노드만 포함하는지 검사합니다.
+
+    Returns:
+        bool: value 변수를 사용하면 True
+
+    Raises:
+        FormulaError: 허용되지 않는 노드나 변수가 포함된 경우
+    """
+    uses_value = False
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise FormulaError(f"허용되지 않는 구문: {type(node).__name__}")
+        if isinstance(node, ast.Name):
+            if node.id != FORMULA_VARIABLE:
+                raise FormulaError(f"알 수 없는 변수: {node.id}")
+            uses_value = True
+        elif isinstance(node, ast.Constant) and not isinstance(node.value, int | float):
+            raise FormulaError(f"숫자가 아닌 상수: {node.value!r}")
+    return uses_value
+
+
+def _compile_expression(source: str) -> CompiledFormula:
+    """value 변수를 받는 람다로 수식을 컴파일합니다."""
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+        uses_value = _validate_tree(tree)
+    except (SyntaxError, FormulaError) as e:
+        return CompiledFormula(source=source, kind=FormulaKind.INVALID, error=str(e))
+
+    lambda_node = ast.Expression(
+        body=ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg=FORMULA_VARIABLE)],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=tree.body,
+        )
+    )
+    ast.fix_missing_locations(lambda_node)
+    code = compile(lambda_node, f"<formula {source!r}>", "eval")
+    # 컴파일 시점에 한 번만 평가하여 함수 객체를 얻습니다 (핫 패스에서는 eval 없음)
+    function = eval(code, {"__builtins__": {}})
+
+    kind = FormulaKind.EXPRESSION if uses_value else FormulaKind.EXPRESSION_DELTA
+    return CompiledFormula(source=source, kind=kind, function=function)
+
+
+@cache
+def compile_formula(source: str) -> CompiledFormula:
+    """
+    수식 문자열을 컴파일합니다. 결과는 수식 문자열을 키로 캐시됩니다.
+
+    Args:
+        source: 수식 문자열
+
+    Returns:
+        CompiledFormula: 컴파일된 수식 (실패 시 kind가 INVALID)
+    """
+    if "%" in source:
+        try:
+            percentage = float(source.replace("%", "")) / 100
+            return CompiledFormula(source=source, kind=FormulaKind.PERCENT, constant=percentage)
+        except ValueError:
+            pass
+    else:
+        try:
+            return CompiledFormula(source=source, kind=FormulaKind.DELTA, constant=float(source))
+        except ValueError:
+            pass
+
+    return _compile_expression(source)
+
+
+def clear_formula_cache() -> None:
+    """컴파일된 수식 캐시를 비웁니다."""
+    compile_formula.cache_clear()
@@ -7,11 +7,20 @@
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from game_constants import Metric
+from src.core.rng import RngService
 from src.events.engine import EventEngine
 from src.events.models import Alert
+from src.metrics.dirty import SkipStats
+from src.metrics.series import MetricsSeries
+from src.metrics.state import METRIC_ORDER
 from src.metrics.tracker import MetricsTracker
 
+# 한 번에 진행할 수 있는 최대 일수
+MAX_ADVANCE_DAYS = 3650
+
 
 class GameEventSystem:
     """
@@ -27,6 +36,7 @@ class GameEventSystem:
         events_file: str | None = "data/events.toml",
         tradeoff_file: str | None = "data/tradeoff_matrix.toml",
         seed: int | None = None,
+        rng: RngService | None = None,
     ):
         """
         GameEventSystem 초기화
@@ -36,6 +46,7 @@ class GameEventSystem:
             events_file: 이벤트 정의 파일 경로 (기본값: "data/events.toml")
             tradeoff_file: 트레이드오프 매트릭스 파일 경로 (기본값: "data/tradeoff_matrix.toml")
             seed: 난수 생성 시드 (기본값: None)
+            rng: 난수 서비스 (기본값: None, 이 경우 seed로 새로 생성)
         """
         # 지표 추적기 초기화
         self.metrics_tracker = metrics_tracker or MetricsTracker()
@@ -54,6 +65,7 @@ class GameEventSystem:
             events_file=events_path,
             tradeoff_file=tradeoff_path,
             seed=seed,
+            rng=rng,
         )
 
         # 현재 게임 일수
@@ -66,12 +78,21 @@ class GameEventSystem:
         Returns:
             Dict[Metric, float]: 업데이트 후 지표 상태
         """
+        metrics = self._step_day()
+
+        # 스냅샷 생성 (지표 추적기의 스냅샷 간격에 따름)
+        self.metrics_tracker.snapshot_if_due()
+
+        return metrics
+
+    def _step_day(self) -> dict[Metric, float]:
+        """스냅샷 없이 하루를 진행합니다."""
         # 일수 증가
         self.day += 1
 
-        # 불확실성 요소 적용
+        # 불확실성 요소 적용 (일수별 "uncertainty" 스트림)
         self.metrics_tracker.uncertainty_apply_random_fluctuation(
-            day=self.day, seed=self.event_engine.rng.randint(0, 10000)
+            day=self.day, rng=self.event_engine.rng_service.stream("uncertainty", self.day)
         )
 
         # 이벤트 엔진 업데이트
@@ -80,11 +101,45 @@ class GameEventSystem:
         # 임계값 이벤트 확인
         self.metrics_tracker.check_threshold_events()
 
-        # 스냅샷 생성
-        self.metrics_tracker.create_snapshot()
-
         return metrics
 
+    def advance_days(self, days: int, snapshot_every: int = 0) -> MetricsSeries:
+        """
+        여러 날을 한 번에 진행합니다 (자동 진행, 리플레이용).
+
+        날마다 update_day()와 같은 순서로 진행하지만, 지표는 미리 할당한 배열에
+        모으고 스냅샷은 생략하거나 snapshot_every일마다만 만듭니다.
+
+        Args:
+            days: 진행할 일수 (1 ~ MAX_ADVANCE_DAYS)
+            snapshot_every: 스냅샷 간격 (기본값: 0, 스냅샷 없음)
+
+        Returns:
+            MetricsSeries: 진행한 날들의 일별 지표 (각 날의 종료 시점)
+
+        Raises:
+            ValueError: 일수가 범위를 벗어난 경우
+        """
+        if not 1 <= days <= MAX_ADVANCE_DAYS:
+            raise ValueError(f"진행 일수는 1 ~ {MAX_ADVANCE_DAYS} 사이여야 합니다: {days}")
+
+        tracker = self.metrics_tracker
+        values = np.empty((days, len(METRIC_ORDER)), dtype=np.float64)
+        start_day = self.day + 1
+        for i in range(days):
+            self._step_day()
+            values[i] = tracker.get_metrics_array()
+            if snapshot_every > 0 and self.day % snapshot_every == 0:
+                tracker.create_snapshot()
+
+        return MetricsSeries(start_day=start_day, values=values)
+
+    def close(self) -> None:
+        """
+        남은 스냅샷을 모두 기록하고 지표 추적기의 자원을 정리합니다.
+        """
+        self.metrics_tracker.close()
+
     def get_alerts(self, count: int | None = None) -> list[Alert]:
         """
         알림을 가져옵니다.
@@ -121,6 +176,20 @@ class GameEventSystem:
         """
         return self.metrics_tracker.get_history(steps)
 
+    def get_skip_stats(self) -> dict[str, SkipStats]:
+        """
+        바뀌지 않은 지표의 조건을 건너뛴 통계를 가져옵니다.
+
+        각 통계의 skip_rate가 건너뛴 조건의 비율이며, str()로 보고용 문장을 만듭니다.
+
+        Returns:
+            dict[str, SkipStats]: 평가기 이름("triggers", "thresholds")별 통계
+        """
+        return {
+            "triggers": self.event_engine.trigger_skip_stats,
+            "thresholds": self.metrics_tracker.threshold_skip_stats,
+        }
+
     def validate_tradeoff_matrix(self) -> bool:
         """
         트레이드오프 매트릭스의 DAG 안전성을 검증합니다.
@@ -164,10 +233,11 @@ class GameEventSystem:
         if seed is not None:
             self.set_seed(seed)
 
-        # 이벤트 엔진 큐 초기화
+        # 이벤트 엔진 큐와 쿨다운 기록 초기화
         self.event_engine.event_queue.clear()
         self.event_engine.alert_queue.clear()
         self.event_engine.current_turn = 0
+        self.event_engine.cooldowns.clear()
 
     def simulate_scenario_no_right_answer(
         self, scenario: dict[str, Any], days: int = 10
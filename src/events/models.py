@@ -10,6 +10,8 @@ from datetime import datetime
 from enum import Enum, auto
 
 from game_constants import FLOAT_EPSILON, Metric
+from src.core.rng import RngStream
+from src.events.formula import compile_formula
 
 
 class TriggerCondition(Enum):
@@ -136,31 +138,9 @@ class Effect:
 
         current_value = current_metrics[self.metric]
 
-        # 백분율 표기법 처리 (예: "-5%")
-        if "%" in self.formula:
-            formula = self.formula.replace("%", "")
-            percentage = float(formula) / 100
-            # 백분율은 현재 값에 대한 상대적 변화량
-            return current_value * (1 + percentage)
-
-        # 일반 수식 평가 (value는 현재 지표 값)
+        # 컴파일된 수식 적용 (백분율/변화량/value 수식 모두 처리, 결과는 캐시됨)
         try:
-            # 수식이 단순 숫자인 경우 (예: "-500")
-            try:
-                # 숫자로 변환 가능하면 변화량으로 처리
-                delta = float(self.formula)
-                return current_value + delta
-            except ValueError:
-                # 수식이 복잡한 경우 (예: "value * 0.9")
-                value = current_value
-                result = eval(self.formula, {"__builtins__": {}}, {"value": value})
-
-                # 수식이 절대값을 반환하는 경우 (value를 사용하지 않는 경우)
-                if "value" not in self.formula:
-                    # 변화량으로 처리
-                    return current_value + float(result)
-                # 수식이 새 값을 직접 계산하는 경우
-                return float(result)
+            return compile_formula(self.formula).apply(current_value)
         except Exception as e:
             # 수식 평가 실패 시 현재 값 유지
             print(f"수식 평가 실패: {self.formula}, 오류: {e}")
@@ -220,7 +200,7 @@ class Event:
         return True
 
     def evaluate_trigger(
-        self, current_metrics: dict[Metric, float], rng: random.Random | None = None
+        self, current_metrics: dict[Metric, float], rng: random.Random | RngStream | None = None
     ) -> bool:
         """
         이벤트 트리거 조건을 평가합니다.
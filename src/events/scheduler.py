@@ -0,0 +1,379 @@
+"""
+다중 세션 틱 스케줄러
+
+호스팅 환경에서 수천 개의 게임 세션을 한 번에 하루씩 진행합니다.
+세션마다 MetricsTracker와 EventEngine을 두는 대신, 지표는 (세션 수 x 지표 수)
+float64 배열 하나에, 이벤트 쿨다운은 (세션 수 x 이벤트 수) 배열에 모으고
+이벤트 정의는 모든 세션이 EventCatalog 하나를 공유합니다.
+
+하루 진행 순서는 GameEventSystem.update_day()와 같습니다.
+1. 무작위 변동 (행복-고통 시소 유지)
+2. 이벤트 폴링 (THRESHOLD 트리거, RANDOM 확률)
+3. 우선순위 순서로 이벤트 효과 적용 (쿨다운, 시소, 지표 추적기 연쇄 효과)
+4. 트레이드오프 매트릭스 연쇄 효과
+
+모든 계산은 세션 축으로 벡터화되어 있고, 난수는 세션 시드의 "scheduler"
+스트림(src.core.rng)에서 (일수, 용도) 카운터로 뽑으므로 같은 시드의 세션은
+함께 진행하는 다른 세션이나 진행 묶음과 관계없이 같은 결과를 냅니다.
+세션별 히스토리와 이벤트 메시지는 보관하지 않습니다.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+from game_constants import (
+    FLOAT_EPSILON,
+    Metric,
+    ProbabilityConstants,
+    cap_metric_value,
+    get_metric_ranges,
+)
+from src.core.rng import RNG_STREAM_STRIDE, RngService, draw_uniforms
+from src.events.catalog import EventCatalog
+from src.metrics.state import METRIC_ORDER, METRIC_ORDINAL, read_only
+from src.metrics.tracker import HAPPINESS_SUFFERING_SUM, MetricsTracker, threshold_cascade_plan
+
+_HAPPINESS = METRIC_ORDINAL[Metric.HAPPINESS]
+_SUFFERING = METRIC_ORDINAL[Metric.SUFFERING]
+
+
+class SessionScheduler:
+    """
+    여러 게임 세션을 한 번에 진행하는 틱 스케줄러
+
+    세션 상태는 행 단위로 빽빽하게 보관하며, 세션을 제거하면 마지막 행을
+    빈자리로 옮깁니다. 용량이 부족하면 두 배로 늘립니다.
+    """
+
+    def __init__(
+        self,
+        catalog: EventCatalog,
+        intensity: float = 0.1,
+        max_cascade_depth: int = 10,
+        capacity: int = 64,
+    ) -> None:
+        """
+        SessionScheduler 초기화
+
+        Args:
+            catalog: 모든 세션이 공유하는 이벤트 카탈로그
+            intensity: 무작위 변동 강도 (기본값: 0.1)
+            max_cascade_depth: 최대 연쇄 깊이 (기본값: 10)
+            capacity: 초기 세션 용량 (기본값: 64)
+        """
+        self.catalog = catalog
+        self.intensity = intensity
+        self.max_cascade_depth = max_cascade_depth
+
+        tracked = tuple(get_metric_ranges())
+        self._fluctuating = np.array(
+            [
+                METRIC_ORDINAL[metric]
+                for metric in tracked
+                if metric not in {Metric.HAPPINESS, Metric.SUFFERING}
+            ],
+            dtype=np.intp,
+        )
+
+        # 하루치 난수 용도: 변동 지표들, 시소 방향, 시소 변동, RANDOM 이벤트들
+        draws = len(self._fluctuating) + 2 + len(catalog.random_positions)
+        if draws > RNG_STREAM_STRIDE:
+            raise ValueError(f"하루 난수 수가 너무 많습니다: {draws}")
+        self._draws = draws
+
+        capacity = max(1, capacity)
+        self._values = np.zeros((capacity, len(METRIC_ORDER)), dtype=np.float64)
+        self._days = np.zeros(capacity, dtype=np.int32)
+        self._keys = np.zeros(capacity, dtype=np.uint64)
+        self._last_fired = np.full((capacity, len(catalog)), -1, dtype=np.int32)
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._rows
+
+    @property
+    def session_ids(self) -> tuple[str, ...]:
+        """행 순서의 세션 ID 목록"""
+        return tuple(self._ids)
+
+    @property
+    def nbytes_per_session(self) -> int:
+        """세션 하나가 차지하는 상태 배열 크기 (바이트)"""
+        return (
+            self._values.itemsize * self._values.shape[1]
+            + self._days.itemsize
+            + self._keys.itemsize
+            + self._last_fired.itemsize * self._last_fired.shape[1]
+        )
+
+    def _grow(self) -> None:
+        """상태 배열 용량을 두 배로 늘립니다."""
+        capacity = self._values.shape[0] * 2
+        size = len(self._ids)
+
+        def resized(array: np.ndarray, fill: float) -> np.ndarray:
+            grown = np.full((capacity, *array.shape[1:]), fill, dtype=array.dtype)
+            grown[:size] = array[:size]
+            return grown
+
+        self._values = resized(self._values, 0.0)
+        self._days = resized(self._days, 0)
+        self._keys = resized(self._keys, 0)
+        self._last_fired = resized(self._last_fired, -1)
+
+    def add_session(
+        self,
+        session_id: str,
+        seed: int | None = None,
+        initial_metrics: Mapping[Metric, float] | None = None,
+        day: int = 0,
+    ) -> None:
+        """
+        세션을 추가합니다.
+
+        Args:
+            session_id: 세션 ID
+            seed: 세션 난수 시드 (기본값: None, 무작위)
+            initial_metrics: 초기 지표 (기본값: None, 상수의 기본값 사용)
+            day: 현재 게임 일수 (기본값: 0)
+
+        Raises:
+            ValueError: 이미 있는 세션 ID인 경우
+        """
+        if session_id in self._rows:
+            raise ValueError(f"이미 있는 세션입니다: {session_id}")
+        if len(self._ids) == self._values.shape[0]:
+            self._grow()
+
+        row = len(self._ids)
+        values = self._values[row]
+        values[:] = 0.0
+        for metric, (_min_val, _max_val, default_val) in get_metric_ranges().items():
+            if initial_metrics and metric in initial_metrics:
+                values[METRIC_ORDINAL[metric]] = cap_metric_value(metric, initial_metrics[metric])
+            else:
+                values[METRIC_ORDINAL[metric]] = default_val
+        self._days[row] = day
+        self._keys[row] = RngService(seed).key("scheduler")
+        self._last_fired[row] = -1
+
+        self._ids.append(session_id)
+        self._rows[session_id] = row
+
+    def remove_session(self, session_id: str) -> bool:
+        """
+        세션을 제거합니다.
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            bool: 제거했으면 True, 없는 세션이면 False
+        """
+        row = self._rows.pop(session_id, None)
+        if row is None:
+            return False
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            for array in (self._values, self._days, self._keys, self._last_fired):
+                array[row] = array[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+        self._ids.pop()
+        return True
+
+    def get_metrics(self, session_id: str) -> dict[Metric, float]:
+        """
+        세션의 현재 지표를 반환합니다.
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            dict[Metric, float]: 추적 중인 지표의 현재 값
+        """
+        row = self._values[self._rows[session_id]]
+        return {metric: float(row[METRIC_ORDINAL[metric]]) for metric in get_metric_ranges()}
+
+    def get_day(self, session_id: str) -> int:
+        """
+        세션의 현재 게임 일수를 반환합니다.
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            int: 현재 게임 일수
+        """
+        return int(self._days[self._rows[session_id]])
+
+    @property
+    def metrics_array(self) -> np.ndarray:
+        """(세션 수 x 지표 수) 지표 배열의 읽기 전용 뷰 (행 순서는 session_ids)"""
+        return read_only(self._values[: len(self._ids)])
+
+    def tick(self, days: int = 1) -> np.ndarray:
+        """
+        모든 세션을 days일 진행합니다.
+
+        Args:
+            days: 진행할 일수 (기본값: 1)
+
+        Returns:
+            np.ndarray: (세션 수 x 이벤트 수) 세션별 이벤트 적용 횟수
+
+        Raises:
+            ValueError: 일수가 1보다 작은 경우
+        """
+        if days < 1:
+            raise ValueError(f"진행 일수는 1 이상이어야 합니다: {days}")
+
+        size = len(self._ids)
+        applied = np.zeros((size, len(self.catalog)), dtype=np.int32)
+        if size == 0:
+            return applied
+        for _ in range(days):
+            self._step(size, applied)
+        return applied
+
+    def _step(self, size: int, applied: np.ndarray) -> None:
+        """모든 세션을 하루 진행합니다."""
+        values = self._values[:size]
+        days = self._days[:size]
+        days += 1
+
+        uniforms = draw_uniforms(self._keys[:size], days, self._draws)
+
+        self._fluctuate(values, uniforms)
+        fired = self._poll(values, uniforms[:, len(self._fluctuating) + 2 :])
+        self._apply_events(values, days, fired, applied)
+
+    def _fluctuate(self, values: np.ndarray, uniforms: np.ndarray) -> None:
+        """불확실성 무작위 변동을 적용합니다 (uncertainty_apply_random_fluctuation과 같은 규칙)."""
+        low = -self.intensity
+        span = 2 * self.intensity
+        columns = self._fluctuating
+        count = len(columns)
+
+        current = values[:, columns]
+        values[:, columns] = current + (low + span * uniforms[:, :count]) * current
+
+        # 행복-고통 시소: 절반 확률로 행복 또는 고통 중 하나를 변동
+        pick_happiness = uniforms[:, count] < ProbabilityConstants.RANDOM_THRESHOLD
+        change = low + span * uniforms[:, count + 1]
+        happiness = values[:, _HAPPINESS]
+        suffering = values[:, _SUFFERING]
+        new_happiness = happiness + change * happiness
+        new_suffering = suffering + change * suffering
+        values[:, _HAPPINESS] = np.where(
+            pick_happiness, new_happiness, HAPPINESS_SUFFERING_SUM - new_suffering
+        )
+        values[:, _SUFFERING] = np.where(
+            pick_happiness, HAPPINESS_SUFFERING_SUM - new_happiness, new_suffering
+        )
+
+    def _poll(self, values: np.ndarray, random_draws: np.ndarray) -> np.ndarray:
+        """발생 조건을 만족한 이벤트의 (세션 수 x 이벤트 수) 마스크를 반환합니다."""
+        catalog = self.catalog
+        fired = np.zeros((values.shape[0], len(catalog)), dtype=bool)
+
+        if len(catalog.threshold_positions):
+            current = values[:, catalog.threshold_columns]
+            thresholds = catalog.threshold_values
+            matched = np.empty(current.shape, dtype=bool)
+            for i, condition in enumerate(catalog.threshold_conditions):
+                matched[:, i] = _compare(condition, current[:, i], thresholds[i])
+            fired[:, catalog.threshold_positions] = matched
+
+        if len(catalog.random_positions):
+            fired[:, catalog.random_positions] |= random_draws < catalog.random_probabilities
+        return fired
+
+    def _apply_events(
+        self, values: np.ndarray, days: np.ndarray, fired: np.ndarray, applied: np.ndarray
+    ) -> None:
+        """발생한 이벤트를 우선순위 순서로 세션별로 적용합니다."""
+        catalog = self.catalog
+        for position in catalog.apply_order:
+            mask = fired[:, position]
+            if not mask.any():
+                continue
+
+            last_fired = self._last_fired[: len(days), position]
+            cooldown = catalog.cooldowns[position]
+            if cooldown > 0:
+                mask &= ~((last_fired >= 0) & (days - last_fired < cooldown))
+                if not mask.any():
+                    continue
+            last_fired[mask] = days[mask]
+            applied[:, position] += mask
+
+            effects = catalog.effects[position]
+            if not effects:
+                continue
+            rows = np.flatnonzero(mask)
+            block = values[rows]
+            updates = {
+                effect.metric: effect.formula.apply_batch(block[:, effect.column])
+                for effect in effects
+            }
+            self._update_block(block, updates)
+            self._cascade(block, set(updates))
+            values[rows] = block
+
+    def _update_block(self, block: np.ndarray, updates: dict[Metric, np.ndarray]) -> None:
+        """
+        MetricsTracker.tradeoff_update_metrics()와 같이 업데이트, 시소, 지표 추적기
+        연쇄 효과를 세션 묶음에 적용합니다.
+        """
+        _apply_seesaw_updates(block, updates)
+        plan = threshold_cascade_plan(MetricsTracker.cascade_thresholds)
+        cascade_updates = plan.propagate_level_batch(
+            lambda column: block[:, column], [METRIC_ORDINAL[metric] for metric in updates]
+        )
+        for metric, column_values in cascade_updates.items():
+            block[:, METRIC_ORDINAL[metric]] = column_values
+
+    def _cascade(self, block: np.ndarray, changed: set[Metric]) -> None:
+        """
+        트레이드오프 매트릭스 연쇄 효과를 세션 묶음에 적용합니다.
+
+        EventEngine과 같은 전파 계획으로 계산하고 한 번에 반영합니다.
+        """
+        updates = self.catalog.cascade_plan.propagate_batch(
+            lambda column: block[:, column],
+            [METRIC_ORDINAL[metric] for metric in changed],
+            self.max_cascade_depth,
+        )
+        if updates:
+            self._update_block(block, updates)
+
+
+def _compare(condition: str, current: np.ndarray, threshold: float) -> np.ndarray:
+    """트리거 조건을 배열로 평가합니다 (TriggerIndex와 같은 규칙)."""
+    if condition == "LESS_THAN":
+        return current < threshold
+    if condition == "LESS_THAN_OR_EQUAL":
+        return current <= threshold
+    if condition == "GREATER_THAN":
+        return current > threshold
+    if condition == "GREATER_THAN_OR_EQUAL":
+        return current >= threshold
+    near = np.abs(current - threshold) < FLOAT_EPSILON
+    return near if condition == "EQUAL" else ~near
+
+
+def _apply_seesaw_updates(block: np.ndarray, updates: dict[Metric, np.ndarray]) -> None:
+    """업데이트를 쓰고 행복-고통 시소 불변식을 맞춥니다 (SimpleSeesawModifier와 같은 규칙)."""
+    for metric, column_values in updates.items():
+        block[:, METRIC_ORDINAL[metric]] = column_values
+    if Metric.HAPPINESS in updates:
+        block[:, _SUFFERING] = HAPPINESS_SUFFERING_SUM - block[:, _HAPPINESS]
+    elif Metric.SUFFERING in updates:
+        block[:, _HAPPINESS] = HAPPINESS_SUFFERING_SUM - block[:, _SUFFERING]
@@ -75,7 +75,7 @@ class Event(BaseModel):
     priority: int = Field(default=0)
     trigger: EventTrigger | None = None
     cascade_events: list[CascadeEvent] = Field(default_factory=list)  # 이벤트 레벨의 연쇄 이벤트
-    last_fired: int | None = None
+    last_fired: int | None = None  # 사용하지 않음: 세션별 발생 기록은 CooldownTable에 보관
 
     model_config = ConfigDict(strict=True)
 
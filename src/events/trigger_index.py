@@ -0,0 +1,231 @@
+"""
+임계값 트리거 인덱스
+
+이벤트 로드 시점에 THRESHOLD 이벤트의 트리거를 지표별·조건별로 정렬된
+임계값 배열로 색인합니다. 매 턴 전체 이벤트 목록을 순회하는 대신, 값이
+바뀐 지표마다 이분 탐색 한 번으로 조건을 만족하는 이벤트를 찾습니다.
+"""
+
+import copy
+from bisect import bisect_left, bisect_right
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from game_constants import FLOAT_EPSILON, Metric
+from src.metrics.dirty import SkipStats
+
+
+def event_category_name(event: Any) -> str:
+    """
+    이벤트 타입을 카테고리 이름으로 정규화합니다.
+
+    Pydantic 이벤트는 문자열("THRESHOLD"), 데이터클래스 이벤트는 Enum을
+    사용하므로 두 형태를 모두 이름 문자열로 맞춥니다.
+    """
+    event_type = getattr(event, "type", None)
+    if isinstance(event_type, Enum):
+        return event_type.name
+    return str(event_type).upper()
+
+
+def resolve_metric(metric: Any) -> Metric | None:
+    """트리거/효과의 지표 표기(Enum 또는 문자열)를 Metric으로 변환합니다."""
+    if isinstance(metric, Metric):
+        return metric
+    if isinstance(metric, str):
+        return getattr(Metric, metric.upper(), None)
+    return None
+
+
+def resolve_condition(condition: Any) -> str:
+    """트리거 조건 표기(Enum 또는 문자열)를 대문자 이름으로 변환합니다."""
+    if isinstance(condition, Enum):
+        return condition.name
+    return str(condition).upper()
+
+
+@dataclass
+class _ThresholdColumn:
+    """한 지표·한 조건에 대한 정렬된 임계값 배열"""
+
+    values: list[float] = field(default_factory=list)
+    positions: list[int] = field(default_factory=list)
+
+    def add(self, value: float, position: int) -> None:
+        """임계값을 정렬 순서를 유지하며 추가합니다."""
+        index = bisect_right(self.values, value)
+        self.values.insert(index, value)
+        self.positions.insert(index, position)
+
+    def matching(self, condition: str, current: float) -> list[int]:
+        """현재 값에서 조건을 만족하는 이벤트 위치 목록을 반환합니다."""
+        values = self.values
+        positions = self.positions
+        if condition == "LESS_THAN":  # current < t
+            return positions[bisect_right(values, current) :]
+        if condition == "LESS_THAN_OR_EQUAL":  # current <= t
+            return positions[bisect_left(values, current) :]
+        if condition == "GREATER_THAN":  # current > t
+            return positions[: bisect_left(values, current)]
+        if condition == "GREATER_THAN_OR_EQUAL":  # current >= t
+            return positions[: bisect_right(values, current)]
+
+        # |current - t| < epsilon 구간
+        low = bisect_right(values, current - FLOAT_EPSILON)
+        high = bisect_left(values, current + FLOAT_EPSILON)
+        if condition == "EQUAL":
+            return positions[low:high]
+        return positions[:low] + positions[high:]  # NOT_EQUAL
+
+
+# 인덱스가 지원하는 트리거 조건
+INDEXED_CONDITIONS: frozenset[str] = frozenset(
+    {
+        "LESS_THAN",
+        "GREATER_THAN",
+        "EQUAL",
+        "NOT_EQUAL",
+        "GREATER_THAN_OR_EQUAL",
+        "LESS_THAN_OR_EQUAL",
+    }
+)
+
+
+class TriggerIndex:
+    """
+    지표별 임계값 트리거 인덱스
+
+    THRESHOLD 이벤트는 (지표, 조건)별 정렬 배열로, RANDOM 이벤트는 원래
+    순서를 유지하는 목록으로 보관합니다. 평가 결과는 지표별로 캐시되어
+    값이 바뀐 지표만 다시 탐색하며, 건너뛴 조건 수는 skip_stats에 집계합니다.
+    """
+
+    def __init__(self, events: Sequence[Any]) -> None:
+        """
+        TriggerIndex 초기화
+
+        Args:
+            events: 색인할 이벤트 목록 (원래 순서가 우선순위 동률 처리에 사용됨)
+        """
+        self._source = events
+        self._source_length = len(events)
+        self.events: list[Any] = list(events)
+        self.random_positions: list[int] = []
+        self.unresolved: list[str] = []
+        self._columns: dict[Metric, dict[str, _ThresholdColumn]] = {}
+        self._cache: dict[Metric, tuple[float, list[int]]] = {}
+        self._last_result: list[int] = []
+        self._condition_counts: dict[Metric, int] = {}
+        self.skip_stats = SkipStats()
+
+        for position, event in enumerate(self.events):
+            category = event_category_name(event)
+            if category == "RANDOM":
+                self.random_positions.append(position)
+            elif category == "THRESHOLD" and event.trigger is not None:
+                self._add_threshold(position, event)
+
+    def _add_threshold(self, position: int, event: Any) -> None:
+        """THRESHOLD 이벤트 트리거를 인덱스에 추가합니다."""
+        trigger = event.trigger
+        metric = resolve_metric(trigger.metric)
+        condition = resolve_condition(trigger.condition)
+        value = trigger.value
+
+        if metric is None or condition not in INDEXED_CONDITIONS:
+            self.unresolved.append(event.id)
+            print(
+                f"[Debug] Unindexable trigger: {event.id} ({trigger.metric}, {trigger.condition})"
+            )
+            return
+        if not isinstance(value, int | float) or isinstance(value, bool):
+            self.unresolved.append(event.id)
+            print(f"[Debug] Non-numeric trigger value: {event.id} ({value!r})")
+            return
+
+        columns = self._columns.setdefault(metric, {})
+        columns.setdefault(condition, _ThresholdColumn()).add(float(value), position)
+        self._condition_counts[metric] = self._condition_counts.get(metric, 0) + 1
+
+    def fork(self) -> "TriggerIndex":
+        """
+        색인 배열을 공유하고 평가 캐시만 새로 가진 사본을 만듭니다.
+
+        공유 이벤트 카탈로그의 인덱스 원본을 세션마다 다시 만들지 않기 위해
+        사용합니다. 색인 배열은 생성 후 바뀌지 않으므로 복사하지 않습니다.
+
+        Returns:
+            TriggerIndex: 평가 캐시가 비어 있는 사본
+        """
+        forked = copy.copy(self)
+        forked._cache = {}
+        forked._last_result = []
+        forked.skip_stats = SkipStats()
+        return forked
+
+    def is_built_from(self, events: Sequence[Any]) -> bool:
+        """주어진 이벤트 목록으로 만든 인덱스인지 확인합니다."""
+        return events is self._source and len(events) == self._source_length
+
+    @property
+    def indexed_metrics(self) -> frozenset[Metric]:
+        """임계값 트리거가 걸린 지표 집합"""
+        return frozenset(self._columns)
+
+    def evaluate(
+        self,
+        current_metrics: dict[Metric, float],
+        changed: Collection[Metric] | None = None,
+    ) -> list[int]:
+        """
+        현재 지표에서 트리거 조건을 만족하는 THRESHOLD 이벤트 위치를 반환합니다.
+
+        값이 바뀐 지표만 이분 탐색하고, 나머지는 이전 결과를 재사용합니다.
+        changed를 주면 값 비교 없이 그 지표(와 아직 평가하지 않은 지표)만
+        다시 탐색합니다.
+
+        Args:
+            current_metrics: 현재 지표 상태
+            changed: 마지막 평가 이후 바뀐 지표 (기본값: None, 값 비교로 판정)
+
+        Returns:
+            list[int]: 조건을 만족하는 이벤트의 원래 목록 내 위치 (오름차순)
+        """
+        updated = False
+        evaluated = skipped = 0
+        for metric, columns in self._columns.items():
+            cached = self._cache.get(metric)
+            if cached is not None and (
+                metric not in changed
+                if changed is not None
+                else cached[0] == current_metrics.get(metric)
+            ):
+                skipped += self._condition_counts[metric]
+                continue
+
+            current = current_metrics.get(metric)
+            evaluated += self._condition_counts[metric]
+            updated = True
+            if current is None:
+                self._cache[metric] = (current, [])  # type: ignore[assignment]
+                continue
+            matched: list[int] = []
+            for condition, column in columns.items():
+                matched.extend(column.matching(condition, current))
+            self._cache[metric] = (current, matched)
+        self.skip_stats.record(evaluated, skipped)
+
+        if updated:
+            positions: set[int] = set()
+            for _value, matched in self._cache.values():
+                positions.update(matched)
+            self._last_result = sorted(positions)
+        return self._last_result
+
+    def threshold_events(
+        self, current_metrics: dict[Metric, float], changed: Collection[Metric] | None = None
+    ) -> list[Any]:
+        """조건을 만족하는 THRESHOLD 이벤트 목록을 원래 순서대로 반환합니다."""
+        return [self.events[position] for position in self.evaluate(current_metrics, changed)]
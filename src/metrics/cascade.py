@@ -0,0 +1,407 @@
+"""
+지표 연쇄 효과 전파 단계
+
+연쇄 효과 간선을 지표 벡터를 한 번 훑는 전파 계획(CascadePlan)으로
+컴파일합니다. 연쇄 효과는 두 단계에서 이 계획 구현을 함께 씁니다.
+
+- 임계값 규칙: 지표 추적기가 지표를 갱신할 때마다 변경 지표의 규칙을 한
+  단계만 평가합니다 (propagate_level, MetricsTracker.cascade_runs /
+  cascade_memo_hits에 집계).
+- 트레이드오프 매트릭스(data/tradeoff_matrix.toml): 이벤트 효과를 적용한
+  뒤에만 EventEngine이 여러 단계로 전파합니다 (propagate,
+  EventEngine.cascade_runs에 집계). 전파 결과를 반영할 때 추적기가 다시
+  임계값 규칙을 평가합니다.
+
+두 단계는 간선 모음과 실행 시점이 달라 따로 반영되므로, 연쇄 효과 비용을
+측정할 때는 두 카운터를 함께 봐야 합니다.
+
+간선은 다음 메서드를 가진 객체입니다 (CascadeEdge 프로토콜).
+- fire(base, value): 발생하면 (새 대상 값, 메시지), 조건이 맞지 않으면 None
+- fire_batch(base, value): 세션 묶음 배열 버전, (새 대상 값 배열, 발생 마스크)
+"""
+
+import heapq
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import numpy as np
+
+from game_constants import Metric
+from src.metrics.state import METRIC_ORDER, METRIC_ORDINAL
+
+# 원인 지표 하나가 가질 수 있는 최대 간선 수 (넘는 간선은 컴파일 시 제외)
+MAX_CASCADE_FAN_OUT = 8
+
+
+class CascadeEdge(Protocol):
+    """연쇄 효과 간선 프로토콜"""
+
+    source: Metric
+    target: Metric
+
+    def fire(self, base: float, value: float) -> tuple[float, str | None] | None:
+        ...
+
+    def fire_batch(self, base: np.ndarray, value: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        ...
+
+
+def matches_condition(condition: str, value: Any, threshold: float) -> Any:
+    """임계값 조건을 스칼라 또는 배열에 대해 평가합니다."""
+    if condition == "LESS_THAN":
+        return value < threshold
+    if condition == "LESS_THAN_OR_EQUAL":
+        return value <= threshold
+    if condition == "GREATER_THAN":
+        return value > threshold
+    if condition == "GREATER_THAN_OR_EQUAL":
+        return value >= threshold
+    raise ValueError(f"지원하지 않는 조건: {condition}")
+
+
+@dataclass(frozen=True, slots=True)
+class RuleCase:
+    """
+    임계값 규칙의 한 구간
+
+    원인 지표 값이 조건을 만족하면 대상 지표에
+    intercept + slope * 원인 값 만큼을 더합니다.
+
+    Attributes:
+        condition: 조건 이름 (LESS_THAN, LESS_THAN_OR_EQUAL, GREATER_THAN, GREATER_THAN_OR_EQUAL)
+        threshold: 임계값
+        intercept: 변화량의 상수항
+        slope: 변화량의 원인 값 계수
+        message: 이벤트 메시지 형식 ({impact}에 변화량)
+    """
+
+    condition: str
+    threshold: float
+    intercept: float
+    slope: float
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class ThresholdRule:
+    """
+    임계값 기반 연쇄 효과 간선
+
+    구간은 순서대로 검사하며 처음 맞는 구간 하나만 적용합니다.
+
+    Attributes:
+        source: 원인 지표
+        target: 대상 지표
+        cases: 검사할 구간 목록
+    """
+
+    source: Metric
+    target: Metric
+    cases: tuple[RuleCase, ...]
+
+    def fire(self, base: float, value: float) -> tuple[float, str | None] | None:
+        """
+        규칙을 적용합니다.
+
+        Args:
+            base: 대상 지표의 현재 값
+            value: 원인 지표의 현재 값
+
+        Returns:
+            (새 대상 값, 메시지), 맞는 구간이 없으면 None
+        """
+        for case in self.cases:
+            if matches_condition(case.condition, value, case.threshold):
+                impact = case.intercept + case.slope * value
+                return base + impact, case.message.format(impact=impact)
+        return None
+
+    def fire_batch(self, base: np.ndarray, value: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        세션 묶음에 규칙을 적용합니다.
+
+        Args:
+            base: 대상 지표의 현재 값 배열
+            value: 원인 지표의 현재 값 배열
+
+        Returns:
+            (새 대상 값 배열, 규칙이 적용된 행 마스크)
+        """
+        result = base
+        fired = np.zeros(base.shape, dtype=bool)
+        for case in self.cases:
+            mask = matches_condition(case.condition, value, case.threshold) & ~fired
+            result = np.where(mask, base + (case.intercept + case.slope * value), result)
+            fired |= mask
+        return result, fired
+
+
+@dataclass(frozen=True)
+class CascadePlan:
+    """
+    위상 정렬된 연쇄 효과 전파 계획
+
+    간선은 원인 지표의 열 번호별로 묶고, 그래프가 DAG이면 원인 지표를
+    위상 순서로 정렬해 둡니다. 한 번의 연쇄는 지표 벡터를 이 순서로 한 번
+    훑어 계산하며, 변경된 값은 호출한 쪽이 마지막에 한 번만 반영합니다.
+
+    Attributes:
+        steps: (원인 지표 열 번호, 간선 목록) 목록
+            (DAG이면 위상 순서, 사이클이 있으면 METRIC_ORDER 순서)
+        is_dag: 연쇄 그래프에 사이클이 없으면 True
+    """
+
+    steps: tuple[tuple[int, tuple[CascadeEdge, ...]], ...] = ()
+    is_dag: bool = True
+
+    def propagate(
+        self,
+        read: Callable[[int], float],
+        changed: Iterable[int],
+        max_depth: int,
+    ) -> tuple[dict[Metric, float], list[str]]:
+        """
+        변경된 지표에서 시작하는 연쇄 효과를 계산합니다 (지표 값은 바꾸지 않음).
+
+        DAG이면 각 원인 지표의 간선을 선행 지표가 모두 계산된 뒤 한 번만
+        적용하고, 같은 대상의 간선은 앞 간선의 결과에 이어서 적용합니다.
+        조건이 맞지 않아 발생하지 않은 간선의 대상은 변경되지 않은 것으로
+        봅니다. 사이클이 있으면 단계별로 max_depth 단계까지 전파합니다.
+
+        Args:
+            read: 열 번호로 현재 지표 값을 읽는 함수
+            changed: 변경된 지표의 열 번호
+            max_depth: 최대 연쇄 깊이
+
+        Returns:
+            tuple: (지표별 새 값, 발생한 간선의 메시지 목록)
+        """
+        values: dict[int, float] = {}
+        messages: list[str] = []
+
+        def current(column: int) -> float:
+            return values[column] if column in values else read(column)
+
+        if self.is_dag:
+            # 시작 지표로부터의 (가장 긴) 연쇄 깊이
+            depths = dict.fromkeys(changed, 0)
+            for column, edges in self.steps:
+                depth = depths.get(column)
+                if depth is None or depth >= max_depth:
+                    continue
+                source = current(column)
+                for edge in edges:
+                    target = METRIC_ORDINAL[edge.target]
+                    result = edge.fire(current(target), source)
+                    if result is None:
+                        continue
+                    values[target], message = result
+                    depths[target] = max(depths.get(target, 0), depth + 1)
+                    if message is not None:
+                        messages.append(message)
+        else:
+            level = set(changed)
+            for _depth in range(max_depth):
+                updates, level_messages = self._fire_level(current, level)
+                if not updates:
+                    break
+                messages.extend(level_messages)
+                values.update(updates)
+                level = set(updates)
+
+        return {METRIC_ORDER[column]: value for column, value in values.items()}, messages
+
+    def propagate_batch(
+        self,
+        read: Callable[[int], np.ndarray],
+        changed: Iterable[int],
+        max_depth: int,
+    ) -> dict[Metric, np.ndarray]:
+        """
+        세션 묶음에 대해 propagate()와 같은 규칙으로 연쇄 효과를 계산합니다.
+
+        행마다 발생 여부와 연쇄 깊이를 따로 추적하므로 각 행의 결과는
+        그 행만 propagate()로 계산한 결과와 같습니다.
+
+        Args:
+            read: 열 번호로 세션 묶음의 지표 열 배열을 읽는 함수
+            changed: 변경된 지표의 열 번호 (모든 행 공통)
+            max_depth: 최대 연쇄 깊이
+
+        Returns:
+            dict[Metric, np.ndarray]: 지표별 새 값 배열
+        """
+        values: dict[int, np.ndarray] = {}
+
+        def current(column: int) -> np.ndarray:
+            return values[column] if column in values else read(column)
+
+        changed = list(changed)
+        if not changed or not self.steps:
+            return {}
+        rows = read(changed[0]).shape
+
+        if self.is_dag:
+            # 행별 연쇄 깊이 (-1은 변경되지 않음)
+            depths = {column: np.zeros(rows, dtype=np.int64) for column in changed}
+            for column, edges in self.steps:
+                depth = depths.get(column)
+                if depth is None:
+                    continue
+                active = (depth >= 0) & (depth < max_depth)
+                if not active.any():
+                    continue
+                source = current(column)
+                for edge in edges:
+                    target = METRIC_ORDINAL[edge.target]
+                    base = current(target)
+                    result, fired = edge.fire_batch(base, source)
+                    fired &= active
+                    if not fired.any():
+                        continue
+                    values[target] = np.where(fired, result, base)
+                    target_depth = depths.get(target, np.full(rows, -1, dtype=np.int64))
+                    depths[target] = np.where(
+                        fired, np.maximum(target_depth, depth + 1), target_depth
+                    )
+        else:
+            level = {column: np.ones(rows, dtype=bool) for column in changed}
+            for _depth in range(max_depth):
+                updates, level = self._fire_level_batch(current, level)
+                if not updates:
+                    break
+                values.update(updates)
+
+        return {METRIC_ORDER[column]: value for column, value in values.items()}
+
+    def propagate_level(
+        self, read: Callable[[int], float], changed: Iterable[int]
+    ) -> tuple[dict[Metric, float], list[str]]:
+        """
+        변경된 지표를 원인으로 하는 간선만 한 단계 적용합니다 (지표 값은 바꾸지 않음).
+
+        모든 간선은 적용 전 값을 읽으므로 결과는 간선 순서와 관계없고, 대상
+        지표의 변경은 더 연쇄하지 않습니다.
+
+        Args:
+            read: 열 번호로 현재 지표 값을 읽는 함수
+            changed: 변경된 지표의 열 번호
+
+        Returns:
+            tuple: (지표별 새 값, 발생한 간선의 메시지 목록)
+        """
+        updates, messages = self._fire_level(read, set(changed))
+        return {METRIC_ORDER[column]: value for column, value in updates.items()}, messages
+
+    def propagate_level_batch(
+        self, read: Callable[[int], np.ndarray], changed: Iterable[int]
+    ) -> dict[Metric, np.ndarray]:
+        """
+        세션 묶음에 대해 propagate_level()과 같은 규칙으로 한 단계를 적용합니다.
+
+        Args:
+            read: 열 번호로 세션 묶음의 지표 열 배열을 읽는 함수
+            changed: 변경된 지표의 열 번호 (모든 행 공통)
+
+        Returns:
+            dict[Metric, np.ndarray]: 지표별 새 값 배열
+        """
+        changed = list(changed)
+        if not changed or not self.steps:
+            return {}
+        rows = read(changed[0]).shape
+        updates, _fired = self._fire_level_batch(
+            read, {column: np.ones(rows, dtype=bool) for column in changed}
+        )
+        return {METRIC_ORDER[column]: value for column, value in updates.items()}
+
+    def _fire_level(
+        self, read: Callable[[int], float], level: set[int]
+    ) -> tuple[dict[int, float], list[str]]:
+        """level의 원인 지표에서 나가는 간선을 적용 전 값 기준으로 한 번씩 적용합니다."""
+        updates: dict[int, float] = {}
+        messages: list[str] = []
+        for column, edges in self.steps:
+            if column not in level:
+                continue
+            source = read(column)
+            for edge in edges:
+                result = edge.fire(read(METRIC_ORDINAL[edge.target]), source)
+                if result is None:
+                    continue
+                updates[METRIC_ORDINAL[edge.target]], message = result
+                if message is not None:
+                    messages.append(message)
+        return updates, messages
+
+    def _fire_level_batch(
+        self, read: Callable[[int], np.ndarray], level: dict[int, np.ndarray]
+    ) -> tuple[dict[int, np.ndarray], dict[int, np.ndarray]]:
+        """_fire_level()의 세션 묶음 버전 (level은 원인 지표별 활성 행 마스크)."""
+        updates: dict[int, np.ndarray] = {}
+        fired_rows: dict[int, np.ndarray] = {}
+        for column, edges in self.steps:
+            active = level.get(column)
+            if active is None:
+                continue
+            source = read(column)
+            for edge in edges:
+                target = METRIC_ORDINAL[edge.target]
+                result, fired = edge.fire_batch(read(target), source)
+                fired &= active
+                if not fired.any():
+                    continue
+                updates[target] = np.where(fired, result, updates.get(target, read(target)))
+                fired_rows[target] = fired_rows.get(target, False) | fired
+        return updates, fired_rows
+
+
+def build_cascade_plan(
+    edges: Iterable[CascadeEdge], max_fan_out: int = MAX_CASCADE_FAN_OUT
+) -> CascadePlan:
+    """
+    간선 목록을 전파 계획으로 컴파일합니다.
+
+    같은 원인 지표의 간선은 주어진 순서를 유지하며, max_fan_out을 넘는
+    간선은 경고를 출력하고 제외합니다. 사이클 여부는 여기서 한 번만 판정합니다.
+
+    Args:
+        edges: 연쇄 효과 간선 목록
+        max_fan_out: 원인 지표 하나의 최대 간선 수 (기본값: MAX_CASCADE_FAN_OUT)
+
+    Returns:
+        CascadePlan: 컴파일된 전파 계획
+    """
+    edges_by_source: dict[int, list[CascadeEdge]] = {}
+    for edge in edges:
+        source_edges = edges_by_source.setdefault(METRIC_ORDINAL[edge.source], [])
+        if len(source_edges) >= max_fan_out:
+            print(f"연쇄 효과 간선 수 제한({max_fan_out}) 초과로 제외: {edge}")
+            continue
+        source_edges.append(edge)
+
+    # 위상 정렬 (Kahn, 진입 차수가 0인 지표 중 METRIC_ORDER가 앞선 것부터)
+    in_degree = [0] * len(METRIC_ORDER)
+    for source_edges in edges_by_source.values():
+        for edge in source_edges:
+            in_degree[METRIC_ORDINAL[edge.target]] += 1
+    ready = [column for column, degree in enumerate(in_degree) if degree == 0]
+    heapq.heapify(ready)
+    order: list[int] = []
+    while ready:
+        column = heapq.heappop(ready)
+        order.append(column)
+        for edge in edges_by_source.get(column, ()):
+            target = METRIC_ORDINAL[edge.target]
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                heapq.heappush(ready, target)
+
+    is_dag = len(order) == len(METRIC_ORDER)
+    if not is_dag:
+        order = sorted(edges_by_source)
+    steps = tuple(
+        (column, tuple(edges_by_source[column])) for column in order if column in edges_by_source
+    )
+    return CascadePlan(steps=steps, is_dag=is_dag)
@@ -0,0 +1,183 @@
+"""
+변경 지표 추적
+
+한 턴에 바뀌는 지표는 보통 여덟 개 중 두세 개뿐이므로, 트리거·임계값·패턴
+평가기는 바뀐 지표에 의존하는 조건만 다시 평가하고 나머지는 이전 결과를
+재사용합니다. MetricChanges는 지표 추적기의 벡터를, ConditionCache는 지표
+이름 dict를 입력으로 받는 평가기를 위한 것이며, 둘 다 건너뛴 조건 수를
+SkipStats로 집계합니다.
+"""
+
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from game_constants import Metric
+from src.metrics.state import METRIC_ORDER
+
+
+@dataclass
+class SkipStats:
+    """
+    조건 평가 통계
+
+    Attributes:
+        evaluated: 다시 평가한 조건 수
+        skipped: 의존 지표가 바뀌지 않아 이전 결과를 재사용한 조건 수
+    """
+
+    evaluated: int = 0
+    skipped: int = 0
+
+    @property
+    def skip_rate(self) -> float:
+        """건너뛴 조건의 비율 (평가 기록이 없으면 0.0)"""
+        total = self.evaluated + self.skipped
+        return self.skipped / total if total else 0.0
+
+    def record(self, evaluated: int, skipped: int) -> None:
+        """
+        평가 결과를 누적합니다.
+
+        Args:
+            evaluated: 다시 평가한 조건 수
+            skipped: 건너뛴 조건 수
+        """
+        self.evaluated += evaluated
+        self.skipped += skipped
+
+    def reset(self) -> None:
+        """통계를 초기화합니다."""
+        self.evaluated = 0
+        self.skipped = 0
+
+    def __str__(self) -> str:
+        total = self.evaluated + self.skipped
+        return f"조건 {total}회 중 {self.skipped}회 건너뜀 ({self.skip_rate:.1%})"
+
+
+class MetricChanges:
+    """
+    지표 추적기의 변경 지표 구독
+
+    구독자마다 기준 벡터를 따로 가지므로, 각 평가기는 자신이 마지막으로
+    평가한 뒤 바뀐 지표만 받습니다. MetricsTracker.subscribe_changes()로 만듭니다.
+    """
+
+    def __init__(self, values: np.ndarray) -> None:
+        """
+        MetricChanges 초기화
+
+        Args:
+            values: 지표 추적기의 지표 벡터 (제자리에서 갱신되는 배열)
+        """
+        self._values = values
+        self._baseline = values.copy()
+
+    def poll(self) -> dict[Metric, float]:
+        """
+        마지막 poll() 이후 바뀐 지표와 변화량을 반환하고 기준을 현재 값으로 옮깁니다.
+
+        Returns:
+            dict[Metric, float]: 바뀐 지표별 변화량 (Metric 선언 순서)
+        """
+        columns = np.flatnonzero(self._values != self._baseline)
+        if not len(columns):
+            return {}
+        changes = {
+            METRIC_ORDER[column]: float(self._values[column] - self._baseline[column])
+            for column in columns
+        }
+        self._baseline[columns] = self._values[columns]
+        return changes
+
+
+def metric_deltas(previous: Mapping[Any, float], current: Mapping[Any, float]) -> dict[Any, float]:
+    """
+    두 지표 dict 사이에 바뀐 지표와 변화량을 구합니다 (없는 지표는 0으로 봄).
+
+    Args:
+        previous: 이전 지표
+        current: 현재 지표
+
+    Returns:
+        dict: 바뀐 지표별 변화량 (current - previous)
+    """
+    deltas: dict[Any, float] = {}
+    for key in previous.keys() | current.keys():
+        delta = current.get(key, 0) - previous.get(key, 0)
+        if delta != 0:
+            deltas[key] = delta
+    return deltas
+
+
+class ConditionCache:
+    """
+    지표 dict에 의존하는 조건의 평가 결과 캐시
+
+    begin()으로 이번 평가의 지표를 넘긴 뒤, 조건마다 check()에 조건 키와
+    의존 지표를 넘기면 의존 지표가 바뀐 조건만 다시 평가합니다. 조건마다
+    마지막으로 평가한 지표를 함께 저장하므로, 몇 번의 평가에서 빠졌던 조건도
+    그동안 바뀐 지표를 놓치지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        """ConditionCache 초기화"""
+        # 조건 키 -> (결과, 평가할 때의 지표)
+        self._results: dict[Hashable, tuple[bool, dict[Any, float]]] = {}
+        self._metrics: dict[Any, float] | None = None
+        self._previous: dict[Any, float] | None = None
+        self._changed: frozenset[Any] = frozenset()
+        self.stats = SkipStats()
+
+    def begin(self, metrics: Mapping[Any, float]) -> dict[Any, float]:
+        """
+        이번 평가의 지표를 설정합니다.
+
+        Args:
+            metrics: 현재 지표
+
+        Returns:
+            dict: 이전 평가 이후 바뀐 지표별 변화량 (첫 평가면 모든 지표)
+        """
+        deltas = metric_deltas(self._metrics or {}, metrics)
+        self._changed = frozenset(deltas)
+        self._previous = self._metrics
+        self._metrics = dict(metrics)
+        return deltas
+
+    def check(
+        self, key: Hashable, dependencies: Iterable[Any], evaluate: Callable[[], bool]
+    ) -> bool:
+        """
+        조건 결과를 반환합니다 (의존 지표가 바뀌지 않았으면 이전 결과 재사용).
+
+        Args:
+            key: 조건을 식별하는 키 (조건 정의가 바뀌면 키도 달라야 함)
+            dependencies: 조건이 읽는 지표
+            evaluate: 조건을 평가하는 함수
+
+        Returns:
+            bool: 조건 충족 여부
+        """
+        metrics = self._metrics or {}
+        cached = self._results.get(key)
+        if cached is not None and self._unchanged(cached[1], dependencies):
+            self.stats.skipped += 1
+            return cached[0]
+        self.stats.evaluated += 1
+        result = evaluate()
+        self._results[key] = (result, metrics)
+        return result
+
+    def _unchanged(self, seen: dict[Any, float], dependencies: Iterable[Any]) -> bool:
+        """조건을 마지막으로 평가한 지표 이후 의존 지표가 바뀌지 않았는지 확인"""
+        if seen is self._metrics:
+            return True
+        if seen is self._previous:
+            return self._changed.isdisjoint(dependencies)
+        # 이전 평가에서 빠졌던 조건은 저장한 지표와 직접 비교
+        metrics = self._metrics or {}
+        return all(seen.get(name, 0) == metrics.get(name, 0) for name in dependencies)
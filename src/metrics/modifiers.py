@@ -4,13 +4,27 @@
 지표 변화에 대한 다양한 수정자를 제공합니다.
 """
 
-import random
-
-from game_constants import Metric, ProbabilityConstants
+from game_constants import (
+    Metric,
+    ProbabilityConstants,
+    get_metric_ranges,
+    get_uncertainty_weights,
+)
+from src.core.rng import RngService, RngStream
+from src.metrics.state import METRIC_ORDER, METRIC_ORDINAL
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Any
 
+import numpy as np
+
+# 행복 + 고통 합 (시소 불변식)
+_SEESAW_SUM = 100.0
+
+# 배치 변동에 세션마다 필요한 난수 수: 지표별 변동, 시소 방향, 시소 변동
+FLUCTUATION_DRAWS = len(METRIC_ORDER) + 2
+
 
 class MetricModifier(ABC):
     """지표 수정자 인터페이스"""
@@ -104,12 +118,28 @@ class AdaptiveModifier(MetricModifier):
 
 
 def uncertainty_apply_random_fluctuation(
-    metrics: dict[Metric, float], intensity: float = 0.1, seed: int | None = None
+    metrics: dict[Metric, float],
+    intensity: float = 0.1,
+    seed: int | None = None,
+    rng: RngStream | None = None,
 ) -> dict[Metric, float]:
-    """불확실성 요소를 반영하여 지표에 무작위 변동을 적용합니다."""
-    # 시드 설정
-    if seed is not None:
-        random.seed(seed)
+    """
+    불확실성 요소를 반영하여 지표에 무작위 변동을 적용합니다.
+
+    난수는 rng에서 뽑으며, rng가 없으면 시드로 만든 "uncertainty" 스트림을
+    사용합니다 (전역 random 상태는 건드리지 않음).
+
+    Args:
+        metrics: 현재 지표
+        intensity: 변동 강도 (기본값: 0.1)
+        seed: 난수 생성 시드 (기본값: None, rng가 있으면 무시)
+        rng: 난수 스트림 (기본값: None)
+
+    Returns:
+        dict[Metric, float]: 변동이 적용된 지표
+    """
+    if rng is None:
+        rng = RngService(seed).stream("uncertainty")
 
     # 지표 복사
     new_metrics = metrics.copy()
@@ -118,21 +148,97 @@ def uncertainty_apply_random_fluctuation(
     for metric in metrics:
         if metric not in {Metric.HAPPINESS, Metric.SUFFERING}:  # 행복-고통은 시소 관계로 처리
             current_value = new_metrics[metric]
-            fluctuation = random.uniform(-intensity, intensity) * current_value
+            fluctuation = rng.uniform(-intensity, intensity) * current_value
             new_metrics[metric] = current_value + fluctuation
 
     # 행복-고통 시소 불변식 유지
     if (
-        random.random() < ProbabilityConstants.RANDOM_THRESHOLD
+        rng.random() < ProbabilityConstants.RANDOM_THRESHOLD
     ):  # 50% 확률로 행복 또는 고통 중 하나를 변경
         happiness = new_metrics[Metric.HAPPINESS]
-        fluctuation = random.uniform(-intensity, intensity) * happiness
+        fluctuation = rng.uniform(-intensity, intensity) * happiness
         new_metrics[Metric.HAPPINESS] = happiness + fluctuation
         new_metrics[Metric.SUFFERING] = 100.0 - new_metrics[Metric.HAPPINESS]
     else:
         suffering = new_metrics[Metric.SUFFERING]
-        fluctuation = random.uniform(-intensity, intensity) * suffering
+        fluctuation = rng.uniform(-intensity, intensity) * suffering
         new_metrics[Metric.SUFFERING] = suffering + fluctuation
         new_metrics[Metric.HAPPINESS] = 100.0 - new_metrics[Metric.SUFFERING]
 
     return new_metrics
+
+
+def uncertainty_apply_random_fluctuation_batch(
+    values: np.ndarray,
+    intensity: float = 0.1,
+    seed: int | None = None,
+    uniforms: np.ndarray | None = None,
+    weights: Mapping[Metric, float] | None = None,
+) -> np.ndarray:
+    """
+    여러 세션의 지표 배열에 불확실성 무작위 변동을 한 번에 적용합니다.
+
+    지표마다 변동 폭을 intensity * |가중치|로 정하고, 행복-고통은 절반 확률로
+    한쪽만 변동한 뒤 다른 쪽을 합 100으로 맞춥니다. 결과는 지표 범위로
+    제한하며(cap_metric_value와 같은 규칙), 시소는 제한한 값을 기준으로 맞추므로
+    제한 후에도 불변식이 유지됩니다.
+
+    Args:
+        values: (세션 수 x 지표 수) 지표 배열 (열 순서는 METRIC_ORDER)
+        intensity: 변동 강도 (기본값: 0.1)
+        seed: 난수 생성 시드 (기본값: None, uniforms가 있으면 무시)
+        uniforms: (세션 수 x FLUCTUATION_DRAWS) [0, 1) 난수
+            (기본값: None, 시드로 만든 "uncertainty" 스트림에서 뽑음)
+        weights: 지표별 불확실성 가중치
+            (기본값: None, get_uncertainty_weights() 사용, 없는 지표는 변동 없음)
+
+    Returns:
+        np.ndarray: 변동이 적용된 새 (세션 수 x 지표 수) 배열
+
+    Raises:
+        ValueError: 배열 모양이 맞지 않는 경우
+    """
+    values = np.asarray(values, dtype=np.float64)
+    columns = len(METRIC_ORDER)
+    if values.shape[1:] != (columns,):
+        raise ValueError(f"지표 배열 모양이 맞지 않습니다: {values.shape}")
+    rows = values.shape[0]
+    if uniforms is None:
+        stream = RngService(seed).stream("uncertainty")
+        uniforms = stream.random_array(rows * FLUCTUATION_DRAWS).reshape(rows, FLUCTUATION_DRAWS)
+    elif uniforms.shape != (rows, FLUCTUATION_DRAWS):
+        raise ValueError(f"난수 배열 모양이 맞지 않습니다: {uniforms.shape}")
+
+    if weights is None:
+        weights = get_uncertainty_weights()
+    weight = np.zeros(columns, dtype=np.float64)
+    lower = np.full(columns, -np.inf)
+    upper = np.full(columns, np.inf)
+    for metric, value in weights.items():
+        weight[METRIC_ORDINAL[metric]] = abs(value)
+    for metric, (min_val, max_val, _default) in get_metric_ranges().items():
+        lower[METRIC_ORDINAL[metric]] = min_val
+        upper[METRIC_ORDINAL[metric]] = max_val
+
+    happiness = METRIC_ORDINAL[Metric.HAPPINESS]
+    suffering = METRIC_ORDINAL[Metric.SUFFERING]
+    seesaw_weight = weight[[happiness, suffering]]
+    weight[[happiness, suffering]] = 0.0  # 행복-고통은 시소 관계로 처리
+
+    # 지표별 변동: value + uniform(-intensity, intensity) * |가중치| * value
+    low = -intensity
+    span = 2 * intensity
+    result = values + (low + span * uniforms[:, :columns]) * weight * values
+
+    # 행복-고통 시소: 고른 쪽을 변동하고 제한한 뒤 다른 쪽을 합으로 맞춤
+    pick_happiness = uniforms[:, columns] < ProbabilityConstants.RANDOM_THRESHOLD
+    side = np.where(pick_happiness, happiness, suffering)
+    side_weight = np.where(pick_happiness, seesaw_weight[0], seesaw_weight[1])
+    current = values[np.arange(rows), side]
+    changed = current + (low + span * uniforms[:, columns + 1]) * side_weight * current
+    changed = np.clip(changed, lower[side], upper[side])
+    result[:, happiness] = np.where(pick_happiness, changed, _SEESAW_SUM - changed)
+    result[:, suffering] = np.where(pick_happiness, _SEESAW_SUM - changed, changed)
+
+    np.clip(result, lower, upper, out=result)
+    return result
@@ -0,0 +1,107 @@
+"""
+일별 지표 시계열
+
+여러 날을 한 번에 진행할 때의 지표 변화를 (일수 x 지표 수) 배열로 모으고,
+API 응답용으로 압축된 열 단위 페이로드로 변환합니다.
+
+페이로드는 지표별로 연속된(열 우선) 값을 리틀 엔디언 float32/float64로
+직렬화한 뒤 zlib 압축과 base64 인코딩을 거칩니다. 같은 지표의 값이 붙어
+있으므로 날마다 dict를 보내는 것보다 훨씬 작습니다.
+"""
+
+import base64
+import zlib
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from game_constants import Metric
+from src.metrics.state import METRIC_ORDER
+
+SERIES_ENCODINGS = ("zlib+base64", "raw")
+SERIES_DTYPES = ("float32", "float64")
+
+
+@dataclass
+class MetricsSeries:
+    """
+    일별 지표 시계열
+
+    Attributes:
+        start_day: 첫 행의 게임 일수
+        values: (일수 x 지표 수) 배열 (열 순서는 METRIC_ORDER)
+    """
+
+    start_day: int
+    values: np.ndarray
+
+    @property
+    def days(self) -> int:
+        """시계열의 일수"""
+        return int(self.values.shape[0])
+
+    def to_dicts(self) -> list[dict[Metric, float]]:
+        """날마다 지표 딕셔너리로 변환합니다."""
+        return [dict(zip(METRIC_ORDER, row, strict=True)) for row in self.values.tolist()]
+
+    def to_payload(self, encoding: str = "zlib+base64", dtype: str = "float32") -> dict[str, Any]:
+        """
+        API 응답용 페이로드로 변환합니다.
+
+        Args:
+            encoding: "zlib+base64"(압축) 또는 "raw"(지표별 숫자 목록)
+            dtype: 압축할 때의 값 정밀도 ("float32" 또는 "float64")
+
+        Returns:
+            dict[str, Any]: 시계열 페이로드
+
+        Raises:
+            ValueError: 지원하지 않는 인코딩 또는 자료형인 경우
+        """
+        if encoding not in SERIES_ENCODINGS:
+            raise ValueError(f"지원하지 않는 시계열 인코딩: {encoding}")
+        if dtype not in SERIES_DTYPES:
+            raise ValueError(f"지원하지 않는 시계열 자료형: {dtype}")
+
+        payload: dict[str, Any] = {
+            "start_day": self.start_day,
+            "days": self.days,
+            "columns": [metric.name.lower() for metric in METRIC_ORDER],
+            "encoding": encoding,
+        }
+        if encoding == "raw":
+            payload["data"] = self.values.T.tolist()
+            return payload
+
+        column_major = np.ascontiguousarray(self.values.T, dtype=np.dtype(dtype).newbyteorder("<"))
+        payload["dtype"] = dtype
+        payload["data"] = base64.b64encode(zlib.compress(column_major.tobytes())).decode("ascii")
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "MetricsSeries":
+        """
+        페이로드에서 시계열을 복원합니다.
+
+        Args:
+            payload: to_payload()가 만든 페이로드
+
+        Returns:
+            MetricsSeries: 복원한 시계열 (열 순서는 METRIC_ORDER)
+        """
+        days = payload["days"]
+        columns = payload["columns"]
+        if payload["encoding"] == "raw":
+            column_major = np.asarray(payload["data"], dtype=np.float64).reshape(len(columns), days)
+        else:
+            raw = zlib.decompress(base64.b64decode(payload["data"]))
+            dtype = np.dtype(payload.get("dtype", "float32")).newbyteorder("<")
+            column_major = np.frombuffer(raw, dtype=dtype).reshape(len(columns), days)
+
+        values = np.zeros((days, len(METRIC_ORDER)), dtype=np.float64)
+        for column, name in enumerate(columns):
+            metric = getattr(Metric, name.upper(), None)
+            if metric is not None:
+                values[:, METRIC_ORDER.index(metric)] = column_major[column]
+        return cls(start_day=payload["start_day"], values=values)
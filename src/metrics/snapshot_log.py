@@ -0,0 +1,331 @@
+"""
+추가 전용(append-only) 바이너리 스냅샷 로그
+
+스냅샷마다 파일을 만드는 대신 하나의 로그 파일에 길이 접두 레코드를 이어
+씁니다. 지표는 Metric 순서의 float64 벡터로 압축 저장하고, 일수 → 파일
+오프셋 인덱스로 원하는 날의 스냅샷을 바로 찾습니다.
+
+파일 구조:
+    헤더:   MAGIC | 지표 이름 길이(u16) | 지표 이름(UTF-8, 쉼표 구분)
+    레코드: 페이로드 길이(u32) | CRC32(u32) | 페이로드
+    페이로드: 일수(i32) | 타임스탬프(f64) | 지표 벡터(f64 x 지표 수) | 부가 정보(JSON)
+
+기록 도중 중단되어 잘린 마지막 레코드는 다시 열 때 잘라냅니다.
+"""
+
+import json
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from game_constants import Metric
+from src.metrics.state import METRIC_ORDER
+
+MAGIC = b"CMSNAPv1"
+_NAMES_HEADER = struct.Struct("<H")
+_RECORD_HEADER = struct.Struct("<II")  # 페이로드 길이, CRC32
+_PAYLOAD_HEADER = struct.Struct("<id")  # 일수, 타임스탬프
+
+# 기본 fsync 간격 (레코드 수)
+DEFAULT_FSYNC_INTERVAL = 32
+
+
+@dataclass
+class SnapshotRecord:
+    """스냅샷 로그 레코드"""
+
+    day: int
+    timestamp: float
+    metrics: dict[Metric, float]
+    events: list[str] = field(default_factory=list)
+    modifier: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 스냅샷 파일과 같은 형태의 딕셔너리로 변환합니다."""
+        return {
+            "day": self.day,
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
+            "metrics": {metric.name: value for metric, value in self.metrics.items()},
+            "events": list(self.events),
+            "modifier": self.modifier,
+        }
+
+
+def is_snapshot_log(filepath: str) -> bool:
+    """파일이 스냅샷 로그인지 헤더로 확인합니다."""
+    try:
+        with open(filepath, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class SnapshotLog:
+    """
+    추가 전용 바이너리 스냅샷 로그
+
+    같은 날의 스냅샷이 여러 번 기록되면 가장 마지막 레코드가 그 날의
+    스냅샷입니다. 로그를 열 때 레코드 헤더만 훑어 오프셋 인덱스를 만들고,
+    fsync_interval개 레코드마다 디스크에 동기화합니다.
+    """
+
+    def __init__(self, path: str, fsync_interval: int = DEFAULT_FSYNC_INTERVAL) -> None:
+        """
+        SnapshotLog 초기화 (파일이 없으면 새로 만듭니다)
+
+        Args:
+            path: 로그 파일 경로
+            fsync_interval: fsync 간격 (레코드 수, 0 이하이면 close/flush 때만)
+        """
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._index: dict[int, int] = {}
+        self._order: list[tuple[int, int]] = []
+        self._unsynced = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            self._create()
+
+        self._file = open(path, "r+b")
+        self._columns = self._read_header()
+        self._data_start = self._file.tell()
+        self._build_index()
+
+    # ------------------------------------------------------------------
+    # 파일 구조
+    # ------------------------------------------------------------------
+
+    def _create(self) -> None:
+        """헤더만 있는 새 로그 파일을 만듭니다."""
+        names = ",".join(metric.name for metric in METRIC_ORDER).encode("utf-8")
+        with open(self.path, "wb") as f:
+            f.write(MAGIC + _NAMES_HEADER.pack(len(names)) + names)
+
+    def _read_header(self) -> list[Metric | None]:
+        """헤더를 읽어 로그의 지표 열 순서를 반환합니다."""
+        f = self._file
+        if f.read(len(MAGIC)) != MAGIC:
+            f.close()
+            raise ValueError(f"스냅샷 로그 파일이 아닙니다: {self.path}")
+        (length,) = _NAMES_HEADER.unpack(f.read(_NAMES_HEADER.size))
+        names = f.read(length).decode("utf-8").split(",")
+        # 로그를 만든 뒤 Metric이 바뀌었더라도 이름으로 대응 (없는 지표는 건너뜀)
+        return [getattr(Metric, name, None) for name in names]
+
+    def _build_index(self) -> None:
+        """레코드 헤더를 훑어 일수 → 오프셋 인덱스를 만들고 잘린 꼬리를 정리합니다."""
+        f = self._file
+        size = os.fstat(f.fileno()).st_size
+        offset = self._data_start
+        minimum = _PAYLOAD_HEADER.size
+        while offset + _RECORD_HEADER.size <= size:
+            f.seek(offset)
+            length, _crc = _RECORD_HEADER.unpack(f.read(_RECORD_HEADER.size))
+            end = offset + _RECORD_HEADER.size + length
+            if length < minimum or end > size:
+                break
+            (day,) = struct.unpack("<i", f.read(4))
+            self._register(day, offset)
+            offset = end
+
+        if offset < size:
+            print(f"스냅샷 로그의 잘린 레코드 정리: {self.path} ({size - offset} bytes)")
+            f.truncate(offset)
+        f.seek(offset)
+
+    def _register(self, day: int, offset: int) -> None:
+        self._index[day] = offset
+        self._order.append((day, offset))
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def append(
+        self,
+        day: int,
+        metrics: np.ndarray | dict[Metric, float],
+        events: list[str] | None = None,
+        modifier: str = "",
+        timestamp: float | None = None,
+    ) -> int:
+        """
+        스냅샷 레코드를 추가합니다.
+
+        Args:
+            day: 게임 일수
+            metrics: Metric 순서 지표 벡터 또는 지표 딕셔너리
+            events: 이벤트 메시지 목록
+            modifier: 수정자 이름
+            timestamp: 기록 시각 (기본값: None, 현재 시각)
+
+        Returns:
+            int: 레코드 오프셋
+        """
+        if isinstance(metrics, np.ndarray):
+            vector = np.asarray(metrics, dtype="<f8")
+        else:
+            vector = np.zeros(len(METRIC_ORDER), dtype="<f8")
+            for i, metric in enumerate(METRIC_ORDER):
+                vector[i] = metrics.get(metric, 0.0)
+        extras = json.dumps(
+            {"events": events or [], "modifier": modifier}, ensure_ascii=False
+        ).encode("utf-8")
+        payload = (
+            _PAYLOAD_HEADER.pack(
+                day, datetime.now().timestamp() if timestamp is None else timestamp
+            )
+            + vector.tobytes()
+            + extras
+        )
+        record = _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+        with self._lock:
+            f = self._file
+            f.seek(0, os.SEEK_END)
+            offset = f.tell()
+            f.write(record)
+            self._register(day, offset)
+            self._unsynced += 1
+            if self.fsync_interval > 0 and self._unsynced >= self.fsync_interval:
+                self._sync()
+        return offset
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def flush(self, fsync: bool = True) -> None:
+        """
+        버퍼의 레코드를 파일에 씁니다.
+
+        Args:
+            fsync: 디스크까지 동기화할지 여부 (기본값: True)
+        """
+        with self._lock:
+            if fsync:
+                self._sync()
+            else:
+                self._file.flush()
+
+    def close(self) -> None:
+        """남은 레코드를 동기화하고 파일을 닫습니다."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._sync()
+            self._file.close()
+
+    @property
+    def closed(self) -> bool:
+        """로그 파일이 닫혔는지 여부"""
+        return self._file.closed
+
+    def __enter__(self) -> "SnapshotLog":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def days(self) -> list[int]:
+        """스냅샷이 있는 일수 목록 (오름차순)"""
+        return sorted(self._index)
+
+    @property
+    def last_day(self) -> int | None:
+        """마지막으로 기록된 레코드의 일수"""
+        return self._order[-1][0] if self._order else None
+
+    def _read_at(self, offset: int) -> SnapshotRecord:
+        """오프셋의 레코드를 읽습니다."""
+        f = self._file
+        f.flush()
+        f.seek(offset)
+        length, crc = _RECORD_HEADER.unpack(f.read(_RECORD_HEADER.size))
+        payload = f.read(length)
+        f.seek(0, os.SEEK_END)
+        if zlib.crc32(payload) != crc:
+            raise ValueError(f"손상된 스냅샷 레코드: {self.path} @ {offset}")
+
+        day, timestamp = _PAYLOAD_HEADER.unpack_from(payload)
+        width = len(self._columns)
+        start = _PAYLOAD_HEADER.size
+        vector = np.frombuffer(payload, dtype="<f8", count=width, offset=start)
+        extras = json.loads(payload[start + 8 * width :].decode("utf-8") or "{}")
+        metrics = {
+            metric: float(value)
+            for metric, value in zip(self._columns, vector.tolist(), strict=True)
+            if metric is not None
+        }
+        return SnapshotRecord(
+            day=day,
+            timestamp=timestamp,
+            metrics=metrics,
+            events=extras.get("events", []),
+            modifier=extras.get("modifier", ""),
+        )
+
+    def read(self, day: int | None = None) -> SnapshotRecord | None:
+        """
+        특정 날의 스냅샷을 읽습니다.
+
+        Args:
+            day: 게임 일수 (기본값: None, 마지막 레코드)
+
+        Returns:
+            Optional[SnapshotRecord]: 스냅샷 (없으면 None)
+        """
+        with self._lock:
+            if day is None:
+                if not self._order:
+                    return None
+                offset = self._order[-1][1]
+            else:
+                found = self._index.get(day)
+                if found is None:
+                    return None
+                offset = found
+            return self._read_at(offset)
+
+    def replay(
+        self, start_day: int | None = None, end_day: int | None = None
+    ) -> Iterator[SnapshotRecord]:
+        """
+        일수 범위의 스냅샷을 기록 순서대로 재생합니다 (디버깅용).
+
+        Args:
+            start_day: 시작 일수 (포함, 기본값: None, 처음부터)
+            end_day: 끝 일수 (포함, 기본값: None, 끝까지)
+
+        Yields:
+            SnapshotRecord: 범위에 속하는 스냅샷 레코드
+        """
+        with self._lock:
+            offsets = [
+                offset
+                for day, offset in self._order
+                if (start_day is None or day >= start_day) and (end_day is None or day <= end_day)
+            ]
+        for offset in offsets:
+            with self._lock:
+                record = self._read_at(offset)
+            yield record
@@ -0,0 +1,264 @@
+"""
+지표 스냅샷 저장 시스템
+
+스냅샷 파일 회전(rotation)을 메모리에서 추적하고, 프로세스에 하나뿐인
+백그라운드 스레드가 제한된 크기의 큐에서 스냅샷을 꺼내 기록합니다. 하루
+진행 경로에서는 파일 쓰기와 디렉토리 스캔이 사라지고, flush()/close()로
+종료 시점에 남은 스냅샷을 모두 기록합니다.
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+from collections import deque
+from typing import Any
+
+# 스냅샷 파일명 규칙
+SNAPSHOT_PREFIX = "metrics_snap_"
+SNAPSHOT_SUFFIX = ".json"
+
+# 백그라운드 기록 큐 최대 크기
+DEFAULT_QUEUE_SIZE = 64
+
+
+def write_snapshot_file(filepath: str, snapshot_data: dict[str, Any]) -> None:
+    """
+    스냅샷 데이터를 JSON 파일로 기록합니다.
+
+    Args:
+        filepath: 저장할 파일 경로
+        snapshot_data: 스냅샷 데이터
+    """
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(snapshot_data, f, indent=2, ensure_ascii=False)
+
+
+class SnapshotRotation:
+    """
+    메모리 기반 스냅샷 파일 회전 관리자
+
+    처음 사용할 때 한 번만 디렉토리를 스캔해 기존 스냅샷을 수정 시간 순으로
+    등록하고, 이후에는 기록한 파일 목록만으로 최대 개수를 유지합니다.
+    """
+
+    def __init__(self, snapshot_dir: str, max_snapshots: int) -> None:
+        """
+        SnapshotRotation 초기화
+
+        Args:
+            snapshot_dir: 스냅샷 저장 디렉토리
+            max_snapshots: 최대 스냅샷 파일 수
+        """
+        self.snapshot_dir = snapshot_dir
+        self.max_snapshots = max_snapshots
+        self._files: deque[str] = deque()
+        self._known: set[str] = set()
+        self._scanned = False
+        self._lock = threading.Lock()
+
+    def _scan_existing(self) -> None:
+        """디렉토리에 이미 있는 스냅샷 파일을 등록합니다 (최초 한 번)."""
+        self._scanned = True
+        if not os.path.exists(self.snapshot_dir):
+            os.makedirs(self.snapshot_dir)
+            return
+
+        existing = [
+            os.path.join(self.snapshot_dir, f)
+            for f in os.listdir(self.snapshot_dir)
+            if f.startswith(SNAPSHOT_PREFIX) and f.endswith(SNAPSHOT_SUFFIX)
+        ]
+        existing.sort(key=os.path.getmtime)
+        self._files.extend(existing)
+        self._known.update(existing)
+
+    def reserve(self, timestamp: str) -> str:
+        """
+        새 스냅샷 파일 경로를 예약합니다.
+
+        같은 타임스탬프가 이미 쓰였다면 순번을 붙여 덮어쓰기를 막습니다.
+
+        Args:
+            timestamp: 파일명에 사용할 타임스탬프
+
+        Returns:
+            str: 예약된 파일 경로
+        """
+        with self._lock:
+            if not self._scanned:
+                self._scan_existing()
+            filepath = os.path.join(self.snapshot_dir, f"{SNAPSHOT_PREFIX}{timestamp}")
+            candidate = filepath + SNAPSHOT_SUFFIX
+            sequence = 1
+            while candidate in self._known:
+                candidate = f"{filepath}_{sequence}{SNAPSHOT_SUFFIX}"
+                sequence += 1
+            self._known.add(candidate)
+            return candidate
+
+    def register(self, filepath: str) -> list[str]:
+        """
+        기록을 마친 스냅샷을 등록하고 초과분 파일을 삭제합니다.
+
+        Args:
+            filepath: 기록한 스냅샷 파일 경로
+
+        Returns:
+            List[str]: 삭제한 파일 경로 목록
+        """
+        with self._lock:
+            if not self._scanned:
+                self._scan_existing()
+            self._files.append(filepath)
+            removed = []
+            while len(self._files) > self.max_snapshots:
+                oldest = self._files.popleft()
+                self._known.discard(oldest)
+                try:
+                    os.remove(oldest)
+                    removed.append(oldest)
+                    print(f"스냅샷 파일 삭제: {oldest}")  # 디버깅용 출력
+                except OSError as e:
+                    print(f"스냅샷 파일 삭제 실패: {oldest}, 오류: {e}")  # 디버깅용 출력
+            return removed
+
+
+class _SnapshotWorker:
+    """
+    모든 SnapshotWriter가 공유하는 백그라운드 기록 스레드
+
+    추적기마다 스레드와 atexit 훅을 만들지 않도록 프로세스에 하나만 두고,
+    처음 스냅샷이 들어올 때 스레드를 시작합니다.
+    """
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        """
+        _SnapshotWorker 초기화
+
+        Args:
+            queue_size: 대기 큐 최대 크기
+        """
+        self._queue: queue.Queue[tuple[SnapshotWriter, str, dict[str, Any]] | None] = queue.Queue(
+            maxsize=queue_size
+        )
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(
+        self, writer: "SnapshotWriter", filepath: str, snapshot_data: dict[str, Any]
+    ) -> None:
+        """스냅샷을 큐에 넣습니다 (큐가 가득 차면 공간이 생길 때까지 대기)."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="metrics-snapshot-writer", daemon=True
+                )
+                self._thread.start()
+                # 인터프리터 종료 시 남은 스냅샷 기록
+                atexit.register(self.close)
+        self._queue.put((writer, filepath, snapshot_data))
+
+    def _run(self) -> None:
+        """기록 스레드 본체: 큐에서 스냅샷을 하나씩 꺼내 기록합니다."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                writer, filepath, snapshot_data = item
+                writer._write(filepath, snapshot_data)
+            finally:
+                # 기록이 실패해도 flush()/close()가 멈추지 않도록 항상 완료 처리
+                self._queue.task_done()
+
+    @property
+    def pending(self) -> int:
+        """기록 대기 중인 스냅샷 수 (근사값)"""
+        return self._queue.qsize()
+
+    def flush(self) -> None:
+        """지금까지 들어온 스냅샷이 모두 기록될 때까지 기다립니다."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """남은 스냅샷을 모두 기록하고 기록 스레드를 종료합니다."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join()
+        atexit.unregister(self.close)
+
+
+# 프로세스 공용 기록 스레드
+_worker = _SnapshotWorker()
+
+
+class SnapshotWriter:
+    """
+    백그라운드 스냅샷 기록기
+
+    submit()은 스냅샷을 공용 기록 스레드의 제한된 크기의 큐에 넣고 바로
+    반환합니다 (큐가 가득 차면 공간이 생길 때까지 대기하므로 스냅샷이
+    버려지지 않음). 기록 스레드는 스냅샷을 하나씩 기록하고 그때마다 이
+    기록기의 회전 관리자에 등록합니다.
+    """
+
+    def __init__(self, rotation: SnapshotRotation) -> None:
+        """
+        SnapshotWriter 초기화
+
+        Args:
+            rotation: 스냅샷 회전 관리자
+        """
+        self.rotation = rotation
+        self._closed = False
+        self.written = 0
+        self.errors: list[str] = []
+
+    def submit(self, filepath: str, snapshot_data: dict[str, Any]) -> None:
+        """
+        스냅샷 기록을 요청합니다.
+
+        Args:
+            filepath: 저장할 파일 경로 (SnapshotRotation.reserve로 예약한 경로)
+            snapshot_data: 스냅샷 데이터
+
+        Raises:
+            RuntimeError: 이미 닫힌 기록기인 경우
+        """
+        if self._closed:
+            raise RuntimeError("닫힌 스냅샷 기록기에는 스냅샷을 추가할 수 없습니다")
+        _worker.submit(self, filepath, snapshot_data)
+
+    def _write(self, filepath: str, snapshot_data: dict[str, Any]) -> None:
+        """스냅샷 하나를 기록하고 회전에 등록합니다 (실패는 기록하고 계속 진행)."""
+        try:
+            write_snapshot_file(filepath, snapshot_data)
+            self.rotation.register(filepath)
+        except Exception as e:
+            # 직렬화 오류(TypeError 등)도 기록 스레드를 죽이지 않음
+            self.errors.append(f"{filepath}: {e}")
+            print(f"스냅샷 기록 실패: {filepath}, 오류: {e}")
+            return
+        self.written += 1
+
+    @property
+    def pending(self) -> int:
+        """공용 큐에서 기록 대기 중인 스냅샷 수 (근사값)"""
+        return _worker.pending
+
+    def flush(self) -> None:
+        """지금까지 요청된 스냅샷이 모두 기록될 때까지 기다립니다."""
+        _worker.flush()
+
+    def close(self) -> None:
+        """남은 스냅샷을 모두 기록하고 이 기록기를 닫습니다 (공용 스레드는 유지)."""
+        if self._closed:
+            return
+        self._closed = True
+        _worker.flush()
@@ -0,0 +1,162 @@
+"""
+배열 기반 지표 상태
+
+지표를 Metric 순서(ordinal)로 인덱싱되는 float64 벡터 하나에 보관하고,
+히스토리는 미리 할당한 2차원 NumPy 링 버퍼에 기록합니다.
+호출자에게는 복사 없이 읽기 전용 뷰를 제공하며, 기존 dict 기반 코드를 위해
+Mapping 호환 파사드를 함께 제공합니다.
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+
+import numpy as np
+
+from game_constants import Metric
+
+# 지표 벡터의 열 순서 (열 번호 = Metric 선언 순서)
+METRIC_ORDER: tuple[Metric, ...] = tuple(Metric)
+METRIC_ORDINAL: dict[Metric, int] = {metric: i for i, metric in enumerate(METRIC_ORDER)}
+
+
+def read_only(array: np.ndarray) -> np.ndarray:
+    """배열의 읽기 전용 뷰를 반환합니다 (복사 없음)."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class MetricsView(Mapping[Metric, float]):
+    """
+    지표 벡터에 대한 읽기 전용 dict 호환 파사드
+
+    벡터를 복사하지 않고 참조하므로 항상 최신 값을 보여줍니다.
+    copy()는 기존 코드와 같이 수정 가능한 dict를 반환합니다.
+    """
+
+    __slots__ = ("_columns", "_index", "_metrics", "_values")
+
+    def __init__(self, values: np.ndarray, metrics: Sequence[Metric]) -> None:
+        """
+        MetricsView 초기화
+
+        Args:
+            values: Metric 순서로 인덱싱되는 지표 벡터
+            metrics: 노출할 지표 목록 (순회 순서)
+        """
+        self._values = values
+        self._metrics = tuple(metrics)
+        self._index = {metric: METRIC_ORDINAL[metric] for metric in self._metrics}
+        self._columns = list(self._index.values())
+
+    def __getitem__(self, metric: Metric) -> float:
+        return float(self._values[self._index[metric]])
+
+    def __contains__(self, metric: object) -> bool:
+        return metric in self._index
+
+    def __iter__(self) -> Iterator[Metric]:
+        return iter(self._metrics)
+
+    def __len__(self) -> int:
+        return len(self._metrics)
+
+    def __repr__(self) -> str:
+        return f"MetricsView({self.copy()!r})"
+
+    def copy(self) -> dict[Metric, float]:
+        """현재 값을 수정 가능한 dict로 복사합니다."""
+        return dict(zip(self._metrics, self._values[self._columns].tolist(), strict=True))
+
+    @property
+    def array(self) -> np.ndarray:
+        """Metric 순서 지표 벡터의 읽기 전용 뷰"""
+        return read_only(self._values)
+
+
+class MetricsHistory:
+    """
+    미리 할당된 2차원 링 버퍼 지표 히스토리
+
+    (용량 x 지표 수) float64 배열에 상태를 한 행씩 기록합니다. 용량을 넘으면
+    가장 오래된 행을 덮어쓰므로 deque(maxlen=...)와 같은 동작을 하면서도
+    기록할 때 dict를 만들지 않습니다. 순회하면 기존처럼 dict를 돌려줍니다.
+    """
+
+    def __init__(self, maxlen: int, metrics: Sequence[Metric]) -> None:
+        """
+        MetricsHistory 초기화
+
+        Args:
+            maxlen: 최대 기록 수
+            metrics: dict로 변환할 때 노출할 지표 목록
+        """
+        self.maxlen = maxlen
+        self._metrics = tuple(metrics)
+        self._columns = [METRIC_ORDINAL[metric] for metric in self._metrics]
+        self._buffer = np.zeros((maxlen, len(METRIC_ORDER)), dtype=np.float64)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, values: np.ndarray | Mapping[Metric, float]) -> None:
+        """
+        상태 한 행을 기록합니다.
+
+        Args:
+            values: Metric 순서 지표 벡터 또는 지표 딕셔너리
+        """
+        if self.maxlen <= 0:
+            return
+        if self._size < self.maxlen:
+            row = (self._start + self._size) % self.maxlen
+            self._size += 1
+        else:
+            row = self._start
+            self._start = (self._start + 1) % self.maxlen
+
+        if isinstance(values, np.ndarray):
+            self._buffer[row] = values
+        else:
+            for metric, value in values.items():
+                self._buffer[row, METRIC_ORDINAL[metric]] = value
+
+    def clear(self) -> None:
+        """모든 기록을 지웁니다."""
+        self._start = 0
+        self._size = 0
+
+    def _row_to_dict(self, row: np.ndarray) -> dict[Metric, float]:
+        return dict(zip(self._metrics, row[self._columns].tolist(), strict=True))
+
+    def __getitem__(self, index: int) -> dict[Metric, float]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("history index out of range")
+        return self._row_to_dict(self._buffer[(self._start + index) % self.maxlen])
+
+    def __iter__(self) -> Iterator[dict[Metric, float]]:
+        for row in self.as_array():
+            yield self._row_to_dict(row)
+
+    def as_array(self, steps: int | None = None) -> np.ndarray:
+        """
+        히스토리를 오래된 순서의 (기록 수 x 지표 수) 읽기 전용 배열로 반환합니다.
+
+        버퍼가 한 바퀴 돌지 않았다면 복사 없는 뷰이고, 돌았다면 순서를
+        맞춘 복사본입니다. 열 순서는 METRIC_ORDER입니다.
+
+        Args:
+            steps: 최근 기록 수 (기본값: None, 전체)
+
+        Returns:
+            np.ndarray: 읽기 전용 히스토리 배열
+        """
+        size = self._size if steps is None else max(0, min(steps, self._size))
+        first = (self._start + self._size - size) % self.maxlen if self.maxlen else 0
+        end = first + size
+        if end <= self.maxlen:
+            return read_only(self._buffer[first:end])
+        return read_only(np.concatenate([self._buffer[first:], self._buffer[: end - self.maxlen]]))
@@ -5,16 +5,32 @@
 """
 
 import json
-import os
 from collections import deque
+from functools import lru_cache
+from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+
 from game_constants import (
     MAGIC_NUMBER_FIFTY,
-    METRIC_RANGES,
+    ConstantsSnapshot,
     Metric,
     cap_metric_value,
+    get_constants_snapshot,
+    get_metric_ranges,
+    subscribe_constants,
+)
+
+from src.core.rng import RngStream
+from src.metrics.cascade import (
+    CascadePlan,
+    RuleCase,
+    ThresholdRule,
+    build_cascade_plan,
+    matches_condition,
 )
+from src.metrics.dirty import MetricChanges, SkipStats
 
 # 수정자 모듈 가져오기
 from src.metrics.modifiers import (
@@ -22,6 +38,15 @@ from src.metrics.modifiers import (
     SimpleSeesawModifier,
     uncertainty_apply_random_fluctuation,
 )
+from src.metrics.snapshot_log import SnapshotLog, SnapshotRecord, is_snapshot_log
+from src.metrics.snapshots import SnapshotRotation, SnapshotWriter, write_snapshot_file
+from src.metrics.state import (
+    METRIC_ORDER,
+    METRIC_ORDINAL,
+    MetricsHistory,
+    MetricsView,
+    read_only,
+)
 
 # 상수
 REPUTATION_THRESHOLD_LOW = 20
@@ -35,6 +60,138 @@ REPUTATION_IMPACT_FACTOR = 30
 FACILITY_IMPACT_FACTOR = 40
 MONEY_IMPACT_FACTOR = 1000
 
+# 임계값 이벤트 (지표별로 처음 맞는 조건 하나만 발생)
+THRESHOLD_EVENT_CHECKS: tuple[tuple[Metric, tuple[tuple[str, float, str], ...]], ...] = (
+    (Metric.MONEY, (("LESS_THAN", MONEY_THRESHOLD_LOW, "자금 위기: 1,000 미만"),)),
+    (
+        Metric.REPUTATION,
+        (
+            ("LESS_THAN", REPUTATION_THRESHOLD_LOW, "평판 위기: 20 미만"),
+            ("GREATER_THAN", REPUTATION_THRESHOLD_HIGH, "평판 호황: 80 초과"),
+        ),
+    ),
+    (
+        Metric.FACILITY,
+        (("LESS_THAN", FACILITY_THRESHOLD_LOW, "시설 위기: 30 미만, 위생 단속 위험"),),
+    ),
+    (
+        Metric.STAFF_FATIGUE,
+        (("GREATER_THAN", STAFF_FATIGUE_THRESHOLD_HIGH, "직원 위기: 피로도 80 초과, 이직 위험"),),
+    ),
+)
+CASCADE_MEMO_SIZE = 256
+
+
+@dataclass(frozen=True)
+class CascadeThresholds:
+    """
+    연쇄 효과 임계값
+
+    엑셀 상수에 같은 이름의 키가 있으면 그 값을, 없으면 모듈 기본값을 사용합니다.
+    상수가 리로드되면 구독 콜백이 새 인스턴스로 교체합니다.
+    """
+
+    reputation_low: float = REPUTATION_THRESHOLD_LOW
+    reputation_baseline: float = MAGIC_NUMBER_FIFTY
+    facility_low: float = FACILITY_THRESHOLD_LOW
+    staff_fatigue_high: float = STAFF_FATIGUE_THRESHOLD_HIGH
+    fatigue_impact: float = FATIGUE_IMPACT_FACTOR
+    reputation_impact: float = REPUTATION_IMPACT_FACTOR
+    facility_impact: float = FACILITY_IMPACT_FACTOR
+    money_impact: float = MONEY_IMPACT_FACTOR
+
+    @classmethod
+    def from_snapshot(cls, snapshot: ConstantsSnapshot) -> "CascadeThresholds":
+        """상수 스냅샷에서 임계값을 만듭니다."""
+        get = snapshot.get
+        return cls(
+            reputation_low=get("REPUTATION_THRESHOLD_LOW", REPUTATION_THRESHOLD_LOW),
+            reputation_baseline=get("REPUTATION_BASELINE", MAGIC_NUMBER_FIFTY),
+            facility_low=get("FACILITY_THRESHOLD_LOW", FACILITY_THRESHOLD_LOW),
+            staff_fatigue_high=get("STAFF_FATIGUE_THRESHOLD_HIGH", STAFF_FATIGUE_THRESHOLD_HIGH),
+            fatigue_impact=get("FATIGUE_IMPACT_FACTOR", FATIGUE_IMPACT_FACTOR),
+            reputation_impact=get("REPUTATION_IMPACT_FACTOR", REPUTATION_IMPACT_FACTOR),
+            facility_impact=get("FACILITY_IMPACT_FACTOR", FACILITY_IMPACT_FACTOR),
+            money_impact=get("MONEY_IMPACT_FACTOR", MONEY_IMPACT_FACTOR),
+        )
+
+    def rules(self) -> tuple[ThresholdRule, ...]:
+        """
+        임계값 기반 연쇄 효과 규칙을 만듭니다.
+
+        - 평판 ≤ reputation_low: 자금 -money_impact * (1 - 평판 / reputation_impact)
+          (평판 > reputation_baseline이면 운영비 증가로 자금 -100)
+        - 직원 피로도 ≥ staff_fatigue_high: 시설 -5 * (피로도 - 임계값) / fatigue_impact
+        - 시설 ≤ facility_low: 평판 -10 * (1 - 시설 / facility_impact)
+
+        Returns:
+            tuple[ThresholdRule, ...]: 연쇄 효과 규칙
+        """
+        return (
+            ThresholdRule(
+                Metric.REPUTATION,
+                Metric.MONEY,
+                (
+                    RuleCase(
+                        "LESS_THAN_OR_EQUAL",
+                        self.reputation_low,
+                        -self.money_impact,
+                        self.money_impact / self.reputation_impact,
+                        "평판 하락으로 인한 매출 감소, 자금 {impact:.0f} 변동",
+                    ),
+                    RuleCase(
+                        "GREATER_THAN",
+                        self.reputation_baseline,
+                        -100,
+                        0,
+                        "평판 상승에 따른 운영비 증가, 자금 {impact:.0f} 변동",
+                    ),
+                ),
+            ),
+            ThresholdRule(
+                Metric.STAFF_FATIGUE,
+                Metric.FACILITY,
+                (
+                    RuleCase(
+                        "GREATER_THAN_OR_EQUAL",
+                        self.staff_fatigue_high,
+                        5 * self.staff_fatigue_high / self.fatigue_impact,
+                        -5 / self.fatigue_impact,
+                        "직원 피로도 증가로 인한 시설 관리 소홀, 시설 상태 {impact:.1f} 변동",
+                    ),
+                ),
+            ),
+            ThresholdRule(
+                Metric.FACILITY,
+                Metric.REPUTATION,
+                (
+                    RuleCase(
+                        "LESS_THAN_OR_EQUAL",
+                        self.facility_low,
+                        -10,
+                        10 / self.facility_impact,
+                        "시설 상태 악화로 인한 고객 불만, 평판 {impact:.1f} 변동",
+                    ),
+                ),
+            ),
+        )
+
+
+@lru_cache(maxsize=32)
+def threshold_cascade_plan(thresholds: CascadeThresholds) -> CascadePlan:
+    """
+    연쇄 효과 임계값 규칙을 전파 계획으로 컴파일합니다.
+
+    같은 임계값은 프로세스 전체에서 한 번만 컴파일합니다.
+
+    Args:
+        thresholds: 연쇄 효과 임계값
+
+    Returns:
+        CascadePlan: 임계값 규칙의 전파 계획
+    """
+    return build_cascade_plan(thresholds.rules())
+
 
 class MetricsTracker:
     """
@@ -44,6 +201,11 @@ class MetricsTracker:
     지표 간 트레이드오프 관계를 유지합니다.
     """
 
+    # 현재 연쇄 효과 임계값 (상수 리로드 시 교체되므로 호출마다 조회 비용이 없음)
+    cascade_thresholds: CascadeThresholds = CascadeThresholds.from_snapshot(
+        get_constants_snapshot()
+    )
+
     def __init__(
         self,
         initial_metrics: dict[Metric, float] | None = None,
@@ -51,6 +213,9 @@ class MetricsTracker:
         history_size: int = 100,
         snapshot_dir: str = "data",
         max_snapshots: int = 5,
+        async_snapshots: bool = False,
+        snapshot_interval: int = 1,
+        snapshot_log: str | None = None,
     ) -> None:
         """
         MetricsTracker 초기화
@@ -61,24 +226,138 @@ class MetricsTracker:
             history_size: 히스토리 저장 크기 (기본값: 100)
             snapshot_dir: 스냅샷 저장 디렉토리 (기본값: "data")
             max_snapshots: 최대 스냅샷 파일 수 (기본값: 5)
+            async_snapshots: 백그라운드 스레드에서 스냅샷을 기록할지 여부 (기본값: False)
+            snapshot_interval: snapshot_if_due()가 스냅샷을 만드는 일수 간격 (기본값: 1)
+            snapshot_log: 스냅샷을 파일별 JSON 대신 기록할 추가 전용 로그 경로
+                (기본값: None, JSON 파일 사용)
         """
-        self.metrics = {}
-        self.history: deque[dict[Metric, float]] = deque(maxlen=history_size)
+        # 지표는 Metric 순서 float64 벡터에, 히스토리는 2차원 링 버퍼에 보관
+        tracked = tuple(get_metric_ranges())
+        self._values = np.zeros(len(METRIC_ORDER), dtype=np.float64)
+        self._view = MetricsView(self._values, tracked)
+        self.history = MetricsHistory(history_size, tracked)
         self.events: deque[str] = deque(maxlen=history_size)
         self.modifier = modifier or SimpleSeesawModifier()
         self.snapshot_dir = snapshot_dir
         self.max_snapshots = max_snapshots
+        self.snapshot_interval = snapshot_interval
+        self._snapshot_rotation = SnapshotRotation(snapshot_dir, max_snapshots)
+        self._snapshot_writer = SnapshotWriter(self._snapshot_rotation) if async_snapshots else None
+        self._snapshot_log = SnapshotLog(snapshot_log) if snapshot_log else None
         self.day = 0
 
-        # 초기 지표 설정
-        for metric, (_min_val, _max_val, default_val) in METRIC_RANGES.items():
+        # 임계값 연쇄 효과 (매트릭스 연쇄 효과는 EventEngine이 이벤트 효과 적용 시 처리)
+        # 같은 날 같은 지표 상태에서 다시 계산하지 않도록 결과를 기억
+        self._cascade_memo: dict[
+            tuple[frozenset[int], bytes], tuple[dict[Metric, float], list[str]]
+        ] = {}
+        self._cascade_memo_owner: tuple[CascadePlan, int] | None = None
+        self.cascade_runs = 0
+        self.cascade_memo_hits = 0
+
+        # 초기 지표 설정 (현재 상수 기준 기본값)
+        for metric, (_min_val, _max_val, default_val) in get_metric_ranges().items():
             if initial_metrics and metric in initial_metrics:
-                self.metrics[metric] = cap_metric_value(metric, initial_metrics[metric])
+                self._values[METRIC_ORDINAL[metric]] = cap_metric_value(
+                    metric, initial_metrics[metric]
+                )
             else:
-                self.metrics[metric] = default_val
+                self._values[METRIC_ORDINAL[metric]] = default_val
 
         # 초기 상태를 히스토리에 추가
-        self.history.append(self.metrics.copy())
+        self.history.append(self._values)
+
+        # 임계값 이벤트는 바뀐 지표의 조건만 다시 확인
+        self._threshold_changes = self.subscribe_changes()
+        self._threshold_messages: dict[Metric, str | None] = {}
+        self.threshold_skip_stats = SkipStats()
+
+    @property
+    def metrics(self) -> MetricsView:
+        """현재 지표의 읽기 전용 dict 호환 뷰 (복사 없음, 항상 최신 값)"""
+        return self._view
+
+    @metrics.setter
+    def metrics(self, values: dict[Metric, float]) -> None:
+        for metric, value in values.items():
+            self._values[METRIC_ORDINAL[metric]] = value
+
+    def get_metric(self, metric: Metric) -> float:
+        """
+        단일 지표 값을 반환합니다 (dict 복사 없음).
+
+        Args:
+            metric: 조회할 지표
+
+        Returns:
+            float: 현재 지표 값
+        """
+        return float(self._values[METRIC_ORDINAL[metric]])
+
+    def get_metrics_view(self) -> MetricsView:
+        """
+        현재 지표의 읽기 전용 뷰를 반환합니다.
+
+        get_metrics()와 달리 복사하지 않으므로, 이후 업데이트가 뷰에 그대로
+        반영됩니다. 값을 보존해야 하면 get_metrics()를 사용하세요.
+
+        Returns:
+            MetricsView: 읽기 전용 dict 호환 뷰
+        """
+        return self._view
+
+    def subscribe_changes(self) -> MetricChanges:
+        """
+        바뀐 지표를 받을 구독을 만듭니다.
+
+        구독의 poll()은 마지막 poll() 이후 바뀐 지표와 변화량을 반환하므로,
+        평가기는 바뀐 지표에 의존하는 조건만 다시 평가할 수 있습니다.
+
+        Returns:
+            MetricChanges: 현재 지표를 기준으로 한 변경 지표 구독
+        """
+        return MetricChanges(self._values)
+
+    def get_metrics_array(self) -> np.ndarray:
+        """
+        Metric 선언 순서로 정렬된 지표 벡터의 읽기 전용 뷰를 반환합니다.
+
+        Returns:
+            np.ndarray: (지표 수,) float64 읽기 전용 배열
+        """
+        return read_only(self._values)
+
+    def get_history_array(self, steps: int | None = None) -> np.ndarray:
+        """
+        지표 히스토리를 (기록 수 x 지표 수) 읽기 전용 배열로 반환합니다.
+
+        Args:
+            steps: 반환할 최근 기록 수 (기본값: None, 전체 히스토리)
+
+        Returns:
+            np.ndarray: 오래된 순서의 히스토리 배열 (열 순서는 Metric 선언 순서)
+        """
+        return self.history.as_array(steps)
+
+    def _apply_updates(self, updates: dict[Metric, float]) -> None:
+        """
+        수정자를 거쳐 지표 업데이트를 적용합니다.
+
+        기본 SimpleSeesawModifier는 벡터에 직접 적용하여 dict를 만들지 않고,
+        다른 수정자는 기존처럼 dict 복사본을 받아 결과를 돌려줍니다.
+        """
+        if type(self.modifier) is SimpleSeesawModifier:
+            values = self._values
+            for metric, value in updates.items():
+                values[METRIC_ORDINAL[metric]] = value
+            happiness = METRIC_ORDINAL[Metric.HAPPINESS]
+            suffering = METRIC_ORDINAL[Metric.SUFFERING]
+            if Metric.HAPPINESS in updates:
+                values[suffering] = HAPPINESS_SUFFERING_SUM - values[happiness]
+            elif Metric.SUFFERING in updates:
+                values[happiness] = HAPPINESS_SUFFERING_SUM - values[suffering]
+            return
+        self.metrics = self.modifier.apply(self.get_metrics(), updates)
 
     def get_metrics(self) -> dict[Metric, float]:
         """
@@ -87,7 +366,7 @@ class MetricsTracker:
         Returns:
             dict[Metric, float]: 현재 지표 상태
         """
-        return self.metrics.copy()
+        return self._view.copy()
 
     def get_history(self, steps: int | None = None) -> list[dict[Metric, float]]:
         """
@@ -138,13 +417,13 @@ class MetricsTracker:
             value: 새 지표 값
         """
         # 지표 업데이트
-        self.metrics = self.modifier.apply(self.metrics, {metric: cap_metric_value(metric, value)})
+        self._apply_updates({metric: cap_metric_value(metric, value)})
 
         # 연쇄 효과 적용
         self.apply_cascade_effects({metric})
 
         # 히스토리에 현재 상태 추가
-        self.history.append(self.metrics.copy())
+        self.history.append(self._values)
 
     def tradeoff_update_metrics(self, updates: dict[Metric, float]) -> None:
         """
@@ -154,99 +433,95 @@ class MetricsTracker:
             updates: 업데이트할 지표와 값의 딕셔너리
         """
         # 지표 업데이트
-        self.metrics = self.modifier.apply(self.metrics, updates)
+        self._apply_updates(updates)
 
         # 연쇄 효과 적용
         self.apply_cascade_effects(set(updates.keys()))
 
         # 히스토리에 현재 상태 추가
-        self.history.append(self.metrics.copy())
+        self.history.append(self._values)
+
+    @property
+    def cascade_plan(self) -> CascadePlan:
+        """현재 임계값 규칙의 전파 계획"""
+        return threshold_cascade_plan(type(self).cascade_thresholds)
 
     def apply_cascade_effects(self, changed_metrics: set[Metric]) -> None:
         """
         지표 변화의 연쇄 효과를 적용합니다.
 
-        예: 평판↓ → 수요↓ → 자금↓
+        예: 시설↓ → 평판↓ → 자금↓
+
+        변경된 지표의 임계값 규칙만 변경 직후 값으로 한 단계 평가하고 결과를
+        한 번에 반영합니다 (반영한 값은 다시 연쇄하지 않음).
+        같은 날 같은 지표 상태와 변경 지표에 대한 결과는 기억해 두고 재사용합니다.
 
         Args:
             changed_metrics: 변경된 지표 집합
         """
-        cascade_updates = {}
-
-        # 평판 변화의 연쇄 효과
-        if Metric.REPUTATION in changed_metrics:
-            reputation = self.metrics[Metric.REPUTATION]
-            # 평판이 REPUTATION_THRESHOLD_LOW 이하로 떨어지면 자금에 영향
-            if reputation <= REPUTATION_THRESHOLD_LOW:
-                money_impact = -MONEY_IMPACT_FACTOR * (1 - reputation / REPUTATION_IMPACT_FACTOR)
-                cascade_updates[Metric.MONEY] = self.metrics[Metric.MONEY] + money_impact
-                self.add_event(f"평판 하락으로 인한 매출 감소, 자금 {money_impact:.0f} 변동")
-            # 평판이 높아져도 약간의 부정적 영향 (테스트 케이스 대응)
-            elif reputation > MAGIC_NUMBER_FIFTY:  # 초기값보다 높아진 경우
-                money_impact = -100  # 약간의 부정적 영향
-                cascade_updates[Metric.MONEY] = self.metrics[Metric.MONEY] + money_impact
-                self.add_event(f"평판 상승에 따른 운영비 증가, 자금 {money_impact:.0f} 변동")
-
-        # 직원 피로도 변화의 연쇄 효과
-        if Metric.STAFF_FATIGUE in changed_metrics:
-            fatigue = self.metrics[Metric.STAFF_FATIGUE]
-            # 피로도가 STAFF_FATIGUE_THRESHOLD_HIGH 이상이면 시설 상태에 영향
-            if fatigue >= STAFF_FATIGUE_THRESHOLD_HIGH:
-                facility_impact = (
-                    -5 * (fatigue - STAFF_FATIGUE_THRESHOLD_HIGH) / FATIGUE_IMPACT_FACTOR
-                )
-                cascade_updates[Metric.FACILITY] = self.metrics[Metric.FACILITY] + facility_impact
-                self.add_event(
-                    f"직원 피로도 증가로 인한 시설 관리 소홀, 시설 상태 {facility_impact:.1f} 변동"
-                )
+        plan = self.cascade_plan
+        if not plan.steps:
+            return
 
-        # 시설 상태 변화의 연쇄 효과
-        if Metric.FACILITY in changed_metrics:
-            facility = self.metrics[Metric.FACILITY]
-            # 시설 상태가 FACILITY_THRESHOLD_LOW 이하면 평판에 영향
-            if facility <= FACILITY_THRESHOLD_LOW:
-                reputation_impact = -10 * (1 - facility / FACILITY_IMPACT_FACTOR)
-                cascade_updates[Metric.REPUTATION] = (
-                    self.metrics[Metric.REPUTATION] + reputation_impact
-                )
-                self.add_event(
-                    f"시설 상태 악화로 인한 고객 불만, 평판 {reputation_impact:.1f} 변동"
-                )
+        owner = (plan, self.day)
+        if owner != self._cascade_memo_owner:
+            self._cascade_memo.clear()
+            self._cascade_memo_owner = owner
+
+        columns = frozenset(METRIC_ORDINAL[metric] for metric in changed_metrics)
+        key = (columns, self._values.tobytes())
+        cached = self._cascade_memo.get(key)
+        if cached is None:
+            self.cascade_runs += 1
+            cached = plan.propagate_level(self._values.item, columns)
+            if len(self._cascade_memo) >= CASCADE_MEMO_SIZE:
+                self._cascade_memo.clear()
+            self._cascade_memo[key] = cached
+        else:
+            self.cascade_memo_hits += 1
+
+        cascade_updates, messages = cached
+        for message in messages:
+            self.add_event(message)
 
         # 연쇄 효과가 있으면 적용
         if cascade_updates:
-            self.metrics = self.modifier.apply(self.metrics, cascade_updates)
+            self._apply_updates(cascade_updates)
 
     def check_threshold_events(self) -> list[str]:
         """
         임계값 기반 이벤트를 확인하고 트리거합니다.
 
+        지난 확인 이후 바뀐 지표의 조건만 다시 확인하고, 나머지 지표는 이전
+        결과를 재사용합니다 (threshold_skip_stats에 집계).
+
         Returns:
             List[str]: 트리거된 이벤트 메시지 목록
         """
-        triggered_events = []
-
-        # 자금 임계값 이벤트
-        money = self.metrics[Metric.MONEY]
-        if money < MONEY_THRESHOLD_LOW:
-            triggered_events.append("자금 위기: 1,000 미만")
-
-        # 평판 임계값 이벤트
-        reputation = self.metrics[Metric.REPUTATION]
-        if reputation < REPUTATION_THRESHOLD_LOW:
-            triggered_events.append("평판 위기: 20 미만")
-        elif reputation > REPUTATION_THRESHOLD_HIGH:
-            triggered_events.append("평판 호황: 80 초과")
-
-        # 시설 임계값 이벤트
-        facility = self.metrics[Metric.FACILITY]
-        if facility < FACILITY_THRESHOLD_LOW:
-            triggered_events.append("시설 위기: 30 미만, 위생 단속 위험")
-
-        # 직원 피로도 임계값 이벤트
-        fatigue = self.metrics[Metric.STAFF_FATIGUE]
-        if fatigue > STAFF_FATIGUE_THRESHOLD_HIGH:
-            triggered_events.append("직원 위기: 피로도 80 초과, 이직 위험")
+        changes = self._threshold_changes.poll()
+        messages = self._threshold_messages
+        evaluated = skipped = 0
+        for metric, checks in THRESHOLD_EVENT_CHECKS:
+            if metric in messages and metric not in changes:
+                skipped += len(checks)
+                continue
+            evaluated += len(checks)
+            value = self._values[METRIC_ORDINAL[metric]]
+            messages[metric] = next(
+                (
+                    message
+                    for condition, threshold, message in checks
+                    if matches_condition(condition, value, threshold)
+                ),
+                None,
+            )
+        self.threshold_skip_stats.record(evaluated, skipped)
+
+        triggered_events = [
+            message
+            for metric, _checks in THRESHOLD_EVENT_CHECKS
+            if (message := messages[metric]) is not None
+        ]
 
         # 이벤트 메시지 추가
         for event in triggered_events:
@@ -255,7 +530,11 @@ class MetricsTracker:
         return triggered_events
 
     def uncertainty_apply_random_fluctuation(
-        self, day: int, intensity: float = 0.1, seed: int | None = None
+        self,
+        day: int,
+        intensity: float = 0.1,
+        seed: int | None = None,
+        rng: RngStream | None = None,
     ) -> None:
         """
         불확실성 요소를 반영하여 지표에 무작위 변동을 적용합니다.
@@ -263,15 +542,18 @@ class MetricsTracker:
         Args:
             day: 현재 게임 일수
             intensity: 변동 강도 (기본값: 0.1)
-            seed: 난수 생성 시드 (기본값: None)
+            seed: 난수 생성 시드 (기본값: None, rng가 있으면 무시)
+            rng: 난수 스트림 (기본값: None)
         """
         self.day = day
 
         # 불확실성 함수를 사용하여 변동 적용
-        self.metrics = uncertainty_apply_random_fluctuation(self.metrics, intensity, seed)
+        self.metrics = uncertainty_apply_random_fluctuation(
+            self.get_metrics(), intensity, seed, rng
+        )
 
         # 히스토리에 현재 상태 추가
-        self.history.append(self.metrics.copy())
+        self.history.append(self._values)
 
         # 임계값 이벤트 확인
         self.check_threshold_events()
@@ -280,17 +562,22 @@ class MetricsTracker:
         """
         현재 지표 상태의 스냅샷을 생성하고 저장합니다.
 
+        비동기 모드에서는 스냅샷을 기록 큐에 넣고 바로 반환하므로, 파일은
+        flush_snapshots() 또는 close() 이후에 존재가 보장됩니다. 스냅샷 로그를
+        사용하면 새 파일 없이 로그에 레코드 하나를 추가합니다.
+
         Returns:
-            str: 저장된 스냅샷 파일 경로
+            str: 저장된 (비동기 모드에서는 저장될) 스냅샷 파일 또는 로그 경로
         """
-        # 스냅샷 디렉토리 확인 및 생성
-        if not os.path.exists(self.snapshot_dir):
-            os.makedirs(self.snapshot_dir)
+        if self._snapshot_log is not None:
+            self._snapshot_log.append(
+                self.day, self._values, list(self.events), self.modifier.get_name()
+            )
+            return self._snapshot_log.path
 
         # 스냅샷 파일명 생성 (YYMMDD_HHMMSS_ms 형식)
         timestamp = datetime.now().strftime("%y%m%d_%H%M%S_%f")[:19]  # 밀리초 포함하여 고유성 보장
-        filename = f"metrics_snap_{timestamp}.json"
-        filepath = os.path.join(self.snapshot_dir, filename)
+        filepath = self._snapshot_rotation.reserve(timestamp)
 
         # 스냅샷 데이터 준비
         snapshot_data = {
@@ -301,53 +588,92 @@ class MetricsTracker:
             "modifier": self.modifier.get_name(),
         }
 
-        # 스냅샷 저장
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(snapshot_data, f, indent=2, ensure_ascii=False)
+        if self._snapshot_writer is not None:
+            self._snapshot_writer.submit(filepath, snapshot_data)
+            return filepath
 
-        # 오래된 스냅샷 정리
-        self._cleanup_old_snapshots()
+        # 스냅샷 저장 후 오래된 스냅샷 정리 (디렉토리 스캔 없이 메모리 목록 기준)
+        write_snapshot_file(filepath, snapshot_data)
+        self._snapshot_rotation.register(filepath)
 
         return filepath
 
-    def _cleanup_old_snapshots(self) -> None:
+    def snapshot_if_due(self) -> str | None:
         """
-        오래된 스냅샷 파일을 정리하여 최대 개수를 유지합니다.
-        """
-        if not os.path.exists(self.snapshot_dir):
-            return
+        스냅샷 간격(snapshot_interval)에 해당하는 날이면 스냅샷을 생성합니다.
 
-        # 스냅샷 파일 목록 가져오기
-        snapshot_files = [
-            os.path.join(self.snapshot_dir, f)
-            for f in os.listdir(self.snapshot_dir)
-            if f.startswith("metrics_snap_") and f.endswith(".json")
-        ]
+        Returns:
+            Optional[str]: 생성한 스냅샷 파일 경로 (해당하는 날이 아니면 None)
+        """
+        if self.snapshot_interval <= 0 or self.day % self.snapshot_interval != 0:
+            return None
+        return self.create_snapshot()
 
-        # 파일 수가 최대 개수를 초과하면 오래된 파일 삭제
-        if len(snapshot_files) > self.max_snapshots:
-            # 파일 수정 시간 기준으로 정렬
-            snapshot_files.sort(key=lambda x: os.path.getmtime(x))
+    def flush_snapshots(self) -> None:
+        """
+        기록 대기 중인 스냅샷이 모두 파일로 저장될 때까지 기다립니다.
+        """
+        if self._snapshot_writer is not None:
+            self._snapshot_writer.flush()
+        if self._snapshot_log is not None:
+            self._snapshot_log.flush()
 
-            # 오래된 파일 삭제
-            files_to_delete = len(snapshot_files) - self.max_snapshots
-            for i in range(files_to_delete):
-                try:
-                    os.remove(snapshot_files[i])
-                    print(f"스냅샷 파일 삭제: {snapshot_files[i]}")  # 디버깅용 출력
-                except OSError as e:
-                    print(f"스냅샷 파일 삭제 실패: {snapshot_files[i]}, 오류: {e}")  # 디버깅용 출력
+    def close(self) -> None:
+        """
+        남은 스냅샷을 모두 기록하고 스냅샷 기록기를 닫습니다.
+        """
+        if self._snapshot_writer is not None:
+            self._snapshot_writer.close()
+        if self._snapshot_log is not None:
+            self._snapshot_log.close()
+
+    def _open_snapshot_log(self, filepath: str | None) -> tuple[SnapshotLog, bool]:
+        """스냅샷 로그를 엽니다 (열려 있는 이 추적기의 로그면 재사용, 닫아야 하는지 함께 반환)."""
+        own = self._snapshot_log
+        if own is not None and (filepath is None or filepath == own.path):
+            if not own.closed:
+                return own, False
+            filepath = own.path
+        if filepath is None:
+            raise ValueError("스냅샷 로그 경로가 지정되지 않았습니다")
+        return SnapshotLog(filepath), True
+
+    def _restore_record(self, record: SnapshotRecord) -> None:
+        """스냅샷 로그 레코드로 상태를 복원합니다."""
+        self.metrics = record.metrics
+        self.day = record.day
+        self.events.clear()
+        self.events.extend(record.events)
+        self.history.append(self._values)
 
-    def load_snapshot(self, filepath: str) -> bool:
+    def load_snapshot(self, filepath: str, day: int | None = None) -> bool:
         """
         저장된 스냅샷을 로드하여 현재 상태를 복원합니다.
 
+        스냅샷 로그 파일이면 오프셋 인덱스로 지정한 날의 레코드를 바로 읽습니다.
+
         Args:
-            filepath: 스냅샷 파일 경로
+            filepath: 스냅샷 파일 또는 스냅샷 로그 경로
+            day: 스냅샷 로그에서 복원할 일수 (기본값: None, 마지막 레코드)
 
         Returns:
             bool: 로드 성공 여부
         """
+        if is_snapshot_log(filepath):
+            try:
+                log, should_close = self._open_snapshot_log(filepath)
+                try:
+                    record = log.read(day)
+                finally:
+                    if should_close:
+                        log.close()
+            except (OSError, ValueError):
+                return False
+            if record is None:
+                return False
+            self._restore_record(record)
+            return True
+
         try:
             with open(filepath, encoding="utf-8") as f:
                 snapshot_data = json.load(f)
@@ -367,12 +693,41 @@ class MetricsTracker:
                 self.events.append(event)
 
             # 히스토리에 현재 상태 추가
-            self.history.append(self.metrics.copy())
+            self.history.append(self._values)
 
             return True
         except (OSError, json.JSONDecodeError, KeyError):
             return False
 
+    def replay_snapshots(
+        self,
+        start_day: int | None = None,
+        end_day: int | None = None,
+        filepath: str | None = None,
+    ) -> list[SnapshotRecord]:
+        """
+        스냅샷 로그에서 일수 범위의 스냅샷을 기록 순서대로 읽습니다 (디버깅용).
+
+        현재 상태는 바꾸지 않으며, 필요한 날은 load_snapshot(path, day)로 복원합니다.
+
+        Args:
+            start_day: 시작 일수 (포함, 기본값: None, 처음부터)
+            end_day: 끝 일수 (포함, 기본값: None, 끝까지)
+            filepath: 스냅샷 로그 경로 (기본값: None, 이 추적기의 로그)
+
+        Returns:
+            List[SnapshotRecord]: 범위에 속하는 스냅샷 레코드 목록
+
+        Raises:
+            ValueError: 사용할 스냅샷 로그가 없는 경우
+        """
+        log, should_close = self._open_snapshot_log(filepath)
+        try:
+            return list(log.replay(start_day, end_day))
+        finally:
+            if should_close:
+                log.close()
+
     def simulate_no_right_answer_decision(
         self, decision: dict[str, float | str | bool]
     ) -> dict[Metric, float]:
@@ -407,9 +762,9 @@ class MetricsTracker:
         """
         MetricsTracker를 초기 상태로 리셋합니다.
         """
-        # 지표를 기본값으로 초기화
-        for metric, (_min_val, _max_val, default_val) in METRIC_RANGES.items():
-            self.metrics[metric] = default_val
+        # 지표를 (현재 상수 기준) 기본값으로 초기화
+        for metric, (_min_val, _max_val, default_val) in get_metric_ranges().items():
+            self._values[METRIC_ORDINAL[metric]] = default_val
 
         # 히스토리 및 이벤트 초기화
         self.history.clear()
@@ -417,4 +772,12 @@ class MetricsTracker:
         self.day = 0
 
         # 초기 상태를 히스토리에 추가
-        self.history.append(self.metrics.copy())
+        self.history.append(self._values)
+
+
+def _refresh_cascade_thresholds(snapshot: ConstantsSnapshot) -> None:
+    """상수 리로드 시 연쇄 효과 임계값을 교체합니다."""
+    MetricsTracker.cascade_thresholds = CascadeThresholds.from_snapshot(snapshot)
+
+
+subscribe_constants(_refresh_cascade_thresholds)
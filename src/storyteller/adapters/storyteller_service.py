@@ -6,14 +6,15 @@
 내러티브를 생성하고 이벤트를 제안합니다.
 """
 
-import random
 from typing import ClassVar, Dict, Any, Optional
 from dataclasses import dataclass
 
 from src.core.ports.container_port import IServiceContainer
 from src.core.ports.event_port import IEventService
+from src.core.rng import RngService
 from src.core.domain.game_state import GameState
 from src.core.domain.metrics import MetricEnum
+from src.metrics.dirty import ConditionCache
 from src.storyteller.ports.storyteller_port import IStorytellerService
 from src.storyteller.domain.models import StoryContext, NarrativeResponse, StoryPattern
 from src.storyteller.domain.strategy_factory import (
@@ -23,7 +24,6 @@ from src.storyteller.domain.strategy_factory import (
 )
 from game_constants import (
     Metric,
-    UNCERTAINTY_WEIGHTS,
     PROBABILITY_LOW_THRESHOLD,
     PROBABILITY_HIGH_THRESHOLD,
     MIN_METRICS_HISTORY_FOR_TREND,
@@ -40,9 +40,20 @@ from game_constants import (
     GAME_PROGRESSION_MID_POINT,
     PATTERN_SCORE_TOLERANCE,
     COMPLEXITY_BONUS_MULTIPLIER,
+    get_constants_snapshot,
+    get_uncertainty_weights,
 )
 
 
+def _probability_thresholds() -> tuple[float, float]:
+    """현재 상수 스냅샷의 (낮은, 높은) 확률 임계값 (상수 리로드를 바로 반영)"""
+    snapshot = get_constants_snapshot()
+    return (
+        snapshot.get("PROBABILITY_LOW_THRESHOLD", PROBABILITY_LOW_THRESHOLD),
+        snapshot.get("PROBABILITY_HIGH_THRESHOLD", PROBABILITY_HIGH_THRESHOLD),
+    )
+
+
 class StorytellerService(IStorytellerService):
     """스토리텔러 서비스 구현체."""
 
@@ -103,15 +114,22 @@ class StorytellerService(IStorytellerService):
         },
     ]
 
-    def __init__(self, container: IServiceContainer, strategy_bundle: StorytellerStrategyBundle | None = None):
+    def __init__(
+        self,
+        container: IServiceContainer,
+        strategy_bundle: StorytellerStrategyBundle | None = None,
+        rng: RngService | None = None,
+    ):
         """
         스토리텔러 서비스를 초기화합니다.
 
         Args:
             container: 의존성 주입 컨테이너
             strategy_bundle: 스토리텔러 전략 번들 (의존성 주입)
+            rng: 난수 서비스 (기본값: None, 이 경우 무작위 시드로 생성)
         """
         self._container = container
+        self._rng = rng or RngService()
         self._event_service = container.get(IEventService)
         
         # 전략 패턴 의존성 주입
@@ -134,6 +152,8 @@ class StorytellerService(IStorytellerService):
             )
             for config in self._STORY_PATTERNS_CONFIG
         ]
+        # 패턴 조건은 지난 조회 이후 바뀐 지표에 의존하는 것만 다시 검사
+        self.pattern_conditions = ConditionCache()
 
     def generate_narrative(self, context: StoryContext) -> NarrativeResponse:
         """
@@ -229,7 +249,7 @@ class StorytellerService(IStorytellerService):
                 filtered_event_ids = event_ids
 
             # uncertainty 원칙에 따라 랜덤 요소 추가
-            return random.choice(filtered_event_ids)
+            return self._rng.daily_stream("storyteller", context.day).choice(filtered_event_ids)
 
         except Exception:
             # 예외 발생 시 None 반환 (이벤트 제안 없음)
@@ -257,6 +277,7 @@ class StorytellerService(IStorytellerService):
 
             # uncertainty 가중치 적용 (기존 로직 유지)
             adjusted_trends = {}
+            rng = self._rng.daily_stream("storyteller", context.day)
             for metric_name, trend_rate in trends.items():
                 # Metric enum에서 해당 metric 찾기
                 metric_enum = None
@@ -266,9 +287,9 @@ class StorytellerService(IStorytellerService):
                         break
                 
                 if metric_enum:
-                    uncertainty_factor = UNCERTAINTY_WEIGHTS.get(metric_enum, 0.0)
+                    uncertainty_factor = get_uncertainty_weights().get(metric_enum, 0.0)
                     adjusted_trend = trend_rate * (
-                        1 + uncertainty_factor * random.uniform(-0.5, 0.5)
+                        1 + uncertainty_factor * rng.uniform(-0.5, 0.5)
                     )
                     adjusted_trends[metric_name] = round(adjusted_trend, 3)
                 else:
@@ -301,8 +322,14 @@ class StorytellerService(IStorytellerService):
 
             applicable_patterns = []
 
+            conditions = self.pattern_conditions
+            conditions.begin(current_metrics)
             for pattern in self._story_patterns:
-                if pattern.matches(current_metrics):
+                if conditions.check(
+                    pattern.pattern_id,
+                    pattern.trigger_conditions,
+                    lambda pattern=pattern: pattern.matches(current_metrics),
+                ):
                     applicable_patterns.append(pattern)
 
             # 전략 패턴을 통한 패턴 우선순위 결정
@@ -320,9 +347,10 @@ class StorytellerService(IStorytellerService):
 
     def _determine_game_phase(self, progression: float) -> str:
         """게임 진행도에 따른 단계 결정"""
-        if progression < PROBABILITY_LOW_THRESHOLD:
+        low_threshold, high_threshold = _probability_thresholds()
+        if progression < low_threshold:
             return "early_game"
-        elif progression < PROBABILITY_HIGH_THRESHOLD:
+        elif progression < high_threshold:
             return "mid_game"
         else:
             return "late_game"
@@ -390,7 +418,7 @@ class StorytellerService(IStorytellerService):
             return events[0]  # 모든 이벤트가 최근 발생했다면 첫 번째 반환
 
         # uncertainty 원칙에 따라 랜덤 요소 추가
-        return random.choice(available_events)
+        return self._rng.daily_stream("storyteller.events").choice(available_events)
 
     def _calculate_linear_trend(self, values: list[float]) -> float:
         """값들의 선형 추세 계산"""
@@ -468,14 +496,11 @@ class StorytellerService(IStorytellerService):
         if "happiness" in metrics and "pain" in metrics:
             happiness_ratio = metrics["happiness"] / 100
             pain_ratio = metrics["pain"] / 100
+            low_threshold, high_threshold = _probability_thresholds()
 
             # 행복과 고통의 불균형 (둘 다 높거나 둘 다 낮은 경우)
-            if (
-                happiness_ratio > PROBABILITY_HIGH_THRESHOLD
-                and pain_ratio > PROBABILITY_HIGH_THRESHOLD
-            ) or (
-                happiness_ratio < PROBABILITY_LOW_THRESHOLD
-                and pain_ratio < PROBABILITY_LOW_THRESHOLD
+            if (happiness_ratio > high_threshold and pain_ratio > high_threshold) or (
+                happiness_ratio < low_threshold and pain_ratio < low_threshold
             ):
                 if "happiness" not in critical_metrics:
                     critical_metrics.append("happiness")
@@ -503,16 +528,18 @@ class StorytellerService(IStorytellerService):
         if not patterns:
             return []
 
+        low_threshold, high_threshold = _probability_thresholds()
+
         # 게임 진행도별 패턴 타입 우선순위 정의
         progression_priorities = {
             # 초기 게임 (0.0 ~ PROBABILITY_LOW_THRESHOLD): uncertainty 중심
             "early": {
                 "uncertainty": 1.0,
-                "tradeoff": PROBABILITY_HIGH_THRESHOLD,
+                "tradeoff": high_threshold,
                 "crisis": 0.8,
                 "opportunity_risk": 0.6,
                 "balance": 0.4,
-                "dilemma": PROBABILITY_LOW_THRESHOLD,
+                "dilemma": low_threshold,
                 "noRightAnswer": 0.2,
             },
             # 중기 게임 (PROBABILITY_LOW_THRESHOLD ~ PROBABILITY_HIGH_THRESHOLD): tradeoff 중심
@@ -520,7 +547,7 @@ class StorytellerService(IStorytellerService):
                 "tradeoff": 1.0,
                 "crisis": 0.9,
                 "uncertainty": 0.8,
-                "dilemma": PROBABILITY_HIGH_THRESHOLD,
+                "dilemma": high_threshold,
                 "opportunity_risk": 0.6,
                 "balance": 0.5,
                 "noRightAnswer": 0.8,
@@ -530,7 +557,7 @@ class StorytellerService(IStorytellerService):
                 "noRightAnswer": 1.0,
                 "dilemma": 0.9,
                 "tradeoff": 0.8,
-                "balance": PROBABILITY_HIGH_THRESHOLD,
+                "balance": high_threshold,
                 "crisis": 0.6,
                 "opportunity_risk": 0.5,
                 "uncertainty": 0.4,
@@ -538,9 +565,9 @@ class StorytellerService(IStorytellerService):
         }
 
         # 현재 진행도에 따른 단계 결정
-        if progression < PROBABILITY_LOW_THRESHOLD:
+        if progression < low_threshold:
             current_priorities = progression_priorities["early"]
-        elif progression < PROBABILITY_HIGH_THRESHOLD:
+        elif progression < high_threshold:
             current_priorities = progression_priorities["mid"]
         else:
             current_priorities = progression_priorities["late"]
@@ -589,7 +616,7 @@ class StorytellerService(IStorytellerService):
             else:
                 # 새로운 점수 그룹 시작
                 if current_score_group:
-                    random.shuffle(current_score_group)  # uncertainty 적용
+                    self._rng.daily_stream("storyteller.patterns").shuffle(current_score_group)  # uncertainty 적용
                     result_patterns.extend(current_score_group)
 
                 current_score_group = [pattern]
@@ -597,7 +624,7 @@ class StorytellerService(IStorytellerService):
 
         # 마지막 그룹 처리
         if current_score_group:
-            random.shuffle(current_score_group)
+            self._rng.daily_stream("storyteller.patterns").shuffle(current_score_group)
             result_patterns.extend(current_score_group)
 
         return result_patterns
@@ -1,7 +1,8 @@
 from typing import Protocol
-import random
 
 from game_constants import Metric, StorytellerConstants
+from src.core.rng import RngService
+from src.metrics.dirty import ConditionCache
 from src.storyteller.domain.models import StoryContext, StoryPattern
 
 
@@ -106,10 +107,18 @@ class LinearTrendAnalyzer:
 class WeightedPatternSelector:
     """가중치 기반 패턴 선택 전략"""
 
+    def __init__(self, rng: RngService | None = None) -> None:
+        # 발동 조건은 지난 선택 이후 바뀐 지표에 의존하는 것만 다시 검사
+        self.conditions = ConditionCache()
+        # 동점 패턴 선택 난수는 일수별 "storyteller.patterns" 스트림
+        self.rng = rng or RngService()
+
     def select(self, context: StoryContext, patterns: list[dict]) -> StoryPattern | None:
         if not patterns:
             return None
 
+        self.conditions.begin(context.current_metrics)
+
         storyteller_constants = StorytellerConstants()
         
         # 진행도 계산 (0~1 사이 값)
@@ -158,19 +167,27 @@ class WeightedPatternSelector:
         if not current_score_group:
             return None
 
-        selected_pattern = random.choice(current_score_group)
+        rng = self.rng.daily_stream("storyteller.patterns", context.day)
+        selected_pattern = rng.choice(current_score_group)
         return StoryPattern(
             pattern_id=selected_pattern["pattern_id"],
             name=selected_pattern["name"],
+            trigger_conditions=selected_pattern.get("trigger_conditions", {}),
+            related_events=selected_pattern["related_events"],
             narrative_template=selected_pattern["narrative_template"],
             pattern_type=selected_pattern["pattern_type"],
         )
 
     def _check_pattern_conditions(self, pattern: dict, metrics: dict[str, float]) -> bool:
-        """패턴의 발동 조건 검사"""
+        """패턴의 발동 조건 검사 (조건 지표가 바뀌지 않았으면 이전 결과 재사용)"""
         conditions = pattern.get("trigger_conditions", {})
-        for metric, threshold in conditions.items():
-            current_value = metrics.get(metric, 0)
-            if current_value < threshold:
-                return False
-        return True
+
+        def check() -> bool:
+            for metric, threshold in conditions.items():
+                current_value = metrics.get(metric, 0)
+                if current_value < threshold:
+                    return False
+            return True
+
+        key = (pattern.get("pattern_id"), tuple(conditions.items()))
+        return self.conditions.check(key, conditions, check)
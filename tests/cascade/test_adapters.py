@@ -6,6 +6,8 @@ Cascade 모듈 어댑터 테스트.
 이 모듈은 연쇄 이벤트 시스템의 어댑터에 대한 단위 테스트를 포함합니다.
 """
 
+import json
+
 import pytest
 from dataclasses import dataclass
 
@@ -100,6 +102,26 @@ class MockEventService(IEventService):
         return 1.0
 
 
+
+class DeltaEventService(MockEventService):
+    """지표 변화량을 한 번에 적용할 수 있는 테스트용 이벤트 서비스."""
+
+    def __init__(self):
+        super().__init__()
+        self.effect_calls = 0
+        self.delta_calls = 0
+
+    def apply_event_effects(self, event: TestEvent, game_state: TestGameState) -> TestGameState:
+        self.effect_calls += 1
+        return super().apply_event_effects(event, game_state)
+
+    def apply_metrics_delta(self, deltas: dict, game_state: TestGameState) -> TestGameState:
+        self.delta_calls += 1
+        new_metrics = dict(game_state.metrics)
+        for metric, value in deltas.items():
+            new_metrics[metric] = new_metrics.get(metric, 0) + value
+        return TestGameState(metrics=new_metrics, turn=game_state.turn)
+
 class TestCascadeServiceImpl:
     """CascadeServiceImpl 클래스 테스트."""
 
@@ -289,6 +311,165 @@ class TestCascadeServiceImpl:
         pending_turn3_again = cascade_service.get_pending_events(3)
         assert len(pending_turn3_again) == 0
 
+    @staticmethod
+    def _register_shared_chain(cascade_service):
+        # root_event와 child2가 child1(-> grandchild -> conditional_event)을 공유
+        for parent, child in [
+            ("root_event", "child1"),
+            ("child2", "child1"),
+            ("child1", "grandchild"),
+        ]:
+            cascade_service.register_cascade_relation(
+                parent_event_id=parent, child_event_id=child, cascade_type_str="IMMEDIATE"
+            )
+        cascade_service.register_cascade_relation(
+            parent_event_id="grandchild",
+            child_event_id="conditional_event",
+            cascade_type_str="CONDITIONAL",
+            trigger_condition={"expression": "metrics.reputation < 0"},
+        )
+
+    @pytest.mark.parametrize("service_cls", [MockEventService, DeltaEventService])
+    def test_process_cascade_batch(self, service_cls):
+        """여러 루트 이벤트의 연쇄 일괄 처리 테스트."""
+        event_service = service_cls()
+        cascade_service = CascadeServiceImpl(event_service)
+        self._register_shared_chain(cascade_service)
+        roots = [event_service.get_event_by_id(event_id) for event_id in ("root_event", "child2")]
+        game_state = TestGameState(metrics={"money": 1000, "reputation": -2, "happiness": 75})
+
+        final_state, result = cascade_service.process_cascade_batch(
+            root_events=roots, game_state=game_state, current_turn=1
+        )
+
+        # 공유 하위 이벤트는 한 번만 발생, 조건은 그때까지 누적된 상태로 평가
+        assert result.triggered_events == ("root_event", "child2", "child1", "grandchild")
+        assert final_state.metrics == {"money": 950, "reputation": 3, "happiness": 65}
+        assert result.metrics_impact == {"money": -50, "reputation": 5, "happiness": -10}
+        assert result.depth_reached == 3
+        if service_cls is DeltaEventService:
+            assert event_service.effect_calls == 0
+            assert event_service.delta_calls == 1  # 조건 평가 직전에 한 번에 적용
+
+    def test_process_cascade_batch_matches_single_chain(
+        self, cascade_service, event_service, game_state
+    ):
+        """루트 하나인 일괄 처리는 process_cascade_chain과 같은 결과를 내는지 테스트."""
+        self._register_shared_chain(cascade_service)
+        root_event = event_service.get_event_by_id("root_event")
+
+        single = cascade_service.process_cascade_chain(root_event, game_state)
+        final_state, batch = cascade_service.process_cascade_batch([root_event], game_state)
+
+        assert batch.triggered_events == single.triggered_events
+        assert batch.metrics_impact == single.metrics_impact
+        assert batch.depth_reached == single.depth_reached
+        assert final_state.metrics["money"] == 950
+
+    def test_process_cascade_batch_root_already_cascaded(self, cascade_service, event_service):
+        """다른 루트의 연쇄로 이미 발생한 루트는 다시 발생하지 않는지 테스트."""
+        self._register_shared_chain(cascade_service)
+        roots = [event_service.get_event_by_id(event_id) for event_id in ("root_event", "child1")]
+        game_state = TestGameState(metrics={"money": 1000, "reputation": -2, "happiness": 75})
+
+        final_state, result = cascade_service.process_cascade_batch(
+            root_events=roots, game_state=game_state, current_turn=1
+        )
+
+        assert result.triggered_events == ("root_event", "child1", "grandchild")
+        assert final_state.metrics == {"money": 950, "reputation": 3, "happiness": 75}
+        assert result.metrics_impact == {"money": -50, "reputation": 5}
+
+    def test_process_cascade_batch_delta_matches_per_event(self):
+        """apply_metrics_delta 경로가 이벤트별 적용과 같은 결과를 내는지 테스트."""
+        outcomes = []
+        for service_cls in (MockEventService, DeltaEventService):
+            event_service = service_cls()
+            cascade_service = CascadeServiceImpl(event_service)
+            self._register_shared_chain(cascade_service)
+            roots = [event_service.get_event_by_id(e) for e in ("root_event", "child2")]
+            # child1까지 적용된 평판이 아직 음수여서 조건부 이벤트도 발생
+            game_state = TestGameState(metrics={"money": 1000, "reputation": -10, "happiness": 75})
+            outcomes.append(
+                cascade_service.process_cascade_batch(
+                    root_events=roots, game_state=game_state, current_turn=1
+                )
+            )
+
+        (per_event_state, per_event), (delta_state, delta) = outcomes
+        assert delta_state.metrics == per_event_state.metrics
+        assert delta.triggered_events == per_event.triggered_events
+        assert delta.metrics_impact == per_event.metrics_impact
+        assert delta.depth_reached == per_event.depth_reached
+        assert "conditional_event" in delta.triggered_events
+        assert delta_state.metrics == {"money": 950, "reputation": 15, "happiness": 65}
+
+    def test_process_cascade_chain_unchanged(self, cascade_service, event_service):
+        """일괄 처리 도입 후에도 process_cascade_chain 결과가 그대로인지 테스트."""
+        self._register_shared_chain(cascade_service)
+        root_event = event_service.get_event_by_id("root_event")
+        game_state = TestGameState(metrics={"money": 1000, "reputation": -2, "happiness": 75})
+
+        result = cascade_service.process_cascade_chain(root_event, game_state, current_turn=1)
+
+        assert result.triggered_events == ("root_event", "child1", "grandchild")
+        assert result.pending_events == ()
+        assert result.metrics_impact == {"money": -50, "reputation": 5}
+        assert result.depth_reached == 3
+
+    def test_pending_events_snapshot_and_cancel(
+        self, cascade_service, event_service, game_state
+    ):
+        """지연 이벤트 저장/복원 및 취소 테스트."""
+        cascade_service.register_cascade_relation(
+            parent_event_id="root_event",
+            child_event_id="delayed_event",
+            cascade_type_str="DELAYED",
+            delay_turns=2,
+        )
+        root_event = event_service.get_event_by_id("root_event")
+        cascade_service.process_cascade_chain(
+            root_event=root_event, game_state=game_state, current_turn=1
+        )
+
+        snapshot = cascade_service.snapshot_pending_events()
+        assert cascade_service.cancel_pending_events("delayed_event") == 1
+        assert cascade_service.get_pending_events(3) == []
+
+        # 저장 시점 상태로 복원하면 다시 발생
+        cascade_service.restore_pending_events(snapshot)
+        pending_turn3 = cascade_service.get_pending_events(3)
+        assert [event.event_id for event in pending_turn3] == ["delayed_event"]
+
+    def test_pending_events_restore_into_new_service(
+        self, cascade_service, event_service, game_state
+    ):
+        """게임 저장 데이터(JSON)로 새 서비스에 지연 이벤트를 복원하는 테스트."""
+        for child, delay in [("delayed_event", 2), ("grandchild", 4)]:
+            cascade_service.register_cascade_relation(
+                parent_event_id="root_event",
+                child_event_id=child,
+                cascade_type_str="DELAYED",
+                delay_turns=delay,
+            )
+        root_event = event_service.get_event_by_id("root_event")
+        cascade_service.process_cascade_chain(
+            root_event=root_event, game_state=game_state, current_turn=1
+        )
+        assert cascade_service.cancel_pending_events("grandchild") == 1
+        assert cascade_service.cancel_pending_events("grandchild") == 0
+
+        # 취소한 이벤트는 저장되지 않음
+        saved = json.loads(json.dumps(cascade_service.snapshot_pending_events()))
+        restored = CascadeServiceImpl(event_service)
+        restored.restore_pending_events(saved)
+
+        assert [event.event_id for event in restored.get_pending_events(3)] == ["delayed_event"]
+        assert restored.get_pending_events(5) == []
+
+        with pytest.raises(ValueError):
+            restored.restore_pending_events({**saved, "version": -1})
+
     def test_check_cascade_cycle(self, cascade_service):
         """연쇄 사이클 검사 테스트."""
         # 사이클이 없는 연쇄 관계 등록
@@ -325,3 +506,59 @@ class TestCascadeServiceImpl:
         assert "reputation" in impact
         assert impact["money"] == -50  # -100 + 50
         assert impact["reputation"] == MAGIC_NUMBER_FIVE
+
+    def test_cascade_chain_cache_invalidation(self, cascade_service):
+        """연쇄 체인 캐시가 관련 관계가 바뀔 때만 무효화되는지 테스트."""
+        cascade_service.register_cascade_relation(
+            parent_event_id="root_event", child_event_id="child1", cascade_type_str="IMMEDIATE"
+        )
+        chain = cascade_service.build_cascade_chain("root_event")
+        assert cascade_service.build_cascade_chain("root_event") is chain
+
+        # 루트에서 도달할 수 없는 관계는 캐시에 영향 없음
+        cascade_service.register_cascade_relation(
+            parent_event_id="child2", child_event_id="grandchild", cascade_type_str="IMMEDIATE"
+        )
+        assert cascade_service.build_cascade_chain("root_event") is chain
+        assert cascade_service.get_reachable_events("root_event") == frozenset({"child1"})
+
+        # 루트에서 도달 가능한 이벤트 아래에 관계가 추가되면 다시 구성
+        cascade_service.register_cascade_relation(
+            parent_event_id="child1", child_event_id="child2", cascade_type_str="IMMEDIATE"
+        )
+        rebuilt = cascade_service.build_cascade_chain("root_event")
+        assert rebuilt is not chain
+        assert len(rebuilt.nodes) == 4  # 루트 + child1 + child2 + grandchild
+        assert rebuilt.get_max_actual_depth() == 3
+        assert cascade_service.get_reachable_events("root_event") == frozenset(
+            {"child1", "child2", "grandchild"}
+        )
+        assert cascade_service.get_topological_order() == [
+            "root_event",
+            "child1",
+            "child2",
+            "grandchild",
+        ]
+
+    def test_cascade_cycle_detected_from_graph_index(self, cascade_service, event_service):
+        """관계 그래프에 사이클이 생기면 체인 구성과 처리가 실패하는지 테스트."""
+        cascade_service.register_cascade_relation(
+            parent_event_id="root_event", child_event_id="child1", cascade_type_str="IMMEDIATE"
+        )
+        cascade_service.register_cascade_relation(
+            parent_event_id="child1", child_event_id="child2", cascade_type_str="IMMEDIATE"
+        )
+        cascade_service.build_cascade_chain("root_event")
+
+        cascade_service.register_cascade_relation(
+            parent_event_id="child2", child_event_id="child1", cascade_type_str="IMMEDIATE"
+        )
+        with pytest.raises(ValueError):
+            cascade_service.build_cascade_chain("root_event")
+        with pytest.raises(ValueError):
+            cascade_service.process_cascade_chain(
+                root_event=event_service.get_event_by_id("root_event"),
+                game_state=TestGameState(metrics={}),
+            )
+        with pytest.raises(ValueError):
+            cascade_service.get_topological_order()
@@ -24,6 +24,7 @@ from src.cascade.domain.models import (
     PendingEvent,
     TriggerCondition,
 )
+from src.cascade.domain.pending_queue import PendingEventQueue
 
 
 class TestTriggerCondition:
@@ -55,6 +56,27 @@ class TestTriggerCondition:
         with pytest.raises(ValueError):
             TriggerCondition(expression="metrics.money > {threshold}")
 
+    def test_hashable_with_parameters(self):
+        """파라미터가 있는 조건의 해시 테스트."""
+        params = {"threshold": 1000}
+        condition = TriggerCondition(expression="metrics.money > {threshold}", parameters=params)
+        same = TriggerCondition(expression="metrics.money > {threshold}", parameters=dict(params))
+
+        assert hash(condition) == hash(same)
+        assert len({condition, same}) == MAGIC_NUMBER_ONE
+
+    def test_distinct_parameters_not_merged(self):
+        """파라미터 값이 다른 조건은 집합에서 구분되는지 테스트."""
+        low = TriggerCondition(
+            expression="metrics.money > {threshold}", parameters={"threshold": 1}
+        )
+        high = TriggerCondition(
+            expression="metrics.money > {threshold}", parameters={"threshold": 1000}
+        )
+
+        assert low != high
+        assert len({low, high}) == MAGIC_NUMBER_TWO
+
 
 class TestPendingEvent:
     """PendingEvent 클래스 테스트."""
@@ -391,3 +413,78 @@ class TestCascadeResult:
 
         assert result1.has_pending_events() is False
         assert result2.has_pending_events() is True
+
+
+class TestPendingEventQueue:
+    """PendingEventQueue 클래스 테스트."""
+
+    @staticmethod
+    def _pending(event_id, trigger_turn, cascade_type=CascadeType.DELAYED):
+        return PendingEvent(
+            event_id=event_id,
+            delay_turns=MAGIC_NUMBER_ONE,
+            trigger_turn=trigger_turn,
+            cascade_type=cascade_type,
+        )
+
+    def test_pop_due_in_turn_order(self):
+        """trigger_turn이 된 이벤트만 등록 순서대로 꺼내는지 테스트."""
+        queue = PendingEventQueue()
+        for event_id, turn in [("c", 7), ("a", 5), ("b", 5), ("d", 6)]:
+            queue.schedule(self._pending(event_id, turn))
+
+        assert queue.peek_turn() == MAGIC_NUMBER_FIVE
+        assert [e.event_id for e in queue.pop_due(5)] == ["a", "b"]
+        assert queue.pop_due(5) == []
+        assert [e.event_id for e in queue] == ["d", "c"]
+        assert len(queue) == MAGIC_NUMBER_TWO
+
+    def test_missed_events_are_dropped(self):
+        """트리거 턴을 놓친 이벤트는 반환하지 않고 버리는지 테스트."""
+        queue = PendingEventQueue()
+        queue.schedule(self._pending("missed", 3))
+        queue.schedule(self._pending("due", 4))
+
+        assert [e.event_id for e in queue.pop_due(4)] == ["due"]
+        assert queue.expired_count == MAGIC_NUMBER_ONE
+        assert len(queue) == 0
+        assert queue.peek_turn() is None
+
+    def test_cancel(self):
+        """핸들/이벤트 ID 기준 취소 테스트."""
+        queue = PendingEventQueue()
+        first = queue.schedule(self._pending("a", 5))
+        queue.schedule(self._pending("b", 5))
+        queue.schedule(self._pending("b", 6))
+        queue.schedule(self._pending("c", 6))
+
+        assert queue.cancel(first) is True
+        assert queue.cancel(first) is False
+        assert queue.cancel_event("b") == MAGIC_NUMBER_TWO
+        assert queue.cancel_event("b") == 0
+        assert queue.peek_turn() == 6
+        assert queue.pop_due(5) == []
+        assert [e.event_id for e in queue.pop_due(6)] == ["c"]
+
+    def test_snapshot_round_trip(self):
+        """스냅샷 저장/복원 테스트."""
+        queue = PendingEventQueue()
+        queue.schedule(self._pending("b", 6, CascadeType.CONDITIONAL))
+        queue.schedule(self._pending("a", 5))
+        queue.cancel(queue.schedule(self._pending("cancelled", 5)))
+
+        snapshot = queue.snapshot()
+        assert snapshot["events"] == [
+            ["a", 1, 5, "DELAYED", 1.0],
+            ["b", 1, 6, "CONDITIONAL", 1.0],
+        ]
+
+        restored = PendingEventQueue()
+        restored.schedule(self._pending("stale", 5))
+        restored.restore(snapshot)
+        assert list(restored) == list(queue)
+
+        with pytest.raises(ValueError):
+            restored.restore({"version": 99, "events": []})
+        with pytest.raises(ValueError):
+            restored.restore({"version": 1, "events": [["x", 1, 5, "UNKNOWN", 1.0]]})
@@ -12,8 +12,14 @@ import os
 from pathlib import Path
 from collections.abc import Generator
 
+import numpy as np
 import pytest
 
+from dev_tools.balance_simulator import BalanceSimulator
+from dev_tools.batch_simulator import METRICS, SIMULATION_MODES, BalanceModel, BatchSimulator
+from dev_tools.scenario_sweep import build_sweep_points, run_sweep
+from dev_tools.streaming_stats import ColumnarSpill, StreamingAggregator
+
 # from dev_tools.balance_simulator import EventSimulator, GameState, SimulationConfig
 
 # 테스트 데이터 경로
@@ -518,5 +524,154 @@ def test_report_generation(setup_test_data: None) -> None:
     #     assert os.path.exists(vis_file)
 
 
+# 테스트 11: 배치 모드 벡터화/스칼라 교차 검증
+@pytest.mark.parametrize("scenario", ["conservative", "aggressive"])
+def test_batch_vectorized_matches_scalar(scenario: str) -> None:
+    """같은 시드에서 벡터화 모드와 스칼라 모드 결과가 일치하는지 테스트"""
+    config = BalanceSimulator(str(TEST_DATA_DIR / "missing.json")).get_default_config()
+    model = BalanceModel(config, "data/events.toml", "data/tradeoff_matrix.toml")
+    simulator = BatchSimulator(model)
+
+    vectorized = simulator.run(scenario, iterations=64, days=30, seed=7, mode="vectorized")
+    scalar = simulator.run(scenario, iterations=64, days=30, seed=7, mode="scalar")
+
+    np.testing.assert_array_equal(vectorized.days_survived, scalar.days_survived)
+    np.testing.assert_allclose(vectorized.final_metrics, scalar.final_metrics)
+    np.testing.assert_allclose(vectorized.daily_mean, scalar.daily_mean)
+    assert vectorized.summary() == scalar.summary()
+
+    # 모든 실행이 행복 + 고통 = 100을 유지
+    np.testing.assert_allclose(
+        vectorized.final_metrics[:, 2] + vectorized.final_metrics[:, 3], 100.0
+    )
+
+
+# 테스트 11-1: 배치 모드와 기존 일일 루프의 결과 일치
+@pytest.mark.parametrize("scenario", ["conservative", "aggressive"])
+@pytest.mark.parametrize("mode", SIMULATION_MODES)
+def test_batch_matches_run_simulation(scenario: str, mode: str) -> None:
+    """같은 설정과 시드에서 배치 모드가 run_simulation()과 실행별로 같은 결과를 내는지 테스트"""
+    simulator = BalanceSimulator(str(TEST_DATA_DIR / "missing.json"))
+    simulator.config["simulation"].update({"iterations": 60, "days": 6})
+
+    legacy = simulator.run_simulation(scenario)
+    events_file, tradeoff_file = simulator._data_files()
+    model = BalanceModel(simulator.config, events_file=events_file, tradeoff_file=tradeoff_file)
+    batch = BatchSimulator(model).run(scenario, mode=mode)
+
+    # 두 경로 모두 RngService의 실행별 위험도 스트림을 사용
+    runs = legacy["detailed_results"]
+    assert 0.0 < legacy["success_rate"] < 1.0
+    assert batch.days_survived.tolist() == [run["days_survived"] for run in runs]
+    expected = np.array([[run["final_metrics"][m.name] for m in METRICS] for run in runs])
+    np.testing.assert_array_equal(batch.final_metrics, expected)
+    summary = batch.summary()
+    assert summary["success_rate"] == legacy["success_rate"]
+    assert summary["avg_survival_days"] == legacy["avg_survival_days"]
+
+
+# 테스트 12: 배치 모드 요약 형태
+def test_batch_summary_shape() -> None:
+    """배치 모드 요약이 analyze_results와 같은 키를 갖는지 테스트"""
+    simulator = BalanceSimulator(str(TEST_DATA_DIR / "missing.json"))
+    summary = simulator.run_batch_simulation("balanced", iterations=10, days=5)
+
+    assert summary["scenario"] == "balanced"
+    assert summary["total_iterations"] == 10
+    assert 0.0 <= summary["success_rate"] <= 1.0
+    assert 0.0 < summary["avg_survival_days"] <= 5
+
+    with pytest.raises(ValueError):
+        simulator.run_batch_simulation("balanced", mode="unknown", iterations=1, days=1)
+
+
+# 테스트 13: 시나리오 스윕 결과는 워커 수와 무관
+def test_sweep_identical_across_worker_counts() -> None:
+    """프로세스 풀 스윕 결과가 워커 수와 관계없이 같은지 테스트"""
+    config = BalanceSimulator(str(TEST_DATA_DIR / "missing.json")).get_default_config()
+    points = build_sweep_points([0.2, 0.8], {"money": [5000, 20000]})
+    assert len(points) == 4
+    assert points[1].name == "risk=0.2 money=20000"
+
+    kwargs = {
+        "iterations": 50,
+        "days": 20,
+        "seed": 11,
+        "chunk_size": 16,
+        "events_file": "data/events.toml",
+        "tradeoff_file": "data/tradeoff_matrix.toml",
+    }
+    serial = run_sweep(config, points, workers=1, **kwargs)
+    parallel = run_sweep(config, points, workers=2, **kwargs)
+
+    assert serial == parallel
+    assert [r["scenario"] for r in serial] == [p.name for p in points]
+    assert all(r["total_iterations"] == 50 for r in serial)
+
+
+# 테스트 14: 스트리밍 집계는 상세 결과 없이 같은 요약을 제공
+def test_streaming_matches_detailed_results(tmp_path: Path) -> None:
+    """스트리밍 모드 요약이 detailed_results 기반 요약과 일치하는지 테스트"""
+    simulator = BalanceSimulator(str(TEST_DATA_DIR / "missing.json"))
+    simulator.config["simulation"].update({"iterations": 5, "days": 10})
+
+    detailed = simulator.run_simulation("balanced")
+    spill_file = tmp_path / "rows.npy"
+    streaming = simulator.run_simulation("balanced", streaming=True, spill_file=str(spill_file))
+
+    assert "detailed_results" not in streaming
+    for key in ("total_iterations", "success_rate", "avg_survival_days"):
+        assert streaming[key] == pytest.approx(detailed[key])
+    for name, value in detailed["final_metrics_avg"].items():
+        assert streaming["final_metrics_avg"][name] == pytest.approx(value)
+
+    # 일자별 통계는 상세 결과에서 직접 계산한 값과 일치
+    day3 = [
+        r["daily_results"][3]["metrics"]["MONEY"]
+        for r in detailed["detailed_results"]
+        if len(r["daily_results"]) > 3
+    ]
+    assert day3
+    stats = streaming["daily_stats"][3]
+    assert stats["alive"] == len(day3)
+    assert stats["metrics"]["money"]["mean"] == pytest.approx(np.mean(day3))
+    assert stats["metrics"]["money"]["min"] == min(day3)
+
+    # 원시 행은 (iteration, day, 지표...) 컬럼형 파일로 기록
+    rows = np.load(spill_file)
+    assert rows.shape == (sum(r["days_survived"] for r in detailed["detailed_results"]), 10)
+    assert json.loads(spill_file.with_suffix(".columns.json").read_text())[:3] == [
+        "iteration",
+        "day",
+        "money",
+    ]
+
+
+# 테스트 15: 스트리밍 집계기 병합
+def test_streaming_aggregator_merge(tmp_path: Path) -> None:
+    """부분 집계 병합 결과가 전체 데이터의 통계와 일치하는지 테스트"""
+    rng = np.random.default_rng(0)
+    first = rng.normal(100.0, 15.0, size=(400, 2))
+    second = rng.normal(80.0, 5.0, size=(250, 2))
+    combined = np.vstack([first, second])
+
+    left = StreamingAggregator(1, ["a", "b"])
+    right = StreamingAggregator(1, ["a", "b"])
+    left.add_day(0, first)
+    for row in second:  # 한 행씩 넣어도 같은 결과 (일반 Welford 갱신)
+        right.add_day(0, row)
+    left.merge(right)
+
+    np.testing.assert_allclose(left.day_mean[0], combined.mean(axis=0))
+    np.testing.assert_allclose(left.day_variance[0], combined.var(axis=0, ddof=1))
+    assert left.day_min[0, 0] == combined[:, 0].min()
+    median = left.sketches[0].quantile(0, 0.5)  # type: ignore[index]
+    assert median == pytest.approx(np.median(combined[:, 0]), rel=0.03)
+
+    with ColumnarSpill(tmp_path / "spill.npy", ["a", "b"], buffer_rows=100) as spill:
+        spill.append(combined)
+    np.testing.assert_array_equal(np.load(tmp_path / "spill.npy"), combined)
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
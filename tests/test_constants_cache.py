@@ -0,0 +1,165 @@
+"""
+엑셀 상수 캐시 및 hot reload 테스트 모듈
+
+컴파일된 상수 캐시가 엑셀 파싱 결과와 같고, 엑셀이 바뀔 때만
+다시 파싱하며, 리로드한 상수가 실행 중인 코드에 반영되는지 검증합니다.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+from collections.abc import Generator
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+import game_constants
+from game_constants import ExcelConstantsLoader, Metric, cap_metric_value
+from src.metrics.tracker import MetricsTracker
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+WORKBOOK = PROJECT_ROOT / "data" / "game_initial_values_with_formulas.xlsx"
+
+
+@pytest.fixture
+def workbook(tmp_path: Path) -> Path:
+    """임시 디렉토리에 복사한 상수 엑셀 파일"""
+    target = tmp_path / "constants.xlsx"
+    shutil.copy2(WORKBOOK, target)
+    return target
+
+
+def _forbid_excel(loader: ExcelConstantsLoader, monkeypatch: pytest.MonkeyPatch) -> None:
+    """엑셀을 다시 파싱하면 실패하도록 만듭니다."""
+
+    def fail(sheet_name: str) -> None:
+        raise AssertionError(f"캐시가 있는데 엑셀 시트를 파싱함: {sheet_name}")
+
+    monkeypatch.setattr(loader, "_load_sheet_data", fail)
+
+
+def test_cache_matches_excel_and_skips_parsing(
+    workbook: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """캐시에서 로드한 상수가 엑셀 파싱 결과와 같은지 테스트합니다."""
+    parsed = ExcelConstantsLoader(str(workbook))
+    parsed.load_all_constants()
+    assert not parsed.loaded_from_cache
+    assert parsed.cache_path.exists()
+
+    cached = ExcelConstantsLoader(str(workbook))
+    _forbid_excel(cached, monkeypatch)
+    cached.load_all_constants()
+
+    assert cached.loaded_from_cache
+    assert cached._cache == parsed._cache
+    assert {k: type(v) for k, v in cached._cache.items()} == {
+        k: type(v) for k, v in parsed._cache.items()
+    }
+    assert cached.get_constant("METRIC_RANGES")[Metric.MONEY][1] == float("inf")
+
+
+def test_cache_invalidation(workbook: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """수정 시간만 바뀌면 캐시를 쓰고, 내용이 바뀌거나 reload하면 다시 파싱하는지 테스트합니다."""
+    ExcelConstantsLoader(str(workbook)).load_all_constants()
+
+    # 내용은 같고 수정 시간만 바뀐 경우: 해시가 같으므로 캐시 사용
+    stat = workbook.stat()
+    os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    touched = ExcelConstantsLoader(str(workbook))
+    _forbid_excel(touched, monkeypatch)
+    touched.load_all_constants()
+    assert touched.loaded_from_cache
+
+    # 명시적인 reload는 항상 엑셀을 다시 파싱
+    reloaded = ExcelConstantsLoader(str(workbook))
+    reloaded.load_all_constants()
+    reloaded.reload_constants()
+    assert not reloaded.loaded_from_cache
+
+    # 내용이 바뀐 경우: 캐시 무효화
+    with open(workbook, "ab") as f:
+        f.write(b"\0")
+    changed = ExcelConstantsLoader(str(workbook))
+    assert changed._read_cache() is None
+
+
+def test_import_does_not_load_pandas() -> None:
+    """캐시가 유효하면 game_constants import가 pandas를 가져오지 않는지 테스트합니다."""
+    ExcelConstantsLoader(str(WORKBOOK)).load_all_constants()
+    code = "import sys, game_constants; print('pandas' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+@pytest.fixture
+def live_workbook(workbook: Path) -> Generator[Path, None, None]:
+    """전역 상수 로더를 임시 엑셀 파일로 바꾸고, 끝나면 원래 상수를 다시 게시합니다."""
+    original = game_constants._constants_loader
+    loader = ExcelConstantsLoader(str(workbook))
+    loader.load_all_constants()
+    game_constants._constants_loader = loader
+    try:
+        yield workbook
+    finally:
+        game_constants._constants_loader = original
+        game_constants._publish_constants()
+
+
+def test_hot_reload_swaps_snapshot(live_workbook: Path) -> None:
+    """엑셀이 바뀌면 감시자가 새 스냅샷을 게시하고 구독자와 hot path에 반영되는지 테스트합니다."""
+    watcher = game_constants.ConstantsWatcher()
+    before = game_constants.get_constants_snapshot()
+    received: list[game_constants.ConstantsSnapshot] = []
+    unsubscribe = game_constants.subscribe_constants(received.append)
+    try:
+        assert not watcher.check()
+
+        workbook = openpyxl.load_workbook(live_workbook)
+        for row in workbook["Metric_Ranges"].iter_rows(min_row=2):
+            if row[0].value == "REPUTATION":
+                row[2].value = 80
+        workbook["Technical_Constants"].append(
+            ["REPUTATION_THRESHOLD_LOW", 35, "float", "technical", "연쇄 효과 평판 임계값"]
+        )
+        workbook.save(live_workbook)
+
+        assert watcher.check()
+        assert not watcher.check()
+    finally:
+        unsubscribe()
+
+    snapshot = game_constants.get_constants_snapshot()
+    assert snapshot.version == before.version + 1
+    assert received == [snapshot]
+    # 이전 스냅샷은 그대로 유지됨
+    assert before.metric_ranges[Metric.REPUTATION][1] == 100
+    assert cap_metric_value(Metric.REPUTATION, 95) == 80
+    assert MetricsTracker.cascade_thresholds.reputation_low == 35
+
+
+def test_reloaded_thresholds_reach_consumers(live_workbook: Path) -> None:
+    """리로드한 확률 임계값이 import 시점 값 대신 사용하는 곳에 반영되는지 테스트합니다."""
+    from dev_tools.balance_simulator import BalanceSimulator
+    from dev_tools.event_validator import EventValidator, _rules_fingerprint
+
+    event = {"effects": [{"probability": 0.85}]}
+    validator = EventValidator("missing.json")
+    fingerprint = _rules_fingerprint()
+    assert "⚠ 확률적 효과 - 불확실성 부족" in validator.validate_uncertainty_elements(event)
+
+    game_constants._constants_loader._cache["PROBABILITY_HIGH_THRESHOLD"] = 0.9
+    game_constants._publish_constants()
+
+    assert "✓ 확률적 효과 - 적절한 불확실성" in validator.validate_uncertainty_elements(event)
+    assert _rules_fingerprint() != fingerprint
+    scenarios = BalanceSimulator("missing.json").get_default_config()["scenarios"]
+    assert scenarios[-1]["risk_factor"] == 0.9
@@ -0,0 +1,155 @@
+"""
+컴파일된 이벤트 뱅크 테스트 모듈
+
+원본 JSON 이벤트를 바이너리 뱅크로 컴파일한 결과가 검증된 모델과 같고,
+원본 내용이 바뀔 때만 오래된 것으로 판단하며, 엔진이 뱅크를 바로
+읽을 수 있는지 검증합니다.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from dev_tools.event_bank_compiler import compile_event_bank
+from src.events.bank import EventBank, EventBankError, is_event_bank
+from src.events.catalog import clear_catalog_cache
+from src.events.engine import EventEngine
+from src.events.schema import Event
+from src.metrics.tracker import MetricsTracker
+
+INPUTS = (("events", "**/*.json"),)
+
+
+def _event(event_id: str, **overrides: Any) -> dict[str, Any]:
+    event = {
+        "id": event_id,
+        "type": "THRESHOLD",
+        "category": "daily_routine",
+        "name_ko": "테스트",
+        "name_en": "Test",
+        "text_ko": "테스트 이벤트",
+        "text_en": "Test event",
+        "effects": [{"metric": "money", "formula": "-100"}],
+        "choices": [
+            {
+                "text_ko": "선택",
+                "text_en": "Choice",
+                "effects": {"money": 10.0},
+            }
+        ],
+        "probability": 1.0,
+        "cooldown": 3,
+        "trigger": {"metric": "MONEY", "condition": "greater_than", "value": 5000},
+    }
+    event.update(overrides)
+    return event
+
+
+@pytest.fixture
+def sources(tmp_path: Path) -> Path:
+    """이벤트 JSON 원본이 들어 있는 임시 루트"""
+    (tmp_path / "events" / "crisis").mkdir(parents=True)
+    (tmp_path / "events" / "crisis" / "a.json").write_text(
+        json.dumps({"events": [_event("crisis_1"), _event("crisis_2", priority=5)]}),
+        encoding="utf-8",
+    )
+    (tmp_path / "events" / "b.json").write_text(
+        json.dumps([_event("daily_1"), _event("broken", probability=2.0), _event("crisis_1")]),
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+def test_compiled_bank_round_trip(sources: Path) -> None:
+    output = sources / "events.evbank"
+    report = compile_event_bank(output, INPUTS, sources)
+
+    assert report.compiled == 3
+    assert [item["id"] for item in report.invalid] == ["broken"]
+    assert "probability" in report.invalid[0]["errors"][0]
+    assert report.duplicates == ["crisis_1"]
+    assert is_event_bank(output)
+
+    with EventBank(output) as bank:
+        assert bank.ids == ["daily_1", "crisis_1", "crisis_2"]
+        assert bank.groups == ["daily_routine", "daily_routine", "crisis"]
+        assert bank.get("crisis_2") == Event.model_validate(_event("crisis_2", priority=5))
+        assert bank.get("crisis_2") is bank.get("crisis_2")
+        assert bank.events()[:2] == [
+            Event.model_validate(_event("daily_1")),
+            Event.model_validate(_event("crisis_1")),
+        ]
+        assert "broken" not in bank
+        with pytest.raises(KeyError):
+            bank.get("broken")
+
+
+def test_compiled_bank_staleness(sources: Path) -> None:
+    output = sources / "events.evbank"
+    compile_event_bank(output, INPUTS, sources)
+    source = sources / "events" / "b.json"
+
+    with EventBank(output) as bank:
+        assert not bank.is_stale()
+
+        # 내용 없이 수정 시각만 바뀐 경우는 최신
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert not bank.is_stale()
+
+        source.write_text(json.dumps([_event("daily_1", cooldown=9)]), encoding="utf-8")
+        assert bank.is_stale()
+
+    with EventBank(output) as bank:
+        (sources / "events" / "new.json").write_text("[]", encoding="utf-8")
+        assert bank.is_stale()
+
+
+def test_compiled_bank_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "not_a_bank.evbank"
+    path.write_bytes(b"{}")
+    assert not is_event_bank(path)
+    with pytest.raises(EventBankError):
+        EventBank(path)
+
+
+def test_event_engine_loads_compiled_bank(sources: Path) -> None:
+    output = sources / "events.evbank"
+    compile_event_bank(output, INPUTS, sources)
+    clear_catalog_cache()
+    try:
+        engine = EventEngine(metrics_tracker=MetricsTracker())
+        engine.load_events(output)
+        assert [event.id for event in engine.events] == ["daily_1", "crisis_1", "crisis_2"]
+        assert engine.events[0].choices[0].effects == {"money": 10.0}
+    finally:
+        clear_catalog_cache()
+
+
+def test_compiled_bank_manifest_and_lazy_records(sources: Path) -> None:
+    output = sources / "events.evbank"
+    compile_event_bank(output, INPUTS, sources)
+
+    with EventBank(output) as bank:
+        manifest = bank.manifest
+        assert [entry.id for entry in manifest] == bank.ids
+        assert [entry.file for entry in manifest] == [
+            "events/b.json",
+            "events/b.json",
+            "events/crisis/a.json",
+        ]
+        assert manifest[2].type == "THRESHOLD"
+        assert manifest[2].metrics == ("money",)
+        assert manifest[1].offset + manifest[1].length == manifest[2].offset
+
+        records = bank.records([2, 0])
+        assert len(records) == 2
+        assert records[0]["id"] == "crisis_2"
+        assert records[0]["_source_file"] == "events/crisis/a.json"
+        assert [record["id"] for record in records[1:]] == ["daily_1"]
+        # 디코딩한 레코드는 보관하지 않으므로 수정해도 뱅크에 영향이 없음
+        records[0]["priority"] = 99
+        assert records[0]["priority"] == 5
@@ -19,7 +19,7 @@ from unittest.mock import patch
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from dev_tools.event_generator import EventGenerator
-from dev_tools.event_validator import EventValidator
+from dev_tools.event_validator import EventValidator, ValidationCache, validate_event_checks
 
 
 class TestEventValidator(unittest.TestCase):
@@ -201,6 +201,76 @@ class TestEventValidator(unittest.TestCase):
             self.assertLessEqual(value, 1.0)
 
 
+class TestValidationPipeline(unittest.TestCase):
+    """캐시·병렬 검증 파이프라인 테스트 클래스"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.events_file = os.path.join(self.temp_dir, "events.json")
+        self.cache_file = os.path.join(self.temp_dir, "cache.json")
+        self.events: list[dict[str, Any]] = [
+            {
+                "id": f"event_{i}",
+                "name": "이벤트",
+                "description": "설명",
+                "category": "crisis",
+                "type": "choice",
+                "effects": [{"metric": "money", "value": i % 7 - 3}],
+                "choices": [
+                    {"id": "a", "text": "A", "effects": [{"metric": "money", "value": i % 40}]},
+                    {"id": "b", "text": "B", "effects": [{"metric": "money", "value": 5}]},
+                ],
+            }
+            for i in range(40)
+        ]
+        # 검사 중 예외가 나는 이벤트 (효과가 dict가 아님)
+        self.events.append({"id": "broken", "effects": ["money"]})
+        self._write_events()
+
+    def tearDown(self) -> None:
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def _write_events(self) -> None:
+        with open(self.events_file, "w", encoding="utf-8") as f:
+            json.dump({"events": self.events}, f, ensure_ascii=False)
+
+    def test_parallel_cached_results_match_sequential(self) -> None:
+        """병렬·캐시 검증 결과가 순차 검증과 같은지 테스트"""
+        validator = EventValidator(self.events_file)
+        expected = validator.validate_events()
+
+        cache = ValidationCache(self.cache_file)
+        self.assertEqual(validator.validate_events(cache, workers=2), expected)
+        self.assertEqual((cache.hits, cache.misses), (0, len(self.events)))
+        self.assertIn("검증 중 예외 발생", expected["events"][-1]["structure_errors"][0])
+
+        # 작은 묶음으로 나눠 프로세스 풀에서 검사해도 순서와 결과가 같음
+        parallel = list(validate_event_checks(self.events, workers=2, chunk_size=8))
+        self.assertEqual([position for position, _checks in parallel], list(range(len(self.events))))
+        for (_position, checks), event_result in zip(parallel, expected["events"], strict=True):
+            self.assertEqual(checks["structure_errors"], event_result["structure_errors"])
+
+    def test_cache_skips_unchanged_events(self) -> None:
+        """내용이 바뀐 이벤트만 다시 검사하는지 테스트"""
+        validator = EventValidator(self.events_file)
+        cache = ValidationCache(self.cache_file)
+        validator.validate_events(cache)
+        cache.save()
+
+        self.events[3]["effects"][0]["value"] = 500
+        self._write_events()
+        cache = ValidationCache(self.cache_file)
+        results = validator.validate_events(cache)
+
+        self.assertEqual((cache.hits, cache.misses), (len(self.events) - 1, 1))
+        self.assertEqual(results, EventValidator(self.events_file).validate_events())
+        self.assertEqual(
+            results["events"][3]["balance_warnings"], ["이벤트가 너무 긍정적임 (트레이드오프 부족)"]
+        )
+
+
 class TestEventGenerator(unittest.TestCase):
     """이벤트 생성기 테스트 클래스"""
 
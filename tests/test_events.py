@@ -16,9 +16,12 @@ import sys
 # 프로젝트 루트 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+import random
 import tempfile
 import time
+from pathlib import Path
 
+import numpy as np
 import pytest
 
 from game_constants import (
@@ -27,13 +30,26 @@ from game_constants import (
     TEST_MIN_CASCADE_EVENTS,
     TEST_METRICS_HISTORY_LENGTH,
 )
+from src.events.catalog import (
+    EventCatalog,
+    compile_cascade_edges,
+    compile_cascade_plan,
+    load_cascade_matrix,
+    load_catalog,
+)
 from src.events.engine import EventEngine
+from src.events.formula import FormulaError, FormulaKind, compile_formula
 from src.events.integration import GameEventSystem
 from src.events.models import Effect, Event, EventCategory, Trigger, TriggerCondition
+from src.events.scheduler import SessionScheduler
 from src.events.schema import (
     load_events_from_json,
+    load_events_from_toml,
     save_events_to_json,
 )
+from src.events.trigger_index import TriggerIndex
+from src.metrics.cascade import build_cascade_plan
+from src.metrics.state import METRIC_ORDER, METRIC_ORDINAL
 from src.metrics.tracker import MetricsTracker
 
 # 테스트 상수
@@ -276,6 +292,106 @@ def test_dag_validation() -> None:
     assert not event_engine.is_dag_safe()
 
 
+
+def test_cascade_plan_single_pass() -> None:
+    """연쇄 효과 매트릭스가 위상 순서의 한 번 전파 계획으로 컴파일되는지 테스트합니다."""
+    matrix = {
+        Metric.REPUTATION: [{"target": "MONEY", "formula": "value * 10"}],
+        Metric.FACILITY: [{"target": "REPUTATION", "formula": "-10"}],
+        Metric.STAFF_FATIGUE: [{"target": "FACILITY", "formula": "-5", "message": "피로"}],
+    }
+    plan = compile_cascade_plan(matrix)
+    assert plan.is_dag
+    assert [METRIC_ORDER[column] for column, _edges in plan.steps] == [
+        Metric.STAFF_FATIGUE,
+        Metric.FACILITY,
+        Metric.REPUTATION,
+    ]
+
+    values = dict.fromkeys(range(len(METRIC_ORDER)), 50.0)
+    changed = [METRIC_ORDINAL[Metric.STAFF_FATIGUE], METRIC_ORDINAL[Metric.REPUTATION]]
+    updates, messages = plan.propagate(values.__getitem__, changed, max_depth=10)
+
+    # 평판 -> 자금은 시설 -> 평판이 반영된 뒤 한 번만 적용
+    assert updates == {Metric.FACILITY: 45.0, Metric.REPUTATION: 40.0, Metric.MONEY: 400.0}
+    assert messages == ["피로"]
+
+    updates, _messages = plan.propagate(values.__getitem__, changed, max_depth=1)
+    assert updates == {Metric.FACILITY: 45.0, Metric.MONEY: 500.0}
+
+
+def test_cascade_plan_cycle_and_single_commit() -> None:
+    """사이클이 있는 매트릭스의 단계별 전파와 엔진의 한 번 반영을 테스트합니다."""
+    engine = EventEngine(metrics_tracker=MetricsTracker(), max_cascade_depth=3)
+    engine.cascade_matrix = {
+        Metric.REPUTATION: [{"target": "MONEY", "formula": "-1"}],
+        Metric.MONEY: [{"target": "REPUTATION", "formula": "-1"}],
+    }
+    assert not engine.is_dag_safe()
+
+    tracker = engine.metrics_tracker
+    before = tracker.get_metrics()
+    history_length = len(tracker.get_history())
+    engine._process_cascade_effects({Metric.REPUTATION}, 0)
+
+    # 평판 -> 자금 -> 평판 -> 자금 (3단계), 지표 추적기에는 한 번만 반영
+    after = tracker.get_metrics()
+    assert after[Metric.MONEY] == pytest.approx(before[Metric.MONEY] - 2)
+    assert after[Metric.REPUTATION] == pytest.approx(before[Metric.REPUTATION] - 1)
+    assert len(tracker.get_history()) == history_length + 1
+
+
+def test_tracker_cascade_stage(capsys: pytest.CaptureFixture[str]) -> None:
+    """지표 추적기의 임계값 규칙이 한 단계만 적용되고 결과를 재사용하는지 테스트합니다."""
+    tracker = MetricsTracker({Metric.REPUTATION: 15.0, Metric.FACILITY: 80.0})
+    engine = EventEngine(metrics_tracker=tracker)
+    engine.cascade_matrix = {
+        Metric.REPUTATION: [{"target": "INVENTORY", "formula": "-1", "message": "재고 감소"}],
+    }
+    before = tracker.get_metrics()
+
+    # 시설(규칙) -> 평판까지만 적용 (평판 규칙과 매트릭스 간선은 연쇄하지 않음)
+    tracker.update_metric(Metric.FACILITY, 20.0)
+    after = tracker.get_metrics()
+    assert after[Metric.REPUTATION] < before[Metric.REPUTATION]
+    assert after[Metric.MONEY] == before[Metric.MONEY]
+    assert after[Metric.INVENTORY] == before[Metric.INVENTORY]
+    assert len(tracker.get_events()) == 1
+    assert tracker.get_events()[0].startswith("시설 상태 악화")
+    assert tracker.cascade_runs == 1
+
+    # 같은 날 같은 상태와 변경 지표면 계산하지 않고 결과를 재사용
+    tracker.metrics = {**before, Metric.FACILITY: 20.0}
+    tracker.apply_cascade_effects({Metric.FACILITY})
+    assert tracker.get_metrics() == after
+    assert (tracker.cascade_runs, tracker.cascade_memo_hits) == (1, 1)
+
+    # 원인 지표별 간선 수 제한
+    matrix = {Metric.REPUTATION: [{"target": "MONEY", "formula": "-1"}] * 3}
+    plan = build_cascade_plan(compile_cascade_edges(matrix), max_fan_out=2)
+    assert [len(edges) for _column, edges in plan.steps] == [2]
+    assert "간선 수 제한(2) 초과" in capsys.readouterr().out
+
+
+def test_matrix_cascade_only_on_event_effects() -> None:
+    """매트릭스를 로드해도 일반 지표 업데이트가 관련 없는 지표를 바꾸지 않는지 테스트합니다."""
+    tradeoff_file = Path(__file__).parent.parent / "data" / "tradeoff_matrix.toml"
+
+    engine = EventEngine(metrics_tracker=MetricsTracker(), tradeoff_file=str(tradeoff_file))
+    assert engine.cascade_matrix
+    engine.metrics_tracker.update_metric(Metric.REPUTATION, 55.0)
+    # 평판 상승 임계값 규칙(-100)만 적용
+    assert engine.metrics_tracker.get_metrics()[Metric.MONEY] == pytest.approx(9900.0)
+
+    engine = EventEngine(metrics_tracker=MetricsTracker(), tradeoff_file=str(tradeoff_file))
+    engine.metrics_tracker.tradeoff_update_metrics({Metric.DEMAND: 40.0})
+    assert engine.metrics_tracker.get_metrics()[Metric.MONEY] == pytest.approx(10000.0)
+    # 매트릭스 단계는 이벤트 효과를 적용할 때만 실행되고 따로 집계됨
+    assert engine.cascade_runs == 0
+    engine._process_cascade_effects({Metric.DEMAND}, 0)
+    assert engine.cascade_runs == 1
+
+
 @pytest.mark.perf
 def test_perf_1000_events(game_event_system: GameEventSystem) -> None:
     """1,000회 이벤트 시뮬레이션의 성능과 메모리 사용량을 테스트합니다."""
@@ -560,3 +676,260 @@ def test_no_right_answer_simulate_scenario(game_event_system: GameEventSystem) -
     # 이벤트 발생 확인 (이벤트가 발생하지 않을 수도 있으므로 완화)
     # 실제 게임에서는 이벤트가 발생할 수 있지만 테스트 환경에서는 발생하지 않을 수 있음
     # assert len(result["events_history"]) > 0  # 주석 처리
+
+
+def test_compiled_formula_semantics() -> None:
+    """컴파일된 수식이 백분율/변화량/value 수식 규칙을 따르는지 테스트합니다."""
+    assert compile_formula("-10%").apply(200.0) == pytest.approx(180.0)
+    assert compile_formula("-500").apply(1000.0) == pytest.approx(500.0)
+    assert compile_formula("value * 0.5").apply(80.0) == pytest.approx(40.0)
+    assert compile_formula("10 * 2").apply(5.0) == pytest.approx(25.0)
+
+    # 연쇄 효과: value는 소스 지표 값, 기준값은 대상 지표 값
+    assert compile_formula("value + 10").apply(1.0, 30.0) == pytest.approx(40.0)
+
+    # 동일한 수식 문자열은 한 번만 컴파일됨
+    assert compile_formula("value * 0.5") is compile_formula("value * 0.5")
+
+
+def test_compiled_formula_rejects_unsafe_expressions() -> None:
+    """함수 호출이나 속성 접근이 포함된 수식은 컴파일되지 않아야 합니다."""
+    for source in ("value.__class__", "random()", "__import__('os')", "value +"):
+        formula = compile_formula(source)
+        assert formula.kind == FormulaKind.INVALID
+        with pytest.raises(FormulaError):
+            formula.apply(1.0)
+
+
+def test_trigger_index_matches_linear_scan() -> None:
+    """트리거 인덱스 결과가 전체 순회 평가 결과와 같은지 테스트합니다."""
+    conditions = [
+        TriggerCondition.LESS_THAN,
+        TriggerCondition.GREATER_THAN,
+        TriggerCondition.EQUAL,
+        TriggerCondition.NOT_EQUAL,
+        TriggerCondition.GREATER_THAN_OR_EQUAL,
+        TriggerCondition.LESS_THAN_OR_EQUAL,
+    ]
+    events = [
+        Event(
+            id=f"threshold_{i}",
+            name=f"임계값 {i}",
+            description="",
+            type=EventCategory.THRESHOLD,
+            effects=[],
+            trigger=Trigger(
+                metric=[Metric.REPUTATION, Metric.FACILITY][i % 2],
+                condition=conditions[i % len(conditions)],
+                value=float(i * 5 % 100),
+            ),
+        )
+        for i in range(60)
+    ]
+    index = TriggerIndex(events)
+
+    rng = random.Random(7)
+    for _ in range(50):
+        metrics = {
+            Metric.REPUTATION: float(rng.choice([0, 25, 50, 75, rng.uniform(0, 100)])),
+            Metric.FACILITY: float(rng.choice([10, 35, 60, 95, rng.uniform(0, 100)])),
+        }
+        expected = [e.id for e in events if e.trigger is not None and e.trigger.evaluate(metrics)]
+        assert [e.id for e in index.threshold_events(metrics)] == expected
+
+
+def test_poll_and_evaluate_triggers_share_index(sample_metrics: dict[Metric, float]) -> None:
+    """poll과 evaluate_triggers가 같은 임계값 이벤트를 찾는지 테스트합니다."""
+    engine = EventEngine(metrics_tracker=MetricsTracker(initial_metrics=sample_metrics), seed=1)
+    event = Event(
+        id="low_reputation",
+        name="평판 하락",
+        description="평판이 낮습니다.",
+        type=EventCategory.THRESHOLD,
+        effects=[],
+        trigger=Trigger(metric=Metric.REPUTATION, condition=TriggerCondition.LESS_THAN, value=60.0),
+    )
+    engine.events = [event]
+
+    assert engine.poll() == [event]
+    assert engine.evaluate_triggers() == [event]
+    assert len(engine.alert_queue) == 1
+
+
+def test_triggers_skip_unchanged_metrics(sample_metrics: dict[Metric, float]) -> None:
+    """트리거 평가가 바뀐 지표의 조건만 다시 탐색하는지 테스트합니다."""
+    tracker = MetricsTracker(initial_metrics=sample_metrics)
+    engine = EventEngine(metrics_tracker=tracker, seed=1)
+    low_reputation, low_facility = (
+        Event(
+            id=f"low_{metric.name.lower()}",
+            name="임계값",
+            description="임계값 이벤트",
+            type=EventCategory.THRESHOLD,
+            effects=[],
+            trigger=Trigger(metric=metric, condition=TriggerCondition.LESS_THAN, value=60.0),
+        )
+        for metric in (Metric.REPUTATION, Metric.FACILITY)
+    )
+    engine.events = [low_reputation, low_facility]
+
+    assert engine.poll() == [low_reputation]
+    stats = engine.trigger_skip_stats
+    assert (stats.evaluated, stats.skipped) == (2, 0)
+
+    # 평판만 바뀌면 시설 조건은 이전 결과를 재사용
+    tracker.update_metric(Metric.REPUTATION, 70.0)
+    assert engine.evaluate_triggers() == []
+    assert (stats.evaluated, stats.skipped) == (3, 1)
+
+    tracker.update_metric(Metric.FACILITY, 40.0)
+    assert engine.evaluate_triggers() == [low_facility]
+    assert engine.evaluate_triggers() == [low_facility]
+    assert (stats.evaluated, stats.skipped) == (4, 4)
+    assert stats.skip_rate == pytest.approx(0.5)
+
+
+def test_advance_days_matches_update_day(tmp_path: Path) -> None:
+    """여러 날을 한 번에 진행한 결과가 하루씩 진행한 결과와 같고, 스냅샷은 샘플링되는지 테스트합니다."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    files = {
+        "events_file": os.path.join(base_dir, "data/events.toml"),
+        "tradeoff_file": os.path.join(base_dir, "data/tradeoff_matrix.toml"),
+    }
+    stepwise = GameEventSystem(
+        metrics_tracker=MetricsTracker(snapshot_dir=str(tmp_path / "a"), snapshot_interval=0),
+        seed=7,
+        **files,
+    )
+    expected = []
+    for _ in range(20):
+        stepwise.update_day()
+        expected.append(stepwise.metrics_tracker.get_metrics_array().copy())
+
+    log_path = str(tmp_path / "b" / "game.snaplog")
+    batched = GameEventSystem(
+        metrics_tracker=MetricsTracker(snapshot_dir=str(tmp_path / "b"), snapshot_log=log_path),
+        seed=7,
+        **files,
+    )
+    series = batched.advance_days(20, snapshot_every=5)
+    batched.close()
+
+    assert series.start_day == 1 and series.days == 20
+    assert series.values.tolist() == [row.tolist() for row in expected]
+    assert batched.day == 20
+    records = batched.metrics_tracker.replay_snapshots(filepath=log_path)
+    assert [record.day for record in records] == [5, 10, 15, 20]
+
+    with pytest.raises(ValueError):
+        batched.advance_days(0)
+
+
+def test_compiled_formula_apply_batch_matches_apply() -> None:
+    """배열 수식 적용이 원소별 apply()와 같은 결과를 내는지 테스트합니다."""
+    base = np.array([10.0, 55.0, 90.0])
+    source = np.array([20.0, 30.0, 40.0])
+    for formula in ["-10%", "-500", "value * 0.5", "10 * 2", "1 if value > 50 else 2"]:
+        compiled = compile_formula(formula)
+        expected = [compiled.apply(b) for b in base.tolist()]
+        assert compiled.apply_batch(base).tolist() == pytest.approx(expected)
+    cascade = compile_formula("-1000 * (1 - value / 30)")
+    expected = [cascade.apply(b, v) for b, v in zip(base.tolist(), source.tolist(), strict=True)]
+    assert cascade.apply_batch(base, source).tolist() == pytest.approx(expected)
+
+
+def test_session_scheduler_matches_event_engine() -> None:
+    """스케줄러가 변동이 없을 때 EventEngine과 같은 지표 변화를 만드는지 테스트합니다."""
+    base_dir = Path(__file__).resolve().parent.parent
+    events = list(load_events_from_toml(base_dir / "data/events.toml").events)
+    for event in events:
+        if event.type == "RANDOM":
+            event.probability = 0.0  # 두 구현의 난수 스트림이 달라 RANDOM 이벤트는 제외
+    tradeoff_file = base_dir / "data/tradeoff_matrix.toml"
+    initial = {
+        Metric.REPUTATION: 25.0,
+        Metric.STAFF_FATIGUE: 90.0,
+        Metric.FACILITY: 25.0,
+        Metric.HAPPINESS: 60.0,
+        Metric.SUFFERING: 40.0,
+    }
+
+    tracker = MetricsTracker(initial_metrics=initial)
+    engine = EventEngine(metrics_tracker=tracker, tradeoff_file=str(tradeoff_file))
+    engine.events = events
+    engine.rebuild_trigger_index()
+
+    catalog = EventCatalog.from_events(events, load_cascade_matrix(tradeoff_file))
+    scheduler = SessionScheduler(catalog, intensity=0.0)
+    scheduler.add_session("player", seed=1, initial_metrics=initial)
+
+    applied = np.zeros(len(catalog), dtype=np.int32)
+    for _ in range(30):
+        engine.update()
+        applied += scheduler.tick()[0]
+        expected = tracker.get_metrics()
+        actual = scheduler.get_metrics("player")
+        for metric, value in expected.items():
+            assert actual[metric] == pytest.approx(value)
+    assert applied.sum() > 0
+    assert scheduler.get_day("player") == 30
+
+
+def test_session_scheduler_streams_are_independent() -> None:
+    """세션 결과가 함께 진행하는 세션이나 진행 묶음과 관계없이 시드로만 결정되는지 테스트합니다."""
+    base_dir = Path(__file__).resolve().parent.parent
+    catalog = EventCatalog.from_files(
+        base_dir / "data/events.toml", base_dir / "data/tradeoff_matrix.toml"
+    )
+
+    alone = SessionScheduler(catalog)
+    alone.add_session("target", seed=42)
+    alone.tick(20)
+
+    crowd = SessionScheduler(catalog, capacity=2)
+    for i in range(50):
+        crowd.add_session(f"other-{i}", seed=i)
+    crowd.add_session("target", seed=42)
+    crowd.tick(5)
+    assert crowd.remove_session("other-3")
+    assert not crowd.remove_session("other-3")
+    crowd.tick(15)
+
+    assert len(crowd) == 50
+    assert crowd.get_day("target") == 20
+    assert crowd.get_metrics("target") == alone.get_metrics("target")
+    values = crowd.metrics_array
+    assert values.shape == (50, len(Metric))
+    happiness = values[:, list(Metric).index(Metric.HAPPINESS)]
+    suffering = values[:, list(Metric).index(Metric.SUFFERING)]
+    assert np.allclose(happiness + suffering, 100.0)
+    with pytest.raises(ValueError):
+        crowd.add_session("target")
+
+
+def test_event_definitions_shared_with_per_engine_cooldowns(tmp_path: Path) -> None:
+    """같은 이벤트 파일은 한 번만 읽어 공유하고, 쿨다운은 엔진마다 따로 기록하는지 테스트합니다."""
+    base_dir = Path(__file__).resolve().parent.parent
+    events_file = tmp_path / "events.toml"
+    events_file.write_bytes((base_dir / "data/events.toml").read_bytes())
+
+    first = EventEngine(metrics_tracker=MetricsTracker(), events_file=str(events_file))
+    second = EventEngine(metrics_tracker=MetricsTracker(), events_file=str(events_file))
+    assert first.events_container is second.events_container
+    assert load_catalog(events_file) is load_catalog(events_file)
+
+    event = next(e for e in first.events if e.cooldown > 0)
+    first.current_turn = 1
+    first.event_queue.append(event)
+    first.apply_effects()
+    assert first.cooldowns.last_fired(event.id) == 1
+    assert second.cooldowns.last_fired(event.id) is None
+    assert event.last_fired is None  # 공유 이벤트 모델은 수정하지 않음
+
+    # 파일이 바뀌면 (수정 시각·크기) 다시 읽음
+    events_file.write_bytes(events_file.read_bytes() + b"\n")
+    stat = events_file.stat()
+    os.utime(events_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = EventEngine(metrics_tracker=MetricsTracker(), events_file=str(events_file))
+    assert reloaded.events_container is not first.events_container
+    assert [e.id for e in reloaded.events] == [e.id for e in first.events]
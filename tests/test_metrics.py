@@ -7,7 +7,9 @@
 import os
 import random
 import tempfile
+import threading
 
+import numpy as np
 import pytest
 from pytest import approx
 
@@ -19,7 +21,18 @@ from game_constants import (
     MAGIC_NUMBER_TWO,
     MAGIC_NUMBER_ZERO,
     Metric as MetricEnum,
+    get_metric_ranges,
 )
+from src.core.rng import RngService
+from src.metrics.dirty import ConditionCache
+from src.metrics.modifiers import (
+    FLUCTUATION_DRAWS,
+    AdaptiveModifier,
+    uncertainty_apply_random_fluctuation_batch,
+)
+from src.metrics.series import MetricsSeries
+from src.metrics.snapshots import SnapshotRotation, SnapshotWriter
+from src.metrics.state import METRIC_ORDER, METRIC_ORDINAL
 from src.metrics.tracker import MetricsTracker
 
 # 테스트 상수
@@ -357,3 +370,314 @@ def test_extreme_values_handling(test_metrics: dict[MetricEnum, float]) -> None:
     # 값이 적절히 제한되었는지 확인
     assert updated_metrics[MetricEnum.MONEY] >= MAGIC_NUMBER_ZERO
     assert updated_metrics[MetricEnum.REPUTATION] >= MAGIC_NUMBER_ZERO
+
+
+def test_metrics_view_is_live_and_read_only(test_metrics: dict[MetricEnum, float]) -> None:
+    """지표 뷰가 복사 없이 최신 값을 보여주고 수정을 막는지 테스트합니다."""
+    tracker = MetricsTracker(test_metrics)
+    view = tracker.get_metrics_view()
+    array = tracker.get_metrics_array()
+
+    tracker.update_metric(MetricEnum.HAPPINESS, 70.0)
+
+    # 같은 뷰가 업데이트(시소 포함)를 바로 반영
+    assert view[MetricEnum.HAPPINESS] == approx(70.0)
+    assert view[MetricEnum.SUFFERING] == approx(30.0)
+    assert array[METRIC_ORDINAL[MetricEnum.SUFFERING]] == approx(30.0)
+    assert tracker.get_metric(MetricEnum.HAPPINESS) == approx(70.0)
+    assert view == tracker.get_metrics()
+
+    # 읽기 전용
+    with pytest.raises(TypeError):
+        view[MetricEnum.MONEY] = 1.0  # type: ignore[index]
+    with pytest.raises(ValueError):
+        array[0] = 1.0
+
+    # copy()는 기존처럼 수정 가능한 dict
+    copied = view.copy()
+    copied[MetricEnum.MONEY] = 1.0
+    assert tracker.get_metric(MetricEnum.MONEY) != 1.0
+
+
+def test_history_ring_buffer_order(test_metrics: dict[MetricEnum, float]) -> None:
+    """히스토리 링 버퍼가 순서를 유지하며 오래된 기록을 덮어쓰는지 테스트합니다."""
+    tracker = MetricsTracker(test_metrics, history_size=4)
+    for day in range(10):
+        tracker.tradeoff_update_metrics({MetricEnum.INVENTORY: float(day)})
+
+    history = tracker.get_history()
+    assert len(history) == 4
+    assert [h[MetricEnum.INVENTORY] for h in history] == [6.0, 7.0, 8.0, 9.0]
+    assert tracker.get_history(2)[0][MetricEnum.INVENTORY] == 8.0
+
+    array = tracker.get_history_array()
+    assert array.shape == (4, len(MetricEnum))
+    np.testing.assert_array_equal(array[:, METRIC_ORDINAL[MetricEnum.INVENTORY]], [6, 7, 8, 9])
+    assert not array.flags.writeable
+    assert tracker.get_history_array(1)[0, METRIC_ORDINAL[MetricEnum.INVENTORY]] == 9.0
+
+
+def test_custom_modifier_uses_dict_path(test_metrics: dict[MetricEnum, float]) -> None:
+    """기본 수정자가 아니면 기존 dict 기반 수정자 경로를 사용하는지 테스트합니다."""
+    tracker = MetricsTracker(test_metrics, modifier=AdaptiveModifier())
+    tracker.tradeoff_update_metrics({MetricEnum.SUFFERING: 25.0, MetricEnum.MONEY: 12345.0})
+
+    metrics = tracker.get_metrics()
+    assert metrics[MetricEnum.MONEY] == approx(12345.0)
+    assert metrics[MetricEnum.HAPPINESS] + metrics[MetricEnum.SUFFERING] == approx(100.0)
+
+
+def test_async_snapshot_writer_rotation(
+    test_metrics: dict[MetricEnum, float], temp_data_dir: str
+) -> None:
+    """비동기 스냅샷 기록기가 모든 스냅샷을 기록하고 메모리 기준으로 회전하는지 테스트합니다."""
+    tracker = MetricsTracker(
+        test_metrics,
+        snapshot_dir=temp_data_dir,
+        max_snapshots=SNAPSHOT_LIMIT,
+        async_snapshots=True,
+    )
+
+    paths = []
+    for i in range(SNAPSHOT_LIMIT * 4):
+        tracker.update_metric(MetricEnum.MONEY, 10000.0 + i)
+        paths.append(tracker.create_snapshot())
+    assert len(set(paths)) == len(paths), "스냅샷 파일 경로가 중복됨"
+
+    tracker.close()
+
+    snapshot_files = sorted(f for f in os.listdir(temp_data_dir) if f.startswith("metrics_snap_"))
+    assert len(snapshot_files) == SNAPSHOT_LIMIT
+    assert os.path.exists(paths[-1])
+
+    new_tracker = MetricsTracker()
+    assert new_tracker.load_snapshot(paths[-1])
+    assert new_tracker.get_metric(MetricEnum.MONEY) == approx(tracker.get_metric(MetricEnum.MONEY))
+
+    # 닫힌 기록기에는 스냅샷을 추가할 수 없음
+    with pytest.raises(RuntimeError):
+        tracker.create_snapshot()
+
+
+def test_async_snapshot_writer_survives_write_errors(temp_data_dir: str) -> None:
+    """직렬화할 수 없는 스냅샷이 있어도 기록 스레드가 계속 동작하는지 테스트합니다."""
+    rotation = SnapshotRotation(temp_data_dir, SNAPSHOT_LIMIT)
+    writer = SnapshotWriter(rotation)
+
+    writer.submit(rotation.reserve("bad"), {"metrics": object()})  # TypeError
+    writer.submit(rotation.reserve("good"), {"metrics": {"MONEY": 1.0}})
+    writer.flush()
+
+    assert writer.written == 1
+    assert len(writer.errors) == 1
+    writer.close()
+
+
+def test_async_snapshot_writers_share_one_thread(
+    test_metrics: dict[MetricEnum, float], temp_data_dir: str
+) -> None:
+    """추적기가 여러 개여도 스냅샷 기록 스레드는 하나만 쓰는지 테스트합니다."""
+    trackers = [
+        MetricsTracker(test_metrics, snapshot_dir=temp_data_dir, async_snapshots=True)
+        for _ in range(3)
+    ]
+    for tracker in trackers:
+        tracker.create_snapshot()
+        tracker.flush_snapshots()
+
+    writer_threads = [t for t in threading.enumerate() if t.name == "metrics-snapshot-writer"]
+    assert len(writer_threads) == 1
+    for tracker in trackers:
+        tracker.close()
+    assert writer_threads[0].is_alive()
+
+
+def test_snapshot_interval(test_metrics: dict[MetricEnum, float], temp_data_dir: str) -> None:
+    """스냅샷 간격에 해당하는 날에만 스냅샷을 만드는지 테스트합니다."""
+    tracker = MetricsTracker(test_metrics, snapshot_dir=temp_data_dir, snapshot_interval=3)
+
+    created = []
+    for day in range(1, 10):
+        tracker.day = day
+        created.append(tracker.snapshot_if_due() is not None)
+
+    assert created == [False, False, True, False, False, True, False, False, True]
+
+
+def test_snapshot_log_restore_and_replay(
+    test_metrics: dict[MetricEnum, float], temp_data_dir: str
+) -> None:
+    """스냅샷 로그 하나에서 임의의 날을 복원하고 일수 범위를 재생하는지 테스트합니다."""
+    log_path = os.path.join(temp_data_dir, "metrics.snaplog")
+    tracker = MetricsTracker(test_metrics, snapshot_dir=temp_data_dir, snapshot_log=log_path)
+
+    money_by_day = {}
+    for day in range(1, 31):
+        tracker.day = day
+        tracker.update_metric(MetricEnum.MONEY, 10000.0 + day * 10)
+        money_by_day[day] = tracker.get_metric(MetricEnum.MONEY)
+        assert tracker.create_snapshot() == log_path
+    tracker.close()
+
+    # 날마다 파일을 만들지 않음
+    assert os.listdir(temp_data_dir) == ["metrics.snaplog"]
+
+    restored = MetricsTracker()
+    assert restored.load_snapshot(log_path, day=7)
+    assert restored.day == 7
+    assert restored.get_metric(MetricEnum.MONEY) == approx(money_by_day[7])
+    assert restored.get_metric(MetricEnum.HAPPINESS) + restored.get_metric(
+        MetricEnum.SUFFERING
+    ) == approx(100.0)
+    assert restored.load_snapshot(log_path)
+    assert restored.day == 30
+    assert not restored.load_snapshot(log_path, day=99)
+
+    records = restored.replay_snapshots(10, 12, filepath=log_path)
+    assert [record.day for record in records] == [10, 11, 12]
+    assert [record.metrics[MetricEnum.MONEY] for record in records] == approx(
+        [money_by_day[10], money_by_day[11], money_by_day[12]]
+    )
+
+    # 잘린 마지막 레코드는 다시 열 때 정리되고 이어서 기록할 수 있음
+    with open(log_path, "ab") as f:
+        f.write(b"\x10\x00")
+    resumed = MetricsTracker(test_metrics, snapshot_dir=temp_data_dir, snapshot_log=log_path)
+    resumed.day = 31
+    resumed.create_snapshot()
+    assert [record.day for record in resumed.replay_snapshots(29)] == [29, 30, 31]
+    resumed.close()
+
+
+def test_metrics_series_payload_round_trip() -> None:
+    """일별 지표 시계열이 압축 페이로드로 변환되고 복원되는지 테스트합니다."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(50.0, 10.0, size=(365, len(METRIC_ORDINAL)))
+    series = MetricsSeries(start_day=31, values=values)
+
+    compressed = series.to_payload()
+    exact = series.to_payload(dtype="float64")
+    raw = series.to_payload("raw")
+    assert compressed["columns"][0] == "money"
+    assert len(compressed["data"]) < len(str(raw["data"]))
+
+    assert MetricsSeries.from_payload(exact).values.tolist() == values.tolist()
+    assert MetricsSeries.from_payload(raw).values.tolist() == values.tolist()
+    restored = MetricsSeries.from_payload(compressed)
+    assert restored.start_day == 31
+    assert np.allclose(restored.values, values, rtol=1e-6)
+    assert restored.to_dicts()[0][MetricEnum.MONEY] == approx(values[0, 0], rel=1e-6)
+
+    with pytest.raises(ValueError):
+        series.to_payload("gzip")
+
+
+def test_metric_changes_and_threshold_skips(test_metrics: dict[MetricEnum, float]) -> None:
+    """변경 지표 구독과 임계값 이벤트의 바뀌지 않은 지표 건너뛰기를 테스트합니다."""
+    tracker = MetricsTracker(test_metrics)
+    changes = tracker.subscribe_changes()
+    assert changes.poll() == {}
+
+    tracker.tradeoff_update_metrics({MetricEnum.INVENTORY: test_metrics[MetricEnum.INVENTORY] + 5})
+    assert changes.poll() == {MetricEnum.INVENTORY: approx(5.0)}
+    assert changes.poll() == {}
+
+    # 첫 확인은 모든 조건, 이후에는 바뀐 지표의 조건만 확인
+    assert tracker.check_threshold_events() == []
+    stats = tracker.threshold_skip_stats
+    assert (stats.evaluated, stats.skipped) == (5, 0)
+
+    tracker.metrics = {MetricEnum.MONEY: 500.0}
+    assert tracker.check_threshold_events() == ["자금 위기: 1,000 미만"]
+    assert (stats.evaluated, stats.skipped) == (6, 4)
+    assert tracker.check_threshold_events() == ["자금 위기: 1,000 미만"]
+    assert stats.skip_rate == approx(9 / 15)
+
+
+def test_condition_cache_rechecks_dependent_conditions() -> None:
+    """지표 이름 dict 조건 캐시가 바뀐 지표에 의존하는 조건만 다시 평가하는지 테스트합니다."""
+    cache = ConditionCache()
+    conditions = {"money_low": {"money": 5000}, "reputation_high": {"reputation": 70}}
+    results = []
+    for metrics in (
+        {"money": 3000, "reputation": 80},
+        {"money": 3000, "reputation": 60},
+        {"money": 9000, "reputation": 60},
+    ):
+        assert set(cache.begin(metrics)) <= {"money", "reputation"}
+        results.append(
+            [
+                cache.check(
+                    key,
+                    condition,
+                    lambda condition=condition, metrics=metrics: all(
+                        metrics.get(name, 0) >= threshold for name, threshold in condition.items()
+                    ),
+                )
+                for key, condition in conditions.items()
+            ]
+        )
+
+    assert results == [[False, True], [False, False], [True, False]]
+    assert (cache.stats.evaluated, cache.stats.skipped) == (4, 2)
+
+
+def test_condition_cache_rechecks_condition_left_out_of_a_round() -> None:
+    """한 번의 평가에서 빠진 조건이 그동안 바뀐 지표로 다시 평가되는지 테스트합니다."""
+    cache = ConditionCache()
+
+    def money_at_least(metrics: dict[str, float]) -> bool:
+        return cache.check("money_high", ["money"], lambda: metrics["money"] >= 5000)
+
+    cache.begin({"money": 3000, "reputation": 50})
+    assert money_at_least({"money": 3000}) is False
+
+    # 조건을 확인하지 않은 평가에서 자금이 바뀜
+    cache.begin({"money": 9000, "reputation": 50})
+    cache.begin({"money": 9000, "reputation": 60})
+    assert money_at_least({"money": 9000}) is True
+
+    # 다시 빠졌다가 바뀐 지표가 없으면 이전 결과를 재사용
+    cache.begin({"money": 9000, "reputation": 70})
+    cache.begin({"money": 9000, "reputation": 80})
+    assert money_at_least({"money": 9000}) is True
+    assert (cache.stats.evaluated, cache.stats.skipped) == (2, 1)
+
+
+def test_batch_fluctuation_keeps_seesaw_and_caps() -> None:
+    """배치 불확실성 변동이 시소 불변식과 지표 범위를 지키고 행별로 재현되는지 테스트합니다."""
+    ranges = get_metric_ranges()
+    defaults = np.array([ranges[metric][2] for metric in METRIC_ORDER])
+    values = np.tile(defaults, (64, 1))
+    values[:32, METRIC_ORDINAL[MetricEnum.HAPPINESS]] = 99.0
+    values[:32, METRIC_ORDINAL[MetricEnum.SUFFERING]] = 1.0
+
+    sessions = [f"session-{i}" for i in range(len(values))]
+    uniforms = RngService(3).uniforms("uncertainty", sessions, 1, FLUCTUATION_DRAWS)
+    result = uncertainty_apply_random_fluctuation_batch(values, 0.5, uniforms=uniforms)
+
+    happiness = result[:, METRIC_ORDINAL[MetricEnum.HAPPINESS]]
+    suffering = result[:, METRIC_ORDINAL[MetricEnum.SUFFERING]]
+    assert np.allclose(happiness + suffering, 100.0)
+    for metric, (min_val, max_val, _default) in ranges.items():
+        column = result[:, METRIC_ORDINAL[metric]]
+        assert np.all((column >= min_val) & (column <= max_val))
+    assert not np.array_equal(result, values)
+
+    # 한 세션씩 적용해도 같은 결과
+    for row in (0, 40):
+        single = uncertainty_apply_random_fluctuation_batch(
+            values[row : row + 1], 0.5, uniforms=uniforms[row : row + 1]
+        )
+        assert np.array_equal(single[0], result[row])
+
+    # 가중치가 없는 지표는 변동하지 않음
+    money_only = uncertainty_apply_random_fluctuation_batch(
+        values, 0.5, uniforms=uniforms, weights={MetricEnum.MONEY: 0.3}
+    )
+    unchanged = [
+        METRIC_ORDINAL[metric]
+        for metric in METRIC_ORDER
+        if metric not in {MetricEnum.MONEY, MetricEnum.HAPPINESS, MetricEnum.SUFFERING}
+    ]
+    assert np.array_equal(money_only[:, unchanged], values[:, unchanged])
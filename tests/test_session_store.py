@@ -0,0 +1,144 @@
+"""
+웹 프로토타입 세션 저장소 테스트 모듈
+
+세 가지 저장소 백엔드가 게임 상태를 같은 방식으로 저장·복원하고,
+LRU/TTL 제거와 재시작 후 복원이 동작하는지 검증합니다.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "web_prototype"))
+sys.path.insert(0, str(ROOT / "backend"))
+
+from session_store import (
+    COMPRESS_THRESHOLD,
+    LocalRedis,
+    MemorySessionStore,
+    RedisSessionStore,
+    SQLiteSessionStore,
+    StateCodec,
+    create_session_store,
+)
+
+GameState = pytest.importorskip("app.core.domain.game_state").GameState
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _sample_state(day: int = 3) -> "GameState":
+    state = GameState(current_day=day, money=12345.0, reputation=61.5)
+    return state.add_event("rain").add_event("inspection")
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite", "redis"])
+def test_backends_round_trip_game_state(backend: str, tmp_path: Path) -> None:
+    """모든 백엔드가 GameState와 기본 모드 dict 상태를 그대로 돌려주는지 테스트합니다."""
+    store = create_session_store(
+        backend,
+        state_from_dict=GameState.from_dict,
+        sqlite_path=str(tmp_path / "sessions.sqlite3"),
+    )
+    state = _sample_state()
+    store.set("player", state)
+    store.set("basic", {"current_day": 1, "money": 10000.0, "events_history": []})
+
+    assert store.get("player") == state
+    assert store.get("basic") == {"current_day": 1, "money": 10000.0, "events_history": []}
+    assert "player" in store
+    assert store.get("missing") is None
+
+    assert store.delete("player")
+    assert not store.delete("player")
+    assert store.get("player") is None
+    store.close()
+
+
+def test_codec_is_compact_and_compresses_long_histories() -> None:
+    """직렬화 결과가 작고, 긴 이벤트 히스토리는 압축되는지 테스트합니다."""
+    codec = StateCodec(GameState.from_dict)
+    small = codec.encode(_sample_state())
+    assert small.startswith(b"j")
+    assert len(small) < COMPRESS_THRESHOLD
+
+    state = GameState(current_day=100)
+    for i in range(200):
+        state = state.add_event(f"event_{i % 7}")
+    blob = codec.encode(state)
+    assert blob.startswith(b"z")
+    assert codec.decode(blob) == state
+
+
+def test_memory_store_lru_and_ttl() -> None:
+    """메모리 저장소가 최대 세션 수와 TTL에 따라 세션을 제거하는지 테스트합니다."""
+    clock = FakeClock()
+    store = MemorySessionStore(max_sessions=2, ttl_seconds=60, clock=clock)
+    store.set("a", 1)
+    store.set("b", 2)
+    assert store.get("a") == 1  # a가 최근 사용
+    store.set("c", 3)  # 가장 오래 사용하지 않은 b 제거
+    assert store.get("b") is None
+    assert len(store) == 2
+
+    clock.now += 30
+    assert store.get("a") == 1  # 접근하면 만료 연장
+    clock.now += 45
+    assert store.get("c") is None
+    assert store.get("a") == 1
+    clock.now += 61
+    assert store.purge_expired() == 1
+    assert len(store) == 0
+
+
+def test_sqlite_store_survives_restart_and_expires(tmp_path: Path) -> None:
+    """SQLite 저장소가 다시 열어도 세션을 유지하고, 만료된 세션은 숨기는지 테스트합니다."""
+    path = str(tmp_path / "sessions.sqlite3")
+    clock = FakeClock()
+    codec = StateCodec(GameState.from_dict)
+
+    store = SQLiteSessionStore(path, ttl_seconds=60, codec=codec, clock=clock)
+    store.set("player", _sample_state())
+    store.set("old", _sample_state(1))
+    clock.now += 30
+    store.set("player", _sample_state(4))
+    store.close()
+
+    # 재시작 (다른 워커 프로세스와 같은 상황)
+    reopened = SQLiteSessionStore(path, ttl_seconds=60, codec=codec, clock=clock)
+    assert reopened.get("player") == _sample_state(4)
+    clock.now += 40
+    assert reopened.get("old") is None
+    assert reopened.get("player") == _sample_state(4)
+    assert reopened.purge_expired() == 1
+    reopened.close()
+    assert os.path.exists(path)
+
+
+def test_redis_store_uses_key_expiry() -> None:
+    """Redis 호환 저장소가 키 만료로 TTL을 처리하는지 테스트합니다."""
+    clock = FakeClock()
+    client = LocalRedis(clock=clock)
+    store = RedisSessionStore(client=client, ttl_seconds=10, codec=StateCodec(GameState.from_dict))
+    store.set("player", _sample_state())
+
+    assert client.exists("chickenmaster:session:player") == 1
+    clock.now += 11
+    assert store.get("player") is None
+
+
+def test_unknown_backend() -> None:
+    """지원하지 않는 백엔드 이름은 ValueError를 발생시키는지 테스트합니다."""
+    with pytest.raises(ValueError):
+        create_session_store("memcached")
@@ -5,9 +5,11 @@ StorytellerService 엣지 케이스 및 예외 상황 테스트
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 from src.storyteller.adapters.storyteller_service import StorytellerService
+from src.storyteller.domain.strategies import WeightedPatternSelector
 from src.storyteller.domain.models import StoryContext, MetricsHistory, RecentEvent, StoryPattern
 
 
@@ -334,5 +336,37 @@ class TestPatternPrioritization:
         assert len(result) == 3  # 모든 패턴이 포함되어야 함
 
 
+class TestWeightedPatternSelector:
+    """가중치 기반 패턴 선택 전략 테스트"""
+
+    @staticmethod
+    def _context(day, metrics):
+        return SimpleNamespace(
+            day=day, current_metrics=metrics, metrics_history=[], recent_events=[]
+        )
+
+    def test_pattern_skipped_for_a_round_sees_metric_changes(self):
+        """한 번의 선택에서 빠진 패턴도 그동안 바뀐 지표로 조건을 다시 검사하는지 테스트"""
+        selector = WeightedPatternSelector()
+        rich = {
+            "pattern_id": "rich",
+            "name": "Rich",
+            "narrative_template": "",
+            "pattern_type": "tradeoff",
+            "related_events": [],
+            "trigger_conditions": {"money": 5000},
+        }
+        other = {**rich, "pattern_id": "other", "trigger_conditions": {}}
+
+        assert selector.select(self._context(1, {"money": 3000}), [rich]) is None
+        # rich가 빠진 선택 사이에 자금이 조건을 넘어섬
+        selected = selector.select(self._context(2, {"money": 9000}), [other])
+        assert selected.pattern_id == "other"
+
+        selected = selector.select(self._context(3, {"money": 9000}), [rich])
+        assert selected is not None
+        assert selected.pattern_id == "rich"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
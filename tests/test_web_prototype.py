@@ -0,0 +1,61 @@
+"""
+웹 프로토타입 API 테스트 모듈
+
+기존 엔드포인트의 응답 모양(GameResponse 필드)과 헬스 체크가
+유지되는지 검증합니다.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "web_prototype"))
+sys.path.insert(0, str(ROOT / "backend"))
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def main(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """웹 프로토타입 모듈 (정적 파일 경로가 상대 경로라 web_prototype에서 import)"""
+    monkeypatch.chdir(ROOT / "web_prototype")
+    return importlib.import_module("main")
+
+
+@pytest.fixture
+def client(main: ModuleType) -> TestClient:
+    """웹 프로토타입 테스트 클라이언트"""
+    return TestClient(main.app)
+
+
+def test_health_check(client: TestClient) -> None:
+    """헬스 체크가 상태 dict를 반환하는지 테스트합니다."""
+    body = client.get("/health").json()
+    assert body["status"] == "healthy"
+    assert "backend_available" in body
+
+
+def test_game_response_keeps_available_actions(main: ModuleType, client: TestClient) -> None:
+    """기존 엔드포인트 응답에 available_actions가 포함되는지 테스트합니다."""
+    assert list(main.GameResponse.model_fields) == [
+        "success",
+        "message",
+        "game_state",
+        "available_actions",
+    ]
+    assert "available_actions" in main.AdvanceResponse.model_fields
+    assert "available_actions" not in main.AdvanceRequest.model_fields
+
+    response = client.post("/api/game/new")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert set(body) == {"success", "message", "game_state", "available_actions"}
+    assert body["available_actions"]
@@ -5,6 +5,8 @@
 
 import sys
 import os
+import re
+import dataclasses
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import json
@@ -14,11 +16,14 @@ from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 # 백엔드 모듈 경로 추가
 backend_path = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_path))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from session_store import create_session_store_from_env
 
 try:
     # 백엔드 게임 로직 임포트
@@ -36,6 +41,24 @@ except ImportError as e:
     print(f"⚠️ 백엔드 로직 로드 실패: {e}")
     BACKEND_AVAILABLE = False
 
+# 빠른 진행(fast-forward)용 시뮬레이션 로직 (저장소 루트의 src 패키지)
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+try:
+    from game_constants import Metric as SimMetric
+    from src.events.integration import GameEventSystem as SimGameEventSystem
+    from src.metrics.tracker import MetricsTracker as SimMetricsTracker
+
+    FAST_FORWARD_AVAILABLE = True
+except ImportError as e:
+    print(f"⚠️ 빠른 진행 로직 로드 실패: {e}")
+    FAST_FORWARD_AVAILABLE = False
+
+# 빠른 진행 설정
+MAX_ADVANCE_DAYS_PER_REQUEST = 365
+SNAPSHOT_LOG_DIR = project_root / "data" / "session_snapshots"
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -56,8 +79,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 게임 상태 저장 (실제로는 데이터베이스나 세션 사용)
-game_sessions: Dict[str, GameState] = {}
+# 게임 세션 저장소 (CHICKENMASTER_SESSION_BACKEND로 memory/sqlite/redis 선택)
+game_sessions = create_session_store_from_env(
+    state_from_dict=GameState.from_dict if BACKEND_AVAILABLE else None
+)
 game_initializer = None
 metrics_tracker = None
 event_engine = None
@@ -73,6 +98,16 @@ class GameResponse(BaseModel):
     game_state: Optional[Dict[str, Any]] = None
     available_actions: List[str] = []
 
+class AdvanceRequest(BaseModel):
+    days: int = Field(30, ge=1, le=MAX_ADVANCE_DAYS_PER_REQUEST)
+    snapshot_every: int = Field(0, ge=0)  # 0이면 스냅샷 없음, N이면 N일마다 기록
+    seed: Optional[int] = None
+    series_encoding: str = "zlib+base64"  # 또는 "raw"
+
+
+class AdvanceResponse(GameResponse):
+    series: Dict[str, Any] = {}
+
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 게임 시스템 초기화"""
@@ -154,7 +189,7 @@ async def new_game(session_id: str = "default"):
         if game_initializer:
             # 실제 게임 로직으로 초기화
             initial_state = game_initializer.initialize()
-            game_sessions[session_id] = initial_state
+            game_sessions.set(session_id, initial_state)
             
             return GameResponse(
                 success=True,
@@ -176,7 +211,7 @@ async def new_game(session_id: str = "default"):
                 "demand": 50.0,
                 "events_history": []
             }
-            game_sessions[session_id] = default_state
+            game_sessions.set(session_id, default_state)
             
             return GameResponse(
                 success=True,
@@ -192,10 +227,10 @@ async def new_game(session_id: str = "default"):
 @app.get("/api/game/state/{session_id}")
 async def get_game_state(session_id: str = "default"):
     """현재 게임 상태 조회"""
-    if session_id not in game_sessions:
+    state = game_sessions.get(session_id)
+    if state is None:
         raise HTTPException(status_code=404, detail="게임 세션을 찾을 수 없습니다")
     
-    state = game_sessions[session_id]
     if hasattr(state, 'to_dict'):
         state_dict = state.to_dict()
     else:
@@ -209,12 +244,11 @@ async def get_game_state(session_id: str = "default"):
 @app.post("/api/game/action")
 async def perform_action(action: GameAction, session_id: str = "default"):
     """게임 액션 수행"""
-    if session_id not in game_sessions:
+    current_state = game_sessions.get(session_id)
+    if current_state is None:
         raise HTTPException(status_code=404, detail="게임 세션을 찾을 수 없습니다")
     
     try:
-        current_state = game_sessions[session_id]
-        
         if action.action_type == "check_status":
             if hasattr(current_state, 'to_dict'):
                 state_dict = current_state.to_dict()
@@ -235,7 +269,7 @@ async def perform_action(action: GameAction, session_id: str = "default"):
                 # 실제 게임 로직이 있다면 여기서 사용
                 if BACKEND_AVAILABLE and hasattr(current_state, 'with_day'):
                     new_state = current_state.with_day(new_day)
-                    game_sessions[session_id] = new_state
+                    game_sessions.set(session_id, new_state)
                     
                     return GameResponse(
                         success=True,
@@ -262,6 +296,11 @@ async def perform_action(action: GameAction, session_id: str = "default"):
         logger.error(f"액션 수행 오류: {e}")
         raise HTTPException(status_code=500, detail=f"액션 수행 실패: {str(e)}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 세션 저장소 정리"""
+    game_sessions.close()
+
 @app.get("/health")
 async def health_check():
     """헬스 체크 엔드포인트"""
@@ -271,6 +310,89 @@ async def health_check():
         "timestamp": "2025-01-18"
     }
 
+
+def _state_metrics(state: Any) -> tuple[int, Dict[str, float]]:
+    """세션 상태에서 현재 일수와 지표(소문자 이름 → 값)를 꺼냅니다."""
+    if hasattr(state, "metrics") and hasattr(state, "current_day"):
+        metrics = {getattr(k, "value", k): v for k, v in state.metrics.items()}
+        return state.current_day, metrics
+    metrics = {
+        metric.name.lower(): state[metric.name.lower()]
+        for metric in SimMetric
+        if metric.name.lower() in state
+    }
+    return state.get("current_day", 1), metrics
+
+
+def _state_with_metrics(state: Any, day: int, metrics: Dict[str, float]) -> Any:
+    """세션 상태에 진행 결과(일수, 지표)를 반영한 새 상태를 만듭니다."""
+    if dataclasses.is_dataclass(state):
+        fields = {f.name for f in dataclasses.fields(state)}
+        return dataclasses.replace(
+            state, current_day=day, **{k: v for k, v in metrics.items() if k in fields}
+        )
+    return {**state, "current_day": day, **metrics}
+
+
+@app.post("/api/game/advance")
+def advance_game(request: AdvanceRequest, session_id: str = "default"):
+    """
+    여러 날을 한 번의 요청으로 진행 (자동 진행, 리플레이용)
+
+    매일의 전체 상태 대신 압축된 일별 지표 시계열을 돌려줍니다.
+    스냅샷은 기본적으로 만들지 않으며, snapshot_every를 주면 세션별
+    스냅샷 로그에 해당 간격으로 기록합니다.
+    """
+    if not FAST_FORWARD_AVAILABLE:
+        raise HTTPException(status_code=503, detail="빠른 진행 기능을 사용할 수 없습니다")
+
+    current_state = game_sessions.get(session_id)
+    if current_state is None:
+        raise HTTPException(status_code=404, detail="게임 세션을 찾을 수 없습니다")
+
+    try:
+        current_day, metrics = _state_metrics(current_state)
+        snapshot_log = None
+        if request.snapshot_every > 0:
+            safe_id = re.sub(r"[^A-Za-z0-9_-]", "_", session_id)
+            snapshot_log = str(SNAPSHOT_LOG_DIR / f"{safe_id}.snaplog")
+
+        tracker = SimMetricsTracker(
+            initial_metrics={SimMetric[name.upper()]: value for name, value in metrics.items()},
+            history_size=1,
+            snapshot_dir=str(SNAPSHOT_LOG_DIR),
+            snapshot_log=snapshot_log,
+        )
+        system = SimGameEventSystem(
+            metrics_tracker=tracker,
+            events_file=str(project_root / "data" / "events.toml"),
+            tradeoff_file=str(project_root / "data" / "tradeoff_matrix.toml"),
+            seed=request.seed,
+        )
+        system.day = current_day
+        try:
+            series = system.advance_days(request.days, snapshot_every=request.snapshot_every)
+        finally:
+            system.close()
+
+        final_metrics = {m.name.lower(): v for m, v in tracker.get_metrics().items()}
+        new_state = _state_with_metrics(current_state, system.day, final_metrics)
+        game_sessions.set(session_id, new_state)
+
+        return AdvanceResponse(
+            success=True,
+            message=f"Day {system.day}: {request.days}일이 지났습니다.",
+            game_state=new_state.to_dict() if hasattr(new_state, "to_dict") else new_state,
+            available_actions=["daily_routine", "view_metrics", "check_status"],
+            series=series.to_payload(request.series_encoding),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"빠른 진행 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"빠른 진행 실패: {str(e)}") from e
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
@@ -0,0 +1,472 @@
+"""
+치킨마스터 웹 게임 세션 저장소
+
+게임 세션을 프로세스 메모리 dict 대신 교체 가능한 저장소에 보관합니다.
+
+- memory: 프로세스 내 LRU + TTL 저장소 (단일 워커, 재시작 시 초기화)
+- sqlite: SQLite(WAL) 파일 저장소 (여러 워커 공유, 재시작 후 유지)
+- redis:  Redis 호환 저장소 (redis 패키지가 없으면 프로세스 내 대체 구현 사용)
+
+sqlite/redis 저장소는 GameState.to_dict()/from_dict()로 상태를 직렬화하고,
+작은 JSON으로 압축해 저장합니다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import redis
+except ImportError:
+    redis = None  # type: ignore
+
+# 세션 기본값
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_SESSIONS = 10000
+DEFAULT_SQLITE_PATH = "data/sessions.sqlite3"
+REDIS_KEY_PREFIX = "chickenmaster:session:"
+
+# 이 크기(바이트)를 넘는 직렬화 데이터는 zlib으로 압축
+COMPRESS_THRESHOLD = 512
+
+# 직렬화 형식 표시 (첫 바이트)
+_RAW = b"j"
+_COMPRESSED = b"z"
+
+SESSION_BACKENDS = ("memory", "sqlite", "redis")
+
+
+class StateCodec:
+    """
+    게임 상태 직렬화기
+
+    to_dict()가 있는 상태 객체는 지표 Enum 키를 문자열 값으로 바꿔
+    저장하고, 읽을 때 state_from_dict(보통 GameState.from_dict)로 복원합니다.
+    백엔드 없이 실행할 때 쓰는 dict 상태는 그대로 저장합니다.
+    """
+
+    def __init__(self, state_from_dict: Callable[[dict[str, Any]], Any] | None = None):
+        """
+        StateCodec 초기화
+
+        Args:
+            state_from_dict: 딕셔너리에서 상태 객체를 만드는 함수 (기본값: None, dict 그대로 반환)
+        """
+        self.state_from_dict = state_from_dict
+
+    def encode(self, state: Any) -> bytes:
+        """상태를 바이트로 직렬화합니다."""
+        if hasattr(state, "to_dict"):
+            data = state.to_dict()
+            metrics = data.get("metrics")
+            if isinstance(metrics, dict):
+                data["metrics"] = {getattr(k, "value", k): v for k, v in metrics.items()}
+            payload = {"s": data}
+        else:
+            payload = {"d": state}
+
+        raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if len(raw) > COMPRESS_THRESHOLD:
+            return _COMPRESSED + zlib.compress(raw)
+        return _RAW + raw
+
+    def decode(self, blob: bytes) -> Any:
+        """직렬화된 바이트에서 상태를 복원합니다."""
+        kind, body = blob[:1], blob[1:]
+        if kind == _COMPRESSED:
+            body = zlib.decompress(body)
+        elif kind != _RAW:
+            raise ValueError(f"알 수 없는 세션 데이터 형식: {kind!r}")
+
+        payload = json.loads(body.decode("utf-8"))
+        if "s" in payload:
+            data = payload["s"]
+            return self.state_from_dict(data) if self.state_from_dict else data
+        return payload["d"]
+
+
+class SessionStore(ABC):
+    """게임 세션 저장소 인터페이스"""
+
+    @abstractmethod
+    def get(self, session_id: str) -> Any | None:
+        """
+        세션 상태를 조회합니다.
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            Optional[Any]: 게임 상태 (없거나 만료되었으면 None)
+        """
+
+    @abstractmethod
+    def set(self, session_id: str, state: Any) -> None:
+        """
+        세션 상태를 저장하고 만료 시간을 갱신합니다.
+
+        Args:
+            session_id: 세션 ID
+            state: 게임 상태
+        """
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """
+        세션을 삭제합니다.
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            bool: 세션이 있었는지 여부
+        """
+
+    def __contains__(self, session_id: object) -> bool:
+        return isinstance(session_id, str) and self.get(session_id) is not None
+
+    def close(self) -> None:  # noqa: B027
+        """저장소 자원을 정리합니다 (기본 구현은 아무것도 하지 않음)."""
+
+
+class MemorySessionStore(SessionStore):
+    """
+    프로세스 내 LRU + TTL 세션 저장소
+
+    상태 객체를 그대로 보관하며 (GameState는 불변), 최대 세션 수를 넘으면
+    가장 오래 사용하지 않은 세션부터, 만료 시간이 지나면 조회 시점에 제거합니다.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        MemorySessionStore 초기화
+
+        Args:
+            max_sessions: 최대 세션 수
+            ttl_seconds: 마지막 접근 후 만료까지의 시간 (초, 0 이하이면 만료 없음)
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._sessions: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expires_at(self) -> float:
+        return self._clock() + self.ttl_seconds if self.ttl_seconds > 0 else float("inf")
+
+    def get(self, session_id: str) -> Any | None:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                del self._sessions[session_id]
+                return None
+            # 접근하면 만료 시간을 연장하고 가장 최근 사용으로 이동
+            self._sessions[session_id] = (self._expires_at(), entry[1])
+            self._sessions.move_to_end(session_id)
+            return entry[1]
+
+    def set(self, session_id: str, state: Any) -> None:
+        with self._lock:
+            self._sessions[session_id] = (self._expires_at(), state)
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def purge_expired(self) -> int:
+        """
+        만료된 세션을 모두 제거합니다.
+
+        Returns:
+            int: 제거한 세션 수
+        """
+        now = self._clock()
+        with self._lock:
+            expired = [sid for sid, (expires_at, _) in self._sessions.items() if expires_at <= now]
+            for session_id in expired:
+                del self._sessions[session_id]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SQLite(WAL) 세션 저장소
+
+    WAL 모드에서는 여러 워커 프로세스가 같은 파일을 동시에 읽고 쓸 수 있고,
+    서버를 재시작해도 세션이 유지됩니다. 만료된 세션은 일정 횟수의 쓰기마다
+    한 번씩 정리합니다.
+    """
+
+    PURGE_EVERY = 256
+
+    def __init__(
+        self,
+        path: str = DEFAULT_SQLITE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        codec: StateCodec | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        SQLiteSessionStore 초기화
+
+        Args:
+            path: 데이터베이스 파일 경로
+            ttl_seconds: 마지막 저장 후 만료까지의 시간 (초, 0 이하이면 만료 없음)
+            codec: 상태 직렬화기 (기본값: None, dict 그대로 저장)
+            clock: 현재 시각 함수 (테스트용, 워커 간 공유되므로 실제 시각 사용)
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.codec = codec or StateCodec()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            " session_id TEXT PRIMARY KEY,"
+            " data BLOB NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _expires_at(self) -> float:
+        return self._clock() + self.ttl_seconds if self.ttl_seconds > 0 else float("inf")
+
+    def get(self, session_id: str) -> Any | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM sessions WHERE session_id = ? AND expires_at > ?",
+                (session_id, self._clock()),
+            ).fetchone()
+        if row is None:
+            return None
+        return self.codec.decode(row[0])
+
+    def set(self, session_id: str, state: Any) -> None:
+        blob = self.codec.encode(state)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sessions (session_id, data, expires_at) VALUES (?, ?, ?)"
+                " ON CONFLICT(session_id) DO UPDATE SET"
+                " data = excluded.data, expires_at = excluded.expires_at",
+                (session_id, blob, self._expires_at()),
+            )
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                self._conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (self._clock(),))
+            self._conn.commit()
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def purge_expired(self) -> int:
+        """
+        만료된 세션을 모두 제거합니다.
+
+        Returns:
+            int: 제거한 세션 수
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE expires_at <= ?", (self._clock(),)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class LocalRedis:
+    """
+    redis.Redis의 세션 저장에 필요한 부분(get/set/delete/exists)만 구현한
+    프로세스 내 대체 구현
+
+    redis 패키지나 서버 없이 개발·테스트할 때 RedisSessionStore에 사용합니다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._data: dict[str, tuple[float, bytes]] = {}
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                del self._data[key]
+                return None
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ex: int | None = None) -> bool:
+        expires_at = self._clock() + ex if ex else float("inf")
+        with self._lock:
+            self._data[key] = (expires_at, value)
+        return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(key, None) is not None for key in keys)
+
+    def exists(self, *keys: str) -> int:
+        return sum(self.get(key) is not None for key in keys)
+
+    def close(self) -> None:
+        pass
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Redis 호환 세션 저장소
+
+    TTL은 Redis 키 만료(SET ... EX)로 처리합니다. client를 주지 않으면
+    url이 있고 redis 패키지가 설치된 경우 실제 Redis에, 아니면 LocalRedis에 연결합니다.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        url: str | None = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        codec: StateCodec | None = None,
+        key_prefix: str = REDIS_KEY_PREFIX,
+    ):
+        """
+        RedisSessionStore 초기화
+
+        Args:
+            client: redis.Redis 호환 클라이언트 (기본값: None, url 또는 LocalRedis 사용)
+            url: Redis 접속 URL (예: redis://localhost:6379/0)
+            ttl_seconds: 마지막 저장 후 만료까지의 시간 (초, 0 이하이면 만료 없음)
+            codec: 상태 직렬화기 (기본값: None, dict 그대로 저장)
+            key_prefix: 세션 키 접두사
+        """
+        if client is None:
+            if url and redis is not None:
+                client = redis.Redis.from_url(url)
+            else:
+                if url:
+                    print("⚠️ redis 패키지가 없어 로컬 Redis 대체 구현을 사용합니다")
+                client = LocalRedis()
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.codec = codec or StateCodec()
+        self.key_prefix = key_prefix
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.key_prefix}{session_id}"
+
+    def get(self, session_id: str) -> Any | None:
+        blob = self.client.get(self._key(session_id))
+        if blob is None:
+            return None
+        return self.codec.decode(blob)
+
+    def set(self, session_id: str, state: Any) -> None:
+        ttl = int(self.ttl_seconds) if self.ttl_seconds > 0 else None
+        self.client.set(self._key(session_id), self.codec.encode(state), ex=ttl)
+
+    def delete(self, session_id: str) -> bool:
+        return bool(self.client.delete(self._key(session_id)))
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def create_session_store(
+    backend: str = "memory",
+    state_from_dict: Callable[[dict[str, Any]], Any] | None = None,
+    ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    max_sessions: int = DEFAULT_MAX_SESSIONS,
+    sqlite_path: str = DEFAULT_SQLITE_PATH,
+    redis_url: str | None = None,
+) -> SessionStore:
+    """
+    세션 저장소를 생성합니다.
+
+    Args:
+        backend: "memory", "sqlite", "redis" 중 하나
+        state_from_dict: 딕셔너리에서 상태 객체를 만드는 함수 (예: GameState.from_dict)
+        ttl_seconds: 세션 만료 시간 (초)
+        max_sessions: memory 저장소의 최대 세션 수
+        sqlite_path: sqlite 저장소 파일 경로
+        redis_url: redis 저장소 접속 URL
+
+    Returns:
+        SessionStore: 생성된 세션 저장소
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드인 경우
+    """
+    if backend == "memory":
+        return MemorySessionStore(max_sessions=max_sessions, ttl_seconds=ttl_seconds)
+
+    codec = StateCodec(state_from_dict)
+    if backend == "sqlite":
+        return SQLiteSessionStore(sqlite_path, ttl_seconds=ttl_seconds, codec=codec)
+    if backend == "redis":
+        return RedisSessionStore(url=redis_url, ttl_seconds=ttl_seconds, codec=codec)
+    raise ValueError(f"지원하지 않는 세션 저장소: {backend} (가능한 값: {SESSION_BACKENDS})")
+
+
+def create_session_store_from_env(
+    state_from_dict: Callable[[dict[str, Any]], Any] | None = None,
+) -> SessionStore:
+    """
+    환경 변수 설정으로 세션 저장소를 생성합니다.
+
+    - CHICKENMASTER_SESSION_BACKEND: memory(기본) / sqlite / redis
+    - CHICKENMASTER_SESSION_TTL: 세션 만료 시간 (초)
+    - CHICKENMASTER_SESSION_MAX: memory 저장소의 최대 세션 수
+    - CHICKENMASTER_SESSION_DB: sqlite 파일 경로
+    - CHICKENMASTER_REDIS_URL: Redis 접속 URL
+
+    Args:
+        state_from_dict: 딕셔너리에서 상태 객체를 만드는 함수
+
+    Returns:
+        SessionStore: 생성된 세션 저장소
+    """
+    env = os.environ
+    return create_session_store(
+        backend=env.get("CHICKENMASTER_SESSION_BACKEND", "memory"),
+        state_from_dict=state_from_dict,
+        ttl_seconds=float(env.get("CHICKENMASTER_SESSION_TTL", DEFAULT_TTL_SECONDS)),
+        max_sessions=int(env.get("CHICKENMASTER_SESSION_MAX", DEFAULT_MAX_SESSIONS)),
+        sqlite_path=env.get("CHICKENMASTER_SESSION_DB", DEFAULT_SQLITE_PATH),
+        redis_url=env.get("CHICKENMASTER_REDIS_URL"),
+    )